@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+
+class Generator:
+    """
+    Generates synthetic stories, scaled along independent axes, so that
+    every hot path of the compiler can be measured on its own.
+    """
+    axes = ('lines', 'depth', 'ladder', 'inline', 'services', 'imports',
+            'templates')
+
+    def __init__(self, lines=0, depth=0, ladder=0, inline=0, services=0,
+                 imports=0, templates=0):
+        self.lines = lines
+        self.depth = depth
+        self.ladder = ladder
+        self.inline = inline
+        self.services = services
+        self.imports = imports
+        self.templates = templates
+
+    @staticmethod
+    def indent(level, line):
+        return '{}{}'.format('    ' * level, line)
+
+    def assignments(self):
+        """
+        Plain assignments of numbers and arithmetic expressions.
+        """
+        lines = []
+        for n in range(self.lines):
+            if n % 2:
+                lines.append('a{} = a{} + {} * 2'.format(n, n - 1, n))
+            else:
+                lines.append('a{} = {}'.format(n, n))
+        return lines
+
+    def nested(self):
+        """
+        Blocks nested in each other, alternating if and foreach.
+        """
+        lines = []
+        for level in range(self.depth):
+            if level % 2:
+                line = 'foreach items{} as item{}'.format(level, level)
+            else:
+                line = 'if n{} > {}'.format(level, level)
+            lines.append(self.indent(level, line))
+        if self.depth:
+            lines.append(self.indent(self.depth, 'x = 0'))
+        return lines
+
+    def ladder_branches(self):
+        """
+        An if statement followed by a ladder of else if branches.
+        """
+        lines = []
+        for n in range(self.ladder):
+            branch = 'else if'
+            if n == 0:
+                branch = 'if'
+            lines.append('{} colour == "colour{}"'.format(branch, n))
+            lines.append(self.indent(1, 'x = {}'.format(n)))
+        if self.ladder:
+            lines.append('else')
+            lines.append(self.indent(1, 'x = -1'))
+        return lines
+
+    def inline_expressions(self):
+        lines = []
+        for n in range(self.inline):
+            line = 'i{} = (alpine echo text:"{}")'.format(n, n)
+            lines.append(line)
+        return lines
+
+    def service_calls(self):
+        """
+        Services with arguments and outputs.
+        """
+        lines = []
+        for n in range(self.services):
+            line = 'service{} run input:{} as output{}'.format(n, n, n)
+            lines.append(line)
+        return lines
+
+    def template_strings(self):
+        lines = []
+        if self.templates:
+            lines.append('name = "world"')
+        for n in range(self.templates):
+            lines.append('t{} = "hello {{name}} number {}"'.format(n, n))
+        return lines
+
+    def modules(self):
+        return ['module{}.story'.format(n) for n in range(self.imports)]
+
+    def import_lines(self):
+        lines = []
+        for n, module in enumerate(self.modules()):
+            lines.append('import "{}" as module{}'.format(module[:-6], n))
+        return lines
+
+    def story(self):
+        """
+        Generates the source of the story.
+        """
+        lines = (self.import_lines() + self.assignments() + self.nested() +
+                 self.ladder_branches() + self.inline_expressions() +
+                 self.service_calls() + self.template_strings())
+        return '\n'.join(lines) + '\n'
+
+    def files(self):
+        """
+        Generates the story and the modules it imports, as a mapping of
+        paths to sources.
+        """
+        files = {'main.story': self.story()}
+        for n, module in enumerate(self.modules()):
+            files[module] = 'm{} = {}\nalpine echo text:"{}"\n'.format(n, n, n)
+        return files
+
+    @classmethod
+    def scaled(cls, axis, size):
+        """
+        Creates a generator scaled along a single axis. The other axes use a
+        small story, so that the axis dominates the measures.
+        """
+        options = {'lines': 4}
+        options[axis] = size
+        return cls(**options)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import statistics
+import time
+
+
+class Harness:
+    """
+    Measures benchmarks in rounds of calls. The calls of a round are
+    calibrated so that the round lasts at least min_time, and the setup of
+    each call is not measured.
+    """
+
+    def __init__(self, rounds=5, min_time=0.1, max_loops=10000):
+        self.rounds = rounds
+        self.min_time = min_time
+        self.max_loops = max_loops
+
+    @staticmethod
+    def call(function, setup=None):
+        """
+        Measures a single call, in seconds.
+        """
+        args = ()
+        if setup:
+            args = (setup(),)
+        start = time.perf_counter()
+        function(*args)
+        return time.perf_counter() - start
+
+    def round(self, function, setup, loops):
+        total = 0
+        for loop in range(loops):
+            total += self.call(function, setup=setup)
+        return total / loops
+
+    def loops(self, function, setup=None):
+        """
+        Finds how many calls last at least min_time.
+        """
+        elapsed = self.call(function, setup=setup)
+        if elapsed >= self.min_time:
+            return 1
+        loops = int(self.min_time / max(elapsed, 1e-9)) + 1
+        return min(loops, self.max_loops)
+
+    def measure(self, function, setup=None):
+        """
+        Measures a benchmark, giving the times of a call in seconds.
+        """
+        loops = self.loops(function, setup=setup)
+        times = []
+        for n in range(self.rounds):
+            times.append(self.round(function, setup, loops))
+        return {'min': min(times), 'median': statistics.median(times),
+                'mean': statistics.mean(times), 'rounds': self.rounds,
+                'loops': loops}
+
+    def run(self, benchmarks, match=None):
+        """
+        Runs the benchmarks whose name contains match, yielding their name
+        and results. Benchmarks that fail are reported with the error.
+        """
+        for name, benchmark in benchmarks:
+            if match and match not in name:
+                continue
+            try:
+                function, setup = benchmark()
+                yield name, self.measure(function, setup=setup)
+            except Exception as e:
+                yield name, {'error': '{}: {}'.format(type(e).__name__, e)}
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+
+import lark
+
+from storyscript.Version import version
+
+
+class History:
+    """
+    Keeps the results of past benchmark runs in a JSON file, so that new
+    results can be compared with the runs made in the same environment.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def default_path():
+        return os.path.join('.benchmarks', 'history.json')
+
+    @staticmethod
+    def environment():
+        """
+        Identifies the environment of a run. Runs are comparable only when
+        made on the same machine with the same Python.
+        """
+        return {'node': platform.node(), 'machine': platform.machine(),
+                'python': platform.python_version()}
+
+    @classmethod
+    def make_run(cls, results):
+        return {'date': datetime.datetime.now().isoformat(),
+                'storyscript': version, 'lark': lark.__version__,
+                'environment': cls.environment(), 'results': results}
+
+    def load(self):
+        """
+        Loads the past runs, the oldest first.
+        """
+        try:
+            with io.open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def save(self, run):
+        """
+        Adds a run to the history. The file is replaced atomically.
+        """
+        runs = self.load() + [run]
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=directory)
+        try:
+            with io.open(handle, 'w') as f:
+                json.dump(runs, f, indent=2)
+            os.replace(temporary, self.path)
+        except Exception as e:
+            os.remove(temporary)
+            raise e
+
+    def baseline(self, runs, name, size=5):
+        """
+        Gets the median of the best times of a benchmark in the last runs
+        made in this environment.
+        """
+        environment = self.environment()
+        times = []
+        for run in reversed(runs):
+            if run['environment'] != environment:
+                continue
+            result = run['results'].get(name, {})
+            if 'min' in result:
+                times.append(result['min'])
+            if len(times) == size:
+                break
+        if times:
+            return statistics.median(times)
+        return None
+
+    def regressions(self, results, threshold=0.2):
+        """
+        Finds the benchmarks that are slower than their baseline by more
+        than the threshold, as tuples of name, baseline and time.
+        """
+        runs = self.load()
+        regressions = []
+        for name, result in results.items():
+            baseline = self.baseline(runs, name)
+            if baseline is None or 'min' not in result:
+                continue
+            if result['min'] > baseline * (1 + threshold):
+                regressions.append((name, baseline, result['min']))
+        return regressions
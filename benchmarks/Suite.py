@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import copy
+import os
+import subprocess
+import sys
+
+from storyscript.Bundle import Bundle
+from storyscript.compiler import Compiler
+from storyscript.parser import Parser
+
+from .Generator import Generator
+
+
+class Suite:
+    """
+    The benchmarks of the hot paths of the compiler. Every benchmark is a
+    function returning the function to measure and its setup, so that
+    stories are generated only for the benchmarks that run.
+
+    Startup benchmarks run commands in a new interpreter, and some have a
+    budget in seconds, since the command line is called by shell prompts.
+    """
+    sizes = {
+        'lines': (10, 100, 400),
+        'depth': (5, 50, 500),
+        'ladder': (10, 50, 200),
+        'inline': (10, 50, 200),
+        'services': (10, 100, 400),
+        'imports': (1, 10, 50),
+        'templates': (10, 100, 400)
+    }
+    cli = 'from storyscript.Cli import Cli\nCli.main({!r})'
+    startup = {
+        'api': 'import storyscript',
+        'cli': 'from storyscript.Cli import Cli',
+        'version': cli.format(['--version']),
+        'grammar': cli.format(['grammar']),
+        'compile': cli.format(['compile', os.devnull, '--no-cache'])
+    }
+    budgets = {
+        'startup.version': 0.1,
+        'startup.grammar': 0.2,
+        'startup.compile': 0.3
+    }
+
+    @staticmethod
+    def parse(generator):
+        """
+        Measures parsing a story, with the parser already built.
+        """
+        source = generator.story()
+        parser = Parser()
+        parser.parse(source)
+        return lambda: parser.parse(source), None
+
+    @staticmethod
+    def compile(generator):
+        """
+        Measures compiling a tree. The preprocessor changes the tree, so
+        every call compiles a copy.
+        """
+        tree = Parser().parse(generator.story())
+        return Compiler.compile, lambda: copy.deepcopy(tree)
+
+    @staticmethod
+    def bundle(generator):
+        """
+        Measures parsing and compiling a story and its modules.
+        """
+        files = generator.files()
+
+        def setup():
+            return Bundle(story_files=dict(files))
+        return lambda bundle: bundle.bundle(), setup
+
+    @staticmethod
+    def run_python(code):
+        """
+        Runs code in a new interpreter, raising its last error line.
+        """
+        process = subprocess.run([sys.executable, '-c', code],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.PIPE)
+        if process.returncode:
+            lines = process.stderr.decode('utf-8').strip().split('\n')
+            raise RuntimeError(lines[-1])
+
+    @classmethod
+    def start(cls, code):
+        """
+        Measures starting a new interpreter and running Storyscript code.
+        """
+        return lambda: cls.run_python(code), None
+
+    @classmethod
+    def over_budget(cls, results):
+        """
+        Finds the benchmarks that are slower than their budget, as tuples of
+        name, budget and time.
+        """
+        exceeded = []
+        for name, budget in cls.budgets.items():
+            result = results.get(name, {})
+            if result.get('min', 0) > budget:
+                exceeded.append((name, budget, result['min']))
+        return exceeded
+
+    @classmethod
+    def benchmarks(cls, quick=False):
+        """
+        Lists the benchmarks as their name and their function. Quick runs
+        use only the smallest size of every axis.
+        """
+        benchmarks = []
+        for phase in (cls.parse, cls.compile, cls.bundle):
+            for axis in Generator.axes:
+                sizes = cls.sizes[axis]
+                if quick:
+                    sizes = sizes[:1]
+                for size in sizes:
+                    name = '{}.{}.{}'.format(phase.__name__, axis, size)
+                    generator = Generator.scaled(axis, size)
+                    benchmark = cls.benchmark(phase, generator)
+                    benchmarks.append((name, benchmark))
+        for name, code in cls.startup.items():
+            benchmark = cls.benchmark(cls.start, code)
+            benchmarks.append(('startup.{}'.format(name), benchmark))
+        return benchmarks
+
+    @staticmethod
+    def benchmark(function, argument):
+        return lambda: function(argument)
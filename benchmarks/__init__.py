@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+from .Generator import Generator
+from .Harness import Harness
+from .History import History
+from .Suite import Suite
+
+
+__all__ = ['Generator', 'Harness', 'History', 'Suite']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import click
+
+from .Harness import Harness
+from .History import History
+from .Suite import Suite
+
+
+@click.command()
+@click.option('--match', '-k', default=None,
+              help='Run only the benchmarks whose name contains this')
+@click.option('--quick', is_flag=True,
+              help='Run only the smallest sizes, in a single round')
+@click.option('--history', default=History.default_path(),
+              help='The file where results are kept')
+@click.option('--save/--no-save', default=True,
+              help='Whether to add the results to the history')
+@click.option('--check', is_flag=True,
+              help='Fail when a benchmark is slower than its baseline or '
+              'its budget')
+@click.option('--threshold', default=0.2, type=float,
+              help='The slowdown that is a regression, 0.2 being 20%')
+def main(match, quick, history, save, check, threshold):
+    """
+    Runs the benchmarks, comparing them with the past runs.
+    """
+    harness = Harness()
+    if quick:
+        harness = Harness(rounds=1, min_time=0.01)
+    history = History(history)
+    runs = history.load()
+    results = {}
+    benchmarks = Suite.benchmarks(quick=quick)
+    header = '{:<28}{:>13}{:>13}{:>10}'
+    click.echo(header.format('benchmark', 'min', 'median', 'change'))
+    for name, result in harness.run(benchmarks, match=match):
+        results[name] = result
+        if 'error' in result:
+            click.echo('{:<28} skipped, {}'.format(name, result['error']))
+            continue
+        line = '{:<28}{:>10.3f} ms{:>10.3f} ms'
+        line = line.format(name, result['min'] * 1000,
+                           result['median'] * 1000)
+        baseline = history.baseline(runs, name)
+        if baseline:
+            change = (result['min'] - baseline) / baseline * 100
+            line = '{}{:>+9.1f}%'.format(line, change)
+        click.echo(line)
+    regressions = history.regressions(results, threshold=threshold)
+    for name, baseline, time in regressions:
+        message = '{} regressed: {:.3f} ms, baseline {:.3f} ms'
+        click.echo(click.style(message.format(name, time * 1000,
+                                              baseline * 1000), fg='red'))
+    exceeded = Suite.over_budget(results)
+    for name, budget, time in exceeded:
+        message = '{} over budget: {:.3f} ms, budget {:.3f} ms'
+        click.echo(click.style(message.format(name, time * 1000,
+                                              budget * 1000), fg='red'))
+    if save:
+        history.save(History.make_run(results))
+    if check and (regressions or exceeded):
+        exit(1)
+
+
+main()
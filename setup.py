@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import io
 
-from setuptools import find_packages, setup
+from setuptools import Command, find_packages, setup
 
 
 version = '0.9.0'
@@ -26,7 +26,6 @@ classifiers = [
 
 requirements = [
     'click==7.0',
-    'delegator.py>=0.1.1',
     'lark-parser>=0.6.5',
     'click-alias==0.1.1a2'
 ]
@@ -37,6 +36,25 @@ extras = [
 ]
 
 
+class GenerateParser(Command):
+    """
+    Generates the tables of the standalone parser. Run it whenever the
+    grammar changes.
+    """
+    description = 'generate the standalone parser from the grammar'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        from storyscript.parser import Parser
+        Parser().generate('storyscript/parser/Tables.py')
+
+
 setup(name='storyscript',
       version=version,
       description=short_description,
@@ -49,13 +67,16 @@ setup(name='storyscript',
       author_email='noreply@storyscript.org',
       url='http://storyscript.org',
       license='MIT',
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks']),
       include_package_data=True,
       zip_safe=True,
       install_requires=requirements,
       extras_require={
           'docs': extras
       },
+      cmdclass={
+          'generate_parser': GenerateParser
+      },
       entry_points={
           'console_scripts': ['storyscript=storyscript.Cli:Cli.main']
       })
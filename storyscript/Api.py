@@ -1,18 +1,32 @@
 # -*- coding: utf-8 -*-
-from .Bundle import Bundle
-from .Story import Story
+import weakref
+
+from .Memory import Memory
+from .Profiler import Profiler
 from .exceptions import StoryError
 
 
 class Api:
     """
     Exposes functionalities for external use
+
+    The async functions process stories in an executor, so that the event
+    loop is not blocked. Cancelling them drops the work if it's not started
+    yet, while work that is running completes in the background.
+
+    The compiler and asyncio are imported only when they are used, so that
+    importing storyscript stays fast.
     """
+    executor = None
+    concurrency = None
+    semaphores = weakref.WeakKeyDictionary()
+
     @staticmethod
     def loads(string, debug=False):
         """
         Load story from a string.
         """
+        from .Story import Story
         try:
             return Story(string).process()
         except StoryError as e:
@@ -28,6 +42,7 @@ class Api:
         """
         Load story from a file stream.
         """
+        from .Story import Story
         try:
             story = Story.from_stream(stream).process()
             return {stream.name: story, 'services': story['services']}
@@ -39,11 +54,30 @@ class Api:
             else:
                 raise StoryError.internal_error(e)
 
+    @staticmethod
+    def load_source(source, name, debug=False):
+        """
+        Load story from the source and the name of a file stream, like
+        Api.load.
+        """
+        from .Story import Story
+        try:
+            story = Story(Story.clean_source(source)).process()
+            return {name: story, 'services': story['services']}
+        except StoryError as e:
+            raise e
+        except Exception as e:
+            if debug:
+                raise e
+            else:
+                raise StoryError.internal_error(e)
+
     @staticmethod
     def load_map(files, debug=False):
         """
         Load multiple stories from a file mapping
         """
+        from .Bundle import Bundle
         try:
             return Bundle(story_files=files).bundle()
         except StoryError as e:
@@ -53,3 +87,113 @@ class Api:
                 raise e
             else:
                 raise StoryError.internal_error(e)
+
+    @staticmethod
+    def profile(hook=None):
+        """
+        Reports the time spent in each phase of the compiler to a hook, by
+        default to new Timings, within a with block.
+        """
+        return Profiler.record(hook=hook)
+
+    @staticmethod
+    def memprofile():
+        """
+        Measures the peak and retained memory of each phase of the compiler
+        with tracemalloc, within a with block. It needs Python 3.9 or later.
+        """
+        return Profiler.record(hook=Memory())
+
+    @classmethod
+    def configure(cls, executor=None, concurrency=None):
+        """
+        Sets the executor used by the async functions and how many stories
+        they process at the same time. By default, the executor of the event
+        loop is used without limits. Process pools need arguments that can
+        be pickled.
+        """
+        cls.executor = executor
+        cls.concurrency = concurrency
+        cls.semaphores = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def semaphore(cls, loop):
+        """
+        Gets the semaphore limiting the concurrency in an event loop.
+        """
+        import asyncio
+        if loop not in cls.semaphores:
+            cls.semaphores[loop] = asyncio.Semaphore(cls.concurrency)
+        return cls.semaphores[loop]
+
+    @staticmethod
+    def remote(function, *args):
+        """
+        Runs a function in a worker process. Story errors can't always be
+        sent back, so they are only reported, and the caller processes the
+        story again to raise them.
+        """
+        try:
+            return True, function(*args)
+        except StoryError:
+            return False, None
+
+    @classmethod
+    async def execute(cls, function, *args):
+        """
+        Runs a function in the executor. Story errors can't be sent back
+        by process pools, so the story is processed again in a thread.
+        """
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+        loop = asyncio.get_event_loop()
+        if isinstance(cls.executor, ProcessPoolExecutor):
+            done, result = await loop.run_in_executor(cls.executor,
+                                                      cls.remote, function,
+                                                      *args)
+            if done:
+                return result
+            return await loop.run_in_executor(None, function, *args)
+        return await loop.run_in_executor(cls.executor, function, *args)
+
+    @classmethod
+    async def run(cls, function, *args):
+        """
+        Runs a function in the executor, within the concurrency limit.
+        """
+        import asyncio
+        if cls.concurrency is None:
+            return await cls.execute(function, *args)
+        async with cls.semaphore(asyncio.get_event_loop()):
+            return await cls.execute(function, *args)
+
+    @classmethod
+    async def loads_async(cls, string, debug=False):
+        """
+        Load story from a string, without blocking the event loop.
+        """
+        return await cls.run(cls.loads, string, debug)
+
+    @classmethod
+    async def load_async(cls, stream, debug=False):
+        """
+        Load story from a file stream, without blocking the event loop. The
+        stream is read here, since streams can't be sent to processes.
+        """
+        try:
+            source = stream.read()
+            name = stream.name
+        except Exception as e:
+            if debug:
+                raise e
+            else:
+                raise StoryError.internal_error(e)
+        return await cls.run(cls.load_source, source, name, debug)
+
+    @classmethod
+    async def load_map_async(cls, files, debug=False):
+        """
+        Load multiple stories from a file mapping, without blocking the
+        event loop.
+        """
+        return await cls.run(cls.load_map, files, debug)
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 import json
 
-from .Bundle import Bundle
-from .parser import Grammar
+from .Profiler import Profiler
 
 
 class App:
     """
     Exposes functionalities for internal use e.g the command line
+
+    Each function imports only the modules it needs, so that commands like
+    grammar don't load the compiler.
     """
 
     @staticmethod
@@ -15,22 +17,46 @@ class App:
         """
         Parses stories found in path, returning their trees
         """
+        from .Bundle import Bundle
         bundle = Bundle.from_path(path, ignored_path=ignored_path)
         return bundle.bundle_trees(ebnf=ebnf)
 
     @staticmethod
-    def compile(path, ignored_path=None, ebnf=None):
+    def compile(path, ignored_path=None, ebnf=None, cache=None, jobs=1):
         """
-        Parses and compiles stories found in path, returning JSON
+        Parses and compiles stories found in path, returning JSON. When a
+        cache directory is given, unchanged stories are read from it.
         """
-        bundle = Bundle.from_path(path, ignored_path=ignored_path)
-        return json.dumps(bundle.bundle(ebnf=ebnf), indent=2)
+        from .Bundle import Bundle
+        from .StoryCache import StoryCache
+        if cache:
+            cache = StoryCache(cache)
+        bundle = Bundle.from_path(path, ignored_path=ignored_path,
+                                  cache=cache)
+        results = bundle.bundle(ebnf=ebnf, jobs=jobs)
+        with Profiler.phase('json'):
+            return json.dumps(results, indent=2)
+
+    @staticmethod
+    def watch(path, output=None, ignored_path=None, ebnf=None, cache=None):
+        """
+        Compiles stories found in path every time they change, yielding
+        JSON or the errors found.
+        """
+        from .StoryCache import StoryCache
+        from .Watcher import Watcher
+        if cache:
+            cache = StoryCache(cache)
+        watcher = Watcher(path, ignored_path=ignored_path, ebnf=ebnf,
+                          cache=cache)
+        return watcher.watch(output=output)
 
     @staticmethod
     def lex(path, ebnf=None):
         """
         Lex stories, producing the list of used tokens
         """
+        from .Bundle import Bundle
         return Bundle.from_path(path).lex(ebnf=ebnf)
 
     @staticmethod
@@ -38,4 +64,5 @@ class App:
         """
         Returns the current grammar
         """
+        from .parser import Grammar
         return Grammar().build()
@@ -1,86 +1,68 @@
 # -*- coding: utf-8 -*-
 import os
 
-import delegator
-
+from .Discovery import Discovery
+from .Profiler import Profiler
 from .Story import Story
+from .StoryCache import StoryCache
+from .Workers import Workers
+from .exceptions import StoryError
 
 
 class Bundle:
     """
     Bundles all stories that must be compiled together.
+
+    Imported stories that are missing from the story files are read from
+    the disk, unless read_files is False.
     """
 
-    def __init__(self, story_files={}):
+    def __init__(self, story_files=None, cache=None, read_files=True):
         self.stories = {}
         self.story_files = story_files
+        if story_files is None:
+            self.story_files = {}
+        self.cache = cache
+        self.read_files = read_files
+        self.loaded = {}
 
     @staticmethod
-    def gitignores():
-        """
-        Get the list of files ignored by git
-        """
-        command = 'git ls-files --others --ignored --exclude-standard'
-        return delegator.run(command).out.split('\n')
-
-    @staticmethod
-    def ignores(path):
-        ignores = []
-        if os.path.isdir(path):
-            for root, subdirs, files in os.walk(path):
-                for file in files:
-                    if file.endswith('.story'):
-                        story = os.path.relpath(os.path.join(root, file))
-                        ignores.append(story)
-            return ignores
-        return [os.path.relpath(path)]
-
-    @staticmethod
-    def filter_path(root, filename, ignores):
-        if filename.endswith('.story'):
-            path = os.path.relpath(os.path.join(root, filename))
-            if path not in ignores:
-                return path
-        return None
-
-    @classmethod
-    def parse_directory(cls, directory, ignored_path=None):
+    def parse_directory(directory, ignored_path=None):
         """
         Parse a directory to find stories.
         """
-        paths = []
-        ignores = cls.gitignores()
-        if ignored_path:
-            ignores = ignores + cls.ignores(ignored_path)
-        for root, subdirs, files in os.walk(directory):
-            for file in files:
-                path = cls.filter_path(root, file, ignores)
-                if path:
-                    paths.append(path)
-        return paths
+        return Discovery.find(directory, ignored_path=ignored_path)
 
     @classmethod
-    def from_path(cls, path, ignored_path=None):
+    def from_path(cls, path, ignored_path=None, cache=None):
         """
         Load a bundle of stories from the filesystem.
         If a directory is given. all `.story` files in the directory will be
         loaded.
         """
-        bundle = Bundle()
         if os.path.isdir(path):
-            for story in cls.parse_directory(path, ignored_path=ignored_path):
+            stories = cls.parse_directory(path, ignored_path=ignored_path)
+            bundle = Bundle(story_files=Discovery.read(stories), cache=cache)
+            for story in stories:
                 bundle.load_story(story)
             return bundle
+        bundle = Bundle(cache=cache)
         bundle.load_story(path)
         return bundle
 
     def load_story(self, path):
         """
-        Reads a story file and adds it to the loaded stories
+        Reads a story file and adds it to the loaded stories. A story is
+        loaded once, so it's parsed and compiled only once.
         """
-        if path not in self.story_files:
-            self.story_files[path] = Story.read(path)
-        return Story(self.story_files[path])
+        if path not in self.loaded:
+            if path not in self.story_files:
+                if self.read_files is False:
+                    message = 'File "{}" not found in the bundle'.format(path)
+                    raise StoryError.unnamed_error(message)
+                self.story_files[path] = Story.read(path)
+            self.loaded[path] = Story(self.story_files[path])
+        return self.loaded[path]
 
     def find_stories(self):
         """
@@ -96,48 +78,183 @@ class Bundle:
         services.sort()
         return services
 
-    def compile_modules(self, stories, ebnf):
-        self.compile(stories, ebnf)
+    @staticmethod
+    def cycle(stack, path):
+        """
+        Makes the error for an import cycle, from the stack of stories being
+        visited to the story that is imported again.
+        """
+        paths = [storypath for storypath, modules in stack]
+        chain = paths[paths.index(path):] + [path]
+        message = 'Import cycle: {}'.format(' -> '.join(chain))
+        return StoryError.unnamed_error(message)
 
-    def parse_modules(self, stories, ebnf):
-        self.parse(stories, ebnf)
+    def graph(self, stories, imports, ebnf):
+        """
+        Walks the import graph of stories depth first, yielding each story
+        after the modules it imports. The imports function finds the modules
+        of a story and is called once per story, so modules shared by many
+        stories are visited only once.
+        """
+        visited = {}
+        for story in stories:
+            if story in visited:
+                continue
+            visited[story] = False
+            stack = [(story, iter(imports(story, ebnf)))]
+            while stack:
+                storypath, modules = stack[-1]
+                module = next(modules, None)
+                if module is None:
+                    stack.pop()
+                    visited[storypath] = True
+                    yield storypath
+                elif module not in visited:
+                    visited[module] = False
+                    stack.append((module, iter(imports(module, ebnf))))
+                elif visited[module] is False:
+                    raise self.cycle(stack, module)
+
+    def parse_story(self, storypath, ebnf):
+        """
+        Parses a story, unless it was parsed already, returning the modules
+        it imports.
+        """
+        story = self.load_story(storypath)
+        if story.tree is None:
+            with Profiler.story(storypath):
+                story.parse(ebnf=ebnf)
+        return story.modules()
 
     def parse(self, stories, ebnf):
         """
-        Parse stories.
+        Parse stories and the modules they import.
+        """
+        for storypath in self.graph(stories, self.parse_story, ebnf):
+            self.stories[storypath] = self.load_story(storypath).tree
+
+    def load_cached(self, story, ebnf):
+        """
+        Takes the compiled story from the cache, if it's there.
+        """
+        if story.compiled is None and self.cache:
+            story.compiled = self.cache.load(story.story, ebnf=ebnf)
+
+    def compile_imports(self, storypath, ebnf):
+        """
+        Finds the modules imported by a story, from the compiled story when
+        it's available or by parsing it.
+        """
+        story = self.load_story(storypath)
+        self.load_cached(story, ebnf)
+        if story.compiled is not None:
+            return StoryCache.modules(story.compiled)
+        return self.parse_story(storypath, ebnf)
+
+    def compile_story(self, storypath, ebnf):
+        """
+        Compiles a parsed story, unless it was found in the cache.
         """
-        for storypath in stories:
-            story = self.load_story(storypath)
-            story.parse(ebnf=ebnf)
-            self.parse_modules(story.modules(), ebnf)
-            self.stories[storypath] = story.tree
+        story = self.load_story(storypath)
+        if story.compiled is None:
+            with Profiler.story(storypath):
+                story.compile()
+            if self.cache:
+                self.cache.save(story.story, story.compiled, ebnf=ebnf)
+        self.stories[storypath] = story.compiled
 
     def compile(self, stories, ebnf):
         """
-        Reads and parses a story, then compiles its modules and finally
-        compiles the story itself.
+        Compiles stories and the modules they import. Each story is compiled
+        once, after its modules.
+        """
+        for storypath in self.graph(stories, self.compile_imports, ebnf):
+            self.compile_story(storypath, ebnf)
+
+    @staticmethod
+    def unvisited(stories, visited):
+        """
+        Gets the stories that were not visited yet, marking them as visited.
         """
-        for storypath in stories:
-            story = self.load_story(storypath)
-            story.parse(ebnf=ebnf)
-            self.compile_modules(story.modules(), ebnf)
-            story.compile()
-            self.stories[storypath] = story.compiled
+        stories = [story for story in dict.fromkeys(stories)
+                   if story not in visited]
+        visited.update(stories)
+        return stories
 
-    def bundle(self, ebnf=None):
+    def parse_parallel(self, stories, ebnf, jobs):
         """
-        Makes the bundle
+        Parses stories and their modules in a pool of processes, a level of
+        imports at a time. The trees are kept in the loaded stories, so that
+        Bundle.parse only puts them in order and parses again the stories
+        that failed, raising their errors.
         """
-        entrypoint = self.find_stories()
+        visited = set()
+        stories = self.unvisited(stories, visited)
+        with Workers(jobs, ebnf=ebnf) as workers:
+            while stories:
+                loaded = [self.load_story(story) for story in stories]
+                trees = workers.parse([story.story for story in loaded])
+                modules = []
+                for story, tree in zip(loaded, trees):
+                    story.tree = tree
+                    if tree is not None:
+                        modules = modules + story.modules()
+                stories = self.unvisited(modules, visited)
+
+    def compile_parallel(self, stories, ebnf, jobs):
+        """
+        Compiles stories and their modules in a pool of processes, a level
+        of imports at a time, like Bundle.parse_parallel. Cached stories
+        are not sent to the pool.
+        """
+        visited = set()
+        stories = self.unvisited(stories, visited)
+        with Workers(jobs, ebnf=ebnf) as workers:
+            while stories:
+                loaded = [self.load_story(story) for story in stories]
+                for story in loaded:
+                    self.load_cached(story, ebnf)
+                pending = [story for story in loaded if story.compiled is None]
+                results = workers.compile([story.story for story in pending])
+                for story, compiled in zip(pending, results):
+                    story.compiled = compiled
+                    if compiled is not None and self.cache:
+                        self.cache.save(story.story, compiled, ebnf=ebnf)
+                modules = []
+                for story in loaded:
+                    if story.compiled is not None:
+                        modules = modules + StoryCache.modules(story.compiled)
+                stories = self.unvisited(modules, visited)
+
+    def forget(self, path):
+        """
+        Forgets a story, so that it's read and compiled again.
+        """
+        self.story_files.pop(path, None)
+        self.loaded.pop(path, None)
+
+    def bundle(self, ebnf=None, jobs=1, entrypoint=None):
+        """
+        Makes the bundle, compiling stories in many processes when more than
+        one job is given. Stories that were compiled already are reused.
+        """
+        if entrypoint is None:
+            entrypoint = self.find_stories()
+        self.stories = {}
+        if jobs > 1:
+            self.compile_parallel(entrypoint, ebnf, jobs)
         self.compile(entrypoint, ebnf)
         return {'stories': self.stories, 'services': self.services(),
                 'entrypoint': entrypoint}
 
-    def bundle_trees(self, ebnf=None):
+    def bundle_trees(self, ebnf=None, jobs=1):
         """
         Makes a bundle of syntax trees
         """
-        self.parse(self.find_stories(), ebnf)
+        stories = self.find_stories()
+        if jobs > 1:
+            self.parse_parallel(stories, ebnf, jobs)
+        self.parse(stories, ebnf)
         return self.stories
 
     def lex(self, ebnf=None):
@@ -6,17 +6,32 @@ import click
 
 from click_alias import ClickAliasedGroup
 
-from .App import App
+from .Memory import Memory
+from .Profiler import Profiler
 from .Project import Project
+from .Timings import Timings
 from .Version import version as app_version
 from .exceptions import StoryError
 
 
 class Cli:
-
+    """
+    The command line. The compiler and the compile server are imported by
+    the commands that use them, so that starting the command line stays
+    fast.
+    """
     version_help = 'Prints Storyscript version'
     silent_help = 'Silent mode. Return syntax errors only.'
     ebnf_help = 'Load the grammar from a file. Useful for development'
+    ignore_help = ('Specify path of ignored files. Stories ignored by git '
+                   'are ignored too')
+    cache_help = 'Directory where compiled stories are cached'
+    jobs_help = 'Number of processes compiling stories'
+    watch_help = 'Compile stories again every time they change'
+    profile_help = ('Print the time spent in each phase of the compiler '
+                    'instead of the results, without using the cache')
+    memprofile_help = ('Print the memory used by each phase of the compiler '
+                       'instead of the results, without using the cache')
 
     @click.group(invoke_without_command=True, cls=ClickAliasedGroup)
     @click.option('--version', '-v', is_flag=True, help=version_help)
@@ -39,12 +54,12 @@ class Cli:
     @click.option('--debug', is_flag=True)
     @click.option('--ebnf', help=ebnf_help)
     @click.option('--raw', is_flag=True)
-    @click.option('--ignore', default=None,
-                  help='Specify path of ignored files')
+    @click.option('--ignore', default=None, help=ignore_help)
     def parse(path, debug, ebnf, raw, ignore):
         """
         Parses stories, producing the abstract syntax tree.
         """
+        from .App import App
         try:
             trees = App.parse(path, ignored_path=ignore, ebnf=ebnf)
             for story, tree in trees.items():
@@ -68,15 +83,46 @@ class Cli:
     @click.option('--silent', '-s', is_flag=True, help=silent_help)
     @click.option('--debug', is_flag=True)
     @click.option('--ebnf', help=ebnf_help)
-    @click.option('--ignore', default=None,
-                  help='Specify path of ignored files')
-    def compile(path, output, json, silent, debug, ebnf, ignore):
+    @click.option('--ignore', default=None, help=ignore_help)
+    @click.option('--cache', default=None, help=cache_help)
+    @click.option('--no-cache', is_flag=True,
+                  help='Compile all stories, without using the cache')
+    @click.option('--jobs', default=1, type=click.IntRange(min=1),
+                  help=jobs_help)
+    @click.option('--watch', '-w', is_flag=True, help=watch_help)
+    @click.option('--profile', is_flag=True, help=profile_help)
+    @click.option('--memprofile', is_flag=True, help=memprofile_help)
+    @click.option('--profile-format', default='text',
+                  type=click.Choice(['text', 'json']))
+    def compile(path, output, json, silent, debug, ebnf, ignore, cache,
+                no_cache, jobs, watch, profile, memprofile, profile_format):
         """
         Compiles stories and prints the resulting json
         """
+        from .App import App
+        from .Client import Client
+        from .StoryCache import StoryCache
+        if no_cache:
+            cache = None
+        elif cache is None:
+            cache = StoryCache.default_directory()
+        if watch:
+            Cli.watch(path, output, json, silent, ignore, ebnf, cache)
+            return
+        if profile or memprofile:
+            hook = Timings()
+            if memprofile:
+                try:
+                    hook = Memory()
+                except StoryError as e:
+                    e.echo()
+                    exit(1)
+            Cli.profile(hook, path, ebnf, ignore, debug, profile_format)
+            return
+        compiler = Client.running() or App
         try:
-            results = App.compile(path, ignored_path=ignore,
-                                  ebnf=ebnf)
+            results = compiler.compile(path, ignored_path=ignore,
+                                       ebnf=ebnf, cache=cache, jobs=jobs)
             if not silent:
                 if json:
                     if output:
@@ -94,6 +140,52 @@ class Cli:
                 e.echo()
                 exit(1)
 
+    @staticmethod
+    def profile(hook, path, ebnf, ignore, debug, profile_format):
+        """
+        Compiles stories in this process, printing what the hook measured in
+        each phase of the compiler. The cache is not used, since stories
+        read from it are neither parsed nor compiled.
+        """
+        from .App import App
+        try:
+            with Profiler.record(hook=hook):
+                App.compile(path, ignored_path=ignore, ebnf=ebnf)
+        except StoryError as e:
+            if debug:
+                raise e
+            e.echo()
+            exit(1)
+        finally:
+            if profile_format == 'json':
+                click.echo(hook.dumps())
+            else:
+                click.echo(hook.text())
+
+    @staticmethod
+    def watch(path, output, json, silent, ignore, ebnf, cache):
+        """
+        Compiles stories every time they change, until interrupted.
+        """
+        from .App import App
+        if json is False:
+            output = None
+        results = App.watch(path, output=output, ignored_path=ignore,
+                            ebnf=ebnf, cache=cache)
+        try:
+            for result in results:
+                if isinstance(result, StoryError):
+                    result.echo()
+                elif silent:
+                    continue
+                elif json and output is None:
+                    click.echo(result)
+                else:
+                    msg = 'Script syntax passed!'
+                    click.echo(click.style(msg, fg='green'))
+        except KeyboardInterrupt:
+            pass
+
     @staticmethod
     @main.command(aliases=['l'])
     @click.argument('path', default=os.getcwd())
@@ -103,6 +195,7 @@ class Cli:
         """
         Shows lexer tokens for given stories
         """
+        from .App import App
         try:
             results = App.lex(path, ebnf=ebnf)
             for file, tokens in results.items():
@@ -122,8 +215,29 @@ class Cli:
         """
         Prints the grammar specification
         """
+        from .App import App
         click.echo(App.grammar())
 
+    @staticmethod
+    @main.command(aliases=['s'])
+    @click.option('--socket', default=None,
+                  help='Path of the Unix socket to listen on')
+    @click.option('--port', default=None, type=int,
+                  help='Listen on a localhost port instead of a socket. '
+                  'Other users can connect to it, so it does not compile '
+                  'paths nor load grammars from files')
+    def serve(socket, port):
+        """
+        Runs a compile server. The compile command uses it when it runs on
+        the default socket.
+        """
+        from .Server import Server
+        try:
+            Server.serve(address=socket, port=port)
+        except StoryError as e:
+            e.echo()
+            exit(1)
+
     @staticmethod
     @main.command(aliases=['n'])
     @click.argument('name')
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import socket
+import stat
+import tempfile
+
+from .Version import version
+from .exceptions import RemoteError
+
+
+class Client:
+    """
+    Sends requests to a compile server started with `storyscript serve`.
+
+    Requests and responses are JSON objects on a single line. A request has
+    a method and its params, and a response has either the result or the
+    error, with the version of the server.
+    """
+
+    def __init__(self, address=None, port=None, timeout=None):
+        self.address = address
+        if address is None and port is None:
+            self.address = self.default_address()
+        self.port = port
+        self.timeout = timeout
+
+    @staticmethod
+    def default_address():
+        """
+        Gets the default path of the server socket, which is private to the
+        user.
+        """
+        root = os.environ.get('XDG_RUNTIME_DIR')
+        if root is None:
+            filename = 'storyscript-{}.sock'.format(os.getuid())
+            return os.path.join(tempfile.gettempdir(), filename)
+        return os.path.join(root, 'storyscript.sock')
+
+    @staticmethod
+    def owned(address):
+        """
+        Whether the address is a socket of the user, so that requests are
+        never sent to a server that another user started at the address.
+        """
+        try:
+            status = os.lstat(address)
+        except OSError:
+            return False
+        if stat.S_ISSOCK(status.st_mode) is False:
+            return False
+        return status.st_uid == os.getuid()
+
+    def connect(self):
+        if self.port:
+            return socket.create_connection(('127.0.0.1', self.port),
+                                            timeout=self.timeout)
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(self.timeout)
+        connection.connect(self.address)
+        return connection
+
+    def send(self, request):
+        """
+        Sends a request, returning the response. A missing response is a
+        connection error.
+        """
+        with self.connect() as connection:
+            message = '{}\n'.format(json.dumps(request))
+            connection.sendall(message.encode('utf-8'))
+            with connection.makefile('r', encoding='utf-8') as stream:
+                response = stream.readline()
+        if response.strip() == '':
+            raise ConnectionError('The server closed the connection')
+        return json.loads(response)
+
+    def request(self, method, **params):
+        """
+        Calls a method of the server, raising the errors of the server as
+        RemoteError.
+        """
+        response = self.send({'method': method, 'params': params})
+        if 'error' in response:
+            error = response['error']
+            raise RemoteError(error['message'], error['short_message'])
+        return response['result']
+
+    @classmethod
+    def running(cls):
+        """
+        Gets a client for the server at the default address, if a server of
+        the same version is running there, on a socket of the user.
+        """
+        client = cls(timeout=1)
+        if cls.owned(client.address) is False:
+            return None
+        try:
+            response = client.send({'method': 'version', 'params': {}})
+        except (OSError, ValueError):
+            return None
+        if response.get('result') != version:
+            return None
+        client.timeout = None
+        return client
+
+    def compile(self, path, ignored_path=None, ebnf=None, cache=None,
+                jobs=1):
+        """
+        Compiles stories like App.compile. Relative paths are resolved from
+        the current directory.
+        """
+        return self.request('compile', path=path, directory=os.getcwd(),
+                            ignored_path=ignored_path, ebnf=ebnf,
+                            cache=cache, jobs=jobs)
+
+    def loads(self, string):
+        return self.request('loads', string=string)
+
+    def load_map(self, files):
+        """
+        Compiles stories like Api.load_map. On the Unix socket, imports
+        missing from the files are read from the current directory.
+        """
+        if self.port:
+            return self.request('load_map', files=files)
+        return self.request('load_map', files=files, directory=os.getcwd())
+
+    def lex(self, string, ebnf=None):
+        return self.request('lex', string=string, ebnf=ebnf)
+
+    def parse(self, string, ebnf=None):
+        return self.request('parse', string=string, ebnf=ebnf)
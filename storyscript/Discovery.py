@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .Gitignore import Gitignore
+from .Story import Story
+
+
+class Discovery:
+    """
+    Finds the stories in a directory, skipping the directories ignored by
+    git, and reads them concurrently.
+    """
+
+    @staticmethod
+    def join(directory, name):
+        if directory == '.':
+            return name
+        return os.path.join(directory, name)
+
+    @staticmethod
+    def ignores(path):
+        """
+        Gets the stories of a path that must be ignored.
+        """
+        ignores = set()
+        if os.path.isdir(path):
+            for root, subdirs, files in os.walk(path):
+                for file in files:
+                    if file.endswith('.story'):
+                        story = os.path.relpath(os.path.join(root, file))
+                        ignores.add(story)
+            return ignores
+        ignores.add(os.path.relpath(path))
+        return ignores
+
+    @staticmethod
+    def scan(directory):
+        """
+        Lists the entries of a directory, or nothing if it can't be read.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return list(entries)
+        except OSError:
+            return []
+
+    @classmethod
+    def find(cls, directory, ignored_path=None):
+        """
+        Finds the stories in a directory, in the order of os.walk. Paths
+        are relative to the current directory.
+        """
+        ignores = set()
+        if ignored_path:
+            ignores = cls.ignores(ignored_path)
+        gitignore = Gitignore.from_directory(directory)
+        paths = []
+        stack = [os.path.relpath(directory)]
+        while stack:
+            current = stack.pop()
+            gitignore.load(current)
+            base = gitignore.relative(current)
+            if base:
+                base = base + '/'
+            subdirs = []
+            for entry in cls.scan(current):
+                if entry.is_dir():
+                    if entry.is_symlink() is False:
+                        if not gitignore.ignored(base + entry.name, True):
+                            subdirs.append(cls.join(current, entry.name))
+                elif entry.name.endswith('.story'):
+                    if not gitignore.ignored(base + entry.name):
+                        path = cls.join(current, entry.name)
+                        if path not in ignores:
+                            paths.append(path)
+            stack.extend(reversed(subdirs))
+        return paths
+
+    @staticmethod
+    def read(paths, jobs=None):
+        """
+        Reads stories with a pool of threads, since reading many files is
+        bound by the file system, returning their sources by path.
+        """
+        if len(paths) < 2:
+            return {path: Story.read(path) for path in paths}
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return dict(zip(paths, executor.map(Story.read, paths)))
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import re
+import struct
+
+
+class Gitignore:
+    """
+    Matches paths against the patterns of the .gitignore files of a git
+    repository, the repository exclude file and the global ignore file,
+    following the rules of git.
+
+    Paths are relative to the root of the repository, or to the searched
+    directory outside repositories. Ignored directories are not walked,
+    unless they contain files tracked in the index.
+
+    Like git, files tracked in the index are never ignored. The global
+    ignore file is the one set by core.excludesFile in the git config files.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.patterns = []
+        self.loaded = set()
+        self.tracked = set()
+
+    @staticmethod
+    def find_root(directory):
+        """
+        Finds the root of the git repository a directory is in, or the
+        directory itself when it's not in a repository.
+        """
+        path = directory
+        while True:
+            if os.path.exists(os.path.join(path, '.git')):
+                return path
+            parent = os.path.dirname(path)
+            if parent == path:
+                return directory
+            path = parent
+
+    @staticmethod
+    def config_files(root):
+        """
+        Gets the git config files that apply to a repository, from the
+        global ones to the one of the repository.
+        """
+        home = os.path.expanduser('~')
+        config = os.environ.get('XDG_CONFIG_HOME')
+        if config is None:
+            config = os.path.join(home, '.config')
+        return [os.path.join(config, 'git', 'config'),
+                os.path.join(home, '.gitconfig'),
+                os.path.join(root, '.git', 'config')]
+
+    @staticmethod
+    def config_string(value):
+        """
+        Reads the value of a git config option, removing quotes, escapes
+        and comments.
+        """
+        string = ''
+        quoted = False
+        i = 0
+        while i < len(value):
+            char = value[i]
+            if char == '"':
+                quoted = not quoted
+            elif char == '\\' and i + 1 < len(value):
+                i += 1
+                string += {'n': '\n', 't': '\t'}.get(value[i], value[i])
+            elif char in '#;' and quoted is False:
+                break
+            else:
+                string += char
+            i += 1
+        return string.strip()
+
+    @classmethod
+    def config_value(cls, path, section, key):
+        """
+        Gets the last value of an option in a git config file, or None when
+        it's not set there.
+        """
+        try:
+            with io.open(path, 'r') as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None
+        value = None
+        current = None
+        for line in lines:
+            line = line.strip()
+            if line.startswith('['):
+                current = line[1:].split(']', 1)[0].strip().lower()
+            elif current == section and '=' in line:
+                name, option = line.split('=', 1)
+                if name.strip().lower() == key:
+                    value = cls.config_string(option)
+        return value
+
+    @classmethod
+    def excludes_file(cls, root):
+        """
+        Gets the path of the global ignore file, as configured by
+        core.excludesFile, or the default one when the option is not set.
+        The config files are read in-process, so that git is never run.
+        """
+        path = None
+        for config in cls.config_files(root):
+            value = cls.config_value(config, 'core', 'excludesfile')
+            if value is not None:
+                path = value
+        if not path:
+            return cls.global_file()
+        return os.path.join(root, os.path.expanduser(path))
+
+    @staticmethod
+    def index_varint(data, offset):
+        """
+        Reads a variable-length integer of the version 4 index, giving the
+        integer and the offset after it.
+        """
+        byte = data[offset]
+        value = byte & 0x7f
+        while byte & 0x80:
+            offset += 1
+            byte = data[offset]
+            value = ((value + 1) << 7) | (byte & 0x7f)
+        return value, offset + 1
+
+    @classmethod
+    def index_paths(cls, data):
+        """
+        Reads the paths of the entries of a git index, or nothing when the
+        index is in a version that is not known.
+        """
+        if len(data) < 12 or data[:4] != b'DIRC':
+            return []
+        version, count = struct.unpack('>II', data[4:12])
+        if version not in (2, 3, 4):
+            return []
+        paths = []
+        path = b''
+        offset = 12
+        for _ in range(count):
+            start = offset
+            flags = struct.unpack('>H', data[offset + 60:offset + 62])[0]
+            offset += 62
+            if version > 2 and flags & 0x4000:
+                offset += 2
+            if version == 4:
+                strip, offset = cls.index_varint(data, offset)
+                end = data.index(b'\0', offset)
+                path = path[:len(path) - strip] + data[offset:end]
+                offset = end + 1
+            else:
+                end = data.index(b'\0', offset)
+                path = data[offset:end]
+                offset = start + (end - start + 8) // 8 * 8
+            paths.append(path.decode('utf-8', 'surrogateescape'))
+        return paths
+
+    def load_index(self, path):
+        """
+        Loads the files tracked in a git index, with the directories that
+        contain them.
+        """
+        try:
+            with io.open(path, 'rb') as f:
+                data = f.read()
+            paths = self.index_paths(data)
+        except (OSError, ValueError, IndexError, struct.error):
+            return
+        for tracked in paths:
+            while tracked and tracked not in self.tracked:
+                self.tracked.add(tracked)
+                tracked = tracked.rpartition('/')[0]
+
+    @staticmethod
+    def global_file():
+        """
+        Gets the path of the default global ignore file of git.
+        """
+        root = os.environ.get('XDG_CONFIG_HOME')
+        if root is None:
+            root = os.path.join(os.path.expanduser('~'), '.config')
+        return os.path.join(root, 'git', 'ignore')
+
+    @staticmethod
+    def translate(pattern):
+        """
+        Translates a glob pattern to a regular expression, where `*` and `?`
+        don't match slashes and `**` matches any number of directories.
+        """
+        regex = ''
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith('**/', i):
+                regex += '(?:.*/)?'
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                regex += '.*'
+                i += 2
+                continue
+            if char == '*':
+                regex += '[^/]*'
+            elif char == '?':
+                regex += '[^/]'
+            elif char == '[' and ']' in pattern[i + 2:]:
+                end = pattern.index(']', i + 2)
+                content = pattern[i + 1:end].replace('\\', '\\\\')
+                if content[0] in '!^':
+                    content = '^' + content[1:]
+                regex += '[{}]'.format(content)
+                i = end
+            elif char == '\\' and i + 1 < len(pattern):
+                i += 1
+                regex += re.escape(pattern[i])
+            else:
+                regex += re.escape(char)
+            i += 1
+        return regex
+
+    @classmethod
+    def parse(cls, line):
+        """
+        Parses a line of an ignore file, giving the compiled pattern,
+        whether it's negated and whether it matches only directories.
+        """
+        if line.endswith('\\ '):
+            line = line[:-2].rstrip(' ') + '\\ '
+        else:
+            line = line.rstrip(' ')
+        if line == '' or line.startswith('#'):
+            return None
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        directory = line.endswith('/')
+        line = line.rstrip('/')
+        if line == '':
+            return None
+        regex = cls.translate(line.lstrip('/'))
+        if '/' not in line:
+            regex = '(?:.*/)?' + regex
+        return re.compile(regex), negate, directory
+
+    def load_file(self, path, base=''):
+        """
+        Loads the patterns of an ignore file, applying to the paths in the
+        base directory.
+        """
+        try:
+            with io.open(path, 'r') as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+        for line in lines:
+            pattern = self.parse(line)
+            if pattern:
+                self.patterns.append((base,) + pattern)
+
+    def relative(self, path):
+        """
+        Gets the path relative to the root, with slashes as separators.
+        """
+        path = os.path.relpath(os.path.abspath(path), self.root)
+        if path == '.':
+            return ''
+        return path.replace(os.sep, '/')
+
+    def load(self, directory):
+        """
+        Loads the .gitignore file of a directory, if any.
+        """
+        base = self.relative(directory)
+        if base not in self.loaded:
+            self.loaded.add(base)
+            self.load_file(os.path.join(directory, '.gitignore'), base)
+
+    def matches(self, path, directory=False):
+        """
+        Whether the patterns ignore a path relative to the root. The last
+        pattern matching the path decides.
+        """
+        for base, regex, negate, only_directories in reversed(self.patterns):
+            if only_directories and directory is False:
+                continue
+            if base:
+                if path.startswith(base + '/') is False:
+                    continue
+                subpath = path[len(base) + 1:]
+            else:
+                subpath = path
+            if regex.fullmatch(subpath):
+                return negate is False
+        return False
+
+    def ignored(self, path, directory=False):
+        """
+        Whether a path relative to the root is ignored. Tracked paths are
+        not ignored. Directories containing tracked files are walked even
+        when they are ignored, so the other paths in them stay ignored.
+        """
+        name = path.rsplit('/', 1)[-1]
+        if directory and name == '.git':
+            return True
+        if path in self.tracked:
+            return False
+        parent = path.rpartition('/')[0]
+        while parent in self.tracked:
+            if self.matches(parent, True):
+                return True
+            parent = parent.rpartition('/')[0]
+        return self.matches(path, directory)
+
+    @classmethod
+    def from_directory(cls, directory):
+        """
+        Makes the matcher for a directory, loading the ignore files that
+        apply to it: the global one, the exclude file of the repository and
+        the .gitignore files of the parent directories, and the index of the
+        repository.
+        """
+        directory = os.path.abspath(directory)
+        root = cls.find_root(directory)
+        gitignore = cls(root)
+        gitignore.load_file(cls.excludes_file(root))
+        gitignore.load_file(os.path.join(root, '.git', 'info', 'exclude'))
+        gitignore.load_index(os.path.join(root, '.git', 'index'))
+        parents = []
+        path = directory
+        while path != root:
+            path = os.path.dirname(path)
+            parents.insert(0, path)
+        for parent in parents:
+            gitignore.load(parent)
+        return gitignore
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import tracemalloc
+
+from .Timings import Timings
+from .exceptions import StoryError
+
+
+class Memory(Timings):
+    """
+    A profiler hook that measures with tracemalloc the peak memory of every
+    phase of every story, and the memory the phase retains, which is mostly
+    what it produces: the source, the tree, the compiled lines or the JSON.
+
+    Tracing starts with the first phase and stops when the hook is closed.
+    The peak is reset at the start of every phase, which tracemalloc can do
+    only from Python 3.9, so the hook can't be made on older versions.
+    """
+    artifacts = {'read': 'source', 'clean': 'source', 'lark': 'parser',
+                 'parse': 'tree', 'transform': 'tree', 'preprocess': 'tree',
+                 'compile': 'lines', 'json': 'json'}
+
+    def __init__(self):
+        if self.supported() is False:
+            message = 'Measuring memory needs Python 3.9 or later'
+            raise StoryError.unnamed_error(message)
+        super().__init__()
+        self.local = threading.local()
+        self.tracing = False
+        self.peak = 0
+
+    def frames(self):
+        """
+        Gets the phases running in this thread, the innermost last.
+        """
+        if hasattr(self.local, 'frames') is False:
+            self.local.frames = []
+        return self.local.frames
+
+    def trace(self):
+        if tracemalloc.is_tracing() is False:
+            tracemalloc.start()
+            self.tracing = True
+
+    @staticmethod
+    def supported():
+        """
+        Whether tracemalloc can reset the peak.
+        """
+        return hasattr(tracemalloc, 'reset_peak')
+
+    def start(self, phase, story):
+        """
+        Starts measuring a phase. The peak of the phases around it is kept
+        before resetting it.
+        """
+        self.trace()
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self.frames():
+            frame['peak'] = max(frame['peak'], peak)
+        tracemalloc.reset_peak()
+        self.frames().append({'current': current, 'peak': current})
+
+    def __call__(self, phase, story, elapsed):
+        frames = self.frames()
+        if frames == []:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        frame = frames.pop()
+        peak = max(frame['peak'], peak)
+        for outer in frames:
+            outer['peak'] = max(outer['peak'], peak)
+        with self.lock:
+            self.peak = max(self.peak, peak)
+            phases = self.stories.setdefault(story, {})
+            top, retained, calls = phases.get(phase, (0, 0, 0))
+            phases[phase] = (max(top, peak - frame['current']),
+                             retained + current - frame['current'],
+                             calls + 1)
+
+    def close(self):
+        """
+        Stops tracing, if it was started by this hook.
+        """
+        if self.tracing:
+            tracemalloc.stop()
+            self.tracing = False
+
+    def total(self):
+        """
+        Gets the memory retained by all phases.
+        """
+        total = 0
+        for phases in self.stories.values():
+            for peak, retained, calls in phases.values():
+                total += retained
+        return total
+
+    def results(self):
+        """
+        Gets the peak and retained memory as a list of stories, in bytes.
+        """
+        results = []
+        for path in self.paths():
+            phases = {}
+            for phase in self.sort(self.stories[path]):
+                peak, retained, calls = self.stories[path][phase]
+                phases[phase] = {'peak': peak, 'retained': retained,
+                                 'calls': calls,
+                                 'artifact': self.artifacts.get(phase)}
+            results.append({'story': path, 'phases': phases})
+        return results
+
+    def dumps(self):
+        return json.dumps({'stories': self.results(), 'peak': self.peak,
+                           'retained': self.total()}, indent=2)
+
+    def text(self):
+        """
+        Formats the memory as a human-readable table, in KiB.
+        """
+        lines = []
+        for result in self.results():
+            lines.append(result['story'] or '(shared)')
+            for phase, memory in result['phases'].items():
+                line = '  {:<12}{:>10.1f} KiB peak{:>10.1f} KiB retained'
+                line = line.format(phase, memory['peak'] / 1024,
+                                   memory['retained'] / 1024)
+                if memory['artifact']:
+                    line = '{} ({})'.format(line, memory['artifact'])
+                lines.append(line)
+        lines.append('Peak{:>20.1f} KiB'.format(self.peak / 1024))
+        return '\n'.join(lines)
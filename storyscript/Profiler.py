@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import threading
+import time
+
+from .Timings import Timings
+
+
+class Profiler:
+    """
+    Measures the phases of the compiler and reports them to hooks. Hooks are
+    callables that receive the phase, the path of the story and the elapsed
+    seconds. Without hooks, phases are not measured.
+
+    Hooks can also have a start method, called with the phase and the story
+    when the phase begins, and a close method, called when they are removed
+    by Profiler.record.
+
+    Phases are attributed to the story being processed by the thread, which
+    is None for work shared by all stories, like building the parser.
+    """
+    hooks = []
+    local = threading.local()
+
+    @classmethod
+    def add(cls, hook):
+        cls.hooks.append(hook)
+
+    @classmethod
+    def remove(cls, hook):
+        if hook in cls.hooks:
+            cls.hooks.remove(hook)
+
+    @classmethod
+    def current(cls):
+        """
+        Gets the story being processed by this thread.
+        """
+        return getattr(cls.local, 'story', None)
+
+    @classmethod
+    @contextlib.contextmanager
+    def story(cls, path):
+        """
+        Attributes the phases measured in this thread to a story.
+        """
+        previous = cls.current()
+        cls.local.story = path
+        try:
+            yield
+        finally:
+            cls.local.story = previous
+
+    @classmethod
+    @contextlib.contextmanager
+    def phase(cls, name):
+        """
+        Measures a phase and reports it to the hooks, even when it fails.
+        """
+        if not cls.hooks:
+            yield
+            return
+        story = cls.current()
+        hooks = list(cls.hooks)
+        for hook in hooks:
+            if hasattr(hook, 'start'):
+                hook.start(name, story)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for hook in reversed(hooks):
+                hook(name, story, elapsed)
+
+    @classmethod
+    @contextlib.contextmanager
+    def record(cls, hook=None):
+        """
+        Reports phases to a hook, by default to new Timings, until the
+        context exits.
+        """
+        if hook is None:
+            hook = Timings()
+        cls.add(hook)
+        try:
+            yield hook
+        finally:
+            cls.remove(hook)
+            if hasattr(hook, 'close'):
+                hook.close()
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import socketserver
+
+from .Api import Api
+from .App import App
+from .Bundle import Bundle
+from .Client import Client
+from .Story import Story
+from .Version import version
+from .exceptions import StoryError
+from .parser import Parser
+
+
+class Server:
+    """
+    A long-lived process that compiles stories on request, so that callers
+    don't pay the startup of Python, the imports and the initialization of
+    the parser every time. The protocol is described by Client.
+
+    Requests are handled one at a time, since the parser is shared.
+
+    Anyone on the machine can connect to a local port, unlike the Unix
+    socket, so requests reading or writing files of the server, like
+    compile, a custom grammar or the directory of load_map, are accepted
+    only on the socket.
+    """
+    methods = ['version', 'compile', 'loads', 'load_map', 'lex', 'parse']
+    file_methods = ['compile']
+    file_params = ['ebnf', 'directory']
+
+    class Handler(socketserver.StreamRequestHandler):
+
+        def handle(self):
+            local = isinstance(self.server, socketserver.UnixStreamServer)
+            for line in self.rfile:
+                response = Server.respond(line, local=local)
+                message = '{}\n'.format(json.dumps(response))
+                self.wfile.write(message.encode('utf-8'))
+
+    @staticmethod
+    def version():
+        return version
+
+    @staticmethod
+    def compile(path, directory, ignored_path=None, ebnf=None, cache=None,
+                jobs=1):
+        """
+        Compiles stories like App.compile, from the directory of the client.
+        """
+        working_directory = os.getcwd()
+        os.chdir(directory)
+        try:
+            return App.compile(path, ignored_path=ignored_path, ebnf=ebnf,
+                               cache=cache, jobs=jobs)
+        finally:
+            os.chdir(working_directory)
+
+    @staticmethod
+    def loads(string):
+        return Api.loads(string)
+
+    @staticmethod
+    def load_map(files, directory=None):
+        """
+        Compiles stories like Api.load_map. Imports missing from the files
+        are read from the directory of the client when it's given, and are
+        errors otherwise, so that files of the server are never read.
+        """
+        if directory is None:
+            return Bundle(story_files=files, read_files=False).bundle()
+        working_directory = os.getcwd()
+        os.chdir(directory)
+        try:
+            return Api.load_map(files)
+        finally:
+            os.chdir(working_directory)
+
+    @staticmethod
+    def lex(string, ebnf=None):
+        tokens = Story(string).lex(ebnf=ebnf)
+        return [[token.type, token.value] for token in tokens]
+
+    @staticmethod
+    def parse(string, ebnf=None):
+        story = Story(string)
+        story.parse(ebnf=ebnf)
+        return story.tree.pretty()
+
+    @staticmethod
+    def error(error):
+        """
+        Formats an error. Errors that can't be formatted are sent as their
+        plain text, so that the client always gets a response.
+        """
+        try:
+            return {'message': error.message(),
+                    'short_message': error.short_message()}
+        except Exception:
+            message = 'Error: {}'.format(error.error)
+            return {'message': message, 'short_message': message}
+
+    @classmethod
+    def uses_files(cls, method, params):
+        """
+        Whether a request reads or writes files of the server.
+        """
+        if method in cls.file_methods:
+            return True
+        for param in cls.file_params:
+            if params.get(param) is not None:
+                return True
+        return False
+
+    @classmethod
+    def respond(cls, line, local=True):
+        """
+        Handles a request, giving the response. Requests that are not local
+        can't use files of the server.
+        """
+        try:
+            request = json.loads(line)
+            method = request['method']
+            params = request.get('params', {})
+            if method not in cls.methods:
+                message = 'Unknown method {}'.format(method)
+                raise StoryError.unnamed_error(message)
+            if local is False and cls.uses_files(method, params):
+                message = ('Method {} with files is only allowed on the '
+                           'Unix socket').format(method)
+                raise StoryError.unnamed_error(message)
+            result = getattr(cls, method)(**params)
+            return {'result': result, 'version': version}
+        except StoryError as error:
+            return {'error': cls.error(error), 'version': version}
+        except Exception as error:
+            error = StoryError.internal_error(error)
+            return {'error': cls.error(error), 'version': version}
+
+    @staticmethod
+    def remove_stale(address):
+        """
+        Removes the socket left by a server that is not running anymore.
+        Sockets of running servers or of other users are kept, so that a
+        server never takes over the socket of another one.
+        """
+        if os.path.lexists(address) is False:
+            return
+        if Client.owned(address) is False:
+            message = '{} is not a socket of the user'.format(address)
+            raise StoryError.unnamed_error(message)
+        try:
+            Client(address=address, timeout=1).connect().close()
+        except OSError:
+            os.remove(address)
+            return
+        message = 'A server is already running at {}'.format(address)
+        raise StoryError.unnamed_error(message)
+
+    @classmethod
+    def make(cls, address=None, port=None):
+        """
+        Makes the socket server, on a local port or on a Unix socket. The
+        socket is created with a restrictive umask, so that only the user
+        can ever connect to it.
+        """
+        if port:
+            server = socketserver.TCPServer(('127.0.0.1', port), cls.Handler,
+                                            bind_and_activate=False)
+            server.allow_reuse_address = True
+            server.server_bind()
+            server.server_activate()
+            return server
+        if address is None:
+            address = Client.default_address()
+        cls.remove_stale(address)
+        umask = os.umask(0o177)
+        try:
+            return socketserver.UnixStreamServer(address, cls.Handler)
+        finally:
+            os.umask(umask)
+
+    @classmethod
+    def serve(cls, address=None, port=None):
+        """
+        Initializes the parser and serves requests until interrupted.
+        """
+        Parser().lark()
+        server = cls.make(address=address, port=port)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if port is None:
+                os.remove(server.server_address)
@@ -5,6 +5,7 @@ import re
 
 from lark.exceptions import UnexpectedInput, UnexpectedToken
 
+from .Profiler import Profiler
 from .compiler import Compiler
 from .exceptions import CompilerError, StoryError, StorySyntaxError
 from .parser import Parser
@@ -19,6 +20,8 @@ class Story:
     def __init__(self, story, path=None):
         self.story = story
         self.path = path
+        self.tree = None
+        self.compiled = None
 
     @staticmethod
     def remove_comments(source):
@@ -39,9 +42,10 @@ class Story:
         """
         Cleans a story by removing all comments.
         """
-        return re.sub(
-            r'###[^#]+###', cls.delete_line, cls.remove_comments(source)
-        )
+        with Profiler.phase('clean'):
+            return re.sub(
+                r'###[^#]+###', cls.delete_line, cls.remove_comments(source)
+            )
 
     @classmethod
     def read(cls, path):
@@ -50,8 +54,11 @@ class Story:
         """
         msg = None
         try:
-            with io.open(path, 'r') as file:
-                return cls.clean_source(file.read())
+            with Profiler.story(path):
+                with Profiler.phase('read'):
+                    with io.open(path, 'r') as file:
+                        source = file.read()
+                return cls.clean_source(source)
         except FileNotFoundError:
             abspath = os.path.abspath(path)
             msg = 'File "{}" not found at {}'.format(path, abspath)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+from .Version import version
+
+
+class StoryCache:
+    """
+    Persists compiled stories in a directory, keyed by the content of the
+    story, the grammar and the Storyscript version, so that unchanged
+    stories are not parsed nor compiled again.
+
+    The parser is imported only when a checksum is needed, so that commands
+    sent to a compile server don't load it. The revision is increased when
+    the compiler output changes within a version.
+    """
+    revision = 1
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.checksums = {}
+
+    @staticmethod
+    def default_directory():
+        """
+        Gets the default directory, inside the user cache directory where
+        parsers are cached too. It follows the XDG specification.
+        """
+        root = os.environ.get('XDG_CACHE_HOME')
+        if root is None:
+            root = os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(root, 'storyscript', 'stories')
+
+    def checksum(self, ebnf):
+        """
+        Gets the checksum of the grammar, computing it once per grammar.
+        """
+        if ebnf not in self.checksums:
+            from .parser import Parser
+            self.checksums[ebnf] = Parser(ebnf=ebnf).checksum()
+        return self.checksums[ebnf]
+
+    def key(self, source, ebnf=None):
+        """
+        Identifies a story source compiled with a grammar.
+        """
+        values = (self.revision, version, self.checksum(ebnf), source)
+        string = '{}\n{}\n{}\n{}'.format(*values)
+        return hashlib.sha1(string.encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, '{}.json'.format(key))
+
+    def load(self, source, ebnf=None):
+        """
+        Loads the compiled story for a source, if any.
+        """
+        try:
+            with io.open(self.path(self.key(source, ebnf)), 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def save(self, source, compiled, ebnf=None):
+        """
+        Saves a compiled story. The file is written atomically and failing
+        to write it is not an error.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=self.directory)
+        except OSError:
+            return
+        try:
+            with io.open(handle, 'w') as f:
+                json.dump(compiled, f)
+            os.replace(temporary, self.path(self.key(source, ebnf)))
+        except Exception:
+            os.remove(temporary)
+
+    @staticmethod
+    def modules(compiled):
+        """
+        Gets the paths of the modules imported by a compiled story.
+        """
+        modules = []
+        for path in compiled['modules'].values():
+            if path.endswith('.story') is False:
+                path = '{}.story'.format(path)
+            modules.append(path)
+        return modules
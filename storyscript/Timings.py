@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+
+
+class Timings:
+    """
+    A profiler hook that adds up the wall time and the calls of every phase
+    of every story.
+    """
+    order = ('read', 'clean', 'lark', 'parse', 'transform', 'preprocess',
+             'compile', 'json')
+
+    def __init__(self):
+        self.stories = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, phase, story, elapsed):
+        with self.lock:
+            phases = self.stories.setdefault(story, {})
+            time, calls = phases.get(phase, (0, 0))
+            phases[phase] = (time + elapsed, calls + 1)
+
+    @classmethod
+    def sort(cls, phases):
+        """
+        Sorts phases in the order they run, followed by unknown phases.
+        """
+        def key(phase):
+            if phase in cls.order:
+                return (cls.order.index(phase), phase)
+            return (len(cls.order), phase)
+        return sorted(phases, key=key)
+
+    def paths(self):
+        """
+        Gets the stories, followed by the work shared by all stories.
+        """
+        paths = sorted(path for path in self.stories if path is not None)
+        if None in self.stories:
+            paths.append(None)
+        return paths
+
+    def total(self):
+        total = 0
+        for phases in self.stories.values():
+            for time, calls in phases.values():
+                total += time
+        return total
+
+    def results(self):
+        """
+        Gets the timings as a list of stories, with times in milliseconds.
+        """
+        results = []
+        for path in self.paths():
+            phases = {}
+            for phase in self.sort(self.stories[path]):
+                time, calls = self.stories[path][phase]
+                phases[phase] = {'time': time * 1000, 'calls': calls}
+            results.append({'story': path, 'phases': phases})
+        return results
+
+    def dumps(self):
+        return json.dumps({'stories': self.results(),
+                           'total': self.total() * 1000}, indent=2)
+
+    def text(self):
+        """
+        Formats the timings as a human-readable table.
+        """
+        lines = []
+        for result in self.results():
+            lines.append(result['story'] or '(shared)')
+            for phase, timing in result['phases'].items():
+                line = '  {:<12}{:>10.2f} ms{:>6} {}'
+                calls = 'call'
+                if timing['calls'] != 1:
+                    calls = 'calls'
+                lines.append(line.format(phase, timing['time'],
+                                         timing['calls'], calls))
+        lines.append('Total{:>19.2f} ms'.format(self.total() * 1000))
+        return '\n'.join(lines)
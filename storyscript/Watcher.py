@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+import tempfile
+import time
+
+from .Bundle import Bundle
+from .Discovery import Discovery
+from .exceptions import StoryError
+
+
+class Watcher:
+    """
+    Watches the stories found in a path and the modules they import, and
+    compiles the bundle again when they change.
+
+    The bundle is kept between changes, so only the stories that changed are
+    read, parsed and compiled again, while the other ones and the parser are
+    reused. Files are polled, comparing their modification time and size.
+    """
+
+    def __init__(self, path, ignored_path=None, ebnf=None, cache=None):
+        self.path = path
+        self.ignored_path = ignored_path
+        self.ebnf = ebnf
+        self.bundle = Bundle(cache=cache)
+        self.entrypoint = []
+        self.snapshot = {}
+
+    def find(self):
+        """
+        Finds the stories in the watched path.
+        """
+        if os.path.isdir(self.path):
+            return Discovery.find(self.path, ignored_path=self.ignored_path)
+        return [self.path]
+
+    @staticmethod
+    def stat(paths):
+        """
+        Gets the modification time and size of files that exist.
+        """
+        stats = {}
+        for path in paths:
+            try:
+                result = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (result.st_mtime_ns, result.st_size)
+        return stats
+
+    def update(self):
+        """
+        Finds the stories that were changed, added or removed since the
+        last update, and makes the bundle forget them.
+        """
+        entrypoint = self.find()
+        snapshot = self.stat(entrypoint + list(self.bundle.loaded))
+        changed = []
+        for path in set(snapshot) | set(self.snapshot):
+            if snapshot.get(path) != self.snapshot.get(path):
+                self.bundle.forget(path)
+                changed.append(path)
+        self.entrypoint = entrypoint
+        self.snapshot = snapshot
+        return sorted(changed)
+
+    def remember(self):
+        """
+        Adds the modules loaded by the last build to the snapshot, so that
+        the modules outside the watched path are not found as new changes
+        by the next update.
+        """
+        loaded = [path for path in self.bundle.loaded
+                  if path not in self.snapshot]
+        self.snapshot.update(self.stat(loaded))
+
+    def compile(self):
+        """
+        Compiles the bundle, returning JSON.
+        """
+        try:
+            results = self.bundle.bundle(ebnf=self.ebnf,
+                                         entrypoint=self.entrypoint)
+        finally:
+            self.remember()
+        return json.dumps(results, indent=2)
+
+    @staticmethod
+    def write(output, results):
+        """
+        Writes the results atomically, so that readers of the output never
+        see a partial bundle.
+        """
+        directory = os.path.dirname(os.path.abspath(output))
+        handle, temporary = tempfile.mkstemp(dir=directory)
+        try:
+            with io.open(handle, 'w') as f:
+                f.write(results)
+            os.replace(temporary, output)
+        except Exception:
+            os.remove(temporary)
+            raise
+
+    def watch(self, output=None, interval=1):
+        """
+        Compiles the stories every time they change, yielding the results or
+        the error. The output file is written after each successful build.
+        """
+        while True:
+            if self.update():
+                try:
+                    results = self.compile()
+                    if output:
+                        self.write(output, results)
+                    yield results
+                except StoryError as error:
+                    yield error
+            time.sleep(interval)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
+
+from .Story import Story
+from .exceptions import StoryError
+
+
+class Workers:
+    """
+    A pool of processes that parse and compile stories independently. Each
+    process keeps its parser in Parser.larks, so the parser is initialized
+    once per process, by its first story.
+
+    Stories that can't be parsed or compiled give None, so that they can be
+    processed again where the error must be raised.
+    """
+
+    def __init__(self, jobs, ebnf=None):
+        self.ebnf = ebnf
+        self.executor = ProcessPoolExecutor(max_workers=jobs)
+
+    @staticmethod
+    def parse_source(source, ebnf):
+        try:
+            story = Story(source)
+            story.parse(ebnf=ebnf)
+            return story.tree
+        except StoryError:
+            return None
+
+    @staticmethod
+    def compile_source(source, ebnf):
+        try:
+            return Story(source).process(ebnf=ebnf)
+        except StoryError:
+            return None
+
+    def map(self, function, sources):
+        ebnfs = [self.ebnf] * len(sources)
+        return list(self.executor.map(function, sources, ebnfs))
+
+    def parse(self, sources):
+        """
+        Parses story sources, returning their trees in the same order.
+        """
+        return self.map(Workers.parse_source, sources)
+
+    def compile(self, sources):
+        """
+        Compiles story sources, returning the results in the same order.
+        """
+        return self.map(Workers.compile_source, sources)
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
@@ -2,6 +2,7 @@
 from .Lines import Lines
 from .Objects import Objects
 from .Preprocessor import Preprocessor
+from ..Profiler import Profiler
 from ..Version import version
 from ..exceptions import CompilerError, StorySyntaxError
 from ..parser import Tree
@@ -11,9 +12,22 @@ class Compiler:
 
     """
     Compiles Storyscript abstract syntax tree to JSON.
+
+    Nested blocks are compiled with an explicit stack of work instead of
+    recursion, so that the nesting of stories is bounded by memory and not
+    by the interpreter stack. Subtrees found while compiling a tree are
+    scheduled, and compiled in order after it.
     """
+    allowed_nodes = ['service_block', 'absolute_expression', 'assignment',
+                     'if_block', 'elseif_block', 'else_block',
+                     'foreach_block', 'function_block', 'when_block',
+                     'try_block', 'catch_block', 'finally_block',
+                     'return_statement', 'arguments', 'imports', 'while_block',
+                     'raise_statement', 'mutation_block', 'indented_chain']
+
     def __init__(self):
         self.lines = Lines()
+        self.scheduled = None
 
     @staticmethod
     def output(tree):
@@ -170,14 +184,17 @@ class Compiler:
         nested_block = tree.nested_block
         args = Objects.assertion(tree.if_statement)
         self.lines.set_scope(line, parent)
+        self.lines.enter_branch(line)
         self.lines.append('if', line, args=args, enter=nested_block.line(),
                           parent=parent)
         self.subtree(nested_block, parent=line)
         trees = []
-        for block in [tree.elseif_block, tree.else_block]:
-            if block:
-                trees.append(block)
+        for block in tree.children:
+            if isinstance(block, Tree):
+                if block.data in ['elseif_block', 'else_block']:
+                    trees.append(block)
         self.subtrees(*trees)
+        self.schedule(self.lines.exit_branch)
 
     def elseif_block(self, tree, parent):
         """
@@ -290,13 +307,15 @@ class Compiler:
         line = tree.line()
         nested_block = tree.nested_block
         self.lines.set_scope(line, parent)
+        self.lines.enter_branch(line)
         self.lines.append('try', line, enter=nested_block.line(),
                           parent=parent)
         self.subtree(nested_block, parent=line)
         if tree.catch_block:
-            self.catch_block(tree.catch_block, parent=parent)
+            self.subtree(tree.catch_block, parent=parent)
         if tree.finally_block:
-            self.finally_block(tree.finally_block, parent=parent)
+            self.subtree(tree.finally_block, parent=parent)
+        self.schedule(self.lines.exit_branch)
 
     def raise_statement(self, tree, parent):
         """
@@ -340,22 +359,47 @@ class Compiler:
         for tree in trees:
             self.subtree(tree)
 
-    def subtree(self, tree, parent=None):
+    def walk(self, function, *args):
+        """
+        Runs a compiling function and the work it schedules, depth first,
+        using an explicit stack.
+        """
+        stack = [(function, args)]
+        try:
+            while stack:
+                function, args = stack.pop()
+                self.scheduled = []
+                function(*args)
+                stack.extend(reversed(self.scheduled))
+        finally:
+            self.scheduled = None
+
+    def schedule(self, function, *args):
+        """
+        Schedules work after the tree being compiled and the work scheduled
+        before. Outside of a walk, the work is done at once.
         """
-        Parses a subtree, checking whether it should be compiled directly
+        if self.scheduled is None:
+            self.walk(function, *args)
+            return
+        self.scheduled.append((function, args))
+
+    def dispatch(self, tree, parent):
+        """
+        Compiles a subtree, checking whether it should be compiled directly
         or keep parsing for deeper trees.
         """
-        allowed_nodes = ['service_block', 'absolute_expression', 'assignment',
-                         'if_block', 'elseif_block', 'else_block',
-                         'foreach_block', 'function_block', 'when_block',
-                         'try_block', 'return_statement', 'arguments',
-                         'imports', 'while_block', 'raise_statement',
-                         'mutation_block', 'indented_chain']
-        if tree.data in allowed_nodes:
+        if tree.data in self.allowed_nodes:
             getattr(self, tree.data)(tree, parent)
             return
         self.parse_tree(tree, parent=parent)
 
+    def subtree(self, tree, parent=None):
+        """
+        Parses a subtree, after the tree being compiled.
+        """
+        self.schedule(self.dispatch, tree, parent)
+
     def parse_tree(self, tree, parent=None):
         """
         Parses a tree looking for subtrees.
@@ -370,9 +414,11 @@ class Compiler:
 
     @classmethod
     def compile(cls, tree, debug=False):
-        tree = Preprocessor.process(tree)
+        with Profiler.phase('preprocess'):
+            tree = Preprocessor.process(tree)
         compiler = cls.compiler()
-        compiler.parse_tree(tree)
+        with Profiler.phase('compile'):
+            compiler.parse_tree(tree)
         lines = compiler.lines
         return {'tree': lines.lines, 'services': lines.get_services(),
                 'entrypoint': lines.first(), 'modules': lines.modules,
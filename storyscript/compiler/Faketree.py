@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
-import random
-import uuid
+import itertools
 
 from lark.lexer import Token
 
@@ -10,30 +9,37 @@ from ..parser import Tree
 class FakeTree:
     """
     Creates fake trees that are not in the original story source.
+
+    Fake lines and names are allocated in order, so compiling the same
+    story always gives the same result. Names are counted by the given
+    counter, that is shared by the fake trees of a story.
     """
-    def __init__(self, block):
+    def __init__(self, block, names=None):
         self.block = block
-        self.original_line = block.line()
+        self.original_line = block.position('line')
         self.new_lines = []
+        if names is None:
+            names = itertools.count()
+        self.names = names
 
     def line(self):
         """
-        Creates fake line numbers. The numbers are decreasing, so that the
-        resulting tree is compiled correctly.
+        Creates fake line numbers, between the previous line and the line of
+        the block, each one after the previous one so that the resulting tree
+        is compiled correctly. For a block at line 12, they are 11.1 to 11.9,
+        then 11.91 to 11.99, 11.991 and so on.
         """
-        lower_bound = float(self.original_line) - 1.0
-        upper_bound = float(self.original_line)
-        if len(self.new_lines) > 0:
-            lower_bound = self.new_lines[-1]
-        fake_line = random.uniform(lower_bound, upper_bound)
+        count = len(self.new_lines)
+        fraction = '9' * (count // 9) + str(count % 9 + 1)
+        fake_line = '{}.{}'.format(self.original_line - 1, fraction)
         self.new_lines.append(fake_line)
-        return str(fake_line)
+        return fake_line
 
     def get_line(self, tree):
         """
         Gets the tree line if it's a new one, otherwise creates it.
         """
-        if float(tree.line()) in self.new_lines:
+        if tree.line() in self.new_lines:
             return tree.line()
         return self.line()
 
@@ -42,7 +48,7 @@ class FakeTree:
         Creates a fake tree path.
         """
         if name is None:
-            name = '${}'.format(uuid.uuid4().hex[:8])
+            name = '${}'.format(next(self.names))
         if line is None:
             line = self.line()
         return Tree('path', [Token('NAME', name, line=line)])
@@ -52,7 +58,7 @@ class FakeTree:
         Creates a fake assignment tree, equivalent to "$fake = value"
         """
         line = self.get_line(value)
-        value.child(0).child(0).line = line
+        value.set_line(line)
         path = self.path(line=line)
         equals = Token('EQUALS', '=', line=line)
         fragment = Tree('assignment_fragment', [equals, value])
@@ -60,12 +66,10 @@ class FakeTree:
 
     def add_assignment(self, value):
         """
-        Creates an assignments and adds it to the current block
+        Creates an assignments and adds it to the current block, before its
+        last child, so that it follows the fake assignments added before it.
         """
         assignment = self.assignment(value)
-        if self.block.child(1):
-            children = [self.block.child(0), assignment, self.block.child(1)]
-            self.block.children = children
-        else:
-            self.block.children = [assignment, self.block.child(0)]
+        children = self.block.children
+        self.block.children = children[:-1] + [assignment] + children[-1:]
         return assignment
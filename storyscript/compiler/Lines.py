@@ -1,38 +1,61 @@
 # -*- coding: utf-8 -*-
+import bisect
+
+from .Symbols import Symbols
 from ..exceptions import StorySyntaxError
 
 
 class Lines:
     """
     Holds compiled lines and provides methods for operation on lines.
+
+    Line numbers are kept ordered as lines are added, together with their
+    numeric values, so that the first and last lines are always at hand.
     """
     def __init__(self):
         self.lines = {}
-        self.variables = []
+        self.ordered = []
+        self.numbers = []
+        self.variables = Symbols()
         self.services = []
         self.functions = {}
         self.output_scopes = {}
         self.modules = {}
+        self.branches = []
 
     def sort(self):
         """
         Returns ordered line numbers
         """
-        return sorted(self.lines.keys(), key=lambda x: float(x))
+        return self.ordered
+
+    def add(self, line):
+        """
+        Adds a line number to the ordered line numbers. Lines are compiled
+        in order nearly always, so it's usually appended.
+        """
+        number = float(line)
+        if self.numbers and number < self.numbers[-1]:
+            index = bisect.bisect(self.numbers, number)
+            self.numbers.insert(index, number)
+            self.ordered.insert(index, line)
+            return
+        self.numbers.append(number)
+        self.ordered.append(line)
 
     def first(self):
         """
         Gets the first line.
         """
-        if self.lines:
-            return self.sort()[0]
+        if self.ordered:
+            return self.ordered[0]
 
     def last(self):
         """
         Gets the last line
         """
-        if self.lines:
-            return self.sort()[-1]
+        if self.ordered:
+            return self.ordered[-1]
 
     def set_name(self, name):
         """
@@ -50,23 +73,39 @@ class Lines:
         if previous_line:
             self.lines[previous_line]['next'] = line_number
 
+    def enter_branch(self, line):
+        """
+        Opens a branching construct, as if and try blocks. Its branches are
+        tracked on a stack, so that nested constructs don't get mixed up.
+        """
+        self.branches.append(line)
+
     def set_exit(self, line):
         """
-        Sets the current line as the exit line for a previous one, as needed
-        in if/elif/else and try/catch/finally blocks.
+        Sets the current line as the exit line for the previous branch of
+        the open construct, as needed in if/elif/else and try/catch/finally
+        blocks. The current line becomes the previous branch.
+        """
+        if self.branches:
+            self.lines[self.branches[-1]]['exit'] = line
+            self.branches[-1] = line
+
+    def exit_branch(self):
+        """
+        Closes the innermost branching construct.
         """
-        methods = ['if', 'elif', 'try', 'catch']
-        for line_number in self.sort()[::-1]:
-            if self.lines[line_number]['method'] in methods:
-                self.lines[line_number]['exit'] = line
-                break
+        self.branches.pop()
 
     def set_scope(self, line, parent, output=[]):
         """
         Keeps track of output scopes so that defined outputs are recognized for
-        nested children.
+        nested children. Each scope holds the outputs visible from it, its own
+        and those of its parents.
         """
-        self.output_scopes[line] = {'parent': parent, 'output': output}
+        visible = self.output_scopes.get(parent, frozenset())
+        if output:
+            visible = visible.union(output)
+        self.output_scopes[line] = visible
 
     def is_output(self, parent, service):
         """
@@ -74,11 +113,7 @@ class Lines:
         or for its parents.
         """
         if parent in self.output_scopes:
-            scope = self.output_scopes[parent]
-            if service in scope['output']:
-                return True
-            if scope['parent']:
-                return self.is_output(scope['parent'], service)
+            return service in self.output_scopes[parent]
         return False
 
     def make(self, method, line, name=None, args=None, service=None,
@@ -87,22 +122,21 @@ class Lines:
         """
         Creates the base dictionary for a given line.
         """
-        dictionary = {
-            line: {
-                'method': method,
-                'ln': line,
-                'output': output,
-                'name': name,
-                'service': service,
-                'command': command,
-                'function': function,
-                'args': args,
-                'enter': enter,
-                'exit': exit,
-                'parent': parent
-            }
+        if line not in self.lines:
+            self.add(line)
+        self.lines[line] = {
+            'method': method,
+            'ln': line,
+            'output': output,
+            'name': name,
+            'service': service,
+            'command': command,
+            'function': function,
+            'args': args,
+            'enter': enter,
+            'exit': exit,
+            'parent': parent
         }
-        self.lines = {**self.lines, **dictionary}
 
     def service_method(self, service, line):
         """
@@ -123,7 +157,8 @@ class Lines:
         if method == 'function':
             self.functions[kwargs['function']] = line
         elif method == 'set':
-            self.variables.append(kwargs['name'])
+            parent = kwargs.get('parent')
+            self.variables.declare(kwargs['name'], line, parent=parent)
         elif method == 'execute':
             if self.is_output(kwargs['parent'], kwargs['service']) is False:
                 self.services.append(kwargs['service'])
@@ -138,6 +173,7 @@ class Lines:
 
     def get_services(self):
         """
-        Get the services and remove duplicates.
+        Get the services and remove duplicates, keeping the order in which
+        they are used, so that the output doesn't depend on hashing.
         """
-        return list(set(self.services))
+        return list(dict.fromkeys(self.services))
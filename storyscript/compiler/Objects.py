@@ -74,7 +74,7 @@ class Objects:
         if len(names) > 1:
             for name in names[1:]:
                 fragment = Tree('path_fragment', [Token('NAME', name)])
-                tree.children.append(fragment)
+                tree.append(fragment)
         return tree
 
     @classmethod
@@ -220,48 +220,75 @@ class Objects:
         return types[operator]
 
     @classmethod
-    def resolve_operand(cls, tree):
+    def operand(cls, tree):
         """
-        Resolves an operand to its value or to the corresponding expression,
-        in case of nested operands.
+        Resolves an operand to its value, or finds the expression tree of a
+        nested operand. Returns the expression tree and the value.
         """
         if (len(tree.children) > 1):
-            return cls.expression(tree)
+            return tree, None
         if tree.data == 'number':
-            return cls.number(tree)
+            return None, cls.number(tree)
         elif tree.exponential:
             if (len(tree.exponential.children)) > 1:
-                return cls.expression(tree.exponential)
+                return tree.exponential, None
             elif tree.exponential.factor.expression:
-                return cls.expression(tree.exponential.factor.expression)
-            return cls.entity(tree.exponential.factor.entity)
+                return tree.exponential.factor.expression, None
+            return None, cls.entity(tree.exponential.factor.entity)
         elif tree.factor:
             if tree.factor.expression:
-                return cls.expression(tree.factor.expression)
+                return tree.factor.expression, None
         elif tree.entity:
-            return cls.entity(tree.entity)
-        return cls.entity(tree.factor.entity)
+            return None, cls.entity(tree.entity)
+        return None, cls.entity(tree.factor.entity)
 
     @classmethod
-    def expression_values(cls, children):
-        values = []
-        for child in children:
-            if isinstance(child, Tree):
-                values.append(cls.resolve_operand(child))
-        return values
+    def resolve_operand(cls, tree):
+        """
+        Resolves an operand to its value or to the corresponding expression,
+        in case of nested operands.
+        """
+        expression, value = cls.operand(tree)
+        if expression is None:
+            return value
+        return cls.expression(expression)
+
+    @staticmethod
+    def operands(tree):
+        """
+        Finds the operands of an expression tree.
+        """
+        children = tree.children
+        if len(children) == 1:
+            children = tree.child(0).children
+        return [child for child in children if isinstance(child, Tree)]
 
     @classmethod
     def expression(cls, tree):
         """
-        Compiles an expression object with the given tree.
+        Compiles an expression object with the given tree. Nested
+        expressions are compiled with an explicit stack, so that their
+        depth is not bounded by recursion.
         """
-        if len(tree.children) == 1:
-            values = cls.expression_values(tree.child(0).children)
-        else:
-            values = cls.expression_values(tree.children)
-        expression_type = Objects.expression_type(tree.find_operator(), tree)
-        return {'$OBJECT': 'expression', 'expression': expression_type,
-                'values': values}
+        item = {'$OBJECT': 'expression', 'expression': None, 'values': []}
+        stack = [(tree, item, iter(cls.operands(tree)))]
+        while stack:
+            current, item, operands = stack[-1]
+            for operand in operands:
+                expression, value = cls.operand(operand)
+                if expression is not None:
+                    value = {'$OBJECT': 'expression', 'expression': None,
+                             'values': []}
+                    stack.append((expression, value,
+                                  iter(cls.operands(expression))))
+                item['values'].append(value)
+                if expression is not None:
+                    break
+            else:
+                stack.pop()
+                operator = current.find_operator()
+                item['expression'] = cls.expression_type(operator, current)
+        return item
 
     @classmethod
     def assertion(cls, tree):
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+import itertools
+
 from .Faketree import FakeTree
+from ..parser import Tree
 
 
 class Preprocessor:
@@ -9,11 +12,11 @@ class Preprocessor:
     """
 
     @staticmethod
-    def fake_tree(block):
+    def fake_tree(block, names):
         """
         Get a fake tree
         """
-        return FakeTree(block)
+        return FakeTree(block, names=names)
 
     @staticmethod
     def replace_expression(fake_tree, parent, inline_expression):
@@ -27,81 +30,133 @@ class Preprocessor:
         entity.path.replace(0, assignment.path.child(0))
 
     @classmethod
-    def replace_in_entity(cls, block, statement, entity):
+    def replace_in_entity(cls, fake_tree, statement, entity):
         """
         Replaces an inline expression inside an entity branch.
         """
-        fake_tree = cls.fake_tree(block)
         line = statement.line()
         service = entity.path.inline_expression.service
+        cls.service_arguments(fake_tree, service)
         assignment = fake_tree.add_assignment(service)
         entity.replace(0, assignment.path)
-        entity.path.children[0].line = line
+        entity.path.set_line(line)
+
+    @staticmethod
+    def inline_arguments(service):
+        """
+        Finds the arguments of a service that are inline expressions.
+        """
+        arguments = []
+        fragment = service.service_fragment
+        if fragment is None:
+            return arguments
+        for child in fragment.children:
+            if isinstance(child, Tree) and child.data == 'arguments':
+                if child.node('entity.path.inline_expression'):
+                    arguments.append(child)
+        return arguments
 
     @classmethod
-    def service_arguments(cls, block, service):
+    def service_arguments(cls, fake_tree, service):
         """
-        Processes the arguments of a service, replacing inline expressions
-        """
-        fake_tree = cls.fake_tree(block)
-        for argument in service.find_data('arguments'):
+        Processes the arguments of a service, replacing inline expressions,
+        including the ones nested in other inline expressions, for example:
+        alpine echo text:(random value length:(random number))
+
+        Nested expressions are replaced first, so that their fake
+        assignments come before the ones using them. A stack is used
+        instead of recursion, since expressions can be nested deeply.
+        """
+        stack = [(argument, False)
+                 for argument in reversed(cls.inline_arguments(service))]
+        while stack:
+            argument, nested_done = stack.pop()
             expression = argument.node('entity.path.inline_expression')
-            if expression:
+            if nested_done:
                 cls.replace_expression(fake_tree, argument, expression)
+                continue
+            stack.append((argument, True))
+            for nested in reversed(cls.inline_arguments(expression.service)):
+                stack.append((nested, False))
 
     @classmethod
-    def assignment_expression(cls, block, tree):
+    def assignment_expression(cls, fake_tree, tree):
         """
         Processess an assignment to an expression, replacing it
         """
-        fake_tree = cls.fake_tree(block)
-        parent = block.rules.assignment.assignment_fragment
+        parent = fake_tree.block.rules.assignment.assignment_fragment
+        cls.service_arguments(fake_tree, tree.inline_expression.service)
         cls.replace_expression(fake_tree, parent, tree.inline_expression)
 
     @classmethod
-    def assignments(cls, block):
+    def assignment(cls, fake_tree):
         """
-        Process assignments, looking for inline expressions, for example:
+        Processes the assignment of a block, looking for inline expressions,
+        for example:
         a = alpine echo text:(random value) or a = (alpine echo message:'text')
         """
-        for assignment in block.find_data('assignment'):
-            fragment = assignment.assignment_fragment
-            if fragment.service:
-                cls.service_arguments(block, fragment.service)
-            elif fragment.expression:
-                factor = fragment.expression.multiplication.exponential.factor
-                if factor.entity.path:
-                    if factor.entity.path.inline_expression:
-                        cls.assignment_expression(block, factor.entity.path)
+        block = fake_tree.block
+        if block.rules is None or block.rules.assignment is None:
+            return
+        fragment = block.rules.assignment.assignment_fragment
+        if fragment.service:
+            cls.service_arguments(fake_tree, fragment.service)
+        elif fragment.expression:
+            factor = fragment.expression.multiplication.exponential.factor
+            if factor.entity.path:
+                if factor.entity.path.inline_expression:
+                    cls.assignment_expression(fake_tree, factor.entity.path)
 
     @classmethod
-    def service(cls, tree):
+    def service(cls, fake_tree):
         """
         Processes services, looking for inline expressions, for example:
         alpine echo text:(random value)
         """
-        service = tree.node('service_block.service')
+        service = fake_tree.block.node('service_block.service')
         if service:
-            cls.service_arguments(tree, service)
+            cls.service_arguments(fake_tree, service)
 
     @classmethod
-    def flow_statement(cls, name, block):
+    def flow_statement(cls, fake_tree, statement):
         """
-        Processes if statements, looking inline expressions.
+        Processes an if or else if statement, looking for inline expressions.
         """
-        for statement in block.find_data(name):
-            if statement.node('entity.path.inline_expression'):
-                cls.replace_in_entity(block, statement, statement.entity)
+        if statement.node('entity.path.inline_expression'):
+            cls.replace_in_entity(fake_tree, statement, statement.entity)
+
+        if statement.child(2):
+            if statement.child(2).node('entitypath.inline_expression'):
+                cls.replace_in_entity(fake_tree, statement, statement.child(2))
 
-            if statement.child(2):
-                if statement.child(2).node('entitypath.inline_expression'):
-                    cls.replace_in_entity(block, statement, statement.child(2))
+    @classmethod
+    def if_block(cls, fake_tree):
+        """
+        Processes the statements of an if block and of its else if blocks.
+        """
+        if_block = fake_tree.block.if_block
+        if if_block is None:
+            return
+        cls.flow_statement(fake_tree, if_block.if_statement)
+        for child in if_block.children:
+            if isinstance(child, Tree) and child.data == 'elseif_block':
+                cls.flow_statement(fake_tree, child.elseif_statement)
 
     @classmethod
     def process(cls, tree):
+        """
+        Processes every block once, handling only the statements that belong
+        to the block itself. Nested blocks come before the blocks containing
+        them, so inline expressions are moved to the innermost block.
+
+        Each block has its own fake tree, so that its fake lines follow each
+        other, while the names of fake variables are counted for the whole
+        story.
+        """
+        names = itertools.count()
         for block in tree.find_data('block'):
-            cls.assignments(block)
-            cls.service(block)
-            cls.flow_statement('if_statement', block)
-            cls.flow_statement('elseif_statement', block)
+            fake_tree = cls.fake_tree(block, names)
+            cls.assignment(fake_tree)
+            cls.service(fake_tree)
+            cls.if_block(fake_tree)
         return tree
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import json
+
+
+class Symbols:
+    """
+    Holds the variables declared in a story, with the line and the scope
+    where they were declared.
+
+    Variable names are lists of names, as made by Objects.names, and are
+    hashed to tuples, so looking them up takes constant time.
+    """
+    def __init__(self):
+        self.symbols = {}
+
+    @staticmethod
+    def key(name):
+        """
+        Makes the hashable key of a name. Parts of the name that are not
+        strings, like indexes, are encoded to JSON.
+        """
+        key = []
+        for part in name:
+            if isinstance(part, str) is False:
+                part = json.dumps(part, sort_keys=True)
+            key.append(part)
+        return tuple(key)
+
+    def declare(self, name, line, parent=None):
+        """
+        Declares a variable. Later declarations of the same variable keep
+        the first one.
+        """
+        key = self.key(name)
+        if key not in self.symbols:
+            self.symbols[key] = {'name': name, 'line': line, 'parent': parent}
+
+    def get(self, name):
+        """
+        Gets the symbol of a variable, if it was declared.
+        """
+        return self.symbols.get(self.key(name))
+
+    def __contains__(self, name):
+        return self.key(name) in self.symbols
+
+    def __len__(self):
+        return len(self.symbols)
@@ -4,5 +4,7 @@ from .Faketree import FakeTree
 from .Lines import Lines
 from .Objects import Objects
 from .Preprocessor import Preprocessor
+from .Symbols import Symbols
 
-__all__ = ['Compiler', 'FakeTree', 'Lines', 'Objects', 'Preprocessor']
+__all__ = ['Compiler', 'FakeTree', 'Lines', 'Objects', 'Preprocessor',
+           'Symbols']
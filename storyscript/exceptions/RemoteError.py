@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from .StoryError import StoryError
+
+
+class RemoteError(StoryError):
+    """
+    An error of a story processed by the compile server, carrying the
+    messages made by the server.
+    """
+
+    def __init__(self, message, short_message, path=None):
+        super().__init__(None, None, path=path)
+        self.remote_message = message
+        self.remote_short_message = short_message
+
+    def message(self):
+        return self.remote_message
+
+    def short_message(self):
+        return self.remote_short_message
@@ -3,8 +3,6 @@ import os
 
 import click
 
-from lark.exceptions import UnexpectedCharacters, UnexpectedToken
-
 from .CompilerError import CompilerError
 from ..ErrorCodes import ErrorCodes
 from ..Intention import Intention
@@ -92,6 +90,7 @@ class StoryError(SyntaxError):
         """
         Identifies the error.
         """
+        from lark.exceptions import UnexpectedCharacters, UnexpectedToken
         if hasattr(self.error, 'error'):
             if not isinstance(self.error.error, str):
                 return ErrorCodes.unidentified_error
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from .CompilerError import CompilerError
 from .ProcessingError import ProcessingError
+from .RemoteError import RemoteError
 from .StoryError import StoryError
 from .StorySyntaxError import StorySyntaxError
 
-__all__ = ['CompilerError', 'ProcessingError', 'StoryError',
+__all__ = ['CompilerError', 'ProcessingError', 'RemoteError', 'StoryError',
            'StorySyntaxError']
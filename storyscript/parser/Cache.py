@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import pickle
+import tempfile
+
+import lark
+from lark.parsers.lalr_analysis import Reduce, Shift
+
+from ..Version import version
+
+
+class Cache:
+    """
+    Persists analysed Lark parsers in the user cache directory, so that the
+    parse tables are built only once and not by every command.
+
+    Cached parsers are keyed by the Lark and Storyscript versions and by the
+    grammar fingerprint, so any change invalidates them. The revision is
+    increased when the content of cached parsers changes.
+    """
+    actions = {'Shift': Shift, 'Reduce': Reduce}
+    revision = 2
+
+    @staticmethod
+    def directory():
+        """
+        Finds the cache directory, following the XDG specification.
+        """
+        root = os.environ.get('XDG_CACHE_HOME')
+        if root is None:
+            root = os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(root, 'storyscript')
+
+    @classmethod
+    def path(cls, fingerprint):
+        """
+        Gets the path of the cached parser for a grammar fingerprint.
+        """
+        filename = 'parser-{}-{}-{}-{}.pickle'.format(cls.revision,
+                                                      lark.__version__,
+                                                      version, fingerprint)
+        return os.path.join(cls.directory(), filename)
+
+    @classmethod
+    def restore_actions(cls, parser):
+        """
+        Restores the LALR actions of an unpickled parser. Lark compares them
+        by identity, so the copies made by pickle must be replaced.
+        """
+        states = parser.parser.parser._parse_table.states
+        for state in states.values():
+            for token, (action, argument) in state.items():
+                state[token] = (cls.actions[action.name], argument)
+
+    @classmethod
+    def load(cls, fingerprint):
+        """
+        Loads the cached parser for the given fingerprint, if any.
+        """
+        try:
+            with io.open(cls.path(fingerprint), 'rb') as f:
+                parser = pickle.load(f)
+            cls.restore_actions(parser)
+            return parser
+        except Exception:
+            return None
+
+    @classmethod
+    def save(cls, fingerprint, parser):
+        """
+        Saves a parser to the cache. The file is written atomically, so that
+        concurrent commands never read a partial file. Failing to write the
+        cache is not an error.
+        """
+        try:
+            os.makedirs(cls.directory(), exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=cls.directory())
+        except OSError:
+            return
+        try:
+            with io.open(handle, 'wb') as f:
+                pickle.dump(parser, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, cls.path(fingerprint))
+        except Exception:
+            os.remove(temporary)
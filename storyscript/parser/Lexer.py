@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from lark.lexer import ContextualLexer, TraditionalLexer
+
+
+class Lexer(ContextualLexer):
+    """
+    A contextual lexer that builds the lexer of a parser state only when the
+    state is reached, since a story uses only a small part of the grammar.
+
+    It's used only by Standalone, with the version of Lark the tables were
+    generated with, so the private parts of Lark are imported only then.
+    """
+    def __init__(self, terminals, states, ignore=(), always_accept=()):
+        self.terminals = terminals
+        self.states = states
+        self.ignore = ignore
+        self.always_accept = always_accept
+        self.lexers = {}
+        self.lexers_by_tokens = {}
+        self.root_lexer = TraditionalLexer(terminals, ignore=ignore)
+        self.set_parser_state(None)
+
+    def state_lexer(self, state):
+        """
+        Gets the lexer for a parser state, building it if needed. States
+        that accept the same tokens share the same lexer.
+        """
+        if state not in self.lexers:
+            key = frozenset(self.states[state])
+            if key not in self.lexers_by_tokens:
+                accepts = key | set(self.ignore) | set(self.always_accept)
+                terminals = []
+                for terminal in self.terminals:
+                    if terminal.name in accepts:
+                        terminals.append(terminal)
+                lexer = TraditionalLexer(terminals, ignore=self.ignore)
+                self.lexers_by_tokens[key] = lexer
+            self.lexers[state] = self.lexers_by_tokens[key]
+        return self.lexers[state]
+
+    def lex(self, stream):
+        from lark.lexer import _Lex
+        lexer = _Lex(self.state_lexer(self.parser_state), self.parser_state)
+        newline_types = self.root_lexer.newline_types
+        ignore_types = self.root_lexer.ignore_types
+        for token in lexer.lex(stream, newline_types, ignore_types):
+            yield token
+            lexer.lexer = self.state_lexer(self.parser_state)
+            lexer.state = self.parser_state
@@ -1,19 +1,32 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import io
+import threading
 
 from lark import Lark
 
+from .Cache import Cache
 from .Grammar import Grammar
 from .Indenter import CustomIndenter
+from .Standalone import Standalone
 from .Transformer import Transformer
 from .Tree import Tree
+from ..Profiler import Profiler
 
 
 class Parser:
     """
     Wraps up the parser submodule and exposes parsing and lexing
     functionalities.
+
+    Lark instances are shared by all parsers of the process and persisted in
+    the cache directory, since building the parse tables is far more
+    expensive than parsing a story. They keep the state of the lexer while
+    parsing, so threads parse one at a time.
     """
+    larks = {}
+    lock = threading.Lock()
+
     def __init__(self, algo='lalr', ebnf=None):
         self.algo = algo
         self.ebnf = ebnf
@@ -38,11 +51,80 @@ class Parser:
                 return f.read()
         return Grammar().build()
 
+    def fingerprint(self, grammar):
+        """
+        Identifies a grammar and the algorithm used to analyse it.
+        """
+        string = '{}\n{}'.format(self.algo, grammar)
+        return hashlib.sha1(string.encode('utf-8')).hexdigest()
+
+    def checksum(self):
+        """
+        Identifies the grammar used by the parser, without building the
+        default grammar when the standalone parser is used.
+        """
+        if self.ebnf is None and Standalone.supports(self.algo):
+            return Standalone.fingerprint()
+        return self.fingerprint(self.grammar())
+
+    def inline(self):
+        """
+        Whether the transformer is applied while parsing, which Lark
+        supports only for LALR.
+        """
+        return self.algo == 'lalr'
+
+    def build(self, grammar, fingerprint):
+        """
+        Loads the Lark instance for a grammar from the cache, or initializes
+        it and caches it.
+        """
+        lark = Cache.load(fingerprint)
+        if lark is None:
+            options = {'parser': self.algo, 'postlex': self.indenter()}
+            if self.inline():
+                options['transformer'] = self.transformer()
+            lark = Lark(grammar, **options)
+            Cache.save(fingerprint, lark)
+        return lark
+
+    def dynamic(self):
+        """
+        Get the grammar and initialize Lark, or reuse the instance that was
+        built for the same grammar.
+        """
+        grammar = self.grammar()
+        fingerprint = self.fingerprint(grammar)
+        if fingerprint not in self.larks:
+            with Profiler.story(None), Profiler.phase('lark'):
+                self.larks[fingerprint] = self.build(grammar, fingerprint)
+        return self.larks[fingerprint]
+
     def lark(self):
         """
-        Get the grammar and initialize Lark.
+        Get the parser. The default grammar uses the standalone parser, so
+        that the grammar is not built nor analysed, while grammars loaded
+        from a file use Lark.
+        """
+        if self.ebnf is None and Standalone.supports(self.algo):
+            fingerprint = Standalone.fingerprint()
+            if fingerprint not in self.larks:
+                with Profiler.story(None), Profiler.phase('lark'):
+                    standalone = Standalone(postlex=self.indenter(),
+                                            transformer=self.transformer())
+                self.larks[fingerprint] = standalone
+            return self.larks[fingerprint]
+        return self.dynamic()
+
+    def generate(self, path):
+        """
+        Generates the tables of the standalone parser from the grammar.
         """
-        return Lark(self.grammar(), parser=self.algo, postlex=self.indenter())
+        grammar = self.grammar()
+        lark = Lark(grammar, parser=self.algo, postlex=self.indenter())
+        source = Standalone.source(lark, self.fingerprint(grammar))
+        with io.open(path, 'w') as f:
+            f.write(source)
 
     def parse(self, source):
         """
@@ -52,8 +134,12 @@ class Parser:
             return Tree('empty', [])
         source = '{}\n'.format(source)
         lark = self.lark()
-        tree = lark.parse(source)
-        return self.transformer().transform(tree)
+        with self.lock, Profiler.phase('parse'):
+            tree = lark.parse(source)
+        if self.inline():
+            return tree
+        with Profiler.phase('transform'):
+            return self.transformer().transform(tree)
 
     def lex(self, source):
         """
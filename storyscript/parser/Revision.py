@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+
+class Revision:
+    """
+    Counts the changes of first children in a group of trees, usually the
+    trees of a story, so that a change invalidates only the first tokens
+    remembered by that group.
+
+    Groups are joined when a tree remembers a first token found through the
+    trees of another group, and a joined group forwards to the group it was
+    joined with.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.parent = None
+
+    def root(self):
+        """
+        Finds the group this revision belongs to, shortening the way for the
+        next lookups.
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        revision = self
+        while revision.parent is not None:
+            revision.parent, revision = root, revision.parent
+        return root
+
+    def join(self, other):
+        """
+        Joins the group of another revision, returning the joined group.
+        """
+        root = self.root()
+        other = other.root()
+        if other is not root:
+            other.parent = root
+        return root
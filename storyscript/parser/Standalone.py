@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import collections
+import pprint
+
+import lark
+from lark.grammar import NonTerminal, Rule, RuleOptions, Terminal
+from lark.lexer import PatternRE, PatternStr, TerminalDef
+from lark.parse_tree_builder import ParseTreeBuilder
+from lark.parsers.lalr_analysis import ParseTable, Reduce, Shift
+from lark.tree import Tree
+
+from . import Tables
+from .Lexer import Lexer
+
+
+class Standalone:
+    """
+    A LALR parser for the default grammar that is built from the tables
+    generated by Parser.generate, instead of analysing the grammar.
+    It exposes the same parse and lex methods of Lark.
+
+    The private parts of Lark are imported only when the parser is made,
+    which happens only when Standalone.supports the installed version, so
+    that other versions can still use the dynamic Lark.
+    """
+    patterns = {'str': PatternStr, 're': PatternRE}
+
+    def __init__(self, postlex=None, transformer=None):
+        self.postlex = postlex
+        self.transformer = transformer
+        self.terminals = self.make_terminals()
+        self.rules = self.make_rules()
+        self.parse_table = self.make_parse_table(self.rules)
+        self.parser = self.make_parser()
+        self.lexer = self.make_lexer()
+
+    @staticmethod
+    def fingerprint():
+        """
+        Gets the fingerprint of the grammar the tables were generated from.
+        """
+        return Tables.fingerprint
+
+    @staticmethod
+    def supports(algo):
+        """
+        Whether the tables can be used for the given algorithm with the
+        installed version of Lark.
+        """
+        return algo == 'lalr' and Tables.lark_version == lark.__version__
+
+    @classmethod
+    def make_terminals(cls):
+        terminals = []
+        for name, pattern, value, flags, priority in Tables.terminals:
+            pattern = cls.patterns[pattern](value, flags)
+            terminals.append(TerminalDef(name, pattern, priority))
+        return terminals
+
+    @staticmethod
+    def make_rules():
+        rules = []
+        for origin, expansion, alias, options in Tables.rules:
+            symbols = []
+            for name, is_term, filter_out in expansion:
+                if is_term:
+                    symbols.append(Terminal(name, filter_out=filter_out))
+                else:
+                    symbols.append(NonTerminal(name))
+            rule_options = None
+            if options:
+                rule_options = RuleOptions(*options)
+            rules.append(Rule(NonTerminal(origin), symbols, alias=alias,
+                              options=rule_options))
+        return rules
+
+    @staticmethod
+    def make_parse_table(rules):
+        """
+        Rebuilds the LALR parse table, where reductions refer to the rules by
+        index.
+        """
+        states = {}
+        for state, actions in Tables.states.items():
+            states[state] = {}
+            for token, (shift, argument) in actions.items():
+                if shift:
+                    states[state][token] = (Shift, argument)
+                else:
+                    states[state][token] = (Reduce, rules[argument])
+        return ParseTable(states, Tables.start_state, Tables.end_state)
+
+    def make_parser(self):
+        from lark.parsers.lalr_parser import _Parser
+        builder = ParseTreeBuilder(self.rules, Tree)
+        callback = builder.create_callback(self.transformer)
+        callbacks = {}
+        for rule in self.rules:
+            callbacks[rule] = getattr(callback, rule.alias)
+        return _Parser(self.parse_table, callbacks)
+
+    def make_lexer(self):
+        always_accept = ()
+        if self.postlex:
+            always_accept = self.postlex.always_accept
+        states = {}
+        for state, actions in self.parse_table.states.items():
+            states[state] = list(actions.keys())
+        return Lexer(self.terminals, states, ignore=Tables.ignore,
+                     always_accept=always_accept)
+
+    def process(self, stream):
+        if self.postlex:
+            return self.postlex.process(stream)
+        return stream
+
+    def parse(self, text):
+        stream = self.process(self.lexer.lex(text))
+        return self.parser.parse(stream, self.lexer.set_parser_state)
+
+    def lex(self, text):
+        return self.process(self.lexer.root_lexer.lex(text))
+
+    @staticmethod
+    def rule_key(rule):
+        """
+        Sorts rules by their origin and expansion.
+        """
+        expansion = [symbol.name for symbol in rule.expansion]
+        return (rule.origin.name, expansion, str(rule.alias))
+
+    @staticmethod
+    def state_numbers(parse_table):
+        """
+        Numbers the states in the order they are reached from the start
+        state, following the tokens in alphabetical order. Lark numbers them
+        in an order that changes between runs.
+        """
+        numbers = {parse_table.start_state: 0}
+        queue = collections.deque([parse_table.start_state])
+        while queue:
+            actions = parse_table.states[queue.popleft()]
+            for token in sorted(actions):
+                action, argument = actions[token]
+                if action is Shift and argument not in numbers:
+                    numbers[argument] = len(numbers)
+                    queue.append(argument)
+        for state in parse_table.states:
+            if state not in numbers:
+                numbers[state] = len(numbers)
+        return numbers
+
+    @classmethod
+    def source(cls, parser, fingerprint):
+        """
+        Produces the source of the tables module for an analysed Lark
+        instance. Rules and states are written in a fixed order, so that
+        generating the tables again from the same grammar gives the same
+        source.
+        """
+        terminals = []
+        for terminal in parser.terminals:
+            pattern = 'str'
+            if isinstance(terminal.pattern, PatternRE):
+                pattern = 're'
+            flags = sorted(terminal.pattern.flags)
+            terminals.append((terminal.name, pattern, terminal.pattern.value,
+                              flags, terminal.priority))
+        aliases = parser._parse_tree_builder.user_aliases
+        parser_rules = sorted(parser.rules, key=cls.rule_key)
+        rules = []
+        for rule in parser_rules:
+            expansion = []
+            for symbol in rule.expansion:
+                filter_out = getattr(symbol, 'filter_out', False)
+                expansion.append((symbol.name, symbol.is_term, filter_out))
+            options = None
+            if rule.options:
+                options = (rule.options.keep_all_tokens, rule.options.expand1,
+                           rule.options.priority)
+            rules.append((rule.origin.name, expansion, aliases[rule],
+                          options))
+        parse_table = parser.parser.parser._parse_table
+        numbers = cls.state_numbers(parse_table)
+        states = {}
+        for state, actions in parse_table.states.items():
+            number = numbers[state]
+            states[number] = {}
+            for token, (action, argument) in actions.items():
+                if action is Shift:
+                    states[number][token] = (True, numbers[argument])
+                else:
+                    index = parser_rules.index(argument)
+                    states[number][token] = (False, index)
+        values = (('lark_version', lark.__version__),
+                  ('fingerprint', fingerprint),
+                  ('start_state', numbers[parse_table.start_state]),
+                  ('end_state', numbers[parse_table.end_state]),
+                  ('ignore', list(parser.ignore_tokens)),
+                  ('terminals', terminals), ('rules', rules),
+                  ('states', states))
+        source = ('# -*- coding: utf-8 -*-\n# flake8: noqa\n'
+                  '# Generated by `python setup.py generate_parser`. '
+                  'Do not edit.\n')
+        for name, value in values:
+            source += '{} = {}\n'.format(name, pprint.pformat(value))
+        return source
@@ -0,0 +1,6626 @@
+# -*- coding: utf-8 -*-
+# flake8: noqa
+# Generated by `python setup.py generate_parser`. Do not edit.
+lark_version = '0.6.5'
+fingerprint = 'e306bead6d9a272f1cf75b2d05ca3b41a2ca10b2'
+start_state = 0
+end_state = 136
+ignore = ['_WS']
+terminals = [('_WS', 're', '(?:\\ )+', [], 1),
+ ('INT_TYPE', 'str', 'int', [], 1),
+ ('FLOAT_TYPE', 'str', 'float', [], 1),
+ ('NUMBER_TYPE', 'str', 'number', [], 1),
+ ('STRING_TYPE', 'str', 'string', [], 1),
+ ('LIST_TYPE', 'str', 'list', [], 1),
+ ('OBJECT_TYPE', 'str', 'object', [], 1),
+ ('REGEXP_TYPE', 'str', 'regex', [], 1),
+ ('FUNCTION_TYPE', 'str', 'function', [], 1),
+ ('ANY_TYPE', 'str', 'any', [], 1),
+ ('_NL', 're', '(\r?\n[\t ]*)+', [], 1),
+ ('_INDENT', 'str', '<INDENT>', [], 1),
+ ('_DEDENT', 'str', '<DEDENT>', [], 1),
+ ('TRUE', 'str', 'true', [], 1),
+ ('FALSE', 'str', 'false', [], 1),
+ ('NULL', 'str', 'null', [], 1),
+ ('INT', 're', '[0-9]+', [], 2),
+ ('FLOAT', 're', '(?:[0-9]+\\.(?:[0-9]+)?|\\.[0-9]+)', [], 2),
+ ('SINGLE_QUOTED', 're', "'([^']*)'", [], 1),
+ ('DOUBLE_QUOTED', 're', '"([^"]*)"', [], 1),
+ ('REGEXP', 're', '\\/([^\\/]*)\\/', [], 2),
+ ('NAME', 're', '[a-zA-Z-\\/_0-9]+', [], 1),
+ ('_OSB', 'str', '[', [], 1),
+ ('_CSB', 'str', ']', [], 1),
+ ('_OCB', 'str', '{', [], 1),
+ ('_CCB', 'str', '}', [], 1),
+ ('_COLON', 'str', ':', [], 1),
+ ('_COMMA', 'str', ',', [], 1),
+ ('_OP', 'str', '(', [], 1),
+ ('_CP', 'str', ')', [], 1),
+ ('EQUALS', 'str', '=', [], 1),
+ ('_DOT', 'str', '.', [], 1),
+ ('_AS', 'str', 'as', [], 1),
+ ('_IMPORT', 'str', 'import', [], 1),
+ ('PLUS', 'str', '+', [], 1),
+ ('DASH', 'str', '-', [], 4),
+ ('MULTIPLIER', 'str', '*', [], 1),
+ ('BSLASH', 'str', '/', [], 3),
+ ('MODULUS', 'str', '%', [], 1),
+ ('POWER', 'str', '^', [], 1),
+ ('NOT', 'str', '!=', [], 1),
+ ('AND', 'str', 'and', [], 1),
+ ('OR', 'str', 'or', [], 1),
+ ('_RETURN', 'str', 'return', [], 1),
+ ('_THEN', 'str', 'then', [], 1),
+ ('GREATER', 'str', '>', [], 1),
+ ('GREATER_EQUAL', 'str', '>=', [], 1),
+ ('LESSER', 'str', '<', [], 1),
+ ('LESSER_EQUAL', 'str', '<=', [], 1),
+ ('EQUAL', 'str', '==', [], 1),
+ ('_IF', 'str', 'if', [], 1),
+ ('_ELSE', 'str', 'else', [], 1),
+ ('_FOREACH', 'str', 'foreach', [], 1),
+ ('_WHILE', 'str', 'while', [], 1),
+ ('_RETURNS', 'str', 'returns', [], 1),
+ ('TRY', 'str', 'try', [], 1),
+ ('_CATCH', 'str', 'catch', [], 1),
+ ('FINALLY', 'str', 'finally', [], 1),
+ ('RAISE', 'str', 'raise', [], 1),
+ ('_WHEN', 'str', 'when', [], 1)]
+rules = [('__anon_plus_12',
+  [('__anon_plus_12', False, False),
+   ('arguments', False, False),
+   ('_NL', True, True)],
+  None,
+  None),
+ ('__anon_plus_12',
+  [('arguments', False, False), ('_NL', True, True)],
+  None,
+  None),
+ ('__anon_plus_13',
+  [('__anon_plus_13', False, False), ('block', False, False)],
+  None,
+  None),
+ ('__anon_plus_13', [('block', False, False)], None, None),
+ ('__anon_plus_7',
+  [('__anon_plus_7', False, False),
+   ('chained_mutation', False, False),
+   ('_NL', True, True)],
+  None,
+  None),
+ ('__anon_plus_7',
+  [('chained_mutation', False, False), ('_NL', True, True)],
+  None,
+  None),
+ ('__anon_star_0',
+  [('_COMMA', True, True), ('_NL', True, True), ('entity', False, False)],
+  None,
+  (True, False, None)),
+ ('__anon_star_0',
+  [('_COMMA', True, True), ('entity', False, False)],
+  None,
+  (True, False, None)),
+ ('__anon_star_0',
+  [('__anon_star_0', False, False),
+   ('_COMMA', True, True),
+   ('_NL', True, True),
+   ('entity', False, False)],
+  None,
+  (True, False, None)),
+ ('__anon_star_0',
+  [('__anon_star_0', False, False),
+   ('_COMMA', True, True),
+   ('entity', False, False)],
+  None,
+  (True, False, None)),
+ ('__anon_star_1',
+  [('_COMMA', True, True), ('_NL', True, True), ('key_value', False, False)],
+  None,
+  None),
+ ('__anon_star_1',
+  [('_COMMA', True, True), ('key_value', False, False)],
+  None,
+  None),
+ ('__anon_star_1',
+  [('__anon_star_1', False, False),
+   ('_COMMA', True, True),
+   ('_NL', True, True),
+   ('key_value', False, False)],
+  None,
+  None),
+ ('__anon_star_1',
+  [('__anon_star_1', False, False),
+   ('_COMMA', True, True),
+   ('key_value', False, False)],
+  None,
+  None),
+ ('__anon_star_10',
+  [('__anon_star_10', False, False), ('elseif_block', False, False)],
+  None,
+  None),
+ ('__anon_star_10', [('elseif_block', False, False)], None, None),
+ ('__anon_star_11',
+  [('__anon_star_11', False, False), ('typed_argument', False, False)],
+  None,
+  None),
+ ('__anon_star_11', [('typed_argument', False, False)], None, None),
+ ('__anon_star_2',
+  [('__anon_star_2', False, False), ('path_fragment', False, False)],
+  None,
+  None),
+ ('__anon_star_2', [('path_fragment', False, False)], None, None),
+ ('__anon_star_3',
+  [('BSLASH', True, False), ('exponential', False, False)],
+  None,
+  None),
+ ('__anon_star_3',
+  [('MODULUS', True, False), ('exponential', False, False)],
+  None,
+  None),
+ ('__anon_star_3',
+  [('MULTIPLIER', True, False), ('exponential', False, False)],
+  None,
+  None),
+ ('__anon_star_3',
+  [('__anon_star_3', False, False),
+   ('BSLASH', True, False),
+   ('exponential', False, False)],
+  None,
+  None),
+ ('__anon_star_3',
+  [('__anon_star_3', False, False),
+   ('MODULUS', True, False),
+   ('exponential', False, False)],
+  None,
+  None),
+ ('__anon_star_3',
+  [('__anon_star_3', False, False),
+   ('MULTIPLIER', True, False),
+   ('exponential', False, False)],
+  None,
+  None),
+ ('__anon_star_4',
+  [('DASH', True, False), ('multiplication', False, False)],
+  None,
+  None),
+ ('__anon_star_4',
+  [('PLUS', True, False), ('multiplication', False, False)],
+  None,
+  None),
+ ('__anon_star_4',
+  [('__anon_star_4', False, False),
+   ('DASH', True, False),
+   ('multiplication', False, False)],
+  None,
+  None),
+ ('__anon_star_4',
+  [('__anon_star_4', False, False),
+   ('PLUS', True, False),
+   ('multiplication', False, False)],
+  None,
+  None),
+ ('__anon_star_5',
+  [('__anon_star_5', False, False), ('arguments', False, False)],
+  None,
+  None),
+ ('__anon_star_5', [('arguments', False, False)], None, None),
+ ('__anon_star_6',
+  [('__anon_star_6', False, False), ('chained_mutation', False, False)],
+  None,
+  None),
+ ('__anon_star_6', [('chained_mutation', False, False)], None, None),
+ ('__anon_star_8', [('_COMMA', True, True), ('NAME', True, False)], None, None),
+ ('__anon_star_8',
+  [('__anon_star_8', False, False),
+   ('_COMMA', True, True),
+   ('NAME', True, False)],
+  None,
+  None),
+ ('__anon_star_9',
+  [('__anon_star_9', False, False), ('chained_mutation', False, False)],
+  None,
+  None),
+ ('__anon_star_9', [('chained_mutation', False, False)], None, None),
+ ('absolute_expression',
+  [('expression', False, False)],
+  None,
+  (False, False, None)),
+ ('arguments',
+  [('NAME', True, False), ('_COLON', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('arguments',
+  [('_COLON', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('assignment',
+  [('path', False, False), ('assignment_fragment', False, False)],
+  None,
+  (False, False, None)),
+ ('assignment_fragment',
+  [('EQUALS', True, False), ('expression', False, False)],
+  None,
+  (False, False, None)),
+ ('assignment_fragment',
+  [('EQUALS', True, False), ('mutation', False, False)],
+  None,
+  (False, False, None)),
+ ('assignment_fragment',
+  [('EQUALS', True, False), ('service', False, False)],
+  None,
+  (False, False, None)),
+ ('block', [('arguments', False, False)], None, (False, False, None)),
+ ('block', [('chained_mutation', False, False)], None, (False, False, None)),
+ ('block', [('foreach_block', False, False)], None, (False, False, None)),
+ ('block', [('function_block', False, False)], None, (False, False, None)),
+ ('block', [('if_block', False, False)], None, (False, False, None)),
+ ('block', [('indented_arguments', False, False)], None, (False, False, None)),
+ ('block', [('indented_chain', False, False)], None, (False, False, None)),
+ ('block', [('mutation_block', False, False)], None, (False, False, None)),
+ ('block',
+  [('rules', False, False), ('_NL', True, True)],
+  None,
+  (False, False, None)),
+ ('block', [('service_block', False, False)], None, (False, False, None)),
+ ('block', [('try_block', False, False)], None, (False, False, None)),
+ ('block', [('when_block', False, False)], None, (False, False, None)),
+ ('block', [('while_block', False, False)], None, (False, False, None)),
+ ('boolean', [('FALSE', True, False)], None, (False, False, None)),
+ ('boolean', [('TRUE', True, False)], None, (False, False, None)),
+ ('catch_block',
+  [('catch_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('catch_statement',
+  [('_CATCH', True, True), ('_AS', True, True), ('NAME', True, False)],
+  None,
+  (False, False, None)),
+ ('chained_mutation',
+  [('_THEN', True, True), ('mutation_fragment', False, False)],
+  None,
+  (False, False, None)),
+ ('command', [('NAME', True, False)], None, (False, False, None)),
+ ('comparisons', [('EQUAL', True, False)], None, (False, False, None)),
+ ('comparisons', [('GREATER', True, False)], None, (False, False, None)),
+ ('comparisons', [('GREATER_EQUAL', True, False)], None, (False, False, None)),
+ ('comparisons', [('LESSER', True, False)], None, (False, False, None)),
+ ('comparisons', [('LESSER_EQUAL', True, False)], None, (False, False, None)),
+ ('comparisons', [('NOT', True, False)], None, (False, False, None)),
+ ('else_block',
+  [('else_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('else_statement', [('_ELSE', True, True)], None, (True, False, None)),
+ ('elseif_block',
+  [('elseif_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('elseif_statement',
+  [('_ELSE', True, True), ('_IF', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('elseif_statement',
+  [('_ELSE', True, True),
+   ('_IF', True, True),
+   ('entity', False, False),
+   ('comparisons', False, False),
+   ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('entity', [('path', False, False)], None, (False, False, None)),
+ ('entity', [('values', False, False)], None, (False, False, None)),
+ ('exponential', [('factor', False, False)], None, (False, False, None)),
+ ('exponential',
+  [('factor', False, False),
+   ('POWER', True, False),
+   ('exponential', False, False)],
+  None,
+  (False, False, None)),
+ ('expression', [('multiplication', False, False)], None, (False, False, None)),
+ ('expression',
+  [('multiplication', False, False), ('__anon_star_4', False, False)],
+  None,
+  (False, False, None)),
+ ('factor',
+  [('DASH', True, False), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('factor',
+  [('PLUS', True, False), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('factor',
+  [('_OP', True, True), ('expression', False, False), ('_CP', True, True)],
+  None,
+  (False, False, None)),
+ ('factor', [('entity', False, False)], None, (False, False, None)),
+ ('finally_block',
+  [('finally_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('finally_statement', [('FINALLY', True, False)], None, (False, False, None)),
+ ('foreach_block',
+  [('foreach_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('foreach_statement',
+  [('_FOREACH', True, True),
+   ('entity', False, False),
+   ('output', False, False)],
+  None,
+  (False, False, None)),
+ ('function_block',
+  [('function_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('function_output',
+  [('_RETURNS', True, True), ('types', False, False)],
+  None,
+  (False, False, None)),
+ ('function_statement',
+  [('FUNCTION_TYPE', True, False), ('NAME', True, False)],
+  None,
+  (False, False, None)),
+ ('function_statement',
+  [('FUNCTION_TYPE', True, False),
+   ('NAME', True, False),
+   ('__anon_star_11', False, False)],
+  None,
+  (False, False, None)),
+ ('function_statement',
+  [('FUNCTION_TYPE', True, False),
+   ('NAME', True, False),
+   ('__anon_star_11', False, False),
+   ('function_output', False, False)],
+  None,
+  (False, False, None)),
+ ('function_statement',
+  [('FUNCTION_TYPE', True, False),
+   ('NAME', True, False),
+   ('function_output', False, False)],
+  None,
+  (False, False, None)),
+ ('if_block',
+  [('if_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('if_block',
+  [('if_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False),
+   ('__anon_star_10', False, False)],
+  None,
+  (False, False, None)),
+ ('if_block',
+  [('if_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False),
+   ('__anon_star_10', False, False),
+   ('else_block', False, False)],
+  None,
+  (False, False, None)),
+ ('if_block',
+  [('if_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False),
+   ('else_block', False, False)],
+  None,
+  (False, False, None)),
+ ('if_statement',
+  [('_IF', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('if_statement',
+  [('_IF', True, True),
+   ('entity', False, False),
+   ('comparisons', False, False),
+   ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('imports',
+  [('_IMPORT', True, True),
+   ('string', False, False),
+   ('_AS', True, True),
+   ('NAME', True, False)],
+  None,
+  (False, False, None)),
+ ('indented_arguments',
+  [('_INDENT', True, True),
+   ('__anon_plus_12', False, False),
+   ('_DEDENT', True, True)],
+  None,
+  (False, False, None)),
+ ('indented_chain',
+  [('_INDENT', True, True),
+   ('__anon_plus_7', False, False),
+   ('_DEDENT', True, True)],
+  None,
+  (False, False, None)),
+ ('inline_expression',
+  [('_OP', True, True), ('service', False, False), ('_CP', True, True)],
+  None,
+  (False, False, None)),
+ ('key_value',
+  [('path', False, False), ('_COLON', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('key_value',
+  [('string', False, False), ('_COLON', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('list',
+  [('_OSB', True, True), ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('entity', False, False),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('entity', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('entity', False, False),
+   ('__anon_star_0', False, False),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('entity', False, False),
+   ('__anon_star_0', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True), ('entity', False, False), ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('entity', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('entity', False, False),
+   ('__anon_star_0', False, False),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('list',
+  [('_OSB', True, True),
+   ('entity', False, False),
+   ('__anon_star_0', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CSB', True, True)],
+  None,
+  (True, False, None)),
+ ('multiplication',
+  [('exponential', False, False)],
+  None,
+  (False, False, None)),
+ ('multiplication',
+  [('exponential', False, False), ('__anon_star_3', False, False)],
+  None,
+  (False, False, None)),
+ ('mutation',
+  [('entity', False, False), ('mutation_fragment', False, False)],
+  None,
+  (False, False, None)),
+ ('mutation',
+  [('entity', False, False),
+   ('mutation_fragment', False, False),
+   ('__anon_star_6', False, False)],
+  None,
+  (False, False, None)),
+ ('mutation_block',
+  [('mutation', False, False), ('_NL', True, True)],
+  None,
+  (False, False, None)),
+ ('mutation_block',
+  [('mutation', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('mutation_fragment', [('NAME', True, False)], None, (False, False, None)),
+ ('mutation_fragment',
+  [('NAME', True, False), ('__anon_star_5', False, False)],
+  None,
+  (False, False, None)),
+ ('nested_block',
+  [('_INDENT', True, True),
+   ('__anon_plus_13', False, False),
+   ('_DEDENT', True, True)],
+  None,
+  (False, False, None)),
+ ('number', [('FLOAT', True, False)], None, (False, False, None)),
+ ('number', [('INT', True, False)], None, (False, False, None)),
+ ('objects',
+  [('_OCB', True, True), ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('key_value', False, False),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('key_value', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('key_value', False, False),
+   ('__anon_star_1', False, False),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('_NL', True, True),
+   ('_INDENT', True, True),
+   ('key_value', False, False),
+   ('__anon_star_1', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True), ('key_value', False, False), ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('key_value', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('key_value', False, False),
+   ('__anon_star_1', False, False),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('objects',
+  [('_OCB', True, True),
+   ('key_value', False, False),
+   ('__anon_star_1', False, False),
+   ('_NL', True, True),
+   ('_DEDENT', True, True),
+   ('_CCB', True, True)],
+  None,
+  (False, False, None)),
+ ('output',
+  [('_AS', True, True), ('NAME', True, False)],
+  None,
+  (False, False, None)),
+ ('output',
+  [('_AS', True, True), ('NAME', True, False), ('__anon_star_8', False, False)],
+  None,
+  (False, False, None)),
+ ('path', [('NAME', True, False)], None, (False, False, None)),
+ ('path',
+  [('NAME', True, False), ('__anon_star_2', False, False)],
+  None,
+  (False, False, None)),
+ ('path', [('inline_expression', False, False)], None, (False, False, None)),
+ ('path',
+  [('inline_expression', False, False), ('__anon_star_2', False, False)],
+  None,
+  (False, False, None)),
+ ('path_fragment',
+  [('_DOT', True, True), ('NAME', True, False)],
+  None,
+  (False, False, None)),
+ ('path_fragment',
+  [('_OSB', True, True), ('INT', True, False), ('_CSB', True, True)],
+  None,
+  (False, False, None)),
+ ('path_fragment',
+  [('_OSB', True, True), ('path', False, False), ('_CSB', True, True)],
+  None,
+  (False, False, None)),
+ ('path_fragment',
+  [('_OSB', True, True), ('string', False, False), ('_CSB', True, True)],
+  None,
+  (False, False, None)),
+ ('raise_statement', [('RAISE', True, False)], None, (False, False, None)),
+ ('raise_statement',
+  [('RAISE', True, False), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('regular_expression', [('REGEXP', True, False)], None, (False, False, None)),
+ ('regular_expression',
+  [('REGEXP', True, False), ('NAME', True, False)],
+  None,
+  (False, False, None)),
+ ('return_statement',
+  [('_RETURN', True, True), ('entity', False, False)],
+  None,
+  (False, False, None)),
+ ('rules', [('absolute_expression', False, False)], None, (False, False, None)),
+ ('rules', [('assignment', False, False)], None, (False, False, None)),
+ ('rules', [('block', False, False)], None, (False, False, None)),
+ ('rules', [('imports', False, False)], None, (False, False, None)),
+ ('rules', [('raise_statement', False, False)], None, (False, False, None)),
+ ('rules', [('return_statement', False, False)], None, (False, False, None)),
+ ('service',
+  [('path', False, False), ('service_fragment', False, False)],
+  None,
+  (False, False, None)),
+ ('service',
+  [('path', False, False),
+   ('service_fragment', False, False),
+   ('__anon_star_9', False, False)],
+  None,
+  (False, False, None)),
+ ('service_block',
+  [('service', False, False), ('_NL', True, True)],
+  None,
+  (False, False, None)),
+ ('service_block',
+  [('service', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('service_fragment',
+  [('__anon_star_5', False, False)],
+  None,
+  (False, False, None)),
+ ('service_fragment',
+  [('__anon_star_5', False, False), ('output', False, False)],
+  None,
+  (False, False, None)),
+ ('service_fragment', [('command', False, False)], None, (False, False, None)),
+ ('service_fragment',
+  [('command', False, False), ('__anon_star_5', False, False)],
+  None,
+  (False, False, None)),
+ ('service_fragment',
+  [('command', False, False),
+   ('__anon_star_5', False, False),
+   ('output', False, False)],
+  None,
+  (False, False, None)),
+ ('service_fragment',
+  [('command', False, False), ('output', False, False)],
+  None,
+  (False, False, None)),
+ ('start',
+  [('_NL', True, True), ('__anon_plus_13', False, False)],
+  None,
+  (False, False, None)),
+ ('start', [('__anon_plus_13', False, False)], None, (False, False, None)),
+ ('string', [('DOUBLE_QUOTED', True, False)], None, (False, False, None)),
+ ('string', [('SINGLE_QUOTED', True, False)], None, (False, False, None)),
+ ('try_block',
+  [('try_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('try_block',
+  [('try_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False),
+   ('catch_block', False, False)],
+  None,
+  (False, False, None)),
+ ('try_block',
+  [('try_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False),
+   ('catch_block', False, False),
+   ('finally_block', False, False)],
+  None,
+  (False, False, None)),
+ ('try_block',
+  [('try_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False),
+   ('finally_block', False, False)],
+  None,
+  (False, False, None)),
+ ('try_statement', [('TRY', True, False)], None, (False, False, None)),
+ ('typed_argument',
+  [('NAME', True, False), ('_COLON', True, True), ('types', False, False)],
+  None,
+  (False, False, None)),
+ ('types', [('ANY_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('FLOAT_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('FUNCTION_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('INT_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('LIST_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('NUMBER_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('OBJECT_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('REGEXP_TYPE', True, False)], None, (False, False, None)),
+ ('types', [('STRING_TYPE', True, False)], None, (False, False, None)),
+ ('values', [('boolean', False, False)], None, (False, False, None)),
+ ('values', [('list', False, False)], None, (False, False, None)),
+ ('values', [('number', False, False)], None, (False, False, None)),
+ ('values', [('objects', False, False)], None, (False, False, None)),
+ ('values', [('regular_expression', False, False)], None, (False, False, None)),
+ ('values', [('string', False, False)], None, (False, False, None)),
+ ('values', [('void', False, False)], None, (False, False, None)),
+ ('void', [('NULL', True, False)], None, (False, False, None)),
+ ('when_block',
+  [('_WHEN', True, True),
+   ('path', False, False),
+   ('output', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('when_block',
+  [('_WHEN', True, True),
+   ('service', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('while_block',
+  [('while_statement', False, False),
+   ('_NL', True, True),
+   ('nested_block', False, False)],
+  None,
+  (False, False, None)),
+ ('while_statement',
+  [('_WHILE', True, True), ('entity', False, False)],
+  None,
+  (False, False, None))]
+states = {0: {'DASH': (True, 1),
+     'DOUBLE_QUOTED': (True, 2),
+     'FALSE': (True, 3),
+     'FLOAT': (True, 4),
+     'FUNCTION_TYPE': (True, 5),
+     'INT': (True, 6),
+     'NAME': (True, 7),
+     'NULL': (True, 8),
+     'PLUS': (True, 9),
+     'RAISE': (True, 10),
+     'REGEXP': (True, 11),
+     'SINGLE_QUOTED': (True, 12),
+     'TRUE': (True, 13),
+     'TRY': (True, 14),
+     '_COLON': (True, 15),
+     '_FOREACH': (True, 16),
+     '_IF': (True, 17),
+     '_IMPORT': (True, 18),
+     '_INDENT': (True, 19),
+     '_NL': (True, 20),
+     '_OCB': (True, 21),
+     '_OP': (True, 22),
+     '_OSB': (True, 23),
+     '_RETURN': (True, 24),
+     '_THEN': (True, 25),
+     '_WHEN': (True, 26),
+     '_WHILE': (True, 27),
+     '__anon_plus_13': (True, 28),
+     'absolute_expression': (True, 29),
+     'arguments': (True, 30),
+     'assignment': (True, 31),
+     'block': (True, 32),
+     'boolean': (True, 33),
+     'chained_mutation': (True, 34),
+     'entity': (True, 35),
+     'exponential': (True, 36),
+     'expression': (True, 37),
+     'factor': (True, 38),
+     'foreach_block': (True, 39),
+     'foreach_statement': (True, 40),
+     'function_block': (True, 41),
+     'function_statement': (True, 42),
+     'if_block': (True, 43),
+     'if_statement': (True, 44),
+     'imports': (True, 45),
+     'indented_arguments': (True, 46),
+     'indented_chain': (True, 47),
+     'inline_expression': (True, 48),
+     'list': (True, 49),
+     'multiplication': (True, 50),
+     'mutation': (True, 51),
+     'mutation_block': (True, 52),
+     'number': (True, 53),
+     'objects': (True, 54),
+     'path': (True, 55),
+     'raise_statement': (True, 56),
+     'regular_expression': (True, 57),
+     'return_statement': (True, 58),
+     'rules': (True, 59),
+     'service': (True, 60),
+     'service_block': (True, 61),
+     'start': (True, 62),
+     'string': (True, 63),
+     'try_block': (True, 64),
+     'try_statement': (True, 65),
+     'values': (True, 66),
+     'void': (True, 67),
+     'when_block': (True, 68),
+     'while_block': (True, 69),
+     'while_statement': (True, 70)},
+ 1: {'DOUBLE_QUOTED': (True, 2),
+     'FALSE': (True, 3),
+     'FLOAT': (True, 4),
+     'INT': (True, 6),
+     'NAME': (True, 71),
+     'NULL': (True, 8),
+     'REGEXP': (True, 11),
+     'SINGLE_QUOTED': (True, 12),
+     'TRUE': (True, 13),
+     '_OCB': (True, 21),
+     '_OP': (True, 72),
+     '_OSB': (True, 23),
+     'boolean': (True, 33),
+     'entity': (True, 73),
+     'inline_expression': (True, 48),
+     'list': (True, 49),
+     'number': (True, 53),
+     'objects': (True, 54),
+     'path': (True, 74),
+     'regular_expression': (True, 57),
+     'string': (True, 63),
+     'values': (True, 66),
+     'void': (True, 67)},
+ 2: {'$END': (False, 175),
+     'BSLASH': (False, 175),
+     'DASH': (False, 175),
+     'DOUBLE_QUOTED': (False, 175),
+     'EQUAL': (False, 175),
+     'FALSE': (False, 175),
+     'FLOAT': (False, 175),
+     'FUNCTION_TYPE': (False, 175),
+     'GREATER': (False, 175),
+     'GREATER_EQUAL': (False, 175),
+     'INT': (False, 175),
+     'LESSER': (False, 175),
+     'LESSER_EQUAL': (False, 175),
+     'MODULUS': (False, 175),
+     'MULTIPLIER': (False, 175),
+     'NAME': (False, 175),
+     'NOT': (False, 175),
+     'NULL': (False, 175),
+     'PLUS': (False, 175),
+     'POWER': (False, 175),
+     'RAISE': (False, 175),
+     'REGEXP': (False, 175),
+     'SINGLE_QUOTED': (False, 175),
+     'TRUE': (False, 175),
+     'TRY': (False, 175),
+     '_AS': (False, 175),
+     '_CCB': (False, 175),
+     '_COLON': (False, 175),
+     '_COMMA': (False, 175),
+     '_CP': (False, 175),
+     '_CSB': (False, 175),
+     '_DEDENT': (False, 175),
+     '_FOREACH': (False, 175),
+     '_IF': (False, 175),
+     '_IMPORT': (False, 175),
+     '_INDENT': (False, 175),
+     '_NL': (False, 175),
+     '_OCB': (False, 175),
+     '_OP': (False, 175),
+     '_OSB': (False, 175),
+     '_RETURN': (False, 175),
+     '_THEN': (False, 175),
+     '_WHEN': (False, 175),
+     '_WHILE': (False, 175)},
+ 3: {'$END': (False, 58),
+     'BSLASH': (False, 58),
+     'DASH': (False, 58),
+     'DOUBLE_QUOTED': (False, 58),
+     'EQUAL': (False, 58),
+     'FALSE': (False, 58),
+     'FLOAT': (False, 58),
+     'FUNCTION_TYPE': (False, 58),
+     'GREATER': (False, 58),
+     'GREATER_EQUAL': (False, 58),
+     'INT': (False, 58),
+     'LESSER': (False, 58),
+     'LESSER_EQUAL': (False, 58),
+     'MODULUS': (False, 58),
+     'MULTIPLIER': (False, 58),
+     'NAME': (False, 58),
+     'NOT': (False, 58),
+     'NULL': (False, 58),
+     'PLUS': (False, 58),
+     'POWER': (False, 58),
+     'RAISE': (False, 58),
+     'REGEXP': (False, 58),
+     'SINGLE_QUOTED': (False, 58),
+     'TRUE': (False, 58),
+     'TRY': (False, 58),
+     '_AS': (False, 58),
+     '_CCB': (False, 58),
+     '_COLON': (False, 58),
+     '_COMMA': (False, 58),
+     '_CP': (False, 58),
+     '_CSB': (False, 58),
+     '_DEDENT': (False, 58),
+     '_FOREACH': (False, 58),
+     '_IF': (False, 58),
+     '_IMPORT': (False, 58),
+     '_INDENT': (False, 58),
+     '_NL': (False, 58),
+     '_OCB': (False, 58),
+     '_OP': (False, 58),
+     '_OSB': (False, 58),
+     '_RETURN': (False, 58),
+     '_THEN': (False, 58),
+     '_WHEN': (False, 58),
+     '_WHILE': (False, 58)},
+ 4: {'$END': (False, 128),
+     'BSLASH': (False, 128),
+     'DASH': (False, 128),
+     'DOUBLE_QUOTED': (False, 128),
+     'EQUAL': (False, 128),
+     'FALSE': (False, 128),
+     'FLOAT': (False, 128),
+     'FUNCTION_TYPE': (False, 128),
+     'GREATER': (False, 128),
+     'GREATER_EQUAL': (False, 128),
+     'INT': (False, 128),
+     'LESSER': (False, 128),
+     'LESSER_EQUAL': (False, 128),
+     'MODULUS': (False, 128),
+     'MULTIPLIER': (False, 128),
+     'NAME': (False, 128),
+     'NOT': (False, 128),
+     'NULL': (False, 128),
+     'PLUS': (False, 128),
+     'POWER': (False, 128),
+     'RAISE': (False, 128),
+     'REGEXP': (False, 128),
+     'SINGLE_QUOTED': (False, 128),
+     'TRUE': (False, 128),
+     'TRY': (False, 128),
+     '_AS': (False, 128),
+     '_CCB': (False, 128),
+     '_COLON': (False, 128),
+     '_COMMA': (False, 128),
+     '_CP': (False, 128),
+     '_CSB': (False, 128),
+     '_DEDENT': (False, 128),
+     '_FOREACH': (False, 128),
+     '_IF': (False, 128),
+     '_IMPORT': (False, 128),
+     '_INDENT': (False, 128),
+     '_NL': (False, 128),
+     '_OCB': (False, 128),
+     '_OP': (False, 128),
+     '_OSB': (False, 128),
+     '_RETURN': (False, 128),
+     '_THEN': (False, 128),
+     '_WHEN': (False, 128),
+     '_WHILE': (False, 128)},
+ 5: {'NAME': (True, 75)},
+ 6: {'$END': (False, 129),
+     'BSLASH': (False, 129),
+     'DASH': (False, 129),
+     'DOUBLE_QUOTED': (False, 129),
+     'EQUAL': (False, 129),
+     'FALSE': (False, 129),
+     'FLOAT': (False, 129),
+     'FUNCTION_TYPE': (False, 129),
+     'GREATER': (False, 129),
+     'GREATER_EQUAL': (False, 129),
+     'INT': (False, 129),
+     'LESSER': (False, 129),
+     'LESSER_EQUAL': (False, 129),
+     'MODULUS': (False, 129),
+     'MULTIPLIER': (False, 129),
+     'NAME': (False, 129),
+     'NOT': (False, 129),
+     'NULL': (False, 129),
+     'PLUS': (False, 129),
+     'POWER': (False, 129),
+     'RAISE': (False, 129),
+     'REGEXP': (False, 129),
+     'SINGLE_QUOTED': (False, 129),
+     'TRUE': (False, 129),
+     'TRY': (False, 129),
+     '_AS': (False, 129),
+     '_CCB': (False, 129),
+     '_COLON': (False, 129),
+     '_COMMA': (False, 129),
+     '_CP': (False, 129),
+     '_CSB': (False, 129),
+     '_DEDENT': (False, 129),
+     '_FOREACH': (False, 129),
+     '_IF': (False, 129),
+     '_IMPORT': (False, 129),
+     '_INDENT': (False, 129),
+     '_NL': (False, 129),
+     '_OCB': (False, 129),
+     '_OP': (False, 129),
+     '_OSB': (False, 129),
+     '_RETURN': (False, 129),
+     '_THEN': (False, 129),
+     '_WHEN': (False, 129),
+     '_WHILE': (False, 129)},
+ 7: {'$END': (False, 144),
+     'BSLASH': (False, 144),
+     'DASH': (False, 144),
+     'DOUBLE_QUOTED': (False, 144),
+     'EQUAL': (False, 144),
+     'EQUALS': (False, 144),
+     'FALSE': (False, 144),
+     'FLOAT': (False, 144),
+     'FUNCTION_TYPE': (False, 144),
+     'GREATER': (False, 144),
+     'GREATER_EQUAL': (False, 144),
+     'INT': (False, 144),
+     'LESSER': (False, 144),
+     'LESSER_EQUAL': (False, 144),
+     'MODULUS': (False, 144),
+     'MULTIPLIER': (False, 144),
+     'NAME': (False, 144),
+     'NOT': (False, 144),
+     'NULL': (False, 144),
+     'PLUS': (False, 144),
+     'POWER': (False, 144),
+     'RAISE': (False, 144),
+     'REGEXP': (False, 144),
+     'SINGLE_QUOTED': (False, 144),
+     'TRUE': (False, 144),
+     'TRY': (False, 144),
+     '_AS': (False, 144),
+     '_CCB': (False, 144),
+     '_COLON': (True, 76),
+     '_COMMA': (False, 144),
+     '_CP': (False, 144),
+     '_CSB': (False, 144),
+     '_DEDENT': (False, 144),
+     '_DOT': (True, 77),
+     '_FOREACH': (False, 144),
+     '_IF': (False, 144),
+     '_IMPORT': (False, 144),
+     '_INDENT': (False, 144),
+     '_NL': (False, 144),
+     '_OCB': (False, 144),
+     '_OP': (False, 144),
+     '_OSB': (True, 78),
+     '_RETURN': (False, 144),
+     '_THEN': (False, 144),
+     '_WHEN': (False, 144),
+     '_WHILE': (False, 144),
+     '__anon_star_2': (True, 79),
+     'path_fragment': (True, 80)},
+ 8: {'$END': (False, 199),
+     'BSLASH': (False, 199),
+     'DASH': (False, 199),
+     'DOUBLE_QUOTED': (False, 199),
+     'EQUAL': (False, 199),
+     'FALSE': (False, 199),
+     'FLOAT': (False, 199),
+     'FUNCTION_TYPE': (False, 199),
+     'GREATER': (False, 199),
+     'GREATER_EQUAL': (False, 199),
+     'INT': (False, 199),
+     'LESSER': (False, 199),
+     'LESSER_EQUAL': (False, 199),
+     'MODULUS': (False, 199),
+     'MULTIPLIER': (False, 199),
+     'NAME': (False, 199),
+     'NOT': (False, 199),
+     'NULL': (False, 199),
+     'PLUS': (False, 199),
+     'POWER': (False, 199),
+     'RAISE': (False, 199),
+     'REGEXP': (False, 199),
+     'SINGLE_QUOTED': (False, 199),
+     'TRUE': (False, 199),
+     'TRY': (False, 199),
+     '_AS': (False, 199),
+     '_CCB': (False, 199),
+     '_COLON': (False, 199),
+     '_COMMA': (False, 199),
+     '_CP': (False, 199),
+     '_CSB': (False, 199),
+     '_DEDENT': (False, 199),
+     '_FOREACH': (False, 199),
+     '_IF': (False, 199),
+     '_IMPORT': (False, 199),
+     '_INDENT': (False, 199),
+     '_NL': (False, 199),
+     '_OCB': (False, 199),
+     '_OP': (False, 199),
+     '_OSB': (False, 199),
+     '_RETURN': (False, 199),
+     '_THEN': (False, 199),
+     '_WHEN': (False, 199),
+     '_WHILE': (False, 199)},
+ 9: {'DOUBLE_QUOTED': (True, 2),
+     'FALSE': (True, 3),
+     'FLOAT': (True, 4),
+     'INT': (True, 6),
+     'NAME': (True, 71),
+     'NULL': (True, 8),
+     'REGEXP': (True, 11),
+     'SINGLE_QUOTED': (True, 12),
+     'TRUE': (True, 13),
+     '_OCB': (True, 21),
+     '_OP': (True, 72),
+     '_OSB': (True, 23),
+     'boolean': (True, 33),
+     'entity': (True, 81),
+     'inline_expression': (True, 48),
+     'list': (True, 49),
+     'number': (True, 53),
+     'objects': (True, 54),
+     'path': (True, 74),
+     'regular_expression': (True, 57),
+     'string': (True, 63),
+     'values': (True, 66),
+     'void': (True, 67)},
+ 10: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_NL': (False, 152),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 82),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 11: {'$END': (False, 154),
+      'BSLASH': (False, 154),
+      'DASH': (False, 154),
+      'DOUBLE_QUOTED': (False, 154),
+      'EQUAL': (False, 154),
+      'FALSE': (False, 154),
+      'FLOAT': (False, 154),
+      'FUNCTION_TYPE': (False, 154),
+      'GREATER': (False, 154),
+      'GREATER_EQUAL': (False, 154),
+      'INT': (False, 154),
+      'LESSER': (False, 154),
+      'LESSER_EQUAL': (False, 154),
+      'MODULUS': (False, 154),
+      'MULTIPLIER': (False, 154),
+      'NAME': (True, 83),
+      'NOT': (False, 154),
+      'NULL': (False, 154),
+      'PLUS': (False, 154),
+      'POWER': (False, 154),
+      'RAISE': (False, 154),
+      'REGEXP': (False, 154),
+      'SINGLE_QUOTED': (False, 154),
+      'TRUE': (False, 154),
+      'TRY': (False, 154),
+      '_AS': (False, 154),
+      '_CCB': (False, 154),
+      '_COLON': (False, 154),
+      '_COMMA': (False, 154),
+      '_CP': (False, 154),
+      '_CSB': (False, 154),
+      '_DEDENT': (False, 154),
+      '_FOREACH': (False, 154),
+      '_IF': (False, 154),
+      '_IMPORT': (False, 154),
+      '_INDENT': (False, 154),
+      '_NL': (False, 154),
+      '_OCB': (False, 154),
+      '_OP': (False, 154),
+      '_OSB': (False, 154),
+      '_RETURN': (False, 154),
+      '_THEN': (False, 154),
+      '_WHEN': (False, 154),
+      '_WHILE': (False, 154)},
+ 12: {'$END': (False, 176),
+      'BSLASH': (False, 176),
+      'DASH': (False, 176),
+      'DOUBLE_QUOTED': (False, 176),
+      'EQUAL': (False, 176),
+      'FALSE': (False, 176),
+      'FLOAT': (False, 176),
+      'FUNCTION_TYPE': (False, 176),
+      'GREATER': (False, 176),
+      'GREATER_EQUAL': (False, 176),
+      'INT': (False, 176),
+      'LESSER': (False, 176),
+      'LESSER_EQUAL': (False, 176),
+      'MODULUS': (False, 176),
+      'MULTIPLIER': (False, 176),
+      'NAME': (False, 176),
+      'NOT': (False, 176),
+      'NULL': (False, 176),
+      'PLUS': (False, 176),
+      'POWER': (False, 176),
+      'RAISE': (False, 176),
+      'REGEXP': (False, 176),
+      'SINGLE_QUOTED': (False, 176),
+      'TRUE': (False, 176),
+      'TRY': (False, 176),
+      '_AS': (False, 176),
+      '_CCB': (False, 176),
+      '_COLON': (False, 176),
+      '_COMMA': (False, 176),
+      '_CP': (False, 176),
+      '_CSB': (False, 176),
+      '_DEDENT': (False, 176),
+      '_FOREACH': (False, 176),
+      '_IF': (False, 176),
+      '_IMPORT': (False, 176),
+      '_INDENT': (False, 176),
+      '_NL': (False, 176),
+      '_OCB': (False, 176),
+      '_OP': (False, 176),
+      '_OSB': (False, 176),
+      '_RETURN': (False, 176),
+      '_THEN': (False, 176),
+      '_WHEN': (False, 176),
+      '_WHILE': (False, 176)},
+ 13: {'$END': (False, 59),
+      'BSLASH': (False, 59),
+      'DASH': (False, 59),
+      'DOUBLE_QUOTED': (False, 59),
+      'EQUAL': (False, 59),
+      'FALSE': (False, 59),
+      'FLOAT': (False, 59),
+      'FUNCTION_TYPE': (False, 59),
+      'GREATER': (False, 59),
+      'GREATER_EQUAL': (False, 59),
+      'INT': (False, 59),
+      'LESSER': (False, 59),
+      'LESSER_EQUAL': (False, 59),
+      'MODULUS': (False, 59),
+      'MULTIPLIER': (False, 59),
+      'NAME': (False, 59),
+      'NOT': (False, 59),
+      'NULL': (False, 59),
+      'PLUS': (False, 59),
+      'POWER': (False, 59),
+      'RAISE': (False, 59),
+      'REGEXP': (False, 59),
+      'SINGLE_QUOTED': (False, 59),
+      'TRUE': (False, 59),
+      'TRY': (False, 59),
+      '_AS': (False, 59),
+      '_CCB': (False, 59),
+      '_COLON': (False, 59),
+      '_COMMA': (False, 59),
+      '_CP': (False, 59),
+      '_CSB': (False, 59),
+      '_DEDENT': (False, 59),
+      '_FOREACH': (False, 59),
+      '_IF': (False, 59),
+      '_IMPORT': (False, 59),
+      '_INDENT': (False, 59),
+      '_NL': (False, 59),
+      '_OCB': (False, 59),
+      '_OP': (False, 59),
+      '_OSB': (False, 59),
+      '_RETURN': (False, 59),
+      '_THEN': (False, 59),
+      '_WHEN': (False, 59),
+      '_WHILE': (False, 59)},
+ 14: {'_NL': (False, 181)},
+ 15: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 84),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 16: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 85),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 17: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 86),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 18: {'DOUBLE_QUOTED': (True, 2),
+      'SINGLE_QUOTED': (True, 12),
+      'string': (True, 87)},
+ 19: {'NAME': (True, 88),
+      '_COLON': (True, 15),
+      '_THEN': (True, 25),
+      '__anon_plus_12': (True, 89),
+      '__anon_plus_7': (True, 90),
+      'arguments': (True, 91),
+      'chained_mutation': (True, 92)},
+ 20: {'DASH': (True, 1),
+      'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'FUNCTION_TYPE': (True, 5),
+      'INT': (True, 6),
+      'NAME': (True, 7),
+      'NULL': (True, 8),
+      'PLUS': (True, 9),
+      'RAISE': (True, 10),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      'TRY': (True, 14),
+      '_COLON': (True, 15),
+      '_FOREACH': (True, 16),
+      '_IF': (True, 17),
+      '_IMPORT': (True, 18),
+      '_INDENT': (True, 19),
+      '_OCB': (True, 21),
+      '_OP': (True, 22),
+      '_OSB': (True, 23),
+      '_RETURN': (True, 24),
+      '_THEN': (True, 25),
+      '_WHEN': (True, 26),
+      '_WHILE': (True, 27),
+      '__anon_plus_13': (True, 93),
+      'absolute_expression': (True, 29),
+      'arguments': (True, 30),
+      'assignment': (True, 31),
+      'block': (True, 32),
+      'boolean': (True, 33),
+      'chained_mutation': (True, 34),
+      'entity': (True, 35),
+      'exponential': (True, 36),
+      'expression': (True, 37),
+      'factor': (True, 38),
+      'foreach_block': (True, 39),
+      'foreach_statement': (True, 40),
+      'function_block': (True, 41),
+      'function_statement': (True, 42),
+      'if_block': (True, 43),
+      'if_statement': (True, 44),
+      'imports': (True, 45),
+      'indented_arguments': (True, 46),
+      'indented_chain': (True, 47),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'multiplication': (True, 50),
+      'mutation': (True, 51),
+      'mutation_block': (True, 52),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 55),
+      'raise_statement': (True, 56),
+      'regular_expression': (True, 57),
+      'return_statement': (True, 58),
+      'rules': (True, 59),
+      'service': (True, 60),
+      'service_block': (True, 61),
+      'string': (True, 63),
+      'try_block': (True, 64),
+      'try_statement': (True, 65),
+      'values': (True, 66),
+      'void': (True, 67),
+      'when_block': (True, 68),
+      'while_block': (True, 69),
+      'while_statement': (True, 70)},
+ 21: {'DOUBLE_QUOTED': (True, 2),
+      'NAME': (True, 71),
+      'SINGLE_QUOTED': (True, 12),
+      '_CCB': (True, 94),
+      '_NL': (True, 95),
+      '_OP': (True, 72),
+      'inline_expression': (True, 48),
+      'key_value': (True, 96),
+      'path': (True, 97),
+      'string': (True, 98)},
+ 22: {'DASH': (True, 1),
+      'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'PLUS': (True, 9),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 22),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 99),
+      'exponential': (True, 36),
+      'expression': (True, 100),
+      'factor': (True, 38),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'multiplication': (True, 50),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 101),
+      'regular_expression': (True, 57),
+      'service': (True, 102),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 23: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_CSB': (True, 103),
+      '_NL': (True, 104),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 105),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 24: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 106),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 25: {'NAME': (True, 107), 'mutation_fragment': (True, 108)},
+ 26: {'NAME': (True, 71),
+      '_OP': (True, 72),
+      'inline_expression': (True, 48),
+      'path': (True, 109),
+      'service': (True, 110)},
+ 27: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 111),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 28: {'$END': (False, 174),
+      'DASH': (True, 1),
+      'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'FUNCTION_TYPE': (True, 5),
+      'INT': (True, 6),
+      'NAME': (True, 7),
+      'NULL': (True, 8),
+      'PLUS': (True, 9),
+      'RAISE': (True, 10),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      'TRY': (True, 14),
+      '_COLON': (True, 15),
+      '_FOREACH': (True, 16),
+      '_IF': (True, 17),
+      '_IMPORT': (True, 18),
+      '_INDENT': (True, 19),
+      '_OCB': (True, 21),
+      '_OP': (True, 22),
+      '_OSB': (True, 23),
+      '_RETURN': (True, 24),
+      '_THEN': (True, 25),
+      '_WHEN': (True, 26),
+      '_WHILE': (True, 27),
+      'absolute_expression': (True, 29),
+      'arguments': (True, 30),
+      'assignment': (True, 31),
+      'block': (True, 112),
+      'boolean': (True, 33),
+      'chained_mutation': (True, 34),
+      'entity': (True, 35),
+      'exponential': (True, 36),
+      'expression': (True, 37),
+      'factor': (True, 38),
+      'foreach_block': (True, 39),
+      'foreach_statement': (True, 40),
+      'function_block': (True, 41),
+      'function_statement': (True, 42),
+      'if_block': (True, 43),
+      'if_statement': (True, 44),
+      'imports': (True, 45),
+      'indented_arguments': (True, 46),
+      'indented_chain': (True, 47),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'multiplication': (True, 50),
+      'mutation': (True, 51),
+      'mutation_block': (True, 52),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 55),
+      'raise_statement': (True, 56),
+      'regular_expression': (True, 57),
+      'return_statement': (True, 58),
+      'rules': (True, 59),
+      'service': (True, 60),
+      'service_block': (True, 61),
+      'string': (True, 63),
+      'try_block': (True, 64),
+      'try_statement': (True, 65),
+      'values': (True, 66),
+      'void': (True, 67),
+      'when_block': (True, 68),
+      'while_block': (True, 69),
+      'while_statement': (True, 70)},
+ 29: {'_NL': (False, 157)},
+ 30: {'$END': (False, 45),
+      'DASH': (False, 45),
+      'DOUBLE_QUOTED': (False, 45),
+      'FALSE': (False, 45),
+      'FLOAT': (False, 45),
+      'FUNCTION_TYPE': (False, 45),
+      'INT': (False, 45),
+      'NAME': (False, 45),
+      'NULL': (False, 45),
+      'PLUS': (False, 45),
+      'RAISE': (False, 45),
+      'REGEXP': (False, 45),
+      'SINGLE_QUOTED': (False, 45),
+      'TRUE': (False, 45),
+      'TRY': (False, 45),
+      '_COLON': (False, 45),
+      '_DEDENT': (False, 45),
+      '_FOREACH': (False, 45),
+      '_IF': (False, 45),
+      '_IMPORT': (False, 45),
+      '_INDENT': (False, 45),
+      '_NL': (False, 45),
+      '_OCB': (False, 45),
+      '_OP': (False, 45),
+      '_OSB': (False, 45),
+      '_RETURN': (False, 45),
+      '_THEN': (False, 45),
+      '_WHEN': (False, 45),
+      '_WHILE': (False, 45)},
+ 31: {'_NL': (False, 158)},
+ 32: {'$END': (False, 3),
+      'DASH': (False, 3),
+      'DOUBLE_QUOTED': (False, 3),
+      'FALSE': (False, 3),
+      'FLOAT': (False, 3),
+      'FUNCTION_TYPE': (False, 3),
+      'INT': (False, 3),
+      'NAME': (False, 3),
+      'NULL': (False, 3),
+      'PLUS': (False, 3),
+      'RAISE': (False, 3),
+      'REGEXP': (False, 3),
+      'SINGLE_QUOTED': (False, 3),
+      'TRUE': (False, 3),
+      'TRY': (False, 3),
+      '_COLON': (False, 3),
+      '_DEDENT': (False, 3),
+      '_FOREACH': (False, 3),
+      '_IF': (False, 3),
+      '_IMPORT': (False, 3),
+      '_INDENT': (False, 3),
+      '_NL': (False, 159),
+      '_OCB': (False, 3),
+      '_OP': (False, 3),
+      '_OSB': (False, 3),
+      '_RETURN': (False, 3),
+      '_THEN': (False, 3),
+      '_WHEN': (False, 3),
+      '_WHILE': (False, 3)},
+ 33: {'$END': (False, 192),
+      'BSLASH': (False, 192),
+      'DASH': (False, 192),
+      'DOUBLE_QUOTED': (False, 192),
+      'EQUAL': (False, 192),
+      'FALSE': (False, 192),
+      'FLOAT': (False, 192),
+      'FUNCTION_TYPE': (False, 192),
+      'GREATER': (False, 192),
+      'GREATER_EQUAL': (False, 192),
+      'INT': (False, 192),
+      'LESSER': (False, 192),
+      'LESSER_EQUAL': (False, 192),
+      'MODULUS': (False, 192),
+      'MULTIPLIER': (False, 192),
+      'NAME': (False, 192),
+      'NOT': (False, 192),
+      'NULL': (False, 192),
+      'PLUS': (False, 192),
+      'POWER': (False, 192),
+      'RAISE': (False, 192),
+      'REGEXP': (False, 192),
+      'SINGLE_QUOTED': (False, 192),
+      'TRUE': (False, 192),
+      'TRY': (False, 192),
+      '_AS': (False, 192),
+      '_CCB': (False, 192),
+      '_COLON': (False, 192),
+      '_COMMA': (False, 192),
+      '_CP': (False, 192),
+      '_CSB': (False, 192),
+      '_DEDENT': (False, 192),
+      '_FOREACH': (False, 192),
+      '_IF': (False, 192),
+      '_IMPORT': (False, 192),
+      '_INDENT': (False, 192),
+      '_NL': (False, 192),
+      '_OCB': (False, 192),
+      '_OP': (False, 192),
+      '_OSB': (False, 192),
+      '_RETURN': (False, 192),
+      '_THEN': (False, 192),
+      '_WHEN': (False, 192),
+      '_WHILE': (False, 192)},
+ 34: {'$END': (False, 46),
+      'DASH': (False, 46),
+      'DOUBLE_QUOTED': (False, 46),
+      'FALSE': (False, 46),
+      'FLOAT': (False, 46),
+      'FUNCTION_TYPE': (False, 46),
+      'INT': (False, 46),
+      'NAME': (False, 46),
+      'NULL': (False, 46),
+      'PLUS': (False, 46),
+      'RAISE': (False, 46),
+      'REGEXP': (False, 46),
+      'SINGLE_QUOTED': (False, 46),
+      'TRUE': (False, 46),
+      'TRY': (False, 46),
+      '_COLON': (False, 46),
+      '_DEDENT': (False, 46),
+      '_FOREACH': (False, 46),
+      '_IF': (False, 46),
+      '_IMPORT': (False, 46),
+      '_INDENT': (False, 46),
+      '_NL': (False, 46),
+      '_OCB': (False, 46),
+      '_OP': (False, 46),
+      '_OSB': (False, 46),
+      '_RETURN': (False, 46),
+      '_THEN': (False, 46),
+      '_WHEN': (False, 46),
+      '_WHILE': (False, 46)},
+ 35: {'BSLASH': (False, 84),
+      'DASH': (False, 84),
+      'MODULUS': (False, 84),
+      'MULTIPLIER': (False, 84),
+      'NAME': (True, 107),
+      'PLUS': (False, 84),
+      'POWER': (False, 84),
+      '_CP': (False, 84),
+      '_NL': (False, 84),
+      'mutation_fragment': (True, 113)},
+ 36: {'BSLASH': (True, 114),
+      'DASH': (False, 119),
+      'MODULUS': (True, 115),
+      'MULTIPLIER': (True, 116),
+      'PLUS': (False, 119),
+      '_CP': (False, 119),
+      '_NL': (False, 119),
+      '__anon_star_3': (True, 117)},
+ 37: {'_NL': (False, 38)},
+ 38: {'BSLASH': (False, 77),
+      'DASH': (False, 77),
+      'MODULUS': (False, 77),
+      'MULTIPLIER': (False, 77),
+      'PLUS': (False, 77),
+      'POWER': (True, 118),
+      '_CP': (False, 77),
+      '_NL': (False, 77)},
+ 39: {'$END': (False, 47),
+      'DASH': (False, 47),
+      'DOUBLE_QUOTED': (False, 47),
+      'FALSE': (False, 47),
+      'FLOAT': (False, 47),
+      'FUNCTION_TYPE': (False, 47),
+      'INT': (False, 47),
+      'NAME': (False, 47),
+      'NULL': (False, 47),
+      'PLUS': (False, 47),
+      'RAISE': (False, 47),
+      'REGEXP': (False, 47),
+      'SINGLE_QUOTED': (False, 47),
+      'TRUE': (False, 47),
+      'TRY': (False, 47),
+      '_COLON': (False, 47),
+      '_DEDENT': (False, 47),
+      '_FOREACH': (False, 47),
+      '_IF': (False, 47),
+      '_IMPORT': (False, 47),
+      '_INDENT': (False, 47),
+      '_NL': (False, 47),
+      '_OCB': (False, 47),
+      '_OP': (False, 47),
+      '_OSB': (False, 47),
+      '_RETURN': (False, 47),
+      '_THEN': (False, 47),
+      '_WHEN': (False, 47),
+      '_WHILE': (False, 47)},
+ 40: {'_NL': (True, 119)},
+ 41: {'$END': (False, 48),
+      'DASH': (False, 48),
+      'DOUBLE_QUOTED': (False, 48),
+      'FALSE': (False, 48),
+      'FLOAT': (False, 48),
+      'FUNCTION_TYPE': (False, 48),
+      'INT': (False, 48),
+      'NAME': (False, 48),
+      'NULL': (False, 48),
+      'PLUS': (False, 48),
+      'RAISE': (False, 48),
+      'REGEXP': (False, 48),
+      'SINGLE_QUOTED': (False, 48),
+      'TRUE': (False, 48),
+      'TRY': (False, 48),
+      '_COLON': (False, 48),
+      '_DEDENT': (False, 48),
+      '_FOREACH': (False, 48),
+      '_IF': (False, 48),
+      '_IMPORT': (False, 48),
+      '_INDENT': (False, 48),
+      '_NL': (False, 48),
+      '_OCB': (False, 48),
+      '_OP': (False, 48),
+      '_OSB': (False, 48),
+      '_RETURN': (False, 48),
+      '_THEN': (False, 48),
+      '_WHEN': (False, 48),
+      '_WHILE': (False, 48)},
+ 42: {'_NL': (True, 120)},
+ 43: {'$END': (False, 49),
+      'DASH': (False, 49),
+      'DOUBLE_QUOTED': (False, 49),
+      'FALSE': (False, 49),
+      'FLOAT': (False, 49),
+      'FUNCTION_TYPE': (False, 49),
+      'INT': (False, 49),
+      'NAME': (False, 49),
+      'NULL': (False, 49),
+      'PLUS': (False, 49),
+      'RAISE': (False, 49),
+      'REGEXP': (False, 49),
+      'SINGLE_QUOTED': (False, 49),
+      'TRUE': (False, 49),
+      'TRY': (False, 49),
+      '_COLON': (False, 49),
+      '_DEDENT': (False, 49),
+      '_FOREACH': (False, 49),
+      '_IF': (False, 49),
+      '_IMPORT': (False, 49),
+      '_INDENT': (False, 49),
+      '_NL': (False, 49),
+      '_OCB': (False, 49),
+      '_OP': (False, 49),
+      '_OSB': (False, 49),
+      '_RETURN': (False, 49),
+      '_THEN': (False, 49),
+      '_WHEN': (False, 49),
+      '_WHILE': (False, 49)},
+ 44: {'_NL': (True, 121)},
+ 45: {'_NL': (False, 160)},
+ 46: {'$END': (False, 50),
+      'DASH': (False, 50),
+      'DOUBLE_QUOTED': (False, 50),
+      'FALSE': (False, 50),
+      'FLOAT': (False, 50),
+      'FUNCTION_TYPE': (False, 50),
+      'INT': (False, 50),
+      'NAME': (False, 50),
+      'NULL': (False, 50),
+      'PLUS': (False, 50),
+      'RAISE': (False, 50),
+      'REGEXP': (False, 50),
+      'SINGLE_QUOTED': (False, 50),
+      'TRUE': (False, 50),
+      'TRY': (False, 50),
+      '_COLON': (False, 50),
+      '_DEDENT': (False, 50),
+      '_FOREACH': (False, 50),
+      '_IF': (False, 50),
+      '_IMPORT': (False, 50),
+      '_INDENT': (False, 50),
+      '_NL': (False, 50),
+      '_OCB': (False, 50),
+      '_OP': (False, 50),
+      '_OSB': (False, 50),
+      '_RETURN': (False, 50),
+      '_THEN': (False, 50),
+      '_WHEN': (False, 50),
+      '_WHILE': (False, 50)},
+ 47: {'$END': (False, 51),
+      'DASH': (False, 51),
+      'DOUBLE_QUOTED': (False, 51),
+      'FALSE': (False, 51),
+      'FLOAT': (False, 51),
+      'FUNCTION_TYPE': (False, 51),
+      'INT': (False, 51),
+      'NAME': (False, 51),
+      'NULL': (False, 51),
+      'PLUS': (False, 51),
+      'RAISE': (False, 51),
+      'REGEXP': (False, 51),
+      'SINGLE_QUOTED': (False, 51),
+      'TRUE': (False, 51),
+      'TRY': (False, 51),
+      '_COLON': (False, 51),
+      '_DEDENT': (False, 51),
+      '_FOREACH': (False, 51),
+      '_IF': (False, 51),
+      '_IMPORT': (False, 51),
+      '_INDENT': (False, 51),
+      '_NL': (False, 51),
+      '_OCB': (False, 51),
+      '_OP': (False, 51),
+      '_OSB': (False, 51),
+      '_RETURN': (False, 51),
+      '_THEN': (False, 51),
+      '_WHEN': (False, 51),
+      '_WHILE': (False, 51)},
+ 48: {'$END': (False, 146),
+      'BSLASH': (False, 146),
+      'DASH': (False, 146),
+      'DOUBLE_QUOTED': (False, 146),
+      'EQUAL': (False, 146),
+      'EQUALS': (False, 146),
+      'FALSE': (False, 146),
+      'FLOAT': (False, 146),
+      'FUNCTION_TYPE': (False, 146),
+      'GREATER': (False, 146),
+      'GREATER_EQUAL': (False, 146),
+      'INT': (False, 146),
+      'LESSER': (False, 146),
+      'LESSER_EQUAL': (False, 146),
+      'MODULUS': (False, 146),
+      'MULTIPLIER': (False, 146),
+      'NAME': (False, 146),
+      'NOT': (False, 146),
+      'NULL': (False, 146),
+      'PLUS': (False, 146),
+      'POWER': (False, 146),
+      'RAISE': (False, 146),
+      'REGEXP': (False, 146),
+      'SINGLE_QUOTED': (False, 146),
+      'TRUE': (False, 146),
+      'TRY': (False, 146),
+      '_AS': (False, 146),
+      '_CCB': (False, 146),
+      '_COLON': (False, 146),
+      '_COMMA': (False, 146),
+      '_CP': (False, 146),
+      '_CSB': (False, 146),
+      '_DEDENT': (False, 146),
+      '_DOT': (True, 77),
+      '_FOREACH': (False, 146),
+      '_IF': (False, 146),
+      '_IMPORT': (False, 146),
+      '_INDENT': (False, 146),
+      '_NL': (False, 146),
+      '_OCB': (False, 146),
+      '_OP': (False, 146),
+      '_OSB': (True, 78),
+      '_RETURN': (False, 146),
+      '_THEN': (False, 146),
+      '_WHEN': (False, 146),
+      '_WHILE': (False, 146),
+      '__anon_star_2': (True, 122),
+      'path_fragment': (True, 80)},
+ 49: {'$END': (False, 193),
+      'BSLASH': (False, 193),
+      'DASH': (False, 193),
+      'DOUBLE_QUOTED': (False, 193),
+      'EQUAL': (False, 193),
+      'FALSE': (False, 193),
+      'FLOAT': (False, 193),
+      'FUNCTION_TYPE': (False, 193),
+      'GREATER': (False, 193),
+      'GREATER_EQUAL': (False, 193),
+      'INT': (False, 193),
+      'LESSER': (False, 193),
+      'LESSER_EQUAL': (False, 193),
+      'MODULUS': (False, 193),
+      'MULTIPLIER': (False, 193),
+      'NAME': (False, 193),
+      'NOT': (False, 193),
+      'NULL': (False, 193),
+      'PLUS': (False, 193),
+      'POWER': (False, 193),
+      'RAISE': (False, 193),
+      'REGEXP': (False, 193),
+      'SINGLE_QUOTED': (False, 193),
+      'TRUE': (False, 193),
+      'TRY': (False, 193),
+      '_AS': (False, 193),
+      '_CCB': (False, 193),
+      '_COLON': (False, 193),
+      '_COMMA': (False, 193),
+      '_CP': (False, 193),
+      '_CSB': (False, 193),
+      '_DEDENT': (False, 193),
+      '_FOREACH': (False, 193),
+      '_IF': (False, 193),
+      '_IMPORT': (False, 193),
+      '_INDENT': (False, 193),
+      '_NL': (False, 193),
+      '_OCB': (False, 193),
+      '_OP': (False, 193),
+      '_OSB': (False, 193),
+      '_RETURN': (False, 193),
+      '_THEN': (False, 193),
+      '_WHEN': (False, 193),
+      '_WHILE': (False, 193)},
+ 50: {'DASH': (True, 123),
+      'PLUS': (True, 124),
+      '_CP': (False, 79),
+      '_NL': (False, 79),
+      '__anon_star_4': (True, 125)},
+ 51: {'_NL': (True, 126)},
+ 52: {'$END': (False, 52),
+      'DASH': (False, 52),
+      'DOUBLE_QUOTED': (False, 52),
+      'FALSE': (False, 52),
+      'FLOAT': (False, 52),
+      'FUNCTION_TYPE': (False, 52),
+      'INT': (False, 52),
+      'NAME': (False, 52),
+      'NULL': (False, 52),
+      'PLUS': (False, 52),
+      'RAISE': (False, 52),
+      'REGEXP': (False, 52),
+      'SINGLE_QUOTED': (False, 52),
+      'TRUE': (False, 52),
+      'TRY': (False, 52),
+      '_COLON': (False, 52),
+      '_DEDENT': (False, 52),
+      '_FOREACH': (False, 52),
+      '_IF': (False, 52),
+      '_IMPORT': (False, 52),
+      '_INDENT': (False, 52),
+      '_NL': (False, 52),
+      '_OCB': (False, 52),
+      '_OP': (False, 52),
+      '_OSB': (False, 52),
+      '_RETURN': (False, 52),
+      '_THEN': (False, 52),
+      '_WHEN': (False, 52),
+      '_WHILE': (False, 52)},
+ 53: {'$END': (False, 194),
+      'BSLASH': (False, 194),
+      'DASH': (False, 194),
+      'DOUBLE_QUOTED': (False, 194),
+      'EQUAL': (False, 194),
+      'FALSE': (False, 194),
+      'FLOAT': (False, 194),
+      'FUNCTION_TYPE': (False, 194),
+      'GREATER': (False, 194),
+      'GREATER_EQUAL': (False, 194),
+      'INT': (False, 194),
+      'LESSER': (False, 194),
+      'LESSER_EQUAL': (False, 194),
+      'MODULUS': (False, 194),
+      'MULTIPLIER': (False, 194),
+      'NAME': (False, 194),
+      'NOT': (False, 194),
+      'NULL': (False, 194),
+      'PLUS': (False, 194),
+      'POWER': (False, 194),
+      'RAISE': (False, 194),
+      'REGEXP': (False, 194),
+      'SINGLE_QUOTED': (False, 194),
+      'TRUE': (False, 194),
+      'TRY': (False, 194),
+      '_AS': (False, 194),
+      '_CCB': (False, 194),
+      '_COLON': (False, 194),
+      '_COMMA': (False, 194),
+      '_CP': (False, 194),
+      '_CSB': (False, 194),
+      '_DEDENT': (False, 194),
+      '_FOREACH': (False, 194),
+      '_IF': (False, 194),
+      '_IMPORT': (False, 194),
+      '_INDENT': (False, 194),
+      '_NL': (False, 194),
+      '_OCB': (False, 194),
+      '_OP': (False, 194),
+      '_OSB': (False, 194),
+      '_RETURN': (False, 194),
+      '_THEN': (False, 194),
+      '_WHEN': (False, 194),
+      '_WHILE': (False, 194)},
+ 54: {'$END': (False, 195),
+      'BSLASH': (False, 195),
+      'DASH': (False, 195),
+      'DOUBLE_QUOTED': (False, 195),
+      'EQUAL': (False, 195),
+      'FALSE': (False, 195),
+      'FLOAT': (False, 195),
+      'FUNCTION_TYPE': (False, 195),
+      'GREATER': (False, 195),
+      'GREATER_EQUAL': (False, 195),
+      'INT': (False, 195),
+      'LESSER': (False, 195),
+      'LESSER_EQUAL': (False, 195),
+      'MODULUS': (False, 195),
+      'MULTIPLIER': (False, 195),
+      'NAME': (False, 195),
+      'NOT': (False, 195),
+      'NULL': (False, 195),
+      'PLUS': (False, 195),
+      'POWER': (False, 195),
+      'RAISE': (False, 195),
+      'REGEXP': (False, 195),
+      'SINGLE_QUOTED': (False, 195),
+      'TRUE': (False, 195),
+      'TRY': (False, 195),
+      '_AS': (False, 195),
+      '_CCB': (False, 195),
+      '_COLON': (False, 195),
+      '_COMMA': (False, 195),
+      '_CP': (False, 195),
+      '_CSB': (False, 195),
+      '_DEDENT': (False, 195),
+      '_FOREACH': (False, 195),
+      '_IF': (False, 195),
+      '_IMPORT': (False, 195),
+      '_INDENT': (False, 195),
+      '_NL': (False, 195),
+      '_OCB': (False, 195),
+      '_OP': (False, 195),
+      '_OSB': (False, 195),
+      '_RETURN': (False, 195),
+      '_THEN': (False, 195),
+      '_WHEN': (False, 195),
+      '_WHILE': (False, 195)},
+ 55: {'$END': (False, 75),
+      'BSLASH': (False, 75),
+      'DASH': (False, 75),
+      'DOUBLE_QUOTED': (False, 75),
+      'EQUAL': (False, 75),
+      'EQUALS': (True, 127),
+      'FALSE': (False, 75),
+      'FLOAT': (False, 75),
+      'FUNCTION_TYPE': (False, 75),
+      'GREATER': (False, 75),
+      'GREATER_EQUAL': (False, 75),
+      'INT': (False, 75),
+      'LESSER': (False, 75),
+      'LESSER_EQUAL': (False, 75),
+      'MODULUS': (False, 75),
+      'MULTIPLIER': (False, 75),
+      'NAME': (True, 128),
+      'NOT': (False, 75),
+      'NULL': (False, 75),
+      'PLUS': (False, 75),
+      'POWER': (False, 75),
+      'RAISE': (False, 75),
+      'REGEXP': (False, 75),
+      'SINGLE_QUOTED': (False, 75),
+      'TRUE': (False, 75),
+      'TRY': (False, 75),
+      '_AS': (False, 75),
+      '_CCB': (False, 75),
+      '_COLON': (True, 15),
+      '_COMMA': (False, 75),
+      '_CP': (False, 75),
+      '_CSB': (False, 75),
+      '_DEDENT': (False, 75),
+      '_FOREACH': (False, 75),
+      '_IF': (False, 75),
+      '_IMPORT': (False, 75),
+      '_INDENT': (False, 75),
+      '_NL': (False, 75),
+      '_OCB': (False, 75),
+      '_OP': (False, 75),
+      '_OSB': (False, 75),
+      '_RETURN': (False, 75),
+      '_THEN': (False, 75),
+      '_WHEN': (False, 75),
+      '_WHILE': (False, 75),
+      '__anon_star_5': (True, 129),
+      'arguments': (True, 130),
+      'assignment_fragment': (True, 131),
+      'command': (True, 132),
+      'service_fragment': (True, 133)},
+ 56: {'_NL': (False, 161)},
+ 57: {'$END': (False, 196),
+      'BSLASH': (False, 196),
+      'DASH': (False, 196),
+      'DOUBLE_QUOTED': (False, 196),
+      'EQUAL': (False, 196),
+      'FALSE': (False, 196),
+      'FLOAT': (False, 196),
+      'FUNCTION_TYPE': (False, 196),
+      'GREATER': (False, 196),
+      'GREATER_EQUAL': (False, 196),
+      'INT': (False, 196),
+      'LESSER': (False, 196),
+      'LESSER_EQUAL': (False, 196),
+      'MODULUS': (False, 196),
+      'MULTIPLIER': (False, 196),
+      'NAME': (False, 196),
+      'NOT': (False, 196),
+      'NULL': (False, 196),
+      'PLUS': (False, 196),
+      'POWER': (False, 196),
+      'RAISE': (False, 196),
+      'REGEXP': (False, 196),
+      'SINGLE_QUOTED': (False, 196),
+      'TRUE': (False, 196),
+      'TRY': (False, 196),
+      '_AS': (False, 196),
+      '_CCB': (False, 196),
+      '_COLON': (False, 196),
+      '_COMMA': (False, 196),
+      '_CP': (False, 196),
+      '_CSB': (False, 196),
+      '_DEDENT': (False, 196),
+      '_FOREACH': (False, 196),
+      '_IF': (False, 196),
+      '_IMPORT': (False, 196),
+      '_INDENT': (False, 196),
+      '_NL': (False, 196),
+      '_OCB': (False, 196),
+      '_OP': (False, 196),
+      '_OSB': (False, 196),
+      '_RETURN': (False, 196),
+      '_THEN': (False, 196),
+      '_WHEN': (False, 196),
+      '_WHILE': (False, 196)},
+ 58: {'_NL': (False, 162)},
+ 59: {'_NL': (True, 134)},
+ 60: {'_NL': (True, 135)},
+ 61: {'$END': (False, 54),
+      'DASH': (False, 54),
+      'DOUBLE_QUOTED': (False, 54),
+      'FALSE': (False, 54),
+      'FLOAT': (False, 54),
+      'FUNCTION_TYPE': (False, 54),
+      'INT': (False, 54),
+      'NAME': (False, 54),
+      'NULL': (False, 54),
+      'PLUS': (False, 54),
+      'RAISE': (False, 54),
+      'REGEXP': (False, 54),
+      'SINGLE_QUOTED': (False, 54),
+      'TRUE': (False, 54),
+      'TRY': (False, 54),
+      '_COLON': (False, 54),
+      '_DEDENT': (False, 54),
+      '_FOREACH': (False, 54),
+      '_IF': (False, 54),
+      '_IMPORT': (False, 54),
+      '_INDENT': (False, 54),
+      '_NL': (False, 54),
+      '_OCB': (False, 54),
+      '_OP': (False, 54),
+      '_OSB': (False, 54),
+      '_RETURN': (False, 54),
+      '_THEN': (False, 54),
+      '_WHEN': (False, 54),
+      '_WHILE': (False, 54)},
+ 62: {'$END': (True, 136)},
+ 63: {'$END': (False, 197),
+      'BSLASH': (False, 197),
+      'DASH': (False, 197),
+      'DOUBLE_QUOTED': (False, 197),
+      'EQUAL': (False, 197),
+      'FALSE': (False, 197),
+      'FLOAT': (False, 197),
+      'FUNCTION_TYPE': (False, 197),
+      'GREATER': (False, 197),
+      'GREATER_EQUAL': (False, 197),
+      'INT': (False, 197),
+      'LESSER': (False, 197),
+      'LESSER_EQUAL': (False, 197),
+      'MODULUS': (False, 197),
+      'MULTIPLIER': (False, 197),
+      'NAME': (False, 197),
+      'NOT': (False, 197),
+      'NULL': (False, 197),
+      'PLUS': (False, 197),
+      'POWER': (False, 197),
+      'RAISE': (False, 197),
+      'REGEXP': (False, 197),
+      'SINGLE_QUOTED': (False, 197),
+      'TRUE': (False, 197),
+      'TRY': (False, 197),
+      '_AS': (False, 197),
+      '_CCB': (False, 197),
+      '_COLON': (False, 197),
+      '_COMMA': (False, 197),
+      '_CP': (False, 197),
+      '_CSB': (False, 197),
+      '_DEDENT': (False, 197),
+      '_FOREACH': (False, 197),
+      '_IF': (False, 197),
+      '_IMPORT': (False, 197),
+      '_INDENT': (False, 197),
+      '_NL': (False, 197),
+      '_OCB': (False, 197),
+      '_OP': (False, 197),
+      '_OSB': (False, 197),
+      '_RETURN': (False, 197),
+      '_THEN': (False, 197),
+      '_WHEN': (False, 197),
+      '_WHILE': (False, 197)},
+ 64: {'$END': (False, 55),
+      'DASH': (False, 55),
+      'DOUBLE_QUOTED': (False, 55),
+      'FALSE': (False, 55),
+      'FLOAT': (False, 55),
+      'FUNCTION_TYPE': (False, 55),
+      'INT': (False, 55),
+      'NAME': (False, 55),
+      'NULL': (False, 55),
+      'PLUS': (False, 55),
+      'RAISE': (False, 55),
+      'REGEXP': (False, 55),
+      'SINGLE_QUOTED': (False, 55),
+      'TRUE': (False, 55),
+      'TRY': (False, 55),
+      '_COLON': (False, 55),
+      '_DEDENT': (False, 55),
+      '_FOREACH': (False, 55),
+      '_IF': (False, 55),
+      '_IMPORT': (False, 55),
+      '_INDENT': (False, 55),
+      '_NL': (False, 55),
+      '_OCB': (False, 55),
+      '_OP': (False, 55),
+      '_OSB': (False, 55),
+      '_RETURN': (False, 55),
+      '_THEN': (False, 55),
+      '_WHEN': (False, 55),
+      '_WHILE': (False, 55)},
+ 65: {'_NL': (True, 137)},
+ 66: {'$END': (False, 76),
+      'BSLASH': (False, 76),
+      'DASH': (False, 76),
+      'DOUBLE_QUOTED': (False, 76),
+      'EQUAL': (False, 76),
+      'FALSE': (False, 76),
+      'FLOAT': (False, 76),
+      'FUNCTION_TYPE': (False, 76),
+      'GREATER': (False, 76),
+      'GREATER_EQUAL': (False, 76),
+      'INT': (False, 76),
+      'LESSER': (False, 76),
+      'LESSER_EQUAL': (False, 76),
+      'MODULUS': (False, 76),
+      'MULTIPLIER': (False, 76),
+      'NAME': (False, 76),
+      'NOT': (False, 76),
+      'NULL': (False, 76),
+      'PLUS': (False, 76),
+      'POWER': (False, 76),
+      'RAISE': (False, 76),
+      'REGEXP': (False, 76),
+      'SINGLE_QUOTED': (False, 76),
+      'TRUE': (False, 76),
+      'TRY': (False, 76),
+      '_AS': (False, 76),
+      '_CCB': (False, 76),
+      '_COLON': (False, 76),
+      '_COMMA': (False, 76),
+      '_CP': (False, 76),
+      '_CSB': (False, 76),
+      '_DEDENT': (False, 76),
+      '_FOREACH': (False, 76),
+      '_IF': (False, 76),
+      '_IMPORT': (False, 76),
+      '_INDENT': (False, 76),
+      '_NL': (False, 76),
+      '_OCB': (False, 76),
+      '_OP': (False, 76),
+      '_OSB': (False, 76),
+      '_RETURN': (False, 76),
+      '_THEN': (False, 76),
+      '_WHEN': (False, 76),
+      '_WHILE': (False, 76)},
+ 67: {'$END': (False, 198),
+      'BSLASH': (False, 198),
+      'DASH': (False, 198),
+      'DOUBLE_QUOTED': (False, 198),
+      'EQUAL': (False, 198),
+      'FALSE': (False, 198),
+      'FLOAT': (False, 198),
+      'FUNCTION_TYPE': (False, 198),
+      'GREATER': (False, 198),
+      'GREATER_EQUAL': (False, 198),
+      'INT': (False, 198),
+      'LESSER': (False, 198),
+      'LESSER_EQUAL': (False, 198),
+      'MODULUS': (False, 198),
+      'MULTIPLIER': (False, 198),
+      'NAME': (False, 198),
+      'NOT': (False, 198),
+      'NULL': (False, 198),
+      'PLUS': (False, 198),
+      'POWER': (False, 198),
+      'RAISE': (False, 198),
+      'REGEXP': (False, 198),
+      'SINGLE_QUOTED': (False, 198),
+      'TRUE': (False, 198),
+      'TRY': (False, 198),
+      '_AS': (False, 198),
+      '_CCB': (False, 198),
+      '_COLON': (False, 198),
+      '_COMMA': (False, 198),
+      '_CP': (False, 198),
+      '_CSB': (False, 198),
+      '_DEDENT': (False, 198),
+      '_FOREACH': (False, 198),
+      '_IF': (False, 198),
+      '_IMPORT': (False, 198),
+      '_INDENT': (False, 198),
+      '_NL': (False, 198),
+      '_OCB': (False, 198),
+      '_OP': (False, 198),
+      '_OSB': (False, 198),
+      '_RETURN': (False, 198),
+      '_THEN': (False, 198),
+      '_WHEN': (False, 198),
+      '_WHILE': (False, 198)},
+ 68: {'$END': (False, 56),
+      'DASH': (False, 56),
+      'DOUBLE_QUOTED': (False, 56),
+      'FALSE': (False, 56),
+      'FLOAT': (False, 56),
+      'FUNCTION_TYPE': (False, 56),
+      'INT': (False, 56),
+      'NAME': (False, 56),
+      'NULL': (False, 56),
+      'PLUS': (False, 56),
+      'RAISE': (False, 56),
+      'REGEXP': (False, 56),
+      'SINGLE_QUOTED': (False, 56),
+      'TRUE': (False, 56),
+      'TRY': (False, 56),
+      '_COLON': (False, 56),
+      '_DEDENT': (False, 56),
+      '_FOREACH': (False, 56),
+      '_IF': (False, 56),
+      '_IMPORT': (False, 56),
+      '_INDENT': (False, 56),
+      '_NL': (False, 56),
+      '_OCB': (False, 56),
+      '_OP': (False, 56),
+      '_OSB': (False, 56),
+      '_RETURN': (False, 56),
+      '_THEN': (False, 56),
+      '_WHEN': (False, 56),
+      '_WHILE': (False, 56)},
+ 69: {'$END': (False, 57),
+      'DASH': (False, 57),
+      'DOUBLE_QUOTED': (False, 57),
+      'FALSE': (False, 57),
+      'FLOAT': (False, 57),
+      'FUNCTION_TYPE': (False, 57),
+      'INT': (False, 57),
+      'NAME': (False, 57),
+      'NULL': (False, 57),
+      'PLUS': (False, 57),
+      'RAISE': (False, 57),
+      'REGEXP': (False, 57),
+      'SINGLE_QUOTED': (False, 57),
+      'TRUE': (False, 57),
+      'TRY': (False, 57),
+      '_COLON': (False, 57),
+      '_DEDENT': (False, 57),
+      '_FOREACH': (False, 57),
+      '_IF': (False, 57),
+      '_IMPORT': (False, 57),
+      '_INDENT': (False, 57),
+      '_NL': (False, 57),
+      '_OCB': (False, 57),
+      '_OP': (False, 57),
+      '_OSB': (False, 57),
+      '_RETURN': (False, 57),
+      '_THEN': (False, 57),
+      '_WHEN': (False, 57),
+      '_WHILE': (False, 57)},
+ 70: {'_NL': (True, 138)},
+ 71: {'$END': (False, 144),
+      'BSLASH': (False, 144),
+      'DASH': (False, 144),
+      'DOUBLE_QUOTED': (False, 144),
+      'EQUAL': (False, 144),
+      'EQUALS': (False, 144),
+      'FALSE': (False, 144),
+      'FLOAT': (False, 144),
+      'FUNCTION_TYPE': (False, 144),
+      'GREATER': (False, 144),
+      'GREATER_EQUAL': (False, 144),
+      'INT': (False, 144),
+      'LESSER': (False, 144),
+      'LESSER_EQUAL': (False, 144),
+      'MODULUS': (False, 144),
+      'MULTIPLIER': (False, 144),
+      'NAME': (False, 144),
+      'NOT': (False, 144),
+      'NULL': (False, 144),
+      'PLUS': (False, 144),
+      'POWER': (False, 144),
+      'RAISE': (False, 144),
+      'REGEXP': (False, 144),
+      'SINGLE_QUOTED': (False, 144),
+      'TRUE': (False, 144),
+      'TRY': (False, 144),
+      '_AS': (False, 144),
+      '_CCB': (False, 144),
+      '_COLON': (False, 144),
+      '_COMMA': (False, 144),
+      '_CP': (False, 144),
+      '_CSB': (False, 144),
+      '_DEDENT': (False, 144),
+      '_DOT': (True, 77),
+      '_FOREACH': (False, 144),
+      '_IF': (False, 144),
+      '_IMPORT': (False, 144),
+      '_INDENT': (False, 144),
+      '_NL': (False, 144),
+      '_OCB': (False, 144),
+      '_OP': (False, 144),
+      '_OSB': (True, 78),
+      '_RETURN': (False, 144),
+      '_THEN': (False, 144),
+      '_WHEN': (False, 144),
+      '_WHILE': (False, 144),
+      '__anon_star_2': (True, 79),
+      'path_fragment': (True, 80)},
+ 72: {'NAME': (True, 71),
+      '_OP': (True, 72),
+      'inline_expression': (True, 48),
+      'path': (True, 139),
+      'service': (True, 102)},
+ 73: {'BSLASH': (False, 81),
+      'DASH': (False, 81),
+      'MODULUS': (False, 81),
+      'MULTIPLIER': (False, 81),
+      'PLUS': (False, 81),
+      'POWER': (False, 81),
+      '_CP': (False, 81),
+      '_NL': (False, 81)},
+ 74: {'$END': (False, 75),
+      'BSLASH': (False, 75),
+      'DASH': (False, 75),
+      'DOUBLE_QUOTED': (False, 75),
+      'EQUAL': (False, 75),
+      'FALSE': (False, 75),
+      'FLOAT': (False, 75),
+      'FUNCTION_TYPE': (False, 75),
+      'GREATER': (False, 75),
+      'GREATER_EQUAL': (False, 75),
+      'INT': (False, 75),
+      'LESSER': (False, 75),
+      'LESSER_EQUAL': (False, 75),
+      'MODULUS': (False, 75),
+      'MULTIPLIER': (False, 75),
+      'NAME': (False, 75),
+      'NOT': (False, 75),
+      'NULL': (False, 75),
+      'PLUS': (False, 75),
+      'POWER': (False, 75),
+      'RAISE': (False, 75),
+      'REGEXP': (False, 75),
+      'SINGLE_QUOTED': (False, 75),
+      'TRUE': (False, 75),
+      'TRY': (False, 75),
+      '_AS': (False, 75),
+      '_CCB': (False, 75),
+      '_COLON': (False, 75),
+      '_COMMA': (False, 75),
+      '_CP': (False, 75),
+      '_CSB': (False, 75),
+      '_DEDENT': (False, 75),
+      '_FOREACH': (False, 75),
+      '_IF': (False, 75),
+      '_IMPORT': (False, 75),
+      '_INDENT': (False, 75),
+      '_NL': (False, 75),
+      '_OCB': (False, 75),
+      '_OP': (False, 75),
+      '_OSB': (False, 75),
+      '_RETURN': (False, 75),
+      '_THEN': (False, 75),
+      '_WHEN': (False, 75),
+      '_WHILE': (False, 75)},
+ 75: {'NAME': (True, 140),
+      '_NL': (False, 91),
+      '_RETURNS': (True, 141),
+      '__anon_star_11': (True, 142),
+      'function_output': (True, 143),
+      'typed_argument': (True, 144)},
+ 76: {'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'INT': (True, 6),
+      'NAME': (True, 71),
+      'NULL': (True, 8),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      '_OCB': (True, 21),
+      '_OP': (True, 72),
+      '_OSB': (True, 23),
+      'boolean': (True, 33),
+      'entity': (True, 145),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 74),
+      'regular_expression': (True, 57),
+      'string': (True, 63),
+      'values': (True, 66),
+      'void': (True, 67)},
+ 77: {'NAME': (True, 146)},
+ 78: {'DOUBLE_QUOTED': (True, 2),
+      'INT': (True, 147),
+      'NAME': (True, 71),
+      'SINGLE_QUOTED': (True, 12),
+      '_OP': (True, 72),
+      'inline_expression': (True, 48),
+      'path': (True, 148),
+      'string': (True, 149)},
+ 79: {'$END': (False, 145),
+      'BSLASH': (False, 145),
+      'DASH': (False, 145),
+      'DOUBLE_QUOTED': (False, 145),
+      'EQUAL': (False, 145),
+      'EQUALS': (False, 145),
+      'FALSE': (False, 145),
+      'FLOAT': (False, 145),
+      'FUNCTION_TYPE': (False, 145),
+      'GREATER': (False, 145),
+      'GREATER_EQUAL': (False, 145),
+      'INT': (False, 145),
+      'LESSER': (False, 145),
+      'LESSER_EQUAL': (False, 145),
+      'MODULUS': (False, 145),
+      'MULTIPLIER': (False, 145),
+      'NAME': (False, 145),
+      'NOT': (False, 145),
+      'NULL': (False, 145),
+      'PLUS': (False, 145),
+      'POWER': (False, 145),
+      'RAISE': (False, 145),
+      'REGEXP': (False, 145),
+      'SINGLE_QUOTED': (False, 145),
+      'TRUE': (False, 145),
+      'TRY': (False, 145),
+      '_AS': (False, 145),
+      '_CCB': (False, 145),
+      '_COLON': (False, 145),
+      '_COMMA': (False, 145),
+      '_CP': (False, 145),
+      '_CSB': (False, 145),
+      '_DEDENT': (False, 145),
+      '_DOT': (True, 77),
+      '_FOREACH': (False, 145),
+      '_IF': (False, 145),
+      '_IMPORT': (False, 145),
+      '_INDENT': (False, 145),
+      '_NL': (False, 145),
+      '_OCB': (False, 145),
+      '_OP': (False, 145),
+      '_OSB': (True, 78),
+      '_RETURN': (False, 145),
+      '_THEN': (False, 145),
+      '_WHEN': (False, 145),
+      '_WHILE': (False, 145),
+      'path_fragment': (True, 150)},
+ 80: {'$END': (False, 19),
+      'BSLASH': (False, 19),
+      'DASH': (False, 19),
+      'DOUBLE_QUOTED': (False, 19),
+      'EQUAL': (False, 19),
+      'EQUALS': (False, 19),
+      'FALSE': (False, 19),
+      'FLOAT': (False, 19),
+      'FUNCTION_TYPE': (False, 19),
+      'GREATER': (False, 19),
+      'GREATER_EQUAL': (False, 19),
+      'INT': (False, 19),
+      'LESSER': (False, 19),
+      'LESSER_EQUAL': (False, 19),
+      'MODULUS': (False, 19),
+      'MULTIPLIER': (False, 19),
+      'NAME': (False, 19),
+      'NOT': (False, 19),
+      'NULL': (False, 19),
+      'PLUS': (False, 19),
+      'POWER': (False, 19),
+      'RAISE': (False, 19),
+      'REGEXP': (False, 19),
+      'SINGLE_QUOTED': (False, 19),
+      'TRUE': (False, 19),
+      'TRY': (False, 19),
+      '_AS': (False, 19),
+      '_CCB': (False, 19),
+      '_COLON': (False, 19),
+      '_COMMA': (False, 19),
+      '_CP': (False, 19),
+      '_CSB': (False, 19),
+      '_DEDENT': (False, 19),
+      '_DOT': (False, 19),
+      '_FOREACH': (False, 19),
+      '_IF': (False, 19),
+      '_IMPORT': (False, 19),
+      '_INDENT': (False, 19),
+      '_NL': (False, 19),
+      '_OCB': (False, 19),
+      '_OP': (False, 19),
+      '_OSB': (False, 19),
+      '_RETURN': (False, 19),
+      '_THEN': (False, 19),
+      '_WHEN': (False, 19),
+      '_WHILE': (False, 19)},
+ 81: {'BSLASH': (False, 82),
+      'DASH': (False, 82),
+      'MODULUS': (False, 82),
+      'MULTIPLIER': (False, 82),
+      'PLUS': (False, 82),
+      'POWER': (False, 82),
+      '_CP': (False, 82),
+      '_NL': (False, 82)},
+ 82: {'_NL': (False, 153)},
+ 83: {'$END': (False, 155),
+      'BSLASH': (False, 155),
+      'DASH': (False, 155),
+      'DOUBLE_QUOTED': (False, 155),
+      'EQUAL': (False, 155),
+      'FALSE': (False, 155),
+      'FLOAT': (False, 155),
+      'FUNCTION_TYPE': (False, 155),
+      'GREATER': (False, 155),
+      'GREATER_EQUAL': (False, 155),
+      'INT': (False, 155),
+      'LESSER': (False, 155),
+      'LESSER_EQUAL': (False, 155),
+      'MODULUS': (False, 155),
+      'MULTIPLIER': (False, 155),
+      'NAME': (False, 155),
+      'NOT': (False, 155),
+      'NULL': (False, 155),
+      'PLUS': (False, 155),
+      'POWER': (False, 155),
+      'RAISE': (False, 155),
+      'REGEXP': (False, 155),
+      'SINGLE_QUOTED': (False, 155),
+      'TRUE': (False, 155),
+      'TRY': (False, 155),
+      '_AS': (False, 155),
+      '_CCB': (False, 155),
+      '_COLON': (False, 155),
+      '_COMMA': (False, 155),
+      '_CP': (False, 155),
+      '_CSB': (False, 155),
+      '_DEDENT': (False, 155),
+      '_FOREACH': (False, 155),
+      '_IF': (False, 155),
+      '_IMPORT': (False, 155),
+      '_INDENT': (False, 155),
+      '_NL': (False, 155),
+      '_OCB': (False, 155),
+      '_OP': (False, 155),
+      '_OSB': (False, 155),
+      '_RETURN': (False, 155),
+      '_THEN': (False, 155),
+      '_WHEN': (False, 155),
+      '_WHILE': (False, 155)},
+ 84: {'$END': (False, 40),
+      'DASH': (False, 40),
+      'DOUBLE_QUOTED': (False, 40),
+      'FALSE': (False, 40),
+      'FLOAT': (False, 40),
+      'FUNCTION_TYPE': (False, 40),
+      'INT': (False, 40),
+      'NAME': (False, 40),
+      'NULL': (False, 40),
+      'PLUS': (False, 40),
+      'RAISE': (False, 40),
+      'REGEXP': (False, 40),
+      'SINGLE_QUOTED': (False, 40),
+      'TRUE': (False, 40),
+      'TRY': (False, 40),
+      '_AS': (False, 40),
+      '_COLON': (False, 40),
+      '_CP': (False, 40),
+      '_DEDENT': (False, 40),
+      '_FOREACH': (False, 40),
+      '_IF': (False, 40),
+      '_IMPORT': (False, 40),
+      '_INDENT': (False, 40),
+      '_NL': (False, 40),
+      '_OCB': (False, 40),
+      '_OP': (False, 40),
+      '_OSB': (False, 40),
+      '_RETURN': (False, 40),
+      '_THEN': (False, 40),
+      '_WHEN': (False, 40),
+      '_WHILE': (False, 40)},
+ 85: {'_AS': (True, 151), 'output': (True, 152)},
+ 86: {'EQUAL': (True, 153),
+      'GREATER': (True, 154),
+      'GREATER_EQUAL': (True, 155),
+      'LESSER': (True, 156),
+      'LESSER_EQUAL': (True, 157),
+      'NOT': (True, 158),
+      '_NL': (False, 99),
+      'comparisons': (True, 159)},
+ 87: {'_AS': (True, 160)},
+ 88: {'_COLON': (True, 76)},
+ 89: {'NAME': (True, 88),
+      '_COLON': (True, 15),
+      '_DEDENT': (True, 161),
+      'arguments': (True, 162)},
+ 90: {'_DEDENT': (True, 163),
+      '_THEN': (True, 25),
+      'chained_mutation': (True, 164)},
+ 91: {'_NL': (True, 165)},
+ 92: {'_NL': (True, 166)},
+ 93: {'$END': (False, 173),
+      'DASH': (True, 1),
+      'DOUBLE_QUOTED': (True, 2),
+      'FALSE': (True, 3),
+      'FLOAT': (True, 4),
+      'FUNCTION_TYPE': (True, 5),
+      'INT': (True, 6),
+      'NAME': (True, 7),
+      'NULL': (True, 8),
+      'PLUS': (True, 9),
+      'RAISE': (True, 10),
+      'REGEXP': (True, 11),
+      'SINGLE_QUOTED': (True, 12),
+      'TRUE': (True, 13),
+      'TRY': (True, 14),
+      '_COLON': (True, 15),
+      '_FOREACH': (True, 16),
+      '_IF': (True, 17),
+      '_IMPORT': (True, 18),
+      '_INDENT': (True, 19),
+      '_OCB': (True, 21),
+      '_OP': (True, 22),
+      '_OSB': (True, 23),
+      '_RETURN': (True, 24),
+      '_THEN': (True, 25),
+      '_WHEN': (True, 26),
+      '_WHILE': (True, 27),
+      'absolute_expression': (True, 29),
+      'arguments': (True, 30),
+      'assignment': (True, 31),
+      'block': (True, 112),
+      'boolean': (True, 33),
+      'chained_mutation': (True, 34),
+      'entity': (True, 35),
+      'exponential': (True, 36),
+      'expression': (True, 37),
+      'factor': (True, 38),
+      'foreach_block': (True, 39),
+      'foreach_statement': (True, 40),
+      'function_block': (True, 41),
+      'function_statement': (True, 42),
+      'if_block': (True, 43),
+      'if_statement': (True, 44),
+      'imports': (True, 45),
+      'indented_arguments': (True, 46),
+      'indented_chain': (True, 47),
+      'inline_expression': (True, 48),
+      'list': (True, 49),
+      'multiplication': (True, 50),
+      'mutation': (True, 51),
+      'mutation_block': (True, 52),
+      'number': (True, 53),
+      'objects': (True, 54),
+      'path': (True, 55),
+      'raise_statement': (True, 56),
+      'regular_expression': (True, 57),
+      'return_statement': (True, 58),
+      'rules': (True, 59),
+      'service': (True, 60),
+      'service_block': (True, 61),
+      'string': (True, 63),
+      'try_block': (True, 64),
+      'try_statement': (True, 65),
+      'values': (True, 66),
+      'void': (True, 67),
+      'when_block': (True, 68),
+      'while_block': (True, 69),
+      'while_statement': (True, 70)},
+ 94: {'$END': (False, 130),
+      'BSLASH': (False, 130),
+      'DASH': (False, 130),
+      'DOUBLE_QUOTED': (False, 130),
+      'EQUAL': (False, 130),
+      'FALSE': (False, 130),
+      'FLOAT': (False, 130),
+      'FUNCTION_TYPE': (False, 130),
+      'GREATER': (False, 130),
+      'GREATER_EQUAL': (False, 130),
+      'INT': (False, 130),
+      'LESSER': (False, 130),
+      'LESSER_EQUAL': (False, 130),
+      'MODULUS': (False, 130),
+      'MULTIPLIER': (False, 130),
+      'NAME': (False, 130),
+      'NOT': (False, 130),
+      'NULL': (False, 130),
+      'PLUS': (False, 130),
+      'POWER': (False, 130),
+      'RAISE': (False, 130),
+      'REGEXP': (False, 130),
+      'SINGLE_QUOTED': (False, 130),
+      'TRUE': (False, 130),
+      'TRY': (False, 130),
+      '_AS': (False, 130),
+      '_CCB': (False, 130),
+      '_COLON': (False, 130),
+      '_COMMA': (False, 130),
+      '_CP': (False, 130),
+      '_CSB': (False, 130),
+      '_DEDENT': (False, 130),
+      '_FOREACH': (False, 130),
+      '_IF': (False, 130),
+      '_IMPORT': (False, 130),
+      '_INDENT': (False, 130),
+      '_NL': (False, 130),
+      '_OCB': (False, 130),
+      '_OP': (False, 130),
+      '_OSB': (False, 130),
+      '_RETURN': (False, 130),
+      '_THEN': (False, 130),
+      '_WHEN': (False, 130),
+      '_WHILE': (False, 130)},
+ 95: {'_DEDENT': (True, 167), '_INDENT': (True, 168)},
+ 96: {'_CCB': (True, 169),
+      '_COMMA': (True, 170),
+      '_NL': (True, 171),
+      '__anon_star_1': (True, 172)},
+ 97: {'_COLON': (True, 173)},
+ 98: {'_COLON': (True, 174)},
+ 99: {'BSLASH': (False, 84),
+      'DASH': (False, 84),
+      'MODULUS': (False, 84),
+      'MULTIPLIER': (False, 84),
+      'PLUS': (False, 84),
+      'POWER': (False, 84),
+      '_CP': (False, 84),
+      '_NL': (False, 84)},
+ 100: {'_CP': (True, 175)},
+ 101: {'$END': (False, 75),
+       'BSLASH': (False, 75),
+       'DASH': (False, 75),
+       'DOUBLE_QUOTED': (False, 75),
+       'EQUAL': (False, 75),
+       'FALSE': (False, 75),
+       'FLOAT': (False, 75),
+       'FUNCTION_TYPE': (False, 75),
+       'GREATER': (False, 75),
+       'GREATER_EQUAL': (False, 75),
+       'INT': (False, 75),
+       'LESSER': (False, 75),
+       'LESSER_EQUAL': (False, 75),
+       'MODULUS': (False, 75),
+       'MULTIPLIER': (False, 75),
+       'NAME': (True, 128),
+       'NOT': (False, 75),
+       'NULL': (False, 75),
+       'PLUS': (False, 75),
+       'POWER': (False, 75),
+       'RAISE': (False, 75),
+       'REGEXP': (False, 75),
+       'SINGLE_QUOTED': (False, 75),
+       'TRUE': (False, 75),
+       'TRY': (False, 75),
+       '_AS': (False, 75),
+       '_CCB': (False, 75),
+       '_COLON': (True, 15),
+       '_COMMA': (False, 75),
+       '_CP': (False, 75),
+       '_CSB': (False, 75),
+       '_DEDENT': (False, 75),
+       '_FOREACH': (False, 75),
+       '_IF': (False, 75),
+       '_IMPORT': (False, 75),
+       '_INDENT': (False, 75),
+       '_NL': (False, 75),
+       '_OCB': (False, 75),
+       '_OP': (False, 75),
+       '_OSB': (False, 75),
+       '_RETURN': (False, 75),
+       '_THEN': (False, 75),
+       '_WHEN': (False, 75),
+       '_WHILE': (False, 75),
+       '__anon_star_5': (True, 129),
+       'arguments': (True, 130),
+       'command': (True, 132),
+       'service_fragment': (True, 133)},
+ 102: {'_CP': (True, 176)},
+ 103: {'$END': (False, 107),
+       'BSLASH': (False, 107),
+       'DASH': (False, 107),
+       'DOUBLE_QUOTED': (False, 107),
+       'EQUAL': (False, 107),
+       'FALSE': (False, 107),
+       'FLOAT': (False, 107),
+       'FUNCTION_TYPE': (False, 107),
+       'GREATER': (False, 107),
+       'GREATER_EQUAL': (False, 107),
+       'INT': (False, 107),
+       'LESSER': (False, 107),
+       'LESSER_EQUAL': (False, 107),
+       'MODULUS': (False, 107),
+       'MULTIPLIER': (False, 107),
+       'NAME': (False, 107),
+       'NOT': (False, 107),
+       'NULL': (False, 107),
+       'PLUS': (False, 107),
+       'POWER': (False, 107),
+       'RAISE': (False, 107),
+       'REGEXP': (False, 107),
+       'SINGLE_QUOTED': (False, 107),
+       'TRUE': (False, 107),
+       'TRY': (False, 107),
+       '_AS': (False, 107),
+       '_CCB': (False, 107),
+       '_COLON': (False, 107),
+       '_COMMA': (False, 107),
+       '_CP': (False, 107),
+       '_CSB': (False, 107),
+       '_DEDENT': (False, 107),
+       '_FOREACH': (False, 107),
+       '_IF': (False, 107),
+       '_IMPORT': (False, 107),
+       '_INDENT': (False, 107),
+       '_NL': (False, 107),
+       '_OCB': (False, 107),
+       '_OP': (False, 107),
+       '_OSB': (False, 107),
+       '_RETURN': (False, 107),
+       '_THEN': (False, 107),
+       '_WHEN': (False, 107),
+       '_WHILE': (False, 107)},
+ 104: {'_DEDENT': (True, 177), '_INDENT': (True, 178)},
+ 105: {'_COMMA': (True, 179),
+       '_CSB': (True, 180),
+       '_NL': (True, 181),
+       '__anon_star_0': (True, 182)},
+ 106: {'_NL': (False, 156)},
+ 107: {'$END': (False, 125),
+       'DASH': (False, 125),
+       'DOUBLE_QUOTED': (False, 125),
+       'FALSE': (False, 125),
+       'FLOAT': (False, 125),
+       'FUNCTION_TYPE': (False, 125),
+       'INT': (False, 125),
+       'NAME': (True, 88),
+       'NULL': (False, 125),
+       'PLUS': (False, 125),
+       'RAISE': (False, 125),
+       'REGEXP': (False, 125),
+       'SINGLE_QUOTED': (False, 125),
+       'TRUE': (False, 125),
+       'TRY': (False, 125),
+       '_COLON': (True, 15),
+       '_CP': (False, 125),
+       '_DEDENT': (False, 125),
+       '_FOREACH': (False, 125),
+       '_IF': (False, 125),
+       '_IMPORT': (False, 125),
+       '_INDENT': (False, 125),
+       '_NL': (False, 125),
+       '_OCB': (False, 125),
+       '_OP': (False, 125),
+       '_OSB': (False, 125),
+       '_RETURN': (False, 125),
+       '_THEN': (False, 125),
+       '_WHEN': (False, 125),
+       '_WHILE': (False, 125),
+       '__anon_star_5': (True, 183),
+       'arguments': (True, 130)},
+ 108: {'$END': (False, 62),
+       'DASH': (False, 62),
+       'DOUBLE_QUOTED': (False, 62),
+       'FALSE': (False, 62),
+       'FLOAT': (False, 62),
+       'FUNCTION_TYPE': (False, 62),
+       'INT': (False, 62),
+       'NAME': (False, 62),
+       'NULL': (False, 62),
+       'PLUS': (False, 62),
+       'RAISE': (False, 62),
+       'REGEXP': (False, 62),
+       'SINGLE_QUOTED': (False, 62),
+       'TRUE': (False, 62),
+       'TRY': (False, 62),
+       '_COLON': (False, 62),
+       '_CP': (False, 62),
+       '_DEDENT': (False, 62),
+       '_FOREACH': (False, 62),
+       '_IF': (False, 62),
+       '_IMPORT': (False, 62),
+       '_INDENT': (False, 62),
+       '_NL': (False, 62),
+       '_OCB': (False, 62),
+       '_OP': (False, 62),
+       '_OSB': (False, 62),
+       '_RETURN': (False, 62),
+       '_THEN': (False, 62),
+       '_WHEN': (False, 62),
+       '_WHILE': (False, 62)},
+ 109: {'NAME': (True, 128),
+       '_AS': (True, 151),
+       '_COLON': (True, 15),
+       '__anon_star_5': (True, 129),
+       'arguments': (True, 130),
+       'command': (True, 132),
+       'output': (True, 184),
+       'service_fragment': (True, 133)},
+ 110: {'_NL': (True, 185)},
+ 111: {'_NL': (False, 203)},
+ 112: {'$END': (False, 2),
+       'DASH': (False, 2),
+       'DOUBLE_QUOTED': (False, 2),
+       'FALSE': (False, 2),
+       'FLOAT': (False, 2),
+       'FUNCTION_TYPE': (False, 2),
+       'INT': (False, 2),
+       'NAME': (False, 2),
+       'NULL': (False, 2),
+       'PLUS': (False, 2),
+       'RAISE': (False, 2),
+       'REGEXP': (False, 2),
+       'SINGLE_QUOTED': (False, 2),
+       'TRUE': (False, 2),
+       'TRY': (False, 2),
+       '_COLON': (False, 2),
+       '_DEDENT': (False, 2),
+       '_FOREACH': (False, 2),
+       '_IF': (False, 2),
+       '_IMPORT': (False, 2),
+       '_INDENT': (False, 2),
+       '_NL': (False, 159),
+       '_OCB': (False, 2),
+       '_OP': (False, 2),
+       '_OSB': (False, 2),
+       '_RETURN': (False, 2),
+       '_THEN': (False, 2),
+       '_WHEN': (False, 2),
+       '_WHILE': (False, 2)},
+ 113: {'_NL': (False, 121),
+       '_THEN': (True, 25),
+       '__anon_star_6': (True, 186),
+       'chained_mutation': (True, 187)},
+ 114: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 188),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 115: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 189),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 116: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 190),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 117: {'BSLASH': (True, 191),
+       'DASH': (False, 120),
+       'MODULUS': (True, 192),
+       'MULTIPLIER': (True, 193),
+       'PLUS': (False, 120),
+       '_CP': (False, 120),
+       '_NL': (False, 120)},
+ 118: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 194),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 119: {'_INDENT': (True, 195), 'nested_block': (True, 196)},
+ 120: {'_INDENT': (True, 195), 'nested_block': (True, 197)},
+ 121: {'_INDENT': (True, 195), 'nested_block': (True, 198)},
+ 122: {'$END': (False, 147),
+       'BSLASH': (False, 147),
+       'DASH': (False, 147),
+       'DOUBLE_QUOTED': (False, 147),
+       'EQUAL': (False, 147),
+       'EQUALS': (False, 147),
+       'FALSE': (False, 147),
+       'FLOAT': (False, 147),
+       'FUNCTION_TYPE': (False, 147),
+       'GREATER': (False, 147),
+       'GREATER_EQUAL': (False, 147),
+       'INT': (False, 147),
+       'LESSER': (False, 147),
+       'LESSER_EQUAL': (False, 147),
+       'MODULUS': (False, 147),
+       'MULTIPLIER': (False, 147),
+       'NAME': (False, 147),
+       'NOT': (False, 147),
+       'NULL': (False, 147),
+       'PLUS': (False, 147),
+       'POWER': (False, 147),
+       'RAISE': (False, 147),
+       'REGEXP': (False, 147),
+       'SINGLE_QUOTED': (False, 147),
+       'TRUE': (False, 147),
+       'TRY': (False, 147),
+       '_AS': (False, 147),
+       '_CCB': (False, 147),
+       '_COLON': (False, 147),
+       '_COMMA': (False, 147),
+       '_CP': (False, 147),
+       '_CSB': (False, 147),
+       '_DEDENT': (False, 147),
+       '_DOT': (True, 77),
+       '_FOREACH': (False, 147),
+       '_IF': (False, 147),
+       '_IMPORT': (False, 147),
+       '_INDENT': (False, 147),
+       '_NL': (False, 147),
+       '_OCB': (False, 147),
+       '_OP': (False, 147),
+       '_OSB': (True, 78),
+       '_RETURN': (False, 147),
+       '_THEN': (False, 147),
+       '_WHEN': (False, 147),
+       '_WHILE': (False, 147),
+       'path_fragment': (True, 150)},
+ 123: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 36),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 199),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 124: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 36),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 200),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 125: {'DASH': (True, 201),
+       'PLUS': (True, 202),
+       '_CP': (False, 80),
+       '_NL': (False, 80)},
+ 126: {'$END': (False, 123),
+       'DASH': (False, 123),
+       'DOUBLE_QUOTED': (False, 123),
+       'FALSE': (False, 123),
+       'FLOAT': (False, 123),
+       'FUNCTION_TYPE': (False, 123),
+       'INT': (False, 123),
+       'NAME': (False, 123),
+       'NULL': (False, 123),
+       'PLUS': (False, 123),
+       'RAISE': (False, 123),
+       'REGEXP': (False, 123),
+       'SINGLE_QUOTED': (False, 123),
+       'TRUE': (False, 123),
+       'TRY': (False, 123),
+       '_COLON': (False, 123),
+       '_DEDENT': (False, 123),
+       '_FOREACH': (False, 123),
+       '_IF': (False, 123),
+       '_IMPORT': (False, 123),
+       '_INDENT': (True, 195),
+       '_NL': (False, 123),
+       '_OCB': (False, 123),
+       '_OP': (False, 123),
+       '_OSB': (False, 123),
+       '_RETURN': (False, 123),
+       '_THEN': (False, 123),
+       '_WHEN': (False, 123),
+       '_WHILE': (False, 123),
+       'nested_block': (True, 203)},
+ 127: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 35),
+       'exponential': (True, 36),
+       'expression': (True, 204),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 50),
+       'mutation': (True, 205),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 101),
+       'regular_expression': (True, 57),
+       'service': (True, 206),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 128: {'NAME': (False, 63),
+       '_AS': (False, 63),
+       '_COLON': (True, 76),
+       '_CP': (False, 63),
+       '_NL': (False, 63),
+       '_THEN': (False, 63)},
+ 129: {'NAME': (True, 88),
+       '_AS': (True, 151),
+       '_COLON': (True, 15),
+       '_CP': (False, 167),
+       '_NL': (False, 167),
+       '_THEN': (False, 167),
+       'arguments': (True, 207),
+       'output': (True, 208)},
+ 130: {'$END': (False, 31),
+       'DASH': (False, 31),
+       'DOUBLE_QUOTED': (False, 31),
+       'FALSE': (False, 31),
+       'FLOAT': (False, 31),
+       'FUNCTION_TYPE': (False, 31),
+       'INT': (False, 31),
+       'NAME': (False, 31),
+       'NULL': (False, 31),
+       'PLUS': (False, 31),
+       'RAISE': (False, 31),
+       'REGEXP': (False, 31),
+       'SINGLE_QUOTED': (False, 31),
+       'TRUE': (False, 31),
+       'TRY': (False, 31),
+       '_AS': (False, 31),
+       '_COLON': (False, 31),
+       '_CP': (False, 31),
+       '_DEDENT': (False, 31),
+       '_FOREACH': (False, 31),
+       '_IF': (False, 31),
+       '_IMPORT': (False, 31),
+       '_INDENT': (False, 31),
+       '_NL': (False, 31),
+       '_OCB': (False, 31),
+       '_OP': (False, 31),
+       '_OSB': (False, 31),
+       '_RETURN': (False, 31),
+       '_THEN': (False, 31),
+       '_WHEN': (False, 31),
+       '_WHILE': (False, 31)},
+ 131: {'_NL': (False, 41)},
+ 132: {'NAME': (True, 88),
+       '_AS': (True, 151),
+       '_COLON': (True, 15),
+       '_CP': (False, 169),
+       '_NL': (False, 169),
+       '_THEN': (False, 169),
+       '__anon_star_5': (True, 209),
+       'arguments': (True, 130),
+       'output': (True, 210)},
+ 133: {'_CP': (False, 163),
+       '_NL': (False, 163),
+       '_THEN': (True, 25),
+       '__anon_star_9': (True, 211),
+       'chained_mutation': (True, 212)},
+ 134: {'$END': (False, 53),
+       'DASH': (False, 53),
+       'DOUBLE_QUOTED': (False, 53),
+       'FALSE': (False, 53),
+       'FLOAT': (False, 53),
+       'FUNCTION_TYPE': (False, 53),
+       'INT': (False, 53),
+       'NAME': (False, 53),
+       'NULL': (False, 53),
+       'PLUS': (False, 53),
+       'RAISE': (False, 53),
+       'REGEXP': (False, 53),
+       'SINGLE_QUOTED': (False, 53),
+       'TRUE': (False, 53),
+       'TRY': (False, 53),
+       '_COLON': (False, 53),
+       '_DEDENT': (False, 53),
+       '_FOREACH': (False, 53),
+       '_IF': (False, 53),
+       '_IMPORT': (False, 53),
+       '_INDENT': (False, 53),
+       '_NL': (False, 53),
+       '_OCB': (False, 53),
+       '_OP': (False, 53),
+       '_OSB': (False, 53),
+       '_RETURN': (False, 53),
+       '_THEN': (False, 53),
+       '_WHEN': (False, 53),
+       '_WHILE': (False, 53)},
+ 135: {'$END': (False, 165),
+       'DASH': (False, 165),
+       'DOUBLE_QUOTED': (False, 165),
+       'FALSE': (False, 165),
+       'FLOAT': (False, 165),
+       'FUNCTION_TYPE': (False, 165),
+       'INT': (False, 165),
+       'NAME': (False, 165),
+       'NULL': (False, 165),
+       'PLUS': (False, 165),
+       'RAISE': (False, 165),
+       'REGEXP': (False, 165),
+       'SINGLE_QUOTED': (False, 165),
+       'TRUE': (False, 165),
+       'TRY': (False, 165),
+       '_COLON': (False, 165),
+       '_DEDENT': (False, 165),
+       '_FOREACH': (False, 165),
+       '_IF': (False, 165),
+       '_IMPORT': (False, 165),
+       '_INDENT': (True, 195),
+       '_NL': (False, 165),
+       '_OCB': (False, 165),
+       '_OP': (False, 165),
+       '_OSB': (False, 165),
+       '_RETURN': (False, 165),
+       '_THEN': (False, 165),
+       '_WHEN': (False, 165),
+       '_WHILE': (False, 165),
+       'nested_block': (True, 213)},
+ 136: {},
+ 137: {'_INDENT': (True, 195), 'nested_block': (True, 214)},
+ 138: {'_INDENT': (True, 195), 'nested_block': (True, 215)},
+ 139: {'NAME': (True, 128),
+       '_COLON': (True, 15),
+       '__anon_star_5': (True, 129),
+       'arguments': (True, 130),
+       'command': (True, 132),
+       'service_fragment': (True, 133)},
+ 140: {'_COLON': (True, 216)},
+ 141: {'ANY_TYPE': (True, 217),
+       'FLOAT_TYPE': (True, 218),
+       'FUNCTION_TYPE': (True, 219),
+       'INT_TYPE': (True, 220),
+       'LIST_TYPE': (True, 221),
+       'NUMBER_TYPE': (True, 222),
+       'OBJECT_TYPE': (True, 223),
+       'REGEXP_TYPE': (True, 224),
+       'STRING_TYPE': (True, 225),
+       'types': (True, 226)},
+ 142: {'NAME': (True, 140),
+       '_NL': (False, 92),
+       '_RETURNS': (True, 141),
+       'function_output': (True, 227),
+       'typed_argument': (True, 228)},
+ 143: {'_NL': (False, 94)},
+ 144: {'NAME': (False, 17), '_NL': (False, 17), '_RETURNS': (False, 17)},
+ 145: {'$END': (False, 39),
+       'DASH': (False, 39),
+       'DOUBLE_QUOTED': (False, 39),
+       'FALSE': (False, 39),
+       'FLOAT': (False, 39),
+       'FUNCTION_TYPE': (False, 39),
+       'INT': (False, 39),
+       'NAME': (False, 39),
+       'NULL': (False, 39),
+       'PLUS': (False, 39),
+       'RAISE': (False, 39),
+       'REGEXP': (False, 39),
+       'SINGLE_QUOTED': (False, 39),
+       'TRUE': (False, 39),
+       'TRY': (False, 39),
+       '_AS': (False, 39),
+       '_COLON': (False, 39),
+       '_CP': (False, 39),
+       '_DEDENT': (False, 39),
+       '_FOREACH': (False, 39),
+       '_IF': (False, 39),
+       '_IMPORT': (False, 39),
+       '_INDENT': (False, 39),
+       '_NL': (False, 39),
+       '_OCB': (False, 39),
+       '_OP': (False, 39),
+       '_OSB': (False, 39),
+       '_RETURN': (False, 39),
+       '_THEN': (False, 39),
+       '_WHEN': (False, 39),
+       '_WHILE': (False, 39)},
+ 146: {'$END': (False, 148),
+       'BSLASH': (False, 148),
+       'DASH': (False, 148),
+       'DOUBLE_QUOTED': (False, 148),
+       'EQUAL': (False, 148),
+       'EQUALS': (False, 148),
+       'FALSE': (False, 148),
+       'FLOAT': (False, 148),
+       'FUNCTION_TYPE': (False, 148),
+       'GREATER': (False, 148),
+       'GREATER_EQUAL': (False, 148),
+       'INT': (False, 148),
+       'LESSER': (False, 148),
+       'LESSER_EQUAL': (False, 148),
+       'MODULUS': (False, 148),
+       'MULTIPLIER': (False, 148),
+       'NAME': (False, 148),
+       'NOT': (False, 148),
+       'NULL': (False, 148),
+       'PLUS': (False, 148),
+       'POWER': (False, 148),
+       'RAISE': (False, 148),
+       'REGEXP': (False, 148),
+       'SINGLE_QUOTED': (False, 148),
+       'TRUE': (False, 148),
+       'TRY': (False, 148),
+       '_AS': (False, 148),
+       '_CCB': (False, 148),
+       '_COLON': (False, 148),
+       '_COMMA': (False, 148),
+       '_CP': (False, 148),
+       '_CSB': (False, 148),
+       '_DEDENT': (False, 148),
+       '_DOT': (False, 148),
+       '_FOREACH': (False, 148),
+       '_IF': (False, 148),
+       '_IMPORT': (False, 148),
+       '_INDENT': (False, 148),
+       '_NL': (False, 148),
+       '_OCB': (False, 148),
+       '_OP': (False, 148),
+       '_OSB': (False, 148),
+       '_RETURN': (False, 148),
+       '_THEN': (False, 148),
+       '_WHEN': (False, 148),
+       '_WHILE': (False, 148)},
+ 147: {'_CSB': (True, 229)},
+ 148: {'_CSB': (True, 230)},
+ 149: {'_CSB': (True, 231)},
+ 150: {'$END': (False, 18),
+       'BSLASH': (False, 18),
+       'DASH': (False, 18),
+       'DOUBLE_QUOTED': (False, 18),
+       'EQUAL': (False, 18),
+       'EQUALS': (False, 18),
+       'FALSE': (False, 18),
+       'FLOAT': (False, 18),
+       'FUNCTION_TYPE': (False, 18),
+       'GREATER': (False, 18),
+       'GREATER_EQUAL': (False, 18),
+       'INT': (False, 18),
+       'LESSER': (False, 18),
+       'LESSER_EQUAL': (False, 18),
+       'MODULUS': (False, 18),
+       'MULTIPLIER': (False, 18),
+       'NAME': (False, 18),
+       'NOT': (False, 18),
+       'NULL': (False, 18),
+       'PLUS': (False, 18),
+       'POWER': (False, 18),
+       'RAISE': (False, 18),
+       'REGEXP': (False, 18),
+       'SINGLE_QUOTED': (False, 18),
+       'TRUE': (False, 18),
+       'TRY': (False, 18),
+       '_AS': (False, 18),
+       '_CCB': (False, 18),
+       '_COLON': (False, 18),
+       '_COMMA': (False, 18),
+       '_CP': (False, 18),
+       '_CSB': (False, 18),
+       '_DEDENT': (False, 18),
+       '_DOT': (False, 18),
+       '_FOREACH': (False, 18),
+       '_IF': (False, 18),
+       '_IMPORT': (False, 18),
+       '_INDENT': (False, 18),
+       '_NL': (False, 18),
+       '_OCB': (False, 18),
+       '_OP': (False, 18),
+       '_OSB': (False, 18),
+       '_RETURN': (False, 18),
+       '_THEN': (False, 18),
+       '_WHEN': (False, 18),
+       '_WHILE': (False, 18)},
+ 151: {'NAME': (True, 232)},
+ 152: {'_NL': (False, 88)},
+ 153: {'DOUBLE_QUOTED': (False, 64),
+       'FALSE': (False, 64),
+       'FLOAT': (False, 64),
+       'INT': (False, 64),
+       'NAME': (False, 64),
+       'NULL': (False, 64),
+       'REGEXP': (False, 64),
+       'SINGLE_QUOTED': (False, 64),
+       'TRUE': (False, 64),
+       '_OCB': (False, 64),
+       '_OP': (False, 64),
+       '_OSB': (False, 64)},
+ 154: {'DOUBLE_QUOTED': (False, 65),
+       'FALSE': (False, 65),
+       'FLOAT': (False, 65),
+       'INT': (False, 65),
+       'NAME': (False, 65),
+       'NULL': (False, 65),
+       'REGEXP': (False, 65),
+       'SINGLE_QUOTED': (False, 65),
+       'TRUE': (False, 65),
+       '_OCB': (False, 65),
+       '_OP': (False, 65),
+       '_OSB': (False, 65)},
+ 155: {'DOUBLE_QUOTED': (False, 66),
+       'FALSE': (False, 66),
+       'FLOAT': (False, 66),
+       'INT': (False, 66),
+       'NAME': (False, 66),
+       'NULL': (False, 66),
+       'REGEXP': (False, 66),
+       'SINGLE_QUOTED': (False, 66),
+       'TRUE': (False, 66),
+       '_OCB': (False, 66),
+       '_OP': (False, 66),
+       '_OSB': (False, 66)},
+ 156: {'DOUBLE_QUOTED': (False, 67),
+       'FALSE': (False, 67),
+       'FLOAT': (False, 67),
+       'INT': (False, 67),
+       'NAME': (False, 67),
+       'NULL': (False, 67),
+       'REGEXP': (False, 67),
+       'SINGLE_QUOTED': (False, 67),
+       'TRUE': (False, 67),
+       '_OCB': (False, 67),
+       '_OP': (False, 67),
+       '_OSB': (False, 67)},
+ 157: {'DOUBLE_QUOTED': (False, 68),
+       'FALSE': (False, 68),
+       'FLOAT': (False, 68),
+       'INT': (False, 68),
+       'NAME': (False, 68),
+       'NULL': (False, 68),
+       'REGEXP': (False, 68),
+       'SINGLE_QUOTED': (False, 68),
+       'TRUE': (False, 68),
+       '_OCB': (False, 68),
+       '_OP': (False, 68),
+       '_OSB': (False, 68)},
+ 158: {'DOUBLE_QUOTED': (False, 69),
+       'FALSE': (False, 69),
+       'FLOAT': (False, 69),
+       'INT': (False, 69),
+       'NAME': (False, 69),
+       'NULL': (False, 69),
+       'REGEXP': (False, 69),
+       'SINGLE_QUOTED': (False, 69),
+       'TRUE': (False, 69),
+       '_OCB': (False, 69),
+       '_OP': (False, 69),
+       '_OSB': (False, 69)},
+ 159: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 233),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 160: {'NAME': (True, 234)},
+ 161: {'$END': (False, 102),
+       'DASH': (False, 102),
+       'DOUBLE_QUOTED': (False, 102),
+       'FALSE': (False, 102),
+       'FLOAT': (False, 102),
+       'FUNCTION_TYPE': (False, 102),
+       'INT': (False, 102),
+       'NAME': (False, 102),
+       'NULL': (False, 102),
+       'PLUS': (False, 102),
+       'RAISE': (False, 102),
+       'REGEXP': (False, 102),
+       'SINGLE_QUOTED': (False, 102),
+       'TRUE': (False, 102),
+       'TRY': (False, 102),
+       '_COLON': (False, 102),
+       '_DEDENT': (False, 102),
+       '_FOREACH': (False, 102),
+       '_IF': (False, 102),
+       '_IMPORT': (False, 102),
+       '_INDENT': (False, 102),
+       '_NL': (False, 102),
+       '_OCB': (False, 102),
+       '_OP': (False, 102),
+       '_OSB': (False, 102),
+       '_RETURN': (False, 102),
+       '_THEN': (False, 102),
+       '_WHEN': (False, 102),
+       '_WHILE': (False, 102)},
+ 162: {'_NL': (True, 235)},
+ 163: {'$END': (False, 103),
+       'DASH': (False, 103),
+       'DOUBLE_QUOTED': (False, 103),
+       'FALSE': (False, 103),
+       'FLOAT': (False, 103),
+       'FUNCTION_TYPE': (False, 103),
+       'INT': (False, 103),
+       'NAME': (False, 103),
+       'NULL': (False, 103),
+       'PLUS': (False, 103),
+       'RAISE': (False, 103),
+       'REGEXP': (False, 103),
+       'SINGLE_QUOTED': (False, 103),
+       'TRUE': (False, 103),
+       'TRY': (False, 103),
+       '_COLON': (False, 103),
+       '_DEDENT': (False, 103),
+       '_FOREACH': (False, 103),
+       '_IF': (False, 103),
+       '_IMPORT': (False, 103),
+       '_INDENT': (False, 103),
+       '_NL': (False, 103),
+       '_OCB': (False, 103),
+       '_OP': (False, 103),
+       '_OSB': (False, 103),
+       '_RETURN': (False, 103),
+       '_THEN': (False, 103),
+       '_WHEN': (False, 103),
+       '_WHILE': (False, 103)},
+ 164: {'_NL': (True, 236)},
+ 165: {'NAME': (False, 1), '_COLON': (False, 1), '_DEDENT': (False, 1)},
+ 166: {'_DEDENT': (False, 5), '_THEN': (False, 5)},
+ 167: {'_CCB': (True, 237)},
+ 168: {'DOUBLE_QUOTED': (True, 2),
+       'NAME': (True, 71),
+       'SINGLE_QUOTED': (True, 12),
+       '_CCB': (True, 238),
+       '_NL': (True, 239),
+       '_OP': (True, 72),
+       'inline_expression': (True, 48),
+       'key_value': (True, 240),
+       'path': (True, 97),
+       'string': (True, 98)},
+ 169: {'$END': (False, 138),
+       'BSLASH': (False, 138),
+       'DASH': (False, 138),
+       'DOUBLE_QUOTED': (False, 138),
+       'EQUAL': (False, 138),
+       'FALSE': (False, 138),
+       'FLOAT': (False, 138),
+       'FUNCTION_TYPE': (False, 138),
+       'GREATER': (False, 138),
+       'GREATER_EQUAL': (False, 138),
+       'INT': (False, 138),
+       'LESSER': (False, 138),
+       'LESSER_EQUAL': (False, 138),
+       'MODULUS': (False, 138),
+       'MULTIPLIER': (False, 138),
+       'NAME': (False, 138),
+       'NOT': (False, 138),
+       'NULL': (False, 138),
+       'PLUS': (False, 138),
+       'POWER': (False, 138),
+       'RAISE': (False, 138),
+       'REGEXP': (False, 138),
+       'SINGLE_QUOTED': (False, 138),
+       'TRUE': (False, 138),
+       'TRY': (False, 138),
+       '_AS': (False, 138),
+       '_CCB': (False, 138),
+       '_COLON': (False, 138),
+       '_COMMA': (False, 138),
+       '_CP': (False, 138),
+       '_CSB': (False, 138),
+       '_DEDENT': (False, 138),
+       '_FOREACH': (False, 138),
+       '_IF': (False, 138),
+       '_IMPORT': (False, 138),
+       '_INDENT': (False, 138),
+       '_NL': (False, 138),
+       '_OCB': (False, 138),
+       '_OP': (False, 138),
+       '_OSB': (False, 138),
+       '_RETURN': (False, 138),
+       '_THEN': (False, 138),
+       '_WHEN': (False, 138),
+       '_WHILE': (False, 138)},
+ 170: {'DOUBLE_QUOTED': (True, 2),
+       'NAME': (True, 71),
+       'SINGLE_QUOTED': (True, 12),
+       '_NL': (True, 241),
+       '_OP': (True, 72),
+       'inline_expression': (True, 48),
+       'key_value': (True, 242),
+       'path': (True, 97),
+       'string': (True, 98)},
+ 171: {'_DEDENT': (True, 243)},
+ 172: {'_CCB': (True, 244), '_COMMA': (True, 245), '_NL': (True, 246)},
+ 173: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 247),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 174: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 248),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 175: {'BSLASH': (False, 83),
+       'DASH': (False, 83),
+       'MODULUS': (False, 83),
+       'MULTIPLIER': (False, 83),
+       'PLUS': (False, 83),
+       'POWER': (False, 83),
+       '_CP': (False, 83),
+       '_NL': (False, 83)},
+ 176: {'$END': (False, 104),
+       'BSLASH': (False, 104),
+       'DASH': (False, 104),
+       'DOUBLE_QUOTED': (False, 104),
+       'EQUAL': (False, 104),
+       'EQUALS': (False, 104),
+       'FALSE': (False, 104),
+       'FLOAT': (False, 104),
+       'FUNCTION_TYPE': (False, 104),
+       'GREATER': (False, 104),
+       'GREATER_EQUAL': (False, 104),
+       'INT': (False, 104),
+       'LESSER': (False, 104),
+       'LESSER_EQUAL': (False, 104),
+       'MODULUS': (False, 104),
+       'MULTIPLIER': (False, 104),
+       'NAME': (False, 104),
+       'NOT': (False, 104),
+       'NULL': (False, 104),
+       'PLUS': (False, 104),
+       'POWER': (False, 104),
+       'RAISE': (False, 104),
+       'REGEXP': (False, 104),
+       'SINGLE_QUOTED': (False, 104),
+       'TRUE': (False, 104),
+       'TRY': (False, 104),
+       '_AS': (False, 104),
+       '_CCB': (False, 104),
+       '_COLON': (False, 104),
+       '_COMMA': (False, 104),
+       '_CP': (False, 104),
+       '_CSB': (False, 104),
+       '_DEDENT': (False, 104),
+       '_DOT': (False, 104),
+       '_FOREACH': (False, 104),
+       '_IF': (False, 104),
+       '_IMPORT': (False, 104),
+       '_INDENT': (False, 104),
+       '_NL': (False, 104),
+       '_OCB': (False, 104),
+       '_OP': (False, 104),
+       '_OSB': (False, 104),
+       '_RETURN': (False, 104),
+       '_THEN': (False, 104),
+       '_WHEN': (False, 104),
+       '_WHILE': (False, 104)},
+ 177: {'_CSB': (True, 249)},
+ 178: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_CSB': (True, 250),
+       '_NL': (True, 251),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 252),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 179: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_NL': (True, 253),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 254),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 180: {'$END': (False, 115),
+       'BSLASH': (False, 115),
+       'DASH': (False, 115),
+       'DOUBLE_QUOTED': (False, 115),
+       'EQUAL': (False, 115),
+       'FALSE': (False, 115),
+       'FLOAT': (False, 115),
+       'FUNCTION_TYPE': (False, 115),
+       'GREATER': (False, 115),
+       'GREATER_EQUAL': (False, 115),
+       'INT': (False, 115),
+       'LESSER': (False, 115),
+       'LESSER_EQUAL': (False, 115),
+       'MODULUS': (False, 115),
+       'MULTIPLIER': (False, 115),
+       'NAME': (False, 115),
+       'NOT': (False, 115),
+       'NULL': (False, 115),
+       'PLUS': (False, 115),
+       'POWER': (False, 115),
+       'RAISE': (False, 115),
+       'REGEXP': (False, 115),
+       'SINGLE_QUOTED': (False, 115),
+       'TRUE': (False, 115),
+       'TRY': (False, 115),
+       '_AS': (False, 115),
+       '_CCB': (False, 115),
+       '_COLON': (False, 115),
+       '_COMMA': (False, 115),
+       '_CP': (False, 115),
+       '_CSB': (False, 115),
+       '_DEDENT': (False, 115),
+       '_FOREACH': (False, 115),
+       '_IF': (False, 115),
+       '_IMPORT': (False, 115),
+       '_INDENT': (False, 115),
+       '_NL': (False, 115),
+       '_OCB': (False, 115),
+       '_OP': (False, 115),
+       '_OSB': (False, 115),
+       '_RETURN': (False, 115),
+       '_THEN': (False, 115),
+       '_WHEN': (False, 115),
+       '_WHILE': (False, 115)},
+ 181: {'_DEDENT': (True, 255)},
+ 182: {'_COMMA': (True, 256), '_CSB': (True, 257), '_NL': (True, 258)},
+ 183: {'$END': (False, 126),
+       'DASH': (False, 126),
+       'DOUBLE_QUOTED': (False, 126),
+       'FALSE': (False, 126),
+       'FLOAT': (False, 126),
+       'FUNCTION_TYPE': (False, 126),
+       'INT': (False, 126),
+       'NAME': (True, 88),
+       'NULL': (False, 126),
+       'PLUS': (False, 126),
+       'RAISE': (False, 126),
+       'REGEXP': (False, 126),
+       'SINGLE_QUOTED': (False, 126),
+       'TRUE': (False, 126),
+       'TRY': (False, 126),
+       '_COLON': (True, 15),
+       '_CP': (False, 126),
+       '_DEDENT': (False, 126),
+       '_FOREACH': (False, 126),
+       '_IF': (False, 126),
+       '_IMPORT': (False, 126),
+       '_INDENT': (False, 126),
+       '_NL': (False, 126),
+       '_OCB': (False, 126),
+       '_OP': (False, 126),
+       '_OSB': (False, 126),
+       '_RETURN': (False, 126),
+       '_THEN': (False, 126),
+       '_WHEN': (False, 126),
+       '_WHILE': (False, 126),
+       'arguments': (True, 207)},
+ 184: {'_NL': (True, 259)},
+ 185: {'_INDENT': (True, 195), 'nested_block': (True, 260)},
+ 186: {'_NL': (False, 122),
+       '_THEN': (True, 25),
+       'chained_mutation': (True, 261)},
+ 187: {'_NL': (False, 33), '_THEN': (False, 33)},
+ 188: {'BSLASH': (False, 20),
+       'DASH': (False, 20),
+       'MODULUS': (False, 20),
+       'MULTIPLIER': (False, 20),
+       'PLUS': (False, 20),
+       '_CP': (False, 20),
+       '_NL': (False, 20)},
+ 189: {'BSLASH': (False, 21),
+       'DASH': (False, 21),
+       'MODULUS': (False, 21),
+       'MULTIPLIER': (False, 21),
+       'PLUS': (False, 21),
+       '_CP': (False, 21),
+       '_NL': (False, 21)},
+ 190: {'BSLASH': (False, 22),
+       'DASH': (False, 22),
+       'MODULUS': (False, 22),
+       'MULTIPLIER': (False, 22),
+       'PLUS': (False, 22),
+       '_CP': (False, 22),
+       '_NL': (False, 22)},
+ 191: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 262),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 192: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 263),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 193: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 264),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 194: {'BSLASH': (False, 78),
+       'DASH': (False, 78),
+       'MODULUS': (False, 78),
+       'MULTIPLIER': (False, 78),
+       'PLUS': (False, 78),
+       '_CP': (False, 78),
+       '_NL': (False, 78)},
+ 195: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'FUNCTION_TYPE': (True, 5),
+       'INT': (True, 6),
+       'NAME': (True, 7),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'RAISE': (True, 10),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       'TRY': (True, 14),
+       '_COLON': (True, 15),
+       '_FOREACH': (True, 16),
+       '_IF': (True, 17),
+       '_IMPORT': (True, 18),
+       '_INDENT': (True, 19),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       '_RETURN': (True, 24),
+       '_THEN': (True, 25),
+       '_WHEN': (True, 26),
+       '_WHILE': (True, 27),
+       '__anon_plus_13': (True, 265),
+       'absolute_expression': (True, 29),
+       'arguments': (True, 30),
+       'assignment': (True, 31),
+       'block': (True, 32),
+       'boolean': (True, 33),
+       'chained_mutation': (True, 34),
+       'entity': (True, 35),
+       'exponential': (True, 36),
+       'expression': (True, 37),
+       'factor': (True, 38),
+       'foreach_block': (True, 39),
+       'foreach_statement': (True, 40),
+       'function_block': (True, 41),
+       'function_statement': (True, 42),
+       'if_block': (True, 43),
+       'if_statement': (True, 44),
+       'imports': (True, 45),
+       'indented_arguments': (True, 46),
+       'indented_chain': (True, 47),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 50),
+       'mutation': (True, 51),
+       'mutation_block': (True, 52),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 55),
+       'raise_statement': (True, 56),
+       'regular_expression': (True, 57),
+       'return_statement': (True, 58),
+       'rules': (True, 59),
+       'service': (True, 60),
+       'service_block': (True, 61),
+       'string': (True, 63),
+       'try_block': (True, 64),
+       'try_statement': (True, 65),
+       'values': (True, 66),
+       'void': (True, 67),
+       'when_block': (True, 68),
+       'while_block': (True, 69),
+       'while_statement': (True, 70)},
+ 196: {'$END': (False, 87),
+       'DASH': (False, 87),
+       'DOUBLE_QUOTED': (False, 87),
+       'FALSE': (False, 87),
+       'FLOAT': (False, 87),
+       'FUNCTION_TYPE': (False, 87),
+       'INT': (False, 87),
+       'NAME': (False, 87),
+       'NULL': (False, 87),
+       'PLUS': (False, 87),
+       'RAISE': (False, 87),
+       'REGEXP': (False, 87),
+       'SINGLE_QUOTED': (False, 87),
+       'TRUE': (False, 87),
+       'TRY': (False, 87),
+       '_COLON': (False, 87),
+       '_DEDENT': (False, 87),
+       '_FOREACH': (False, 87),
+       '_IF': (False, 87),
+       '_IMPORT': (False, 87),
+       '_INDENT': (False, 87),
+       '_NL': (False, 87),
+       '_OCB': (False, 87),
+       '_OP': (False, 87),
+       '_OSB': (False, 87),
+       '_RETURN': (False, 87),
+       '_THEN': (False, 87),
+       '_WHEN': (False, 87),
+       '_WHILE': (False, 87)},
+ 197: {'$END': (False, 89),
+       'DASH': (False, 89),
+       'DOUBLE_QUOTED': (False, 89),
+       'FALSE': (False, 89),
+       'FLOAT': (False, 89),
+       'FUNCTION_TYPE': (False, 89),
+       'INT': (False, 89),
+       'NAME': (False, 89),
+       'NULL': (False, 89),
+       'PLUS': (False, 89),
+       'RAISE': (False, 89),
+       'REGEXP': (False, 89),
+       'SINGLE_QUOTED': (False, 89),
+       'TRUE': (False, 89),
+       'TRY': (False, 89),
+       '_COLON': (False, 89),
+       '_DEDENT': (False, 89),
+       '_FOREACH': (False, 89),
+       '_IF': (False, 89),
+       '_IMPORT': (False, 89),
+       '_INDENT': (False, 89),
+       '_NL': (False, 89),
+       '_OCB': (False, 89),
+       '_OP': (False, 89),
+       '_OSB': (False, 89),
+       '_RETURN': (False, 89),
+       '_THEN': (False, 89),
+       '_WHEN': (False, 89),
+       '_WHILE': (False, 89)},
+ 198: {'$END': (False, 95),
+       'DASH': (False, 95),
+       'DOUBLE_QUOTED': (False, 95),
+       'FALSE': (False, 95),
+       'FLOAT': (False, 95),
+       'FUNCTION_TYPE': (False, 95),
+       'INT': (False, 95),
+       'NAME': (False, 95),
+       'NULL': (False, 95),
+       'PLUS': (False, 95),
+       'RAISE': (False, 95),
+       'REGEXP': (False, 95),
+       'SINGLE_QUOTED': (False, 95),
+       'TRUE': (False, 95),
+       'TRY': (False, 95),
+       '_COLON': (False, 95),
+       '_DEDENT': (False, 95),
+       '_ELSE': (True, 266),
+       '_FOREACH': (False, 95),
+       '_IF': (False, 95),
+       '_IMPORT': (False, 95),
+       '_INDENT': (False, 95),
+       '_NL': (False, 95),
+       '_OCB': (False, 95),
+       '_OP': (False, 95),
+       '_OSB': (False, 95),
+       '_RETURN': (False, 95),
+       '_THEN': (False, 95),
+       '_WHEN': (False, 95),
+       '_WHILE': (False, 95),
+       '__anon_star_10': (True, 267),
+       'else_block': (True, 268),
+       'else_statement': (True, 269),
+       'elseif_block': (True, 270),
+       'elseif_statement': (True, 271)},
+ 199: {'DASH': (False, 26),
+       'PLUS': (False, 26),
+       '_CP': (False, 26),
+       '_NL': (False, 26)},
+ 200: {'DASH': (False, 27),
+       'PLUS': (False, 27),
+       '_CP': (False, 27),
+       '_NL': (False, 27)},
+ 201: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 36),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 272),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 202: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 99),
+       'exponential': (True, 36),
+       'factor': (True, 38),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 273),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 203: {'$END': (False, 124),
+       'DASH': (False, 124),
+       'DOUBLE_QUOTED': (False, 124),
+       'FALSE': (False, 124),
+       'FLOAT': (False, 124),
+       'FUNCTION_TYPE': (False, 124),
+       'INT': (False, 124),
+       'NAME': (False, 124),
+       'NULL': (False, 124),
+       'PLUS': (False, 124),
+       'RAISE': (False, 124),
+       'REGEXP': (False, 124),
+       'SINGLE_QUOTED': (False, 124),
+       'TRUE': (False, 124),
+       'TRY': (False, 124),
+       '_COLON': (False, 124),
+       '_DEDENT': (False, 124),
+       '_FOREACH': (False, 124),
+       '_IF': (False, 124),
+       '_IMPORT': (False, 124),
+       '_INDENT': (False, 124),
+       '_NL': (False, 124),
+       '_OCB': (False, 124),
+       '_OP': (False, 124),
+       '_OSB': (False, 124),
+       '_RETURN': (False, 124),
+       '_THEN': (False, 124),
+       '_WHEN': (False, 124),
+       '_WHILE': (False, 124)},
+ 204: {'_NL': (False, 42)},
+ 205: {'_NL': (False, 43)},
+ 206: {'_NL': (False, 44)},
+ 207: {'$END': (False, 30),
+       'DASH': (False, 30),
+       'DOUBLE_QUOTED': (False, 30),
+       'FALSE': (False, 30),
+       'FLOAT': (False, 30),
+       'FUNCTION_TYPE': (False, 30),
+       'INT': (False, 30),
+       'NAME': (False, 30),
+       'NULL': (False, 30),
+       'PLUS': (False, 30),
+       'RAISE': (False, 30),
+       'REGEXP': (False, 30),
+       'SINGLE_QUOTED': (False, 30),
+       'TRUE': (False, 30),
+       'TRY': (False, 30),
+       '_AS': (False, 30),
+       '_COLON': (False, 30),
+       '_CP': (False, 30),
+       '_DEDENT': (False, 30),
+       '_FOREACH': (False, 30),
+       '_IF': (False, 30),
+       '_IMPORT': (False, 30),
+       '_INDENT': (False, 30),
+       '_NL': (False, 30),
+       '_OCB': (False, 30),
+       '_OP': (False, 30),
+       '_OSB': (False, 30),
+       '_RETURN': (False, 30),
+       '_THEN': (False, 30),
+       '_WHEN': (False, 30),
+       '_WHILE': (False, 30)},
+ 208: {'_CP': (False, 168), '_NL': (False, 168), '_THEN': (False, 168)},
+ 209: {'NAME': (True, 88),
+       '_AS': (True, 151),
+       '_COLON': (True, 15),
+       '_CP': (False, 170),
+       '_NL': (False, 170),
+       '_THEN': (False, 170),
+       'arguments': (True, 207),
+       'output': (True, 274)},
+ 210: {'_CP': (False, 172), '_NL': (False, 172), '_THEN': (False, 172)},
+ 211: {'_CP': (False, 164),
+       '_NL': (False, 164),
+       '_THEN': (True, 25),
+       'chained_mutation': (True, 275)},
+ 212: {'_CP': (False, 37), '_NL': (False, 37), '_THEN': (False, 37)},
+ 213: {'$END': (False, 166),
+       'DASH': (False, 166),
+       'DOUBLE_QUOTED': (False, 166),
+       'FALSE': (False, 166),
+       'FLOAT': (False, 166),
+       'FUNCTION_TYPE': (False, 166),
+       'INT': (False, 166),
+       'NAME': (False, 166),
+       'NULL': (False, 166),
+       'PLUS': (False, 166),
+       'RAISE': (False, 166),
+       'REGEXP': (False, 166),
+       'SINGLE_QUOTED': (False, 166),
+       'TRUE': (False, 166),
+       'TRY': (False, 166),
+       '_COLON': (False, 166),
+       '_DEDENT': (False, 166),
+       '_FOREACH': (False, 166),
+       '_IF': (False, 166),
+       '_IMPORT': (False, 166),
+       '_INDENT': (False, 166),
+       '_NL': (False, 166),
+       '_OCB': (False, 166),
+       '_OP': (False, 166),
+       '_OSB': (False, 166),
+       '_RETURN': (False, 166),
+       '_THEN': (False, 166),
+       '_WHEN': (False, 166),
+       '_WHILE': (False, 166)},
+ 214: {'$END': (False, 177),
+       'DASH': (False, 177),
+       'DOUBLE_QUOTED': (False, 177),
+       'FALSE': (False, 177),
+       'FINALLY': (True, 276),
+       'FLOAT': (False, 177),
+       'FUNCTION_TYPE': (False, 177),
+       'INT': (False, 177),
+       'NAME': (False, 177),
+       'NULL': (False, 177),
+       'PLUS': (False, 177),
+       'RAISE': (False, 177),
+       'REGEXP': (False, 177),
+       'SINGLE_QUOTED': (False, 177),
+       'TRUE': (False, 177),
+       'TRY': (False, 177),
+       '_CATCH': (True, 277),
+       '_COLON': (False, 177),
+       '_DEDENT': (False, 177),
+       '_FOREACH': (False, 177),
+       '_IF': (False, 177),
+       '_IMPORT': (False, 177),
+       '_INDENT': (False, 177),
+       '_NL': (False, 177),
+       '_OCB': (False, 177),
+       '_OP': (False, 177),
+       '_OSB': (False, 177),
+       '_RETURN': (False, 177),
+       '_THEN': (False, 177),
+       '_WHEN': (False, 177),
+       '_WHILE': (False, 177),
+       'catch_block': (True, 278),
+       'catch_statement': (True, 279),
+       'finally_block': (True, 280),
+       'finally_statement': (True, 281)},
+ 215: {'$END': (False, 202),
+       'DASH': (False, 202),
+       'DOUBLE_QUOTED': (False, 202),
+       'FALSE': (False, 202),
+       'FLOAT': (False, 202),
+       'FUNCTION_TYPE': (False, 202),
+       'INT': (False, 202),
+       'NAME': (False, 202),
+       'NULL': (False, 202),
+       'PLUS': (False, 202),
+       'RAISE': (False, 202),
+       'REGEXP': (False, 202),
+       'SINGLE_QUOTED': (False, 202),
+       'TRUE': (False, 202),
+       'TRY': (False, 202),
+       '_COLON': (False, 202),
+       '_DEDENT': (False, 202),
+       '_FOREACH': (False, 202),
+       '_IF': (False, 202),
+       '_IMPORT': (False, 202),
+       '_INDENT': (False, 202),
+       '_NL': (False, 202),
+       '_OCB': (False, 202),
+       '_OP': (False, 202),
+       '_OSB': (False, 202),
+       '_RETURN': (False, 202),
+       '_THEN': (False, 202),
+       '_WHEN': (False, 202),
+       '_WHILE': (False, 202)},
+ 216: {'ANY_TYPE': (True, 217),
+       'FLOAT_TYPE': (True, 218),
+       'FUNCTION_TYPE': (True, 219),
+       'INT_TYPE': (True, 220),
+       'LIST_TYPE': (True, 221),
+       'NUMBER_TYPE': (True, 222),
+       'OBJECT_TYPE': (True, 223),
+       'REGEXP_TYPE': (True, 224),
+       'STRING_TYPE': (True, 225),
+       'types': (True, 282)},
+ 217: {'NAME': (False, 183), '_NL': (False, 183), '_RETURNS': (False, 183)},
+ 218: {'NAME': (False, 184), '_NL': (False, 184), '_RETURNS': (False, 184)},
+ 219: {'NAME': (False, 185), '_NL': (False, 185), '_RETURNS': (False, 185)},
+ 220: {'NAME': (False, 186), '_NL': (False, 186), '_RETURNS': (False, 186)},
+ 221: {'NAME': (False, 187), '_NL': (False, 187), '_RETURNS': (False, 187)},
+ 222: {'NAME': (False, 188), '_NL': (False, 188), '_RETURNS': (False, 188)},
+ 223: {'NAME': (False, 189), '_NL': (False, 189), '_RETURNS': (False, 189)},
+ 224: {'NAME': (False, 190), '_NL': (False, 190), '_RETURNS': (False, 190)},
+ 225: {'NAME': (False, 191), '_NL': (False, 191), '_RETURNS': (False, 191)},
+ 226: {'_NL': (False, 90)},
+ 227: {'_NL': (False, 93)},
+ 228: {'NAME': (False, 16), '_NL': (False, 16), '_RETURNS': (False, 16)},
+ 229: {'$END': (False, 149),
+       'BSLASH': (False, 149),
+       'DASH': (False, 149),
+       'DOUBLE_QUOTED': (False, 149),
+       'EQUAL': (False, 149),
+       'EQUALS': (False, 149),
+       'FALSE': (False, 149),
+       'FLOAT': (False, 149),
+       'FUNCTION_TYPE': (False, 149),
+       'GREATER': (False, 149),
+       'GREATER_EQUAL': (False, 149),
+       'INT': (False, 149),
+       'LESSER': (False, 149),
+       'LESSER_EQUAL': (False, 149),
+       'MODULUS': (False, 149),
+       'MULTIPLIER': (False, 149),
+       'NAME': (False, 149),
+       'NOT': (False, 149),
+       'NULL': (False, 149),
+       'PLUS': (False, 149),
+       'POWER': (False, 149),
+       'RAISE': (False, 149),
+       'REGEXP': (False, 149),
+       'SINGLE_QUOTED': (False, 149),
+       'TRUE': (False, 149),
+       'TRY': (False, 149),
+       '_AS': (False, 149),
+       '_CCB': (False, 149),
+       '_COLON': (False, 149),
+       '_COMMA': (False, 149),
+       '_CP': (False, 149),
+       '_CSB': (False, 149),
+       '_DEDENT': (False, 149),
+       '_DOT': (False, 149),
+       '_FOREACH': (False, 149),
+       '_IF': (False, 149),
+       '_IMPORT': (False, 149),
+       '_INDENT': (False, 149),
+       '_NL': (False, 149),
+       '_OCB': (False, 149),
+       '_OP': (False, 149),
+       '_OSB': (False, 149),
+       '_RETURN': (False, 149),
+       '_THEN': (False, 149),
+       '_WHEN': (False, 149),
+       '_WHILE': (False, 149)},
+ 230: {'$END': (False, 150),
+       'BSLASH': (False, 150),
+       'DASH': (False, 150),
+       'DOUBLE_QUOTED': (False, 150),
+       'EQUAL': (False, 150),
+       'EQUALS': (False, 150),
+       'FALSE': (False, 150),
+       'FLOAT': (False, 150),
+       'FUNCTION_TYPE': (False, 150),
+       'GREATER': (False, 150),
+       'GREATER_EQUAL': (False, 150),
+       'INT': (False, 150),
+       'LESSER': (False, 150),
+       'LESSER_EQUAL': (False, 150),
+       'MODULUS': (False, 150),
+       'MULTIPLIER': (False, 150),
+       'NAME': (False, 150),
+       'NOT': (False, 150),
+       'NULL': (False, 150),
+       'PLUS': (False, 150),
+       'POWER': (False, 150),
+       'RAISE': (False, 150),
+       'REGEXP': (False, 150),
+       'SINGLE_QUOTED': (False, 150),
+       'TRUE': (False, 150),
+       'TRY': (False, 150),
+       '_AS': (False, 150),
+       '_CCB': (False, 150),
+       '_COLON': (False, 150),
+       '_COMMA': (False, 150),
+       '_CP': (False, 150),
+       '_CSB': (False, 150),
+       '_DEDENT': (False, 150),
+       '_DOT': (False, 150),
+       '_FOREACH': (False, 150),
+       '_IF': (False, 150),
+       '_IMPORT': (False, 150),
+       '_INDENT': (False, 150),
+       '_NL': (False, 150),
+       '_OCB': (False, 150),
+       '_OP': (False, 150),
+       '_OSB': (False, 150),
+       '_RETURN': (False, 150),
+       '_THEN': (False, 150),
+       '_WHEN': (False, 150),
+       '_WHILE': (False, 150)},
+ 231: {'$END': (False, 151),
+       'BSLASH': (False, 151),
+       'DASH': (False, 151),
+       'DOUBLE_QUOTED': (False, 151),
+       'EQUAL': (False, 151),
+       'EQUALS': (False, 151),
+       'FALSE': (False, 151),
+       'FLOAT': (False, 151),
+       'FUNCTION_TYPE': (False, 151),
+       'GREATER': (False, 151),
+       'GREATER_EQUAL': (False, 151),
+       'INT': (False, 151),
+       'LESSER': (False, 151),
+       'LESSER_EQUAL': (False, 151),
+       'MODULUS': (False, 151),
+       'MULTIPLIER': (False, 151),
+       'NAME': (False, 151),
+       'NOT': (False, 151),
+       'NULL': (False, 151),
+       'PLUS': (False, 151),
+       'POWER': (False, 151),
+       'RAISE': (False, 151),
+       'REGEXP': (False, 151),
+       'SINGLE_QUOTED': (False, 151),
+       'TRUE': (False, 151),
+       'TRY': (False, 151),
+       '_AS': (False, 151),
+       '_CCB': (False, 151),
+       '_COLON': (False, 151),
+       '_COMMA': (False, 151),
+       '_CP': (False, 151),
+       '_CSB': (False, 151),
+       '_DEDENT': (False, 151),
+       '_DOT': (False, 151),
+       '_FOREACH': (False, 151),
+       '_IF': (False, 151),
+       '_IMPORT': (False, 151),
+       '_INDENT': (False, 151),
+       '_NL': (False, 151),
+       '_OCB': (False, 151),
+       '_OP': (False, 151),
+       '_OSB': (False, 151),
+       '_RETURN': (False, 151),
+       '_THEN': (False, 151),
+       '_WHEN': (False, 151),
+       '_WHILE': (False, 151)},
+ 232: {'_COMMA': (True, 283),
+       '_CP': (False, 142),
+       '_NL': (False, 142),
+       '_THEN': (False, 142),
+       '__anon_star_8': (True, 284)},
+ 233: {'_NL': (False, 100)},
+ 234: {'_NL': (False, 101)},
+ 235: {'NAME': (False, 0), '_COLON': (False, 0), '_DEDENT': (False, 0)},
+ 236: {'_DEDENT': (False, 4), '_THEN': (False, 4)},
+ 237: {'$END': (False, 131),
+       'BSLASH': (False, 131),
+       'DASH': (False, 131),
+       'DOUBLE_QUOTED': (False, 131),
+       'EQUAL': (False, 131),
+       'FALSE': (False, 131),
+       'FLOAT': (False, 131),
+       'FUNCTION_TYPE': (False, 131),
+       'GREATER': (False, 131),
+       'GREATER_EQUAL': (False, 131),
+       'INT': (False, 131),
+       'LESSER': (False, 131),
+       'LESSER_EQUAL': (False, 131),
+       'MODULUS': (False, 131),
+       'MULTIPLIER': (False, 131),
+       'NAME': (False, 131),
+       'NOT': (False, 131),
+       'NULL': (False, 131),
+       'PLUS': (False, 131),
+       'POWER': (False, 131),
+       'RAISE': (False, 131),
+       'REGEXP': (False, 131),
+       'SINGLE_QUOTED': (False, 131),
+       'TRUE': (False, 131),
+       'TRY': (False, 131),
+       '_AS': (False, 131),
+       '_CCB': (False, 131),
+       '_COLON': (False, 131),
+       '_COMMA': (False, 131),
+       '_CP': (False, 131),
+       '_CSB': (False, 131),
+       '_DEDENT': (False, 131),
+       '_FOREACH': (False, 131),
+       '_IF': (False, 131),
+       '_IMPORT': (False, 131),
+       '_INDENT': (False, 131),
+       '_NL': (False, 131),
+       '_OCB': (False, 131),
+       '_OP': (False, 131),
+       '_OSB': (False, 131),
+       '_RETURN': (False, 131),
+       '_THEN': (False, 131),
+       '_WHEN': (False, 131),
+       '_WHILE': (False, 131)},
+ 238: {'$END': (False, 132),
+       'BSLASH': (False, 132),
+       'DASH': (False, 132),
+       'DOUBLE_QUOTED': (False, 132),
+       'EQUAL': (False, 132),
+       'FALSE': (False, 132),
+       'FLOAT': (False, 132),
+       'FUNCTION_TYPE': (False, 132),
+       'GREATER': (False, 132),
+       'GREATER_EQUAL': (False, 132),
+       'INT': (False, 132),
+       'LESSER': (False, 132),
+       'LESSER_EQUAL': (False, 132),
+       'MODULUS': (False, 132),
+       'MULTIPLIER': (False, 132),
+       'NAME': (False, 132),
+       'NOT': (False, 132),
+       'NULL': (False, 132),
+       'PLUS': (False, 132),
+       'POWER': (False, 132),
+       'RAISE': (False, 132),
+       'REGEXP': (False, 132),
+       'SINGLE_QUOTED': (False, 132),
+       'TRUE': (False, 132),
+       'TRY': (False, 132),
+       '_AS': (False, 132),
+       '_CCB': (False, 132),
+       '_COLON': (False, 132),
+       '_COMMA': (False, 132),
+       '_CP': (False, 132),
+       '_CSB': (False, 132),
+       '_DEDENT': (False, 132),
+       '_FOREACH': (False, 132),
+       '_IF': (False, 132),
+       '_IMPORT': (False, 132),
+       '_INDENT': (False, 132),
+       '_NL': (False, 132),
+       '_OCB': (False, 132),
+       '_OP': (False, 132),
+       '_OSB': (False, 132),
+       '_RETURN': (False, 132),
+       '_THEN': (False, 132),
+       '_WHEN': (False, 132),
+       '_WHILE': (False, 132)},
+ 239: {'_DEDENT': (True, 285)},
+ 240: {'_CCB': (True, 286),
+       '_COMMA': (True, 170),
+       '_NL': (True, 287),
+       '__anon_star_1': (True, 288)},
+ 241: {'DOUBLE_QUOTED': (True, 2),
+       'NAME': (True, 71),
+       'SINGLE_QUOTED': (True, 12),
+       '_OP': (True, 72),
+       'inline_expression': (True, 48),
+       'key_value': (True, 289),
+       'path': (True, 97),
+       'string': (True, 98)},
+ 242: {'_CCB': (False, 11), '_COMMA': (False, 11), '_NL': (False, 11)},
+ 243: {'_CCB': (True, 290)},
+ 244: {'$END': (False, 140),
+       'BSLASH': (False, 140),
+       'DASH': (False, 140),
+       'DOUBLE_QUOTED': (False, 140),
+       'EQUAL': (False, 140),
+       'FALSE': (False, 140),
+       'FLOAT': (False, 140),
+       'FUNCTION_TYPE': (False, 140),
+       'GREATER': (False, 140),
+       'GREATER_EQUAL': (False, 140),
+       'INT': (False, 140),
+       'LESSER': (False, 140),
+       'LESSER_EQUAL': (False, 140),
+       'MODULUS': (False, 140),
+       'MULTIPLIER': (False, 140),
+       'NAME': (False, 140),
+       'NOT': (False, 140),
+       'NULL': (False, 140),
+       'PLUS': (False, 140),
+       'POWER': (False, 140),
+       'RAISE': (False, 140),
+       'REGEXP': (False, 140),
+       'SINGLE_QUOTED': (False, 140),
+       'TRUE': (False, 140),
+       'TRY': (False, 140),
+       '_AS': (False, 140),
+       '_CCB': (False, 140),
+       '_COLON': (False, 140),
+       '_COMMA': (False, 140),
+       '_CP': (False, 140),
+       '_CSB': (False, 140),
+       '_DEDENT': (False, 140),
+       '_FOREACH': (False, 140),
+       '_IF': (False, 140),
+       '_IMPORT': (False, 140),
+       '_INDENT': (False, 140),
+       '_NL': (False, 140),
+       '_OCB': (False, 140),
+       '_OP': (False, 140),
+       '_OSB': (False, 140),
+       '_RETURN': (False, 140),
+       '_THEN': (False, 140),
+       '_WHEN': (False, 140),
+       '_WHILE': (False, 140)},
+ 245: {'DOUBLE_QUOTED': (True, 2),
+       'NAME': (True, 71),
+       'SINGLE_QUOTED': (True, 12),
+       '_NL': (True, 291),
+       '_OP': (True, 72),
+       'inline_expression': (True, 48),
+       'key_value': (True, 292),
+       'path': (True, 97),
+       'string': (True, 98)},
+ 246: {'_DEDENT': (True, 293)},
+ 247: {'_CCB': (False, 105), '_COMMA': (False, 105), '_NL': (False, 105)},
+ 248: {'_CCB': (False, 106), '_COMMA': (False, 106), '_NL': (False, 106)},
+ 249: {'$END': (False, 108),
+       'BSLASH': (False, 108),
+       'DASH': (False, 108),
+       'DOUBLE_QUOTED': (False, 108),
+       'EQUAL': (False, 108),
+       'FALSE': (False, 108),
+       'FLOAT': (False, 108),
+       'FUNCTION_TYPE': (False, 108),
+       'GREATER': (False, 108),
+       'GREATER_EQUAL': (False, 108),
+       'INT': (False, 108),
+       'LESSER': (False, 108),
+       'LESSER_EQUAL': (False, 108),
+       'MODULUS': (False, 108),
+       'MULTIPLIER': (False, 108),
+       'NAME': (False, 108),
+       'NOT': (False, 108),
+       'NULL': (False, 108),
+       'PLUS': (False, 108),
+       'POWER': (False, 108),
+       'RAISE': (False, 108),
+       'REGEXP': (False, 108),
+       'SINGLE_QUOTED': (False, 108),
+       'TRUE': (False, 108),
+       'TRY': (False, 108),
+       '_AS': (False, 108),
+       '_CCB': (False, 108),
+       '_COLON': (False, 108),
+       '_COMMA': (False, 108),
+       '_CP': (False, 108),
+       '_CSB': (False, 108),
+       '_DEDENT': (False, 108),
+       '_FOREACH': (False, 108),
+       '_IF': (False, 108),
+       '_IMPORT': (False, 108),
+       '_INDENT': (False, 108),
+       '_NL': (False, 108),
+       '_OCB': (False, 108),
+       '_OP': (False, 108),
+       '_OSB': (False, 108),
+       '_RETURN': (False, 108),
+       '_THEN': (False, 108),
+       '_WHEN': (False, 108),
+       '_WHILE': (False, 108)},
+ 250: {'$END': (False, 109),
+       'BSLASH': (False, 109),
+       'DASH': (False, 109),
+       'DOUBLE_QUOTED': (False, 109),
+       'EQUAL': (False, 109),
+       'FALSE': (False, 109),
+       'FLOAT': (False, 109),
+       'FUNCTION_TYPE': (False, 109),
+       'GREATER': (False, 109),
+       'GREATER_EQUAL': (False, 109),
+       'INT': (False, 109),
+       'LESSER': (False, 109),
+       'LESSER_EQUAL': (False, 109),
+       'MODULUS': (False, 109),
+       'MULTIPLIER': (False, 109),
+       'NAME': (False, 109),
+       'NOT': (False, 109),
+       'NULL': (False, 109),
+       'PLUS': (False, 109),
+       'POWER': (False, 109),
+       'RAISE': (False, 109),
+       'REGEXP': (False, 109),
+       'SINGLE_QUOTED': (False, 109),
+       'TRUE': (False, 109),
+       'TRY': (False, 109),
+       '_AS': (False, 109),
+       '_CCB': (False, 109),
+       '_COLON': (False, 109),
+       '_COMMA': (False, 109),
+       '_CP': (False, 109),
+       '_CSB': (False, 109),
+       '_DEDENT': (False, 109),
+       '_FOREACH': (False, 109),
+       '_IF': (False, 109),
+       '_IMPORT': (False, 109),
+       '_INDENT': (False, 109),
+       '_NL': (False, 109),
+       '_OCB': (False, 109),
+       '_OP': (False, 109),
+       '_OSB': (False, 109),
+       '_RETURN': (False, 109),
+       '_THEN': (False, 109),
+       '_WHEN': (False, 109),
+       '_WHILE': (False, 109)},
+ 251: {'_DEDENT': (True, 294)},
+ 252: {'_COMMA': (True, 179),
+       '_CSB': (True, 295),
+       '_NL': (True, 296),
+       '__anon_star_0': (True, 297)},
+ 253: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 298),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 254: {'_COMMA': (False, 7), '_CSB': (False, 7), '_NL': (False, 7)},
+ 255: {'_CSB': (True, 299)},
+ 256: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_NL': (True, 300),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 301),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 257: {'$END': (False, 117),
+       'BSLASH': (False, 117),
+       'DASH': (False, 117),
+       'DOUBLE_QUOTED': (False, 117),
+       'EQUAL': (False, 117),
+       'FALSE': (False, 117),
+       'FLOAT': (False, 117),
+       'FUNCTION_TYPE': (False, 117),
+       'GREATER': (False, 117),
+       'GREATER_EQUAL': (False, 117),
+       'INT': (False, 117),
+       'LESSER': (False, 117),
+       'LESSER_EQUAL': (False, 117),
+       'MODULUS': (False, 117),
+       'MULTIPLIER': (False, 117),
+       'NAME': (False, 117),
+       'NOT': (False, 117),
+       'NULL': (False, 117),
+       'PLUS': (False, 117),
+       'POWER': (False, 117),
+       'RAISE': (False, 117),
+       'REGEXP': (False, 117),
+       'SINGLE_QUOTED': (False, 117),
+       'TRUE': (False, 117),
+       'TRY': (False, 117),
+       '_AS': (False, 117),
+       '_CCB': (False, 117),
+       '_COLON': (False, 117),
+       '_COMMA': (False, 117),
+       '_CP': (False, 117),
+       '_CSB': (False, 117),
+       '_DEDENT': (False, 117),
+       '_FOREACH': (False, 117),
+       '_IF': (False, 117),
+       '_IMPORT': (False, 117),
+       '_INDENT': (False, 117),
+       '_NL': (False, 117),
+       '_OCB': (False, 117),
+       '_OP': (False, 117),
+       '_OSB': (False, 117),
+       '_RETURN': (False, 117),
+       '_THEN': (False, 117),
+       '_WHEN': (False, 117),
+       '_WHILE': (False, 117)},
+ 258: {'_DEDENT': (True, 302)},
+ 259: {'_INDENT': (True, 195), 'nested_block': (True, 303)},
+ 260: {'$END': (False, 201),
+       'DASH': (False, 201),
+       'DOUBLE_QUOTED': (False, 201),
+       'FALSE': (False, 201),
+       'FLOAT': (False, 201),
+       'FUNCTION_TYPE': (False, 201),
+       'INT': (False, 201),
+       'NAME': (False, 201),
+       'NULL': (False, 201),
+       'PLUS': (False, 201),
+       'RAISE': (False, 201),
+       'REGEXP': (False, 201),
+       'SINGLE_QUOTED': (False, 201),
+       'TRUE': (False, 201),
+       'TRY': (False, 201),
+       '_COLON': (False, 201),
+       '_DEDENT': (False, 201),
+       '_FOREACH': (False, 201),
+       '_IF': (False, 201),
+       '_IMPORT': (False, 201),
+       '_INDENT': (False, 201),
+       '_NL': (False, 201),
+       '_OCB': (False, 201),
+       '_OP': (False, 201),
+       '_OSB': (False, 201),
+       '_RETURN': (False, 201),
+       '_THEN': (False, 201),
+       '_WHEN': (False, 201),
+       '_WHILE': (False, 201)},
+ 261: {'_NL': (False, 32), '_THEN': (False, 32)},
+ 262: {'BSLASH': (False, 23),
+       'DASH': (False, 23),
+       'MODULUS': (False, 23),
+       'MULTIPLIER': (False, 23),
+       'PLUS': (False, 23),
+       '_CP': (False, 23),
+       '_NL': (False, 23)},
+ 263: {'BSLASH': (False, 24),
+       'DASH': (False, 24),
+       'MODULUS': (False, 24),
+       'MULTIPLIER': (False, 24),
+       'PLUS': (False, 24),
+       '_CP': (False, 24),
+       '_NL': (False, 24)},
+ 264: {'BSLASH': (False, 25),
+       'DASH': (False, 25),
+       'MODULUS': (False, 25),
+       'MULTIPLIER': (False, 25),
+       'PLUS': (False, 25),
+       '_CP': (False, 25),
+       '_NL': (False, 25)},
+ 265: {'DASH': (True, 1),
+       'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'FUNCTION_TYPE': (True, 5),
+       'INT': (True, 6),
+       'NAME': (True, 7),
+       'NULL': (True, 8),
+       'PLUS': (True, 9),
+       'RAISE': (True, 10),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       'TRY': (True, 14),
+       '_COLON': (True, 15),
+       '_DEDENT': (True, 304),
+       '_FOREACH': (True, 16),
+       '_IF': (True, 17),
+       '_IMPORT': (True, 18),
+       '_INDENT': (True, 19),
+       '_OCB': (True, 21),
+       '_OP': (True, 22),
+       '_OSB': (True, 23),
+       '_RETURN': (True, 24),
+       '_THEN': (True, 25),
+       '_WHEN': (True, 26),
+       '_WHILE': (True, 27),
+       'absolute_expression': (True, 29),
+       'arguments': (True, 30),
+       'assignment': (True, 31),
+       'block': (True, 112),
+       'boolean': (True, 33),
+       'chained_mutation': (True, 34),
+       'entity': (True, 35),
+       'exponential': (True, 36),
+       'expression': (True, 37),
+       'factor': (True, 38),
+       'foreach_block': (True, 39),
+       'foreach_statement': (True, 40),
+       'function_block': (True, 41),
+       'function_statement': (True, 42),
+       'if_block': (True, 43),
+       'if_statement': (True, 44),
+       'imports': (True, 45),
+       'indented_arguments': (True, 46),
+       'indented_chain': (True, 47),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'multiplication': (True, 50),
+       'mutation': (True, 51),
+       'mutation_block': (True, 52),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 55),
+       'raise_statement': (True, 56),
+       'regular_expression': (True, 57),
+       'return_statement': (True, 58),
+       'rules': (True, 59),
+       'service': (True, 60),
+       'service_block': (True, 61),
+       'string': (True, 63),
+       'try_block': (True, 64),
+       'try_statement': (True, 65),
+       'values': (True, 66),
+       'void': (True, 67),
+       'when_block': (True, 68),
+       'while_block': (True, 69),
+       'while_statement': (True, 70)},
+ 266: {'_IF': (True, 305), '_NL': (False, 71)},
+ 267: {'$END': (False, 96),
+       'DASH': (False, 96),
+       'DOUBLE_QUOTED': (False, 96),
+       'FALSE': (False, 96),
+       'FLOAT': (False, 96),
+       'FUNCTION_TYPE': (False, 96),
+       'INT': (False, 96),
+       'NAME': (False, 96),
+       'NULL': (False, 96),
+       'PLUS': (False, 96),
+       'RAISE': (False, 96),
+       'REGEXP': (False, 96),
+       'SINGLE_QUOTED': (False, 96),
+       'TRUE': (False, 96),
+       'TRY': (False, 96),
+       '_COLON': (False, 96),
+       '_DEDENT': (False, 96),
+       '_ELSE': (True, 266),
+       '_FOREACH': (False, 96),
+       '_IF': (False, 96),
+       '_IMPORT': (False, 96),
+       '_INDENT': (False, 96),
+       '_NL': (False, 96),
+       '_OCB': (False, 96),
+       '_OP': (False, 96),
+       '_OSB': (False, 96),
+       '_RETURN': (False, 96),
+       '_THEN': (False, 96),
+       '_WHEN': (False, 96),
+       '_WHILE': (False, 96),
+       'else_block': (True, 306),
+       'else_statement': (True, 269),
+       'elseif_block': (True, 307),
+       'elseif_statement': (True, 271)},
+ 268: {'$END': (False, 98),
+       'DASH': (False, 98),
+       'DOUBLE_QUOTED': (False, 98),
+       'FALSE': (False, 98),
+       'FLOAT': (False, 98),
+       'FUNCTION_TYPE': (False, 98),
+       'INT': (False, 98),
+       'NAME': (False, 98),
+       'NULL': (False, 98),
+       'PLUS': (False, 98),
+       'RAISE': (False, 98),
+       'REGEXP': (False, 98),
+       'SINGLE_QUOTED': (False, 98),
+       'TRUE': (False, 98),
+       'TRY': (False, 98),
+       '_COLON': (False, 98),
+       '_DEDENT': (False, 98),
+       '_FOREACH': (False, 98),
+       '_IF': (False, 98),
+       '_IMPORT': (False, 98),
+       '_INDENT': (False, 98),
+       '_NL': (False, 98),
+       '_OCB': (False, 98),
+       '_OP': (False, 98),
+       '_OSB': (False, 98),
+       '_RETURN': (False, 98),
+       '_THEN': (False, 98),
+       '_WHEN': (False, 98),
+       '_WHILE': (False, 98)},
+ 269: {'_NL': (True, 308)},
+ 270: {'$END': (False, 15),
+       'DASH': (False, 15),
+       'DOUBLE_QUOTED': (False, 15),
+       'FALSE': (False, 15),
+       'FLOAT': (False, 15),
+       'FUNCTION_TYPE': (False, 15),
+       'INT': (False, 15),
+       'NAME': (False, 15),
+       'NULL': (False, 15),
+       'PLUS': (False, 15),
+       'RAISE': (False, 15),
+       'REGEXP': (False, 15),
+       'SINGLE_QUOTED': (False, 15),
+       'TRUE': (False, 15),
+       'TRY': (False, 15),
+       '_COLON': (False, 15),
+       '_DEDENT': (False, 15),
+       '_ELSE': (False, 15),
+       '_FOREACH': (False, 15),
+       '_IF': (False, 15),
+       '_IMPORT': (False, 15),
+       '_INDENT': (False, 15),
+       '_NL': (False, 15),
+       '_OCB': (False, 15),
+       '_OP': (False, 15),
+       '_OSB': (False, 15),
+       '_RETURN': (False, 15),
+       '_THEN': (False, 15),
+       '_WHEN': (False, 15),
+       '_WHILE': (False, 15)},
+ 271: {'_NL': (True, 309)},
+ 272: {'DASH': (False, 28),
+       'PLUS': (False, 28),
+       '_CP': (False, 28),
+       '_NL': (False, 28)},
+ 273: {'DASH': (False, 29),
+       'PLUS': (False, 29),
+       '_CP': (False, 29),
+       '_NL': (False, 29)},
+ 274: {'_CP': (False, 171), '_NL': (False, 171), '_THEN': (False, 171)},
+ 275: {'_CP': (False, 36), '_NL': (False, 36), '_THEN': (False, 36)},
+ 276: {'_NL': (False, 86)},
+ 277: {'_AS': (True, 310)},
+ 278: {'$END': (False, 178),
+       'DASH': (False, 178),
+       'DOUBLE_QUOTED': (False, 178),
+       'FALSE': (False, 178),
+       'FINALLY': (True, 276),
+       'FLOAT': (False, 178),
+       'FUNCTION_TYPE': (False, 178),
+       'INT': (False, 178),
+       'NAME': (False, 178),
+       'NULL': (False, 178),
+       'PLUS': (False, 178),
+       'RAISE': (False, 178),
+       'REGEXP': (False, 178),
+       'SINGLE_QUOTED': (False, 178),
+       'TRUE': (False, 178),
+       'TRY': (False, 178),
+       '_COLON': (False, 178),
+       '_DEDENT': (False, 178),
+       '_FOREACH': (False, 178),
+       '_IF': (False, 178),
+       '_IMPORT': (False, 178),
+       '_INDENT': (False, 178),
+       '_NL': (False, 178),
+       '_OCB': (False, 178),
+       '_OP': (False, 178),
+       '_OSB': (False, 178),
+       '_RETURN': (False, 178),
+       '_THEN': (False, 178),
+       '_WHEN': (False, 178),
+       '_WHILE': (False, 178),
+       'finally_block': (True, 311),
+       'finally_statement': (True, 281)},
+ 279: {'_NL': (True, 312)},
+ 280: {'$END': (False, 180),
+       'DASH': (False, 180),
+       'DOUBLE_QUOTED': (False, 180),
+       'FALSE': (False, 180),
+       'FLOAT': (False, 180),
+       'FUNCTION_TYPE': (False, 180),
+       'INT': (False, 180),
+       'NAME': (False, 180),
+       'NULL': (False, 180),
+       'PLUS': (False, 180),
+       'RAISE': (False, 180),
+       'REGEXP': (False, 180),
+       'SINGLE_QUOTED': (False, 180),
+       'TRUE': (False, 180),
+       'TRY': (False, 180),
+       '_COLON': (False, 180),
+       '_DEDENT': (False, 180),
+       '_FOREACH': (False, 180),
+       '_IF': (False, 180),
+       '_IMPORT': (False, 180),
+       '_INDENT': (False, 180),
+       '_NL': (False, 180),
+       '_OCB': (False, 180),
+       '_OP': (False, 180),
+       '_OSB': (False, 180),
+       '_RETURN': (False, 180),
+       '_THEN': (False, 180),
+       '_WHEN': (False, 180),
+       '_WHILE': (False, 180)},
+ 281: {'_NL': (True, 313)},
+ 282: {'NAME': (False, 182), '_NL': (False, 182), '_RETURNS': (False, 182)},
+ 283: {'NAME': (True, 314)},
+ 284: {'_COMMA': (True, 315),
+       '_CP': (False, 143),
+       '_NL': (False, 143),
+       '_THEN': (False, 143)},
+ 285: {'_CCB': (True, 316)},
+ 286: {'$END': (False, 134),
+       'BSLASH': (False, 134),
+       'DASH': (False, 134),
+       'DOUBLE_QUOTED': (False, 134),
+       'EQUAL': (False, 134),
+       'FALSE': (False, 134),
+       'FLOAT': (False, 134),
+       'FUNCTION_TYPE': (False, 134),
+       'GREATER': (False, 134),
+       'GREATER_EQUAL': (False, 134),
+       'INT': (False, 134),
+       'LESSER': (False, 134),
+       'LESSER_EQUAL': (False, 134),
+       'MODULUS': (False, 134),
+       'MULTIPLIER': (False, 134),
+       'NAME': (False, 134),
+       'NOT': (False, 134),
+       'NULL': (False, 134),
+       'PLUS': (False, 134),
+       'POWER': (False, 134),
+       'RAISE': (False, 134),
+       'REGEXP': (False, 134),
+       'SINGLE_QUOTED': (False, 134),
+       'TRUE': (False, 134),
+       'TRY': (False, 134),
+       '_AS': (False, 134),
+       '_CCB': (False, 134),
+       '_COLON': (False, 134),
+       '_COMMA': (False, 134),
+       '_CP': (False, 134),
+       '_CSB': (False, 134),
+       '_DEDENT': (False, 134),
+       '_FOREACH': (False, 134),
+       '_IF': (False, 134),
+       '_IMPORT': (False, 134),
+       '_INDENT': (False, 134),
+       '_NL': (False, 134),
+       '_OCB': (False, 134),
+       '_OP': (False, 134),
+       '_OSB': (False, 134),
+       '_RETURN': (False, 134),
+       '_THEN': (False, 134),
+       '_WHEN': (False, 134),
+       '_WHILE': (False, 134)},
+ 287: {'_DEDENT': (True, 317)},
+ 288: {'_CCB': (True, 318), '_COMMA': (True, 245), '_NL': (True, 319)},
+ 289: {'_CCB': (False, 10), '_COMMA': (False, 10), '_NL': (False, 10)},
+ 290: {'$END': (False, 139),
+       'BSLASH': (False, 139),
+       'DASH': (False, 139),
+       'DOUBLE_QUOTED': (False, 139),
+       'EQUAL': (False, 139),
+       'FALSE': (False, 139),
+       'FLOAT': (False, 139),
+       'FUNCTION_TYPE': (False, 139),
+       'GREATER': (False, 139),
+       'GREATER_EQUAL': (False, 139),
+       'INT': (False, 139),
+       'LESSER': (False, 139),
+       'LESSER_EQUAL': (False, 139),
+       'MODULUS': (False, 139),
+       'MULTIPLIER': (False, 139),
+       'NAME': (False, 139),
+       'NOT': (False, 139),
+       'NULL': (False, 139),
+       'PLUS': (False, 139),
+       'POWER': (False, 139),
+       'RAISE': (False, 139),
+       'REGEXP': (False, 139),
+       'SINGLE_QUOTED': (False, 139),
+       'TRUE': (False, 139),
+       'TRY': (False, 139),
+       '_AS': (False, 139),
+       '_CCB': (False, 139),
+       '_COLON': (False, 139),
+       '_COMMA': (False, 139),
+       '_CP': (False, 139),
+       '_CSB': (False, 139),
+       '_DEDENT': (False, 139),
+       '_FOREACH': (False, 139),
+       '_IF': (False, 139),
+       '_IMPORT': (False, 139),
+       '_INDENT': (False, 139),
+       '_NL': (False, 139),
+       '_OCB': (False, 139),
+       '_OP': (False, 139),
+       '_OSB': (False, 139),
+       '_RETURN': (False, 139),
+       '_THEN': (False, 139),
+       '_WHEN': (False, 139),
+       '_WHILE': (False, 139)},
+ 291: {'DOUBLE_QUOTED': (True, 2),
+       'NAME': (True, 71),
+       'SINGLE_QUOTED': (True, 12),
+       '_OP': (True, 72),
+       'inline_expression': (True, 48),
+       'key_value': (True, 320),
+       'path': (True, 97),
+       'string': (True, 98)},
+ 292: {'_CCB': (False, 13), '_COMMA': (False, 13), '_NL': (False, 13)},
+ 293: {'_CCB': (True, 321)},
+ 294: {'_CSB': (True, 322)},
+ 295: {'$END': (False, 111),
+       'BSLASH': (False, 111),
+       'DASH': (False, 111),
+       'DOUBLE_QUOTED': (False, 111),
+       'EQUAL': (False, 111),
+       'FALSE': (False, 111),
+       'FLOAT': (False, 111),
+       'FUNCTION_TYPE': (False, 111),
+       'GREATER': (False, 111),
+       'GREATER_EQUAL': (False, 111),
+       'INT': (False, 111),
+       'LESSER': (False, 111),
+       'LESSER_EQUAL': (False, 111),
+       'MODULUS': (False, 111),
+       'MULTIPLIER': (False, 111),
+       'NAME': (False, 111),
+       'NOT': (False, 111),
+       'NULL': (False, 111),
+       'PLUS': (False, 111),
+       'POWER': (False, 111),
+       'RAISE': (False, 111),
+       'REGEXP': (False, 111),
+       'SINGLE_QUOTED': (False, 111),
+       'TRUE': (False, 111),
+       'TRY': (False, 111),
+       '_AS': (False, 111),
+       '_CCB': (False, 111),
+       '_COLON': (False, 111),
+       '_COMMA': (False, 111),
+       '_CP': (False, 111),
+       '_CSB': (False, 111),
+       '_DEDENT': (False, 111),
+       '_FOREACH': (False, 111),
+       '_IF': (False, 111),
+       '_IMPORT': (False, 111),
+       '_INDENT': (False, 111),
+       '_NL': (False, 111),
+       '_OCB': (False, 111),
+       '_OP': (False, 111),
+       '_OSB': (False, 111),
+       '_RETURN': (False, 111),
+       '_THEN': (False, 111),
+       '_WHEN': (False, 111),
+       '_WHILE': (False, 111)},
+ 296: {'_DEDENT': (True, 323)},
+ 297: {'_COMMA': (True, 256), '_CSB': (True, 324), '_NL': (True, 325)},
+ 298: {'_COMMA': (False, 6), '_CSB': (False, 6), '_NL': (False, 6)},
+ 299: {'$END': (False, 116),
+       'BSLASH': (False, 116),
+       'DASH': (False, 116),
+       'DOUBLE_QUOTED': (False, 116),
+       'EQUAL': (False, 116),
+       'FALSE': (False, 116),
+       'FLOAT': (False, 116),
+       'FUNCTION_TYPE': (False, 116),
+       'GREATER': (False, 116),
+       'GREATER_EQUAL': (False, 116),
+       'INT': (False, 116),
+       'LESSER': (False, 116),
+       'LESSER_EQUAL': (False, 116),
+       'MODULUS': (False, 116),
+       'MULTIPLIER': (False, 116),
+       'NAME': (False, 116),
+       'NOT': (False, 116),
+       'NULL': (False, 116),
+       'PLUS': (False, 116),
+       'POWER': (False, 116),
+       'RAISE': (False, 116),
+       'REGEXP': (False, 116),
+       'SINGLE_QUOTED': (False, 116),
+       'TRUE': (False, 116),
+       'TRY': (False, 116),
+       '_AS': (False, 116),
+       '_CCB': (False, 116),
+       '_COLON': (False, 116),
+       '_COMMA': (False, 116),
+       '_CP': (False, 116),
+       '_CSB': (False, 116),
+       '_DEDENT': (False, 116),
+       '_FOREACH': (False, 116),
+       '_IF': (False, 116),
+       '_IMPORT': (False, 116),
+       '_INDENT': (False, 116),
+       '_NL': (False, 116),
+       '_OCB': (False, 116),
+       '_OP': (False, 116),
+       '_OSB': (False, 116),
+       '_RETURN': (False, 116),
+       '_THEN': (False, 116),
+       '_WHEN': (False, 116),
+       '_WHILE': (False, 116)},
+ 300: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 326),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 301: {'_COMMA': (False, 9), '_CSB': (False, 9), '_NL': (False, 9)},
+ 302: {'_CSB': (True, 327)},
+ 303: {'$END': (False, 200),
+       'DASH': (False, 200),
+       'DOUBLE_QUOTED': (False, 200),
+       'FALSE': (False, 200),
+       'FLOAT': (False, 200),
+       'FUNCTION_TYPE': (False, 200),
+       'INT': (False, 200),
+       'NAME': (False, 200),
+       'NULL': (False, 200),
+       'PLUS': (False, 200),
+       'RAISE': (False, 200),
+       'REGEXP': (False, 200),
+       'SINGLE_QUOTED': (False, 200),
+       'TRUE': (False, 200),
+       'TRY': (False, 200),
+       '_COLON': (False, 200),
+       '_DEDENT': (False, 200),
+       '_FOREACH': (False, 200),
+       '_IF': (False, 200),
+       '_IMPORT': (False, 200),
+       '_INDENT': (False, 200),
+       '_NL': (False, 200),
+       '_OCB': (False, 200),
+       '_OP': (False, 200),
+       '_OSB': (False, 200),
+       '_RETURN': (False, 200),
+       '_THEN': (False, 200),
+       '_WHEN': (False, 200),
+       '_WHILE': (False, 200)},
+ 304: {'$END': (False, 127),
+       'DASH': (False, 127),
+       'DOUBLE_QUOTED': (False, 127),
+       'FALSE': (False, 127),
+       'FINALLY': (False, 127),
+       'FLOAT': (False, 127),
+       'FUNCTION_TYPE': (False, 127),
+       'INT': (False, 127),
+       'NAME': (False, 127),
+       'NULL': (False, 127),
+       'PLUS': (False, 127),
+       'RAISE': (False, 127),
+       'REGEXP': (False, 127),
+       'SINGLE_QUOTED': (False, 127),
+       'TRUE': (False, 127),
+       'TRY': (False, 127),
+       '_CATCH': (False, 127),
+       '_COLON': (False, 127),
+       '_DEDENT': (False, 127),
+       '_ELSE': (False, 127),
+       '_FOREACH': (False, 127),
+       '_IF': (False, 127),
+       '_IMPORT': (False, 127),
+       '_INDENT': (False, 127),
+       '_NL': (False, 127),
+       '_OCB': (False, 127),
+       '_OP': (False, 127),
+       '_OSB': (False, 127),
+       '_RETURN': (False, 127),
+       '_THEN': (False, 127),
+       '_WHEN': (False, 127),
+       '_WHILE': (False, 127)},
+ 305: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 328),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 306: {'$END': (False, 97),
+       'DASH': (False, 97),
+       'DOUBLE_QUOTED': (False, 97),
+       'FALSE': (False, 97),
+       'FLOAT': (False, 97),
+       'FUNCTION_TYPE': (False, 97),
+       'INT': (False, 97),
+       'NAME': (False, 97),
+       'NULL': (False, 97),
+       'PLUS': (False, 97),
+       'RAISE': (False, 97),
+       'REGEXP': (False, 97),
+       'SINGLE_QUOTED': (False, 97),
+       'TRUE': (False, 97),
+       'TRY': (False, 97),
+       '_COLON': (False, 97),
+       '_DEDENT': (False, 97),
+       '_FOREACH': (False, 97),
+       '_IF': (False, 97),
+       '_IMPORT': (False, 97),
+       '_INDENT': (False, 97),
+       '_NL': (False, 97),
+       '_OCB': (False, 97),
+       '_OP': (False, 97),
+       '_OSB': (False, 97),
+       '_RETURN': (False, 97),
+       '_THEN': (False, 97),
+       '_WHEN': (False, 97),
+       '_WHILE': (False, 97)},
+ 307: {'$END': (False, 14),
+       'DASH': (False, 14),
+       'DOUBLE_QUOTED': (False, 14),
+       'FALSE': (False, 14),
+       'FLOAT': (False, 14),
+       'FUNCTION_TYPE': (False, 14),
+       'INT': (False, 14),
+       'NAME': (False, 14),
+       'NULL': (False, 14),
+       'PLUS': (False, 14),
+       'RAISE': (False, 14),
+       'REGEXP': (False, 14),
+       'SINGLE_QUOTED': (False, 14),
+       'TRUE': (False, 14),
+       'TRY': (False, 14),
+       '_COLON': (False, 14),
+       '_DEDENT': (False, 14),
+       '_ELSE': (False, 14),
+       '_FOREACH': (False, 14),
+       '_IF': (False, 14),
+       '_IMPORT': (False, 14),
+       '_INDENT': (False, 14),
+       '_NL': (False, 14),
+       '_OCB': (False, 14),
+       '_OP': (False, 14),
+       '_OSB': (False, 14),
+       '_RETURN': (False, 14),
+       '_THEN': (False, 14),
+       '_WHEN': (False, 14),
+       '_WHILE': (False, 14)},
+ 308: {'_INDENT': (True, 195), 'nested_block': (True, 329)},
+ 309: {'_INDENT': (True, 195), 'nested_block': (True, 330)},
+ 310: {'NAME': (True, 331)},
+ 311: {'$END': (False, 179),
+       'DASH': (False, 179),
+       'DOUBLE_QUOTED': (False, 179),
+       'FALSE': (False, 179),
+       'FLOAT': (False, 179),
+       'FUNCTION_TYPE': (False, 179),
+       'INT': (False, 179),
+       'NAME': (False, 179),
+       'NULL': (False, 179),
+       'PLUS': (False, 179),
+       'RAISE': (False, 179),
+       'REGEXP': (False, 179),
+       'SINGLE_QUOTED': (False, 179),
+       'TRUE': (False, 179),
+       'TRY': (False, 179),
+       '_COLON': (False, 179),
+       '_DEDENT': (False, 179),
+       '_FOREACH': (False, 179),
+       '_IF': (False, 179),
+       '_IMPORT': (False, 179),
+       '_INDENT': (False, 179),
+       '_NL': (False, 179),
+       '_OCB': (False, 179),
+       '_OP': (False, 179),
+       '_OSB': (False, 179),
+       '_RETURN': (False, 179),
+       '_THEN': (False, 179),
+       '_WHEN': (False, 179),
+       '_WHILE': (False, 179)},
+ 312: {'_INDENT': (True, 195), 'nested_block': (True, 332)},
+ 313: {'_INDENT': (True, 195), 'nested_block': (True, 333)},
+ 314: {'_COMMA': (False, 34),
+       '_CP': (False, 34),
+       '_NL': (False, 34),
+       '_THEN': (False, 34)},
+ 315: {'NAME': (True, 334)},
+ 316: {'$END': (False, 133),
+       'BSLASH': (False, 133),
+       'DASH': (False, 133),
+       'DOUBLE_QUOTED': (False, 133),
+       'EQUAL': (False, 133),
+       'FALSE': (False, 133),
+       'FLOAT': (False, 133),
+       'FUNCTION_TYPE': (False, 133),
+       'GREATER': (False, 133),
+       'GREATER_EQUAL': (False, 133),
+       'INT': (False, 133),
+       'LESSER': (False, 133),
+       'LESSER_EQUAL': (False, 133),
+       'MODULUS': (False, 133),
+       'MULTIPLIER': (False, 133),
+       'NAME': (False, 133),
+       'NOT': (False, 133),
+       'NULL': (False, 133),
+       'PLUS': (False, 133),
+       'POWER': (False, 133),
+       'RAISE': (False, 133),
+       'REGEXP': (False, 133),
+       'SINGLE_QUOTED': (False, 133),
+       'TRUE': (False, 133),
+       'TRY': (False, 133),
+       '_AS': (False, 133),
+       '_CCB': (False, 133),
+       '_COLON': (False, 133),
+       '_COMMA': (False, 133),
+       '_CP': (False, 133),
+       '_CSB': (False, 133),
+       '_DEDENT': (False, 133),
+       '_FOREACH': (False, 133),
+       '_IF': (False, 133),
+       '_IMPORT': (False, 133),
+       '_INDENT': (False, 133),
+       '_NL': (False, 133),
+       '_OCB': (False, 133),
+       '_OP': (False, 133),
+       '_OSB': (False, 133),
+       '_RETURN': (False, 133),
+       '_THEN': (False, 133),
+       '_WHEN': (False, 133),
+       '_WHILE': (False, 133)},
+ 317: {'_CCB': (True, 335)},
+ 318: {'$END': (False, 136),
+       'BSLASH': (False, 136),
+       'DASH': (False, 136),
+       'DOUBLE_QUOTED': (False, 136),
+       'EQUAL': (False, 136),
+       'FALSE': (False, 136),
+       'FLOAT': (False, 136),
+       'FUNCTION_TYPE': (False, 136),
+       'GREATER': (False, 136),
+       'GREATER_EQUAL': (False, 136),
+       'INT': (False, 136),
+       'LESSER': (False, 136),
+       'LESSER_EQUAL': (False, 136),
+       'MODULUS': (False, 136),
+       'MULTIPLIER': (False, 136),
+       'NAME': (False, 136),
+       'NOT': (False, 136),
+       'NULL': (False, 136),
+       'PLUS': (False, 136),
+       'POWER': (False, 136),
+       'RAISE': (False, 136),
+       'REGEXP': (False, 136),
+       'SINGLE_QUOTED': (False, 136),
+       'TRUE': (False, 136),
+       'TRY': (False, 136),
+       '_AS': (False, 136),
+       '_CCB': (False, 136),
+       '_COLON': (False, 136),
+       '_COMMA': (False, 136),
+       '_CP': (False, 136),
+       '_CSB': (False, 136),
+       '_DEDENT': (False, 136),
+       '_FOREACH': (False, 136),
+       '_IF': (False, 136),
+       '_IMPORT': (False, 136),
+       '_INDENT': (False, 136),
+       '_NL': (False, 136),
+       '_OCB': (False, 136),
+       '_OP': (False, 136),
+       '_OSB': (False, 136),
+       '_RETURN': (False, 136),
+       '_THEN': (False, 136),
+       '_WHEN': (False, 136),
+       '_WHILE': (False, 136)},
+ 319: {'_DEDENT': (True, 336)},
+ 320: {'_CCB': (False, 12), '_COMMA': (False, 12), '_NL': (False, 12)},
+ 321: {'$END': (False, 141),
+       'BSLASH': (False, 141),
+       'DASH': (False, 141),
+       'DOUBLE_QUOTED': (False, 141),
+       'EQUAL': (False, 141),
+       'FALSE': (False, 141),
+       'FLOAT': (False, 141),
+       'FUNCTION_TYPE': (False, 141),
+       'GREATER': (False, 141),
+       'GREATER_EQUAL': (False, 141),
+       'INT': (False, 141),
+       'LESSER': (False, 141),
+       'LESSER_EQUAL': (False, 141),
+       'MODULUS': (False, 141),
+       'MULTIPLIER': (False, 141),
+       'NAME': (False, 141),
+       'NOT': (False, 141),
+       'NULL': (False, 141),
+       'PLUS': (False, 141),
+       'POWER': (False, 141),
+       'RAISE': (False, 141),
+       'REGEXP': (False, 141),
+       'SINGLE_QUOTED': (False, 141),
+       'TRUE': (False, 141),
+       'TRY': (False, 141),
+       '_AS': (False, 141),
+       '_CCB': (False, 141),
+       '_COLON': (False, 141),
+       '_COMMA': (False, 141),
+       '_CP': (False, 141),
+       '_CSB': (False, 141),
+       '_DEDENT': (False, 141),
+       '_FOREACH': (False, 141),
+       '_IF': (False, 141),
+       '_IMPORT': (False, 141),
+       '_INDENT': (False, 141),
+       '_NL': (False, 141),
+       '_OCB': (False, 141),
+       '_OP': (False, 141),
+       '_OSB': (False, 141),
+       '_RETURN': (False, 141),
+       '_THEN': (False, 141),
+       '_WHEN': (False, 141),
+       '_WHILE': (False, 141)},
+ 322: {'$END': (False, 110),
+       'BSLASH': (False, 110),
+       'DASH': (False, 110),
+       'DOUBLE_QUOTED': (False, 110),
+       'EQUAL': (False, 110),
+       'FALSE': (False, 110),
+       'FLOAT': (False, 110),
+       'FUNCTION_TYPE': (False, 110),
+       'GREATER': (False, 110),
+       'GREATER_EQUAL': (False, 110),
+       'INT': (False, 110),
+       'LESSER': (False, 110),
+       'LESSER_EQUAL': (False, 110),
+       'MODULUS': (False, 110),
+       'MULTIPLIER': (False, 110),
+       'NAME': (False, 110),
+       'NOT': (False, 110),
+       'NULL': (False, 110),
+       'PLUS': (False, 110),
+       'POWER': (False, 110),
+       'RAISE': (False, 110),
+       'REGEXP': (False, 110),
+       'SINGLE_QUOTED': (False, 110),
+       'TRUE': (False, 110),
+       'TRY': (False, 110),
+       '_AS': (False, 110),
+       '_CCB': (False, 110),
+       '_COLON': (False, 110),
+       '_COMMA': (False, 110),
+       '_CP': (False, 110),
+       '_CSB': (False, 110),
+       '_DEDENT': (False, 110),
+       '_FOREACH': (False, 110),
+       '_IF': (False, 110),
+       '_IMPORT': (False, 110),
+       '_INDENT': (False, 110),
+       '_NL': (False, 110),
+       '_OCB': (False, 110),
+       '_OP': (False, 110),
+       '_OSB': (False, 110),
+       '_RETURN': (False, 110),
+       '_THEN': (False, 110),
+       '_WHEN': (False, 110),
+       '_WHILE': (False, 110)},
+ 323: {'_CSB': (True, 337)},
+ 324: {'$END': (False, 113),
+       'BSLASH': (False, 113),
+       'DASH': (False, 113),
+       'DOUBLE_QUOTED': (False, 113),
+       'EQUAL': (False, 113),
+       'FALSE': (False, 113),
+       'FLOAT': (False, 113),
+       'FUNCTION_TYPE': (False, 113),
+       'GREATER': (False, 113),
+       'GREATER_EQUAL': (False, 113),
+       'INT': (False, 113),
+       'LESSER': (False, 113),
+       'LESSER_EQUAL': (False, 113),
+       'MODULUS': (False, 113),
+       'MULTIPLIER': (False, 113),
+       'NAME': (False, 113),
+       'NOT': (False, 113),
+       'NULL': (False, 113),
+       'PLUS': (False, 113),
+       'POWER': (False, 113),
+       'RAISE': (False, 113),
+       'REGEXP': (False, 113),
+       'SINGLE_QUOTED': (False, 113),
+       'TRUE': (False, 113),
+       'TRY': (False, 113),
+       '_AS': (False, 113),
+       '_CCB': (False, 113),
+       '_COLON': (False, 113),
+       '_COMMA': (False, 113),
+       '_CP': (False, 113),
+       '_CSB': (False, 113),
+       '_DEDENT': (False, 113),
+       '_FOREACH': (False, 113),
+       '_IF': (False, 113),
+       '_IMPORT': (False, 113),
+       '_INDENT': (False, 113),
+       '_NL': (False, 113),
+       '_OCB': (False, 113),
+       '_OP': (False, 113),
+       '_OSB': (False, 113),
+       '_RETURN': (False, 113),
+       '_THEN': (False, 113),
+       '_WHEN': (False, 113),
+       '_WHILE': (False, 113)},
+ 325: {'_DEDENT': (True, 338)},
+ 326: {'_COMMA': (False, 8), '_CSB': (False, 8), '_NL': (False, 8)},
+ 327: {'$END': (False, 118),
+       'BSLASH': (False, 118),
+       'DASH': (False, 118),
+       'DOUBLE_QUOTED': (False, 118),
+       'EQUAL': (False, 118),
+       'FALSE': (False, 118),
+       'FLOAT': (False, 118),
+       'FUNCTION_TYPE': (False, 118),
+       'GREATER': (False, 118),
+       'GREATER_EQUAL': (False, 118),
+       'INT': (False, 118),
+       'LESSER': (False, 118),
+       'LESSER_EQUAL': (False, 118),
+       'MODULUS': (False, 118),
+       'MULTIPLIER': (False, 118),
+       'NAME': (False, 118),
+       'NOT': (False, 118),
+       'NULL': (False, 118),
+       'PLUS': (False, 118),
+       'POWER': (False, 118),
+       'RAISE': (False, 118),
+       'REGEXP': (False, 118),
+       'SINGLE_QUOTED': (False, 118),
+       'TRUE': (False, 118),
+       'TRY': (False, 118),
+       '_AS': (False, 118),
+       '_CCB': (False, 118),
+       '_COLON': (False, 118),
+       '_COMMA': (False, 118),
+       '_CP': (False, 118),
+       '_CSB': (False, 118),
+       '_DEDENT': (False, 118),
+       '_FOREACH': (False, 118),
+       '_IF': (False, 118),
+       '_IMPORT': (False, 118),
+       '_INDENT': (False, 118),
+       '_NL': (False, 118),
+       '_OCB': (False, 118),
+       '_OP': (False, 118),
+       '_OSB': (False, 118),
+       '_RETURN': (False, 118),
+       '_THEN': (False, 118),
+       '_WHEN': (False, 118),
+       '_WHILE': (False, 118)},
+ 328: {'EQUAL': (True, 153),
+       'GREATER': (True, 154),
+       'GREATER_EQUAL': (True, 155),
+       'LESSER': (True, 156),
+       'LESSER_EQUAL': (True, 157),
+       'NOT': (True, 158),
+       '_NL': (False, 73),
+       'comparisons': (True, 339)},
+ 329: {'$END': (False, 70),
+       'DASH': (False, 70),
+       'DOUBLE_QUOTED': (False, 70),
+       'FALSE': (False, 70),
+       'FLOAT': (False, 70),
+       'FUNCTION_TYPE': (False, 70),
+       'INT': (False, 70),
+       'NAME': (False, 70),
+       'NULL': (False, 70),
+       'PLUS': (False, 70),
+       'RAISE': (False, 70),
+       'REGEXP': (False, 70),
+       'SINGLE_QUOTED': (False, 70),
+       'TRUE': (False, 70),
+       'TRY': (False, 70),
+       '_COLON': (False, 70),
+       '_DEDENT': (False, 70),
+       '_FOREACH': (False, 70),
+       '_IF': (False, 70),
+       '_IMPORT': (False, 70),
+       '_INDENT': (False, 70),
+       '_NL': (False, 70),
+       '_OCB': (False, 70),
+       '_OP': (False, 70),
+       '_OSB': (False, 70),
+       '_RETURN': (False, 70),
+       '_THEN': (False, 70),
+       '_WHEN': (False, 70),
+       '_WHILE': (False, 70)},
+ 330: {'$END': (False, 72),
+       'DASH': (False, 72),
+       'DOUBLE_QUOTED': (False, 72),
+       'FALSE': (False, 72),
+       'FLOAT': (False, 72),
+       'FUNCTION_TYPE': (False, 72),
+       'INT': (False, 72),
+       'NAME': (False, 72),
+       'NULL': (False, 72),
+       'PLUS': (False, 72),
+       'RAISE': (False, 72),
+       'REGEXP': (False, 72),
+       'SINGLE_QUOTED': (False, 72),
+       'TRUE': (False, 72),
+       'TRY': (False, 72),
+       '_COLON': (False, 72),
+       '_DEDENT': (False, 72),
+       '_ELSE': (False, 72),
+       '_FOREACH': (False, 72),
+       '_IF': (False, 72),
+       '_IMPORT': (False, 72),
+       '_INDENT': (False, 72),
+       '_NL': (False, 72),
+       '_OCB': (False, 72),
+       '_OP': (False, 72),
+       '_OSB': (False, 72),
+       '_RETURN': (False, 72),
+       '_THEN': (False, 72),
+       '_WHEN': (False, 72),
+       '_WHILE': (False, 72)},
+ 331: {'_NL': (False, 61)},
+ 332: {'$END': (False, 60),
+       'DASH': (False, 60),
+       'DOUBLE_QUOTED': (False, 60),
+       'FALSE': (False, 60),
+       'FINALLY': (False, 60),
+       'FLOAT': (False, 60),
+       'FUNCTION_TYPE': (False, 60),
+       'INT': (False, 60),
+       'NAME': (False, 60),
+       'NULL': (False, 60),
+       'PLUS': (False, 60),
+       'RAISE': (False, 60),
+       'REGEXP': (False, 60),
+       'SINGLE_QUOTED': (False, 60),
+       'TRUE': (False, 60),
+       'TRY': (False, 60),
+       '_COLON': (False, 60),
+       '_DEDENT': (False, 60),
+       '_FOREACH': (False, 60),
+       '_IF': (False, 60),
+       '_IMPORT': (False, 60),
+       '_INDENT': (False, 60),
+       '_NL': (False, 60),
+       '_OCB': (False, 60),
+       '_OP': (False, 60),
+       '_OSB': (False, 60),
+       '_RETURN': (False, 60),
+       '_THEN': (False, 60),
+       '_WHEN': (False, 60),
+       '_WHILE': (False, 60)},
+ 333: {'$END': (False, 85),
+       'DASH': (False, 85),
+       'DOUBLE_QUOTED': (False, 85),
+       'FALSE': (False, 85),
+       'FLOAT': (False, 85),
+       'FUNCTION_TYPE': (False, 85),
+       'INT': (False, 85),
+       'NAME': (False, 85),
+       'NULL': (False, 85),
+       'PLUS': (False, 85),
+       'RAISE': (False, 85),
+       'REGEXP': (False, 85),
+       'SINGLE_QUOTED': (False, 85),
+       'TRUE': (False, 85),
+       'TRY': (False, 85),
+       '_COLON': (False, 85),
+       '_DEDENT': (False, 85),
+       '_FOREACH': (False, 85),
+       '_IF': (False, 85),
+       '_IMPORT': (False, 85),
+       '_INDENT': (False, 85),
+       '_NL': (False, 85),
+       '_OCB': (False, 85),
+       '_OP': (False, 85),
+       '_OSB': (False, 85),
+       '_RETURN': (False, 85),
+       '_THEN': (False, 85),
+       '_WHEN': (False, 85),
+       '_WHILE': (False, 85)},
+ 334: {'_COMMA': (False, 35),
+       '_CP': (False, 35),
+       '_NL': (False, 35),
+       '_THEN': (False, 35)},
+ 335: {'$END': (False, 135),
+       'BSLASH': (False, 135),
+       'DASH': (False, 135),
+       'DOUBLE_QUOTED': (False, 135),
+       'EQUAL': (False, 135),
+       'FALSE': (False, 135),
+       'FLOAT': (False, 135),
+       'FUNCTION_TYPE': (False, 135),
+       'GREATER': (False, 135),
+       'GREATER_EQUAL': (False, 135),
+       'INT': (False, 135),
+       'LESSER': (False, 135),
+       'LESSER_EQUAL': (False, 135),
+       'MODULUS': (False, 135),
+       'MULTIPLIER': (False, 135),
+       'NAME': (False, 135),
+       'NOT': (False, 135),
+       'NULL': (False, 135),
+       'PLUS': (False, 135),
+       'POWER': (False, 135),
+       'RAISE': (False, 135),
+       'REGEXP': (False, 135),
+       'SINGLE_QUOTED': (False, 135),
+       'TRUE': (False, 135),
+       'TRY': (False, 135),
+       '_AS': (False, 135),
+       '_CCB': (False, 135),
+       '_COLON': (False, 135),
+       '_COMMA': (False, 135),
+       '_CP': (False, 135),
+       '_CSB': (False, 135),
+       '_DEDENT': (False, 135),
+       '_FOREACH': (False, 135),
+       '_IF': (False, 135),
+       '_IMPORT': (False, 135),
+       '_INDENT': (False, 135),
+       '_NL': (False, 135),
+       '_OCB': (False, 135),
+       '_OP': (False, 135),
+       '_OSB': (False, 135),
+       '_RETURN': (False, 135),
+       '_THEN': (False, 135),
+       '_WHEN': (False, 135),
+       '_WHILE': (False, 135)},
+ 336: {'_CCB': (True, 340)},
+ 337: {'$END': (False, 112),
+       'BSLASH': (False, 112),
+       'DASH': (False, 112),
+       'DOUBLE_QUOTED': (False, 112),
+       'EQUAL': (False, 112),
+       'FALSE': (False, 112),
+       'FLOAT': (False, 112),
+       'FUNCTION_TYPE': (False, 112),
+       'GREATER': (False, 112),
+       'GREATER_EQUAL': (False, 112),
+       'INT': (False, 112),
+       'LESSER': (False, 112),
+       'LESSER_EQUAL': (False, 112),
+       'MODULUS': (False, 112),
+       'MULTIPLIER': (False, 112),
+       'NAME': (False, 112),
+       'NOT': (False, 112),
+       'NULL': (False, 112),
+       'PLUS': (False, 112),
+       'POWER': (False, 112),
+       'RAISE': (False, 112),
+       'REGEXP': (False, 112),
+       'SINGLE_QUOTED': (False, 112),
+       'TRUE': (False, 112),
+       'TRY': (False, 112),
+       '_AS': (False, 112),
+       '_CCB': (False, 112),
+       '_COLON': (False, 112),
+       '_COMMA': (False, 112),
+       '_CP': (False, 112),
+       '_CSB': (False, 112),
+       '_DEDENT': (False, 112),
+       '_FOREACH': (False, 112),
+       '_IF': (False, 112),
+       '_IMPORT': (False, 112),
+       '_INDENT': (False, 112),
+       '_NL': (False, 112),
+       '_OCB': (False, 112),
+       '_OP': (False, 112),
+       '_OSB': (False, 112),
+       '_RETURN': (False, 112),
+       '_THEN': (False, 112),
+       '_WHEN': (False, 112),
+       '_WHILE': (False, 112)},
+ 338: {'_CSB': (True, 341)},
+ 339: {'DOUBLE_QUOTED': (True, 2),
+       'FALSE': (True, 3),
+       'FLOAT': (True, 4),
+       'INT': (True, 6),
+       'NAME': (True, 71),
+       'NULL': (True, 8),
+       'REGEXP': (True, 11),
+       'SINGLE_QUOTED': (True, 12),
+       'TRUE': (True, 13),
+       '_OCB': (True, 21),
+       '_OP': (True, 72),
+       '_OSB': (True, 23),
+       'boolean': (True, 33),
+       'entity': (True, 342),
+       'inline_expression': (True, 48),
+       'list': (True, 49),
+       'number': (True, 53),
+       'objects': (True, 54),
+       'path': (True, 74),
+       'regular_expression': (True, 57),
+       'string': (True, 63),
+       'values': (True, 66),
+       'void': (True, 67)},
+ 340: {'$END': (False, 137),
+       'BSLASH': (False, 137),
+       'DASH': (False, 137),
+       'DOUBLE_QUOTED': (False, 137),
+       'EQUAL': (False, 137),
+       'FALSE': (False, 137),
+       'FLOAT': (False, 137),
+       'FUNCTION_TYPE': (False, 137),
+       'GREATER': (False, 137),
+       'GREATER_EQUAL': (False, 137),
+       'INT': (False, 137),
+       'LESSER': (False, 137),
+       'LESSER_EQUAL': (False, 137),
+       'MODULUS': (False, 137),
+       'MULTIPLIER': (False, 137),
+       'NAME': (False, 137),
+       'NOT': (False, 137),
+       'NULL': (False, 137),
+       'PLUS': (False, 137),
+       'POWER': (False, 137),
+       'RAISE': (False, 137),
+       'REGEXP': (False, 137),
+       'SINGLE_QUOTED': (False, 137),
+       'TRUE': (False, 137),
+       'TRY': (False, 137),
+       '_AS': (False, 137),
+       '_CCB': (False, 137),
+       '_COLON': (False, 137),
+       '_COMMA': (False, 137),
+       '_CP': (False, 137),
+       '_CSB': (False, 137),
+       '_DEDENT': (False, 137),
+       '_FOREACH': (False, 137),
+       '_IF': (False, 137),
+       '_IMPORT': (False, 137),
+       '_INDENT': (False, 137),
+       '_NL': (False, 137),
+       '_OCB': (False, 137),
+       '_OP': (False, 137),
+       '_OSB': (False, 137),
+       '_RETURN': (False, 137),
+       '_THEN': (False, 137),
+       '_WHEN': (False, 137),
+       '_WHILE': (False, 137)},
+ 341: {'$END': (False, 114),
+       'BSLASH': (False, 114),
+       'DASH': (False, 114),
+       'DOUBLE_QUOTED': (False, 114),
+       'EQUAL': (False, 114),
+       'FALSE': (False, 114),
+       'FLOAT': (False, 114),
+       'FUNCTION_TYPE': (False, 114),
+       'GREATER': (False, 114),
+       'GREATER_EQUAL': (False, 114),
+       'INT': (False, 114),
+       'LESSER': (False, 114),
+       'LESSER_EQUAL': (False, 114),
+       'MODULUS': (False, 114),
+       'MULTIPLIER': (False, 114),
+       'NAME': (False, 114),
+       'NOT': (False, 114),
+       'NULL': (False, 114),
+       'PLUS': (False, 114),
+       'POWER': (False, 114),
+       'RAISE': (False, 114),
+       'REGEXP': (False, 114),
+       'SINGLE_QUOTED': (False, 114),
+       'TRUE': (False, 114),
+       'TRY': (False, 114),
+       '_AS': (False, 114),
+       '_CCB': (False, 114),
+       '_COLON': (False, 114),
+       '_COMMA': (False, 114),
+       '_CP': (False, 114),
+       '_CSB': (False, 114),
+       '_DEDENT': (False, 114),
+       '_FOREACH': (False, 114),
+       '_IF': (False, 114),
+       '_IMPORT': (False, 114),
+       '_INDENT': (False, 114),
+       '_NL': (False, 114),
+       '_OCB': (False, 114),
+       '_OP': (False, 114),
+       '_OSB': (False, 114),
+       '_RETURN': (False, 114),
+       '_THEN': (False, 114),
+       '_WHEN': (False, 114),
+       '_WHILE': (False, 114)},
+ 342: {'_NL': (False, 74)}}
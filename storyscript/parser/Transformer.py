@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
-from lark import Transformer as LarkTransformer
+from functools import partial
+
+from lark import Transformer as LarkTransformer, Tree as LarkTree
+from lark.visitors import Discard
 
 from .Tree import Tree
 from ..exceptions import StorySyntaxError
@@ -11,6 +14,9 @@ class Transformer(LarkTransformer):
     Performs transformations on the tree before it's parsed.
     All trees are transformed to Storyscript's custom tree. In some cases,
     additional transformations or checks are performed.
+
+    With LALR, the transformer is applied by Lark while parsing, so each
+    node is built only once.
     """
     reserved_keywords = ['function', 'if', 'else', 'foreach', 'return',
                          'returns', 'try', 'catch', 'finally', 'when', 'as',
@@ -35,7 +41,7 @@ class Transformer(LarkTransformer):
         fragment = tree.service_fragment
         if fragment.output is None:
             output = Tree('output', [fragment.command.child(0)])
-            fragment.children.append(output)
+            fragment.append(output)
 
     @staticmethod
     def arguments(matches):
@@ -81,7 +87,7 @@ class Transformer(LarkTransformer):
                 cls.implicit_output(matches[0])
             if matches[1].block.rules:
                 for argument in matches[1].find_data('arguments'):
-                    matches[0].service_fragment.children.append(argument)
+                    matches[0].service_fragment.append(argument)
                 return Tree('service_block', [matches[0]])
         return Tree('service_block', matches)
 
@@ -93,5 +99,30 @@ class Transformer(LarkTransformer):
         cls.implicit_output(matches[0])
         return Tree('when_block', matches)
 
+    def transform(self, tree):
+        """
+        Transforms a tree from the leaves up, like Lark, but with an explicit
+        stack instead of recursion, so that deep trees can be transformed.
+        """
+        stack = [(tree, iter(tree.children), [])]
+        while True:
+            current, children, transformed = stack[-1]
+            for child in children:
+                if isinstance(child, LarkTree):
+                    stack.append((child, iter(child.children), []))
+                    break
+                transformed.append(child)
+            else:
+                stack.pop()
+                if stack == []:
+                    return self._call_userfunc(current, transformed)
+                try:
+                    result = self._call_userfunc(current, transformed)
+                    stack[-1][2].append(result)
+                except Discard:
+                    pass
+
     def __getattr__(self, attribute, *args):
-        return lambda matches: Tree(attribute, matches)
+        if attribute.startswith('__'):
+            raise AttributeError(attribute)
+        return partial(Tree, attribute)
@@ -2,6 +2,7 @@
 from lark.lexer import Token
 from lark.tree import Tree as LarkTree
 
+from .Revision import Revision
 from ..exceptions import CompilerError
 
 
@@ -9,22 +10,83 @@ class Tree(LarkTree):
     """
     Wraps the original Tree class from lark, providing many useful
     enhancements.
+
+    Subtrees are found through an index of the children by rule name, that
+    is built on the first lookup and dropped when the children change.
+    Children must be changed with the methods of the tree, or by assigning
+    a new list.
+
+    Likewise, the first token of a tree, which gives its position, is found
+    once and remembered until a first child changes in the trees it was
+    found through. Trees share a revision with the trees they found their
+    first token through, so changes in a story don't affect other stories.
     """
+    paths = {}
+    _index = None
+    _first = None
+    _revision = None
+
+    @property
+    def children(self):
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        if '_children' in self.__dict__:
+            self.invalidate_positions()
+        self._children = children
+        self._index = None
+
+    def revision(self):
+        """
+        Gets the revision of the group of the tree, creating it if needed.
+        """
+        if self._revision is None:
+            self._revision = Revision()
+        self._revision = self._revision.root()
+        return self._revision
+
+    def invalidate_positions(self):
+        """
+        Forgets the first tokens found through this tree, since its first
+        child changed. Trees without a revision were never used to find
+        one.
+        """
+        if self._revision is not None:
+            self.revision().count += 1
+
+    def index(self):
+        """
+        Gets the index of the children, mapping rule names to the first
+        subtree of that rule.
+        """
+        if self._index is None:
+            self._index = {}
+            for item in self.children:
+                if isinstance(item, Tree):
+                    self._index.setdefault(item.data, item)
+        return self._index
 
     @staticmethod
     def walk(tree, path):
-        for item in tree.children:
-            if isinstance(item, Tree):
-                if item.data == path:
-                    return item
+        return tree.index().get(path)
+
+    @classmethod
+    def shards(cls, path):
+        """
+        Splits a dotted path, remembering the result since the same paths
+        are used over and over.
+        """
+        if path not in cls.paths:
+            cls.paths[path] = path.split('.')
+        return cls.paths[path]
 
     def node(self, path):
         """
         Finds a subtree or a nested subtree, using path
         """
-        shards = path.split('.')
         current = None
-        for shard in shards:
+        for shard in self.shards(path):
             if current is None:
                 current = self.walk(self, shard)
             else:
@@ -41,16 +103,62 @@ class Tree(LarkTree):
         """
         return list(self.find_data(path))
 
+    def known_first(self):
+        """
+        Whether the first token found for the tree is still valid.
+        """
+        if self._first is None:
+            return False
+        revision = self.revision()
+        return self._first[0] is revision and self._first[1] == revision.count
+
+    def first_token(self):
+        """
+        Finds the first token of a tree, following the first children. The
+        token is remembered by all the trees on the way, which join the same
+        revision.
+        """
+        if self.known_first() is False:
+            trees = []
+            token = self
+            while isinstance(token, Tree) and token.known_first() is False:
+                trees.append(token)
+                token = token.child(0)
+            revision = Revision()
+            if isinstance(token, Tree):
+                revision = token.revision()
+                token = token._first[2]
+            for tree in trees:
+                if tree._revision is not None:
+                    revision = revision.join(tree._revision)
+            for tree in trees:
+                tree._revision = revision
+                tree._first = (revision, revision.count, token)
+        return self._first[2]
+
+    def position(self, position):
+        """
+        Finds the requested positional attribute of a tree, as it's stored
+        in its first token, for internal use. Lines of tokens from the story
+        are integers.
+        """
+        token = self.first_token()
+        if token is not None:
+            return getattr(token, position)
+
     def _find_position(self, position):
         """
-        Finds the request positional attribute of a tree, by finding the
-        first token its first token and returning the token's positional
-        attribute
+        Finds the requested positional attribute of a tree as a string.
         """
-        for child in self.children:
-            if isinstance(child, Token):
-                return str(getattr(child, position))
-            return child._find_position(position)
+        value = self.position(position)
+        if value is not None:
+            return str(value)
+
+    def set_line(self, line):
+        """
+        Sets the line of the first token of the tree.
+        """
+        self.first_token().line = line
 
     def line(self):
         """
@@ -75,6 +183,17 @@ class Tree(LarkTree):
         Inserts an item into the current tree.
         """
         self.children.insert(0, item)
+        self._index = None
+        self.invalidate_positions()
+
+    def append(self, item):
+        """
+        Appends an item to the current tree.
+        """
+        if not self.children:
+            self.invalidate_positions()
+        self.children.append(item)
+        self._index = None
 
     def rename(self, new_name):
         """
@@ -87,6 +206,9 @@ class Tree(LarkTree):
         Replaces a child at the given index
         """
         self.children[index] = item
+        self._index = None
+        if index == 0:
+            self.invalidate_positions()
 
     def extract_path(self):
         """
@@ -133,5 +255,18 @@ class Tree(LarkTree):
         if not cond:
             raise CompilerError(error, tree=self)
 
+    def __getstate__(self):
+        """
+        Pickles the tree without the index and the first token, since they
+        are found again quickly.
+        """
+        state = dict(self.__dict__)
+        state.pop('_index', None)
+        state.pop('_first', None)
+        state.pop('_revision', None)
+        return state
+
     def __getattr__(self, attribute):
+        if attribute.startswith('_'):
+            raise AttributeError(attribute)
         return self.node(attribute)
@@ -1,10 +1,14 @@
+from .Cache import Cache
 from .Ebnf import Ebnf
 from .Grammar import Grammar
 from .Indenter import CustomIndenter
+from .Lexer import Lexer
 from .Parser import Parser
+from .Revision import Revision
+from .Standalone import Standalone
 from .Transformer import Transformer
 from .Tree import Tree
 
 
-__all__ = ['CustomIndenter', 'Ebnf', 'Grammar', 'Parser', 'Transformer',
-           'Tree']
+__all__ = ['Cache', 'CustomIndenter', 'Ebnf', 'Grammar', 'Lexer', 'Parser',
+           'Revision', 'Standalone', 'Transformer', 'Tree']
@@ -1,4 +1,11 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch
 
 from pytest import raises
@@ -91,3 +98,95 @@ def test_api_load_ice():
         assert e.value.message() == \
             """Internal error occured: ICE
 Please report at https://github.com/storyscript/storyscript/issues"""
+
+
+def test_api_loads_async():
+    async def many():
+        stories = ['x = {}'.format(i) for i in range(4)]
+        return await asyncio.gather(*[Api.loads_async(s) for s in stories])
+
+    loop = asyncio.new_event_loop()
+    results = loop.run_until_complete(many())
+    loop.close()
+    assert [result['tree']['1']['args'] for result in results] == \
+        [[0], [1], [2], [3]]
+
+
+def test_api_loads_async_error():
+    """
+    Ensures the async functions raise the same errors
+    """
+    loop = asyncio.new_event_loop()
+    with raises(StoryError) as e:
+        loop.run_until_complete(Api.loads_async('foo'))
+    loop.close()
+    assert e.value.short_message() == 'E0040: No operator provided'
+
+
+def test_api_load_async_process(tmpdir):
+    """
+    Ensures load_async works with a process pool
+    """
+    tmpdir.join('a.story').write('x = 1\n')
+    Api.configure(executor=ProcessPoolExecutor(max_workers=1))
+    loop = asyncio.new_event_loop()
+    try:
+        with io.open(str(tmpdir.join('a.story')), 'r') as stream:
+            result = loop.run_until_complete(Api.load_async(stream))
+    finally:
+        loop.close()
+        Api.executor.shutdown()
+        Api.configure()
+    assert result[str(tmpdir.join('a.story'))]['tree']['1']['args'] == [1]
+
+
+def test_api_profile():
+    with Api.profile() as timings:
+        Api.loads('x = 1\n')
+    phases = timings.stories[None]
+    assert phases['parse'][1] == 1
+    assert phases['preprocess'][1] == 1
+    assert phases['compile'][1] == 1
+
+
+def test_api_memprofile():
+    """
+    Ensures Api.memprofile measures the memory of the phases and stops
+    tracing
+    """
+    with Api.memprofile() as memory:
+        Api.load_map({'a.story': 'x = 1\n'})
+    assert tracemalloc.is_tracing() is False
+    phases = memory.stories['a.story']
+    assert phases['parse'][2] == 1
+    assert phases['compile'][0] > 0
+    assert memory.peak > 0
+
+
+def test_api_import_lazy():
+    """
+    Ensures importing storyscript doesn't load the compiler nor asyncio
+    """
+    code = ('import sys, storyscript\n'
+            'modules = ["lark", "asyncio", "storyscript.compiler"]\n'
+            'print([m for m in modules if m in sys.modules])')
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode('utf-8').strip() == '[]'
+
+
+def test_api_loads_hash_seed():
+    """
+    Ensures the output doesn't depend on the hash seed
+    """
+    story = ('alpine echo text:(random strings)\n'
+             'x = (redis get key:(uuid generate))\n'
+             'slack send text:(time now) to:(users get)\n')
+    code = ('import json, sys, storyscript\n'
+            'print(json.dumps(storyscript.loads(sys.argv[1])))')
+    outputs = []
+    for seed in ('1', '2', '3'):
+        environment = dict(os.environ, PYTHONHASHSEED=seed)
+        output = subprocess.check_output([sys.executable, '-c', code, story],
+                                         env=environment)
+        outputs.append(output)
+    assert outputs[0] == outputs[1] == outputs[2]
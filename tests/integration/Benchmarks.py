@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from benchmarks.Generator import Generator
+
+from pytest import mark
+
+from storyscript.Api import Api
+
+
+@mark.parametrize('axis', Generator.axes)
+def test_generator_compiles(axis):
+    """
+    Ensures the generated stories compile along every axis
+    """
+    generator = Generator.scaled(axis, 6)
+    result = Api.load_map(generator.files())
+    assert len(result['stories']) == 1 + generator.imports
+    assert result['stories']['main.story']['tree']
+
+
+def test_generator_services():
+    result = Api.load_map(Generator(services=2).files())
+    assert result['services'] == ['service0', 'service1']
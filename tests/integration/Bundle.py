@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from pytest import raises
+
+from storyscript.Bundle import Bundle
+from storyscript.Story import Story
+from storyscript.StoryCache import StoryCache
+from storyscript.exceptions import StoryError
+
+
+def test_bundle_cache(tmpdir):
+    """
+    Ensures cached stories are compiled once and that the cached results
+    are the same as compiling again
+    """
+    files = {'one.story': 'import "two" as two\nx = 1\n',
+             'two.story': 'alpine echo text:"hello"\n'}
+    cache = StoryCache(str(tmpdir))
+    expected = Bundle(story_files=dict(files), cache=cache).bundle()
+    assert len(tmpdir.listdir()) == 2
+    with patch.object(Story, 'parse') as parse:
+        result = Bundle(story_files=dict(files), cache=cache).bundle()
+    assert parse.call_count == 0
+    assert result == expected
+
+
+def test_bundle_cache_changed(tmpdir):
+    cache = StoryCache(str(tmpdir))
+    Bundle(story_files={'one.story': 'x = 1\n'}, cache=cache).bundle()
+    result = Bundle(story_files={'one.story': 'x = 2\n'}, cache=cache)
+    story = result.bundle()['stories']['one.story']
+    assert story['tree']['1']['args'] == [2]
+
+
+def test_bundle_shared_module():
+    """
+    Ensures a module imported by many stories is compiled once
+    """
+    files = {'a.story': 'import "utils" as utils\n',
+             'b.story': 'import "utils" as utils\n',
+             'utils.story': 'x = 1\n'}
+    with patch.object(Story, 'compile', autospec=True,
+                      side_effect=Story.compile) as compile:
+        result = Bundle(story_files=files).bundle()
+    assert compile.call_count == 3
+    assert list(result['stories']) == ['utils.story', 'a.story', 'b.story']
+
+
+def test_bundle_import_cycle():
+    files = {'a.story': 'import "b" as b\n', 'b.story': 'import "a" as a\n'}
+    with raises(StoryError) as e:
+        Bundle(story_files=files).bundle()
+    message = 'Import cycle: a.story -> b.story -> a.story'
+    assert e.value.message() == message
+
+
+def test_bundle_jobs():
+    """
+    Ensures stories compiled in many processes give the same bundle
+    """
+    files = {'a.story': 'import "utils" as utils\nalpine echo text:"a"\n',
+             'b.story': 'import "utils" as utils\nx = 1\n',
+             'utils.story': 'http fetch url:"hello"\n'}
+    expected = Bundle(story_files=dict(files)).bundle()
+    result = Bundle(story_files=dict(files)).bundle(jobs=2)
+    assert result == expected
+    assert list(result['stories']) == list(expected['stories'])
+
+
+def test_bundle_jobs_error():
+    """
+    Ensures errors of stories compiled in many processes are raised
+    """
+    files = {'a.story': 'x = 1\n', 'b.story': 'foo\n'}
+    with raises(StoryError) as e:
+        Bundle(story_files=files).bundle(jobs=2)
+    assert e.value.short_message() == 'E0040: No operator provided'
+
+
+def test_bundle_trees_jobs():
+    files = {'a.story': 'import "b" as b\n', 'b.story': 'x = 1\n'}
+    expected = Bundle(story_files=dict(files)).bundle_trees()
+    result = Bundle(story_files=dict(files)).bundle_trees(jobs=2)
+    assert result == expected
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+import subprocess
+import sys
 from unittest import mock
 
 from click.testing import CliRunner
@@ -68,3 +70,19 @@ def test_cli_lex_exit_file_not_found():
     # the error message contains the absolute path too
     assert 'File "this-path-will-never-ever-exist-123456" not found' \
         in e.output
+
+
+def test_cli_version_lazy():
+    """
+    Ensures the version command doesn't load the compiler nor the parser
+    """
+    code = ('import sys\n'
+            'from storyscript.Cli import Cli\n'
+            'try:\n'
+            '    Cli.main(["--version"])\n'
+            'except SystemExit:\n'
+            '    pass\n'
+            'modules = ["lark", "asyncio", "storyscript.compiler"]\n'
+            'print([m for m in modules if m in sys.modules])')
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode('utf-8').strip().split('\n')[-1] == '[]'
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import shutil
+import subprocess
+
+from pytest import mark
+
+from storyscript.Bundle import Bundle
+
+
+def test_gitignore_parse_directory(tmpdir):
+    """
+    Ensures stories ignored by .gitignore files are not found, and ignored
+    directories are not walked
+    """
+    tmpdir.mkdir('.git')
+    tmpdir.join('.gitignore').write('node_modules/\n*.tmp.story\n')
+    tmpdir.join('one.story').write('x = 1\n')
+    tmpdir.join('one.tmp.story').write('x = 1\n')
+    tmpdir.mkdir('node_modules').join('lib.story').write('x = 1\n')
+    src = tmpdir.mkdir('src')
+    src.join('.gitignore').write('*.story\n!keep.story\n')
+    src.join('two.story').write('x = 1\n')
+    src.join('keep.story').write('x = 1\n')
+    with tmpdir.as_cwd():
+        result = Bundle.parse_directory('.')
+    assert sorted(result) == ['one.story', 'src/keep.story']
+
+
+def test_gitignore_parse_directory_parent(tmpdir):
+    """
+    Ensures the .gitignore files of the parent directories apply
+    """
+    tmpdir.mkdir('.git')
+    tmpdir.join('.gitignore').write('ignored.story\n')
+    src = tmpdir.mkdir('src')
+    src.join('ignored.story').write('x = 1\n')
+    src.join('one.story').write('x = 1\n')
+    with src.as_cwd():
+        assert Bundle.parse_directory('.') == ['one.story']
+
+
+def test_gitignore_from_path(tmpdir):
+    """
+    Ensures a directory bundle reads the stories that are not ignored
+    """
+    tmpdir.mkdir('.git')
+    tmpdir.join('.gitignore').write('build/\n')
+    tmpdir.join('one.story').write('x = 1 # comment\n')
+    tmpdir.mkdir('build').join('two.story').write('x = 1\n')
+    with tmpdir.as_cwd():
+        bundle = Bundle.from_path('.')
+    assert bundle.story_files == {'one.story': 'x = 1 \n'}
+
+
+@mark.skipif(shutil.which('git') is None, reason='git is not installed')
+def test_gitignore_excludes_file(tmpdir):
+    """
+    Ensures the ignore file set by core.excludesFile applies
+    """
+    subprocess.check_call(['git', 'init', '-q', str(tmpdir)])
+    excludes = tmpdir.join('excludes')
+    excludes.write('local.story\n')
+    subprocess.check_call(['git', 'config', 'core.excludesFile',
+                           str(excludes)], cwd=str(tmpdir))
+    tmpdir.join('local.story').write('x = 1\n')
+    tmpdir.join('one.story').write('x = 1\n')
+    with tmpdir.as_cwd():
+        assert Bundle.parse_directory('.') == ['one.story']
+
+
+def test_gitignore_excludes_file_config(tmpdir):
+    """
+    Ensures core.excludesFile is read from the config of the repository
+    """
+    excludes = tmpdir.join('excludes')
+    excludes.write('local.story\n')
+    config = '[core]\n\texcludesFile = "{}"\n'.format(excludes)
+    tmpdir.mkdir('.git').join('config').write(config)
+    tmpdir.join('local.story').write('x = 1\n')
+    tmpdir.join('one.story').write('x = 1\n')
+    with tmpdir.as_cwd():
+        assert Bundle.parse_directory('.') == ['one.story']
+
+
+@mark.skipif(shutil.which('git') is None, reason='git is not installed')
+def test_gitignore_tracked(tmpdir):
+    """
+    Ensures stories tracked by git are found even when they are ignored,
+    like git does
+    """
+    subprocess.check_call(['git', 'init', '-q', str(tmpdir)])
+    tmpdir.mkdir('build').join('one.story').write('x = 1\n')
+    tmpdir.join('build', 'two.story').write('x = 1\n')
+    subprocess.check_call(['git', 'add', 'build/one.story'],
+                          cwd=str(tmpdir))
+    tmpdir.join('.gitignore').write('build/\n')
+    with tmpdir.as_cwd():
+        assert Bundle.parse_directory('.') == ['build/one.story']
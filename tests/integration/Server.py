@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+import os
+import socket
+import threading
+
+from pytest import fixture, raises
+
+from storyscript.Api import Api
+from storyscript.Client import Client
+from storyscript.Server import Server
+from storyscript.exceptions import StoryError
+
+
+@fixture
+def client(tmpdir):
+    address = str(tmpdir.join('story.sock'))
+    server = Server.make(address=address)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield Client(address=address)
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_server_loads(client):
+    assert client.loads('x = 1\n') == Api.loads('x = 1\n')
+
+
+def test_server_load_map(client):
+    files = {'a.story': 'x = 1\n'}
+    assert client.load_map(files) == Api.load_map(files)
+
+
+def test_server_lex(client):
+    assert client.lex('x = 1\n')[0] == ['NAME', 'x']
+
+
+def test_server_parse(client):
+    assert client.parse('x = 1\n').startswith('start')
+
+
+def test_server_error(client):
+    """
+    Ensures errors are raised by the client with the messages of the server
+    """
+    with raises(StoryError) as e:
+        client.loads('foo')
+    assert e.value.short_message() == 'E0040: No operator provided'
+
+
+def test_server_error_unformatted(client):
+    """
+    Ensures errors that can't be formatted are still sent to the client
+    """
+    with raises(StoryError) as e:
+        client.loads('x = ]\n')
+    assert "No terminal defined for ']'" in e.value.short_message()
+
+
+def test_server_socket_permissions(tmpdir):
+    address = str(tmpdir.join('story.sock'))
+    server = Server.make(address=address)
+    assert os.stat(address).st_mode & 0o777 == 0o600
+    server.server_close()
+
+
+def test_server_port_files(tmpdir):
+    """
+    Ensures a server on a port doesn't compile paths for its clients
+    """
+    with socket.socket() as free:
+        free.bind(('127.0.0.1', 0))
+        port = free.getsockname()[1]
+    server = Server.make(port=port)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    client = Client(port=port)
+    try:
+        assert client.loads('x = 1\n') == Api.loads('x = 1\n')
+        with raises(StoryError) as e:
+            client.compile(str(tmpdir))
+        assert 'only allowed on the Unix socket' in e.value.short_message()
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_server_port_imports(tmpdir):
+    """
+    Ensures a server on a port doesn't read the imports of load_map from
+    its files
+    """
+    tmpdir.join('secret.story').write('x = 1\n')
+    with socket.socket() as free:
+        free.bind(('127.0.0.1', 0))
+        port = free.getsockname()[1]
+    server = Server.make(port=port)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    path = str(tmpdir.join('secret'))
+    files = {'a.story': 'import "{}" as secret\n'.format(path)}
+    try:
+        with raises(StoryError) as e:
+            Client(port=port).load_map(files)
+        assert 'not found in the bundle' in e.value.short_message()
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_server_load_map_imports(client, tmpdir):
+    """
+    Ensures imports of load_map are read from the directory of the client
+    """
+    tmpdir.join('module.story').write('x = 1\n')
+    files = {'a.story': 'import "module" as module\n'}
+    working_directory = os.getcwd()
+    with tmpdir.as_cwd():
+        result = client.load_map(files)
+    assert 'module.story' in result['stories']
+    assert os.getcwd() == working_directory
+
+
+def test_server_make_running(client):
+    """
+    Ensures a server doesn't take over the socket of a running server
+    """
+    with raises(StoryError) as e:
+        Server.make(address=client.address)
+    assert 'A server is already running' in e.value.short_message()
+    assert client.loads('x = 1\n') == Api.loads('x = 1\n')
+
+
+def test_server_make_stale(tmpdir):
+    """
+    Ensures the socket of a server that stopped is replaced
+    """
+    address = str(tmpdir.join('story.sock'))
+    with socket.socket(socket.AF_UNIX) as stale:
+        stale.bind(address)
+    server = Server.make(address=address)
+    assert os.path.exists(address)
+    server.server_close()
+
+
+def test_server_compile(client, tmpdir):
+    tmpdir.join('one.story').write('x = 1\n')
+    working_directory = os.getcwd()
+    with tmpdir.as_cwd():
+        result = client.compile('one.story')
+    assert '"one.story"' in result
+    assert os.getcwd() == working_directory
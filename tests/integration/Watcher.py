@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+from unittest.mock import patch
+
+from storyscript.Story import Story
+from storyscript.Watcher import Watcher
+from storyscript.exceptions import StoryError
+
+
+def touch(path, source):
+    """
+    Writes a story, making sure its modification time changes.
+    """
+    mtime = 0
+    if path.exists():
+        mtime = os.stat(str(path)).st_mtime_ns
+    path.write(source)
+    os.utime(str(path), ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+
+def test_watcher(tmpdir):
+    """
+    Ensures only the stories that changed are compiled again
+    """
+    touch(tmpdir.join('one.story'), 'import "utils" as utils\nx = 1\n')
+    touch(tmpdir.join('utils.story'), 'y = 1\n')
+    with tmpdir.as_cwd():
+        watcher = Watcher('.')
+        watcher.update()
+        first = json.loads(watcher.compile())
+        assert sorted(first['stories']) == ['one.story', 'utils.story']
+        assert watcher.update() == []
+        touch(tmpdir.join('utils.story'), 'y = 2\n')
+        assert watcher.update() == ['utils.story']
+        with patch.object(Story, 'parse', autospec=True,
+                          side_effect=Story.parse) as parse:
+            result = json.loads(watcher.compile())
+    assert parse.call_count == 1
+    assert result['stories']['one.story'] == first['stories']['one.story']
+    assert result['stories']['utils.story']['tree']['1']['args'] == [2]
+
+
+def test_watcher_module_outside_path(tmpdir):
+    """
+    Ensures changes to imported modules of a watched story are found
+    """
+    touch(tmpdir.join('one.story'), 'import "utils" as utils\n')
+    touch(tmpdir.join('utils.story'), 'y = 1\n')
+    with tmpdir.as_cwd():
+        watcher = Watcher('one.story')
+        watcher.update()
+        watcher.compile()
+        touch(tmpdir.join('utils.story'), 'y = 1\nz = 2\n')
+        assert watcher.update() == ['utils.story']
+
+
+def test_watcher_module_outside_path_unchanged(tmpdir):
+    """
+    Ensures imported modules are not found as changed after the first build
+    """
+    touch(tmpdir.join('one.story'), 'import "utils" as utils\n')
+    touch(tmpdir.join('utils.story'), 'y = 1\n')
+    with tmpdir.as_cwd():
+        watcher = Watcher('one.story')
+        watcher.update()
+        watcher.compile()
+        assert watcher.update() == []
+
+
+def test_watcher_watch(tmpdir):
+    touch(tmpdir.join('one.story'), 'x = 1\n')
+    output = tmpdir.join('out.json')
+    with tmpdir.as_cwd():
+        results = Watcher('one.story').watch(output=str(output))
+        result = next(results)
+        assert json.loads(output.read()) == json.loads(result)
+        touch(tmpdir.join('one.story'), 'foo\n')
+        with patch('time.sleep'):
+            assert isinstance(next(results), StoryError)
+    assert json.loads(output.read()) == json.loads(result)
@@ -153,6 +153,70 @@ def test_compiler_if_inline_expression(parser):
     assert result['tree']['1']['args'] == [{'$OBJECT': 'path', 'paths': name}]
 
 
+def test_compiler_if_nested_inline_expression(parser):
+    """
+    Ensures that inline expressions of nested blocks are compiled in the
+    nested block, before the statement using them
+    """
+    tree = parser.parse('if a\n\tif (random numbers)\n\t\tx = 0')
+    result = Compiler.compile(tree)
+    line = result['tree']['1']['next']
+    name = result['tree'][line]['name']
+    assert 1 < float(line) < 2
+    assert result['tree'][line]['parent'] == '1'
+    assert result['tree'][line]['next'] == '2'
+    assert result['tree']['2']['args'] == [{'$OBJECT': 'path', 'paths': name}]
+
+
+def test_compiler_nested_inline_expressions(parser):
+    """
+    Ensures that inline expressions nested in other inline expressions of a
+    nested block are compiled, before the expressions using them
+    """
+    source = 'if a\n    x = (alpine echo text:(random strings))'
+    result = Compiler.compile(parser.parse(source))
+    tree = result['tree']
+    assert list(tree) == ['1', '1.1', '1.2', '2']
+    assert tree['1.1']['service'] == 'random'
+    assert tree['1.1']['name'] == ['$0']
+    assert tree['1.1']['parent'] == '1'
+    assert tree['1.2']['service'] == 'alpine'
+    assert tree['1.2']['name'] == ['$1']
+    assert tree['1.2']['args'] == [{'$OBJECT': 'argument', 'name': 'text',
+                                    'argument': {'$OBJECT': 'path',
+                                                 'paths': ['$0']}}]
+    assert tree['2']['args'] == [{'$OBJECT': 'path', 'paths': ['$1']}]
+    assert result['services'] == ['random', 'alpine']
+
+
+def test_compiler_many_inline_expressions(parser):
+    """
+    Ensures that a service with many inline expressions, nested or not,
+    keeps its line
+    """
+    source = 'alpine echo a:(random strings b:(random numbers)) c:(random ls)'
+    result = Compiler.compile(parser.parse(source))
+    tree = result['tree']
+    assert list(tree) == ['0.1', '0.2', '0.3', '1']
+    assert tree['1']['service'] == 'alpine'
+    assert tree['1']['args'][0]['argument']['paths'] == ['$1']
+    assert tree['1']['args'][1]['argument']['paths'] == ['$2']
+    assert tree['0.2']['args'][0]['argument']['paths'] == ['$0']
+
+
+def test_compiler_inline_expression_deterministic(parser):
+    """
+    Ensures that compiling the same story gives the same lines and names
+    for inline expressions
+    """
+    source = ('a = alpine echo text:(random value)\n'
+              'if (random numbers)\n\tx = 0')
+    result = Compiler.compile(parser.parse(source))
+    assert result == Compiler.compile(parser.parse(source))
+    assert result['tree']['0.1']['name'] == ['$0']
+    assert result['tree']['1.1']['name'] == ['$1']
+
+
 def test_compiler_if_elseif(parser):
     source = 'if colour == "red"\n\tx = 0\nelse if colour == "blue"\n\tx = 1'
     tree = parser.parse(source)
@@ -176,6 +240,32 @@ def test_compiler_if_else(parser):
     assert result['tree']['4']['parent'] == '3'
 
 
+def test_compiler_if_elseif_ladder(parser):
+    """
+    Ensures that every branch of an if/elif/else ladder is compiled and
+    exits to the next one
+    """
+    source = ('if a\n\tx = 0\nelse if b\n\tx = 1\nelse if c\n\tx = 2\n'
+              'else\n\tx = 3')
+    result = Compiler.compile(parser.parse(source))
+    assert result['tree']['1']['exit'] == '3'
+    assert result['tree']['3']['exit'] == '5'
+    assert result['tree']['5']['method'] == 'elif'
+    assert result['tree']['5']['exit'] == '7'
+    assert result['tree']['7']['method'] == 'else'
+
+
+def test_compiler_if_nested_else(parser):
+    """
+    Ensures that the else of an outer if is not taken as the exit of an
+    inner if
+    """
+    source = 'if a\n\tif b\n\t\tx = 0\nelse\n\tx = 1'
+    result = Compiler.compile(parser.parse(source))
+    assert result['tree']['1']['exit'] == '4'
+    assert result['tree']['2']['exit'] is None
+
+
 def test_compiler_foreach(parser):
     tree = parser.parse('foreach items as item\n\tx = 0')
     result = Compiler.compile(tree)
@@ -358,3 +448,32 @@ def test_compiler_try_nested_raise_error(parser):
     assert result['tree']['5']['method'] == 'raise'
     assert result['tree']['5']['parent'] == '4'
     assert result['tree']['5']['args'] == args
+
+
+def test_compiler_nesting_deep(parser):
+    """
+    Ensures blocks nested deeper than the recursion limit are compiled
+    """
+    lines = []
+    for level in range(1500):
+        lines.append('{}if a{}'.format('    ' * level, level))
+    lines.append('{}x = 0'.format('    ' * 1500))
+    result = Compiler.compile(parser.parse('\n'.join(lines)))
+    assert len(result['tree']) == 1501
+    assert result['tree']['1501']['parent'] == '1500'
+
+
+def test_compiler_expression_deep(parser):
+    """
+    Ensures expressions nested deeper than the recursion limit are compiled
+    """
+    source = '1 + 2'
+    for n in range(1500):
+        source = '1 + ({})'.format(source)
+    result = Compiler.compile(parser.parse('a = {}'.format(source)))
+    expression = result['tree']['1']['args'][0]
+    for n in range(1500):
+        assert expression['values'][0] == 1
+        expression = expression['values'][1]
+    assert expression == {'$OBJECT': 'expression', 'expression': 'sum',
+                          'values': [1, 2]}
@@ -1,7 +1,15 @@
 # -*- coding: utf-8 -*-
+import io
+import os
+import subprocess
+import sys
+
+from lark.exceptions import UnexpectedInput
 from lark.lexer import Token
 
-from pytest import mark
+from pytest import mark, raises
+
+from storyscript.parser import Grammar, Parser, Standalone, Tables
 
 
 def test_parser_sum(parser):
@@ -196,3 +204,88 @@ def test_parser_try_raise_error_message(parser):
     assert raise_statement.child(0) == 'raise'
     token = Token('DOUBLE_QUOTED', '"error"')
     assert raise_statement.entity.values.string.child(0) == token
+
+
+def test_parser_cached_after_error(parser):
+    """
+    Ensures that the cached parser can be reused after a failed parse
+    """
+    with raises(UnexpectedInput):
+        parser.parse('if x\n\ty = ]\n')
+    result = parser.parse('x = 0\n')
+    assert result.block.rules.assignment.path.child(0) == Token('NAME', 'x')
+
+
+def test_parser_cache(monkeypatch, tmpdir):
+    """
+    Ensures that parsers loaded from the cache can parse stories
+    """
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+    monkeypatch.setattr(Parser, 'larks', {})
+    monkeypatch.setattr(Parser, 'lark', Parser.dynamic)
+    Parser().lark()
+    monkeypatch.setattr(Parser, 'larks', {})
+    monkeypatch.setattr(sys.modules[Parser.__module__], 'Lark', None)
+    result = Parser().parse('if x\n\ty = 0\n')
+    assert result.block.if_block.if_statement.entity.path.child(0) == 'x'
+
+
+def test_parser_standalone_tables():
+    """
+    Ensures that the standalone tables were generated from the current
+    grammar. Run `python setup.py generate_parser` when this fails.
+    """
+    assert Tables.fingerprint == Parser().fingerprint(Grammar().build())
+
+
+def test_parser_generate_deterministic(tmpdir):
+    """
+    Ensures that generating the tables gives the same source with any hash
+    seed, so that they are changed only by changes of the grammar
+    """
+    sources = []
+    for seed in ('1', '2'):
+        path = str(tmpdir.join('tables{}.py'.format(seed)))
+        code = ('import sys\nfrom storyscript.parser import Parser\n'
+                'Parser().generate(sys.argv[1])')
+        environment = dict(os.environ, PYTHONHASHSEED=seed)
+        subprocess.check_call([sys.executable, '-c', code, path],
+                              env=environment)
+        with io.open(path) as f:
+            sources.append(f.read())
+    assert sources[0] == sources[1]
+    with io.open(Tables.__file__) as f:
+        assert f.read() == sources[0]
+
+
+def test_parser_standalone_other_lark():
+    """
+    Ensures the parser can be imported when Lark lacks the private names
+    used by the standalone parser, so other versions use the dynamic Lark
+    """
+    code = ('import lark, lark.lexer, lark.parsers.lalr_parser\n'
+            'del lark.lexer._Lex, lark.parsers.lalr_parser._Parser\n'
+            'lark.__version__ = "0.0.0"\n'
+            'from storyscript.parser import Standalone\n'
+            'print(Standalone.supports("lalr"))')
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode('utf-8').strip() == 'False'
+
+
+@mark.parametrize('source', [
+    'x = 0\n',
+    'if x\n\ty = 0\nelse if z\n\ty = 1\nelse\n\ty = 2\n',
+    'alpine echo message:"hi" as out\n\tout key:"value"\n',
+    'function f n:int returns int\n\treturn n\n',
+    'x = 3 * (4 + y) ^ 2\n',
+    'try\n\tx = [1, {"a": 2}]\ncatch as error\n\traise error\n'
+])
+def test_parser_standalone(source):
+    """
+    Ensures that the standalone parser produces the same trees of Lark
+    """
+    parser = Parser()
+    assert isinstance(parser.lark(), Standalone)
+    assert parser.lark().parse(source) == parser.dynamic().parse(source)
+    tokens = list(parser.lark().lex(source))
+    assert tokens == list(parser.dynamic().lex(source))
@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
-from pytest import raises
+import asyncio
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from pytest import fixture, raises
 
 from storyscript.Api import Api
 from storyscript.Bundle import Bundle
+from storyscript.Memory import Memory
+from storyscript.Profiler import Profiler
 from storyscript.Story import Story
 from storyscript.exceptions import StoryError
 
@@ -32,6 +39,33 @@ def test_api_load(patch, magic):
     assert result == {stream.name: story, 'services': story['services']}
 
 
+def test_api_load_source(patch):
+    patch.object(Story, 'clean_source')
+    patch.init(Story)
+    patch.object(Story, 'process')
+    result = Api.load_source('source', 'a.story')
+    Story.clean_source.assert_called_with('source')
+    Story.__init__.assert_called_with(Story.clean_source())
+    story = Story.process()
+    assert result == {'a.story': story, 'services': story['services']}
+
+
+def test_api_load_source_internal_error(patch):
+    patch.object(Story, 'clean_source', side_effect=Exception('unknown'))
+    patch.object(StoryError, 'internal_error',
+                 return_value=Exception('ICE'))
+    with raises(Exception) as e:
+        Api.load_source('source', 'a.story')
+    assert str(e.value) == 'ICE'
+
+
+def test_api_load_source_internal_error_debug(patch):
+    patch.object(Story, 'clean_source', side_effect=Exception('unknown'))
+    with raises(Exception) as e:
+        Api.load_source('source', 'a.story', debug=True)
+    assert str(e.value) == 'unknown'
+
+
 def test_api_load_map(patch, magic):
     """
     Ensures Api.load_map can compile stories from a map
@@ -135,3 +169,172 @@ def test_api_load_map_internal_error_debug(patch):
         Api.load_map({}, debug=True)
 
     assert str(e.value) == 'An unknown error.'
+
+
+def test_api_profile(patch):
+    patch.object(Profiler, 'record')
+    result = Api.profile(hook='hook')
+    Profiler.record.assert_called_with(hook='hook')
+    assert result == Profiler.record()
+
+
+def test_api_memprofile(patch):
+    patch.object(Profiler, 'record')
+    result = Api.memprofile()
+    assert isinstance(Profiler.record.call_args[1]['hook'], Memory)
+    assert result == Profiler.record()
+
+
+@fixture
+def run():
+    """
+    Runs a coroutine in a new event loop.
+    """
+    def run(coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+    return run
+
+
+@fixture
+def configure(patch):
+    patch.object(Api, 'executor', None)
+    patch.object(Api, 'concurrency', None)
+    patch.object(Api, 'semaphores', weakref.WeakKeyDictionary())
+
+
+def test_api_configure(configure):
+    Api.configure(executor='executor', concurrency=2)
+    assert Api.executor == 'executor'
+    assert Api.concurrency == 2
+    assert len(Api.semaphores) == 0
+
+
+def test_api_semaphore(run, configure):
+    Api.concurrency = 2
+
+    async def semaphore():
+        loop = asyncio.get_event_loop()
+        return Api.semaphore(loop), Api.semaphore(loop)
+
+    first, second = run(semaphore())
+    assert first is second
+    assert isinstance(first, asyncio.Semaphore)
+
+
+def test_api_remote():
+    assert Api.remote(str.upper, 'story') == (True, 'STORY')
+
+
+def test_api_remote_error(magic):
+    function = magic(side_effect=StoryError(None, None))
+    assert Api.remote(function, 'story') == (False, None)
+
+
+def test_api_execute(run, configure):
+    assert run(Api.execute(str.upper, 'story')) == 'STORY'
+
+
+def test_api_execute_executor(run, configure):
+    Api.executor = ThreadPoolExecutor(max_workers=1)
+    assert run(Api.execute(str.upper, 'story')) == 'STORY'
+    Api.executor.shutdown()
+
+
+def test_api_execute_process(patch, run, configure):
+    """
+    Ensures story errors of a process pool are raised by processing the
+    story again in this process
+    """
+    Api.executor = ProcessPoolExecutor(max_workers=1)
+    error = StoryError(None, None)
+
+    async def run_in_executor(executor, function, *args):
+        if executor is Api.executor:
+            return False, None
+        raise error
+
+    patch.object(asyncio.BaseEventLoop, 'run_in_executor',
+                 side_effect=run_in_executor)
+    with raises(StoryError) as e:
+        run(Api.execute(Api.loads, 'foo'))
+    assert e.value == error
+
+
+def test_api_execute_process_done(patch, run, configure):
+    Api.executor = ProcessPoolExecutor(max_workers=1)
+
+    async def run_in_executor(executor, function, *args):
+        assert function == Api.remote
+        return True, 'result'
+
+    patch.object(asyncio.BaseEventLoop, 'run_in_executor',
+                 side_effect=run_in_executor)
+    assert run(Api.execute(Api.loads, 'x = 1')) == 'result'
+
+
+def test_api_run(run, configure):
+    assert run(Api.run(str.upper, 'story')) == 'STORY'
+    assert len(Api.semaphores) == 0
+
+
+def test_api_run_concurrency(run, configure):
+    """
+    Ensures Api.run processes no more stories than the concurrency limit
+    """
+    Api.concurrency = 2
+    running = []
+    counts = []
+
+    def function(value):
+        running.append(value)
+        counts.append(len(running))
+        time.sleep(0.01)
+        running.remove(value)
+        return value
+
+    async def many():
+        return await asyncio.gather(*[Api.run(function, i) for i in range(6)])
+
+    assert run(many()) == list(range(6))
+    assert max(counts) <= 2
+
+
+def test_api_async(patch, run):
+    """
+    Ensures the async functions run the sync ones
+    """
+    async def call(function, *args):
+        return function, args
+
+    patch.object(Api, 'run', side_effect=call)
+    assert run(Api.loads_async('string')) == (Api.loads, ('string', False))
+    assert run(Api.load_map_async('files')) == (Api.load_map,
+                                                ('files', False))
+
+
+def test_api_load_async(patch, magic, run):
+    """
+    Ensures load_async reads the stream before running Api.load_source
+    """
+    async def call(function, *args):
+        return function, args
+
+    patch.object(Api, 'run', side_effect=call)
+    stream = magic()
+    result = run(Api.load_async(stream, debug=True))
+    args = (stream.read(), stream.name, True)
+    assert result == (Api.load_source, args)
+
+
+def test_api_load_async_internal_error(patch, magic, run):
+    patch.object(StoryError, 'internal_error',
+                 return_value=Exception('ICE'))
+    stream = magic()
+    stream.read.side_effect = Exception('unknown')
+    with raises(Exception) as e:
+        run(Api.load_async(stream))
+    assert str(e.value) == 'ICE'
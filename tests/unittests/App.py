@@ -5,6 +5,9 @@ from pytest import fixture
 
 from storyscript.App import App
 from storyscript.Bundle import Bundle
+from storyscript.Profiler import Profiler
+from storyscript.StoryCache import StoryCache
+from storyscript.Watcher import Watcher
 from storyscript.parser import Grammar
 
 
@@ -39,16 +42,25 @@ def test_app_parse_ebnf(bundle):
 def test_app_compile(patch, bundle):
     patch.object(json, 'dumps')
     result = App.compile('path')
-    Bundle.from_path.assert_called_with('path', ignored_path=None)
-    Bundle.from_path().bundle.assert_called_with(ebnf=None)
+    Bundle.from_path.assert_called_with('path', ignored_path=None,
+                                        cache=None)
+    Bundle.from_path().bundle.assert_called_with(ebnf=None, jobs=1)
     json.dumps.assert_called_with(Bundle.from_path().bundle(), indent=2)
     assert result == json.dumps()
 
 
+def test_app_compile_phase(patch, bundle):
+    patch.object(json, 'dumps')
+    patch.object(Profiler, 'phase')
+    App.compile('path')
+    Profiler.phase.assert_called_with('json')
+
+
 def test_app_compile_ignored_path(patch, bundle):
     patch.object(json, 'dumps')
     App.compile('path', ignored_path='ignored')
-    Bundle.from_path.assert_called_with('path', ignored_path='ignored')
+    Bundle.from_path.assert_called_with('path', ignored_path='ignored',
+                                        cache=None)
 
 
 def test_app_compile_ebnf(patch, bundle):
@@ -57,7 +69,19 @@ def test_app_compile_ebnf(patch, bundle):
     """
     patch.object(json, 'dumps')
     App.compile('path', ebnf='ebnf')
-    Bundle.from_path().bundle.assert_called_with(ebnf='ebnf')
+    Bundle.from_path().bundle.assert_called_with(ebnf='ebnf', jobs=1)
+
+
+def test_app_compile_cache(patch, bundle):
+    """
+    Ensures App.compile uses the cache in the given directory
+    """
+    patch.object(json, 'dumps')
+    patch.init(StoryCache)
+    App.compile('path', cache='directory')
+    StoryCache.__init__.assert_called_with('directory')
+    kwargs = Bundle.from_path.call_args[1]
+    assert isinstance(kwargs['cache'], StoryCache)
 
 
 def test_app_lex(bundle):
@@ -76,3 +100,29 @@ def test_app_grammar(patch):
     patch.init(Grammar)
     patch.object(Grammar, 'build')
     assert App.grammar() == Grammar().build()
+
+
+def test_app_compile_jobs(patch, bundle):
+    patch.object(json, 'dumps')
+    App.compile('path', jobs=4)
+    Bundle.from_path().bundle.assert_called_with(ebnf=None, jobs=4)
+
+
+def test_app_watch(patch):
+    patch.init(Watcher)
+    patch.object(Watcher, 'watch')
+    result = App.watch('path', output='out.json', ignored_path='ignored',
+                       ebnf='ebnf')
+    Watcher.__init__.assert_called_with('path', ignored_path='ignored',
+                                        ebnf='ebnf', cache=None)
+    Watcher.watch.assert_called_with(output='out.json')
+    assert result == Watcher.watch()
+
+
+def test_app_watch_cache(patch):
+    patch.init(Watcher)
+    patch.init(StoryCache)
+    patch.object(Watcher, 'watch')
+    App.watch('path', cache='directory')
+    StoryCache.__init__.assert_called_with('directory')
+    assert isinstance(Watcher.__init__.call_args[1]['cache'], StoryCache)
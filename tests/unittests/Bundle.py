@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 import os
 
-import delegator
-
-from pytest import fixture
+from pytest import fixture, raises
 
 from storyscript.Bundle import Bundle
+from storyscript.Discovery import Discovery
+from storyscript.Profiler import Profiler
 from storyscript.Story import Story
+from storyscript.StoryCache import StoryCache
+from storyscript.Workers import Workers
+from storyscript.exceptions import StoryError
 
 
 @fixture
@@ -17,81 +20,29 @@ def bundle(patch):
 def test_bundle_init(bundle):
     assert bundle.stories == {}
     assert bundle.story_files == {}
+    assert bundle.cache is None
+    assert bundle.read_files is True
+    assert bundle.loaded == {}
 
 
-def test_bundle_init_files():
-    bundle = Bundle(story_files={'one.story': 'hello'})
-    assert bundle.story_files == {'one.story': 'hello'}
-
-
-def test_bundle_gitignores(patch):
-    """
-    Ensures gitignores uses can produce the list of ignored files.
-    """
-    patch.object(delegator, 'run')
-    result = Bundle.gitignores()
-    command = 'git ls-files --others --ignored --exclude-standard'
-    delegator.run.assert_called_with(command)
-    delegator.run().out.split.assert_called_with('\n')
-    assert result == delegator.run().out.split()
-
-
-def test_bundle_ignores(patch):
-    patch.object(os.path, 'isdir')
-    patch.object(os, 'walk', return_value=[('root', [], ['one.story', 'two'])])
-    result = Bundle.ignores('path')
-    os.walk.assert_called_with('path')
-    assert result == ['root/one.story']
-
-
-def test_bundle_ignores_not_dir(patch):
-    patch.many(os.path, ['relpath', 'isdir'])
-    os.path.isdir.return_value = False
-    result = Bundle.ignores('path')
-    os.path.relpath.assert_called_with('path')
-    assert result == [os.path.relpath()]
-
-
-def test_bundle_filter_path(patch):
-    patch.object(os.path, 'relpath')
-    result = Bundle.filter_path('./root', 'one.story', [])
-    os.path.relpath.assert_called_with('./root/one.story')
-    assert result == os.path.relpath()
+def test_bundle_init_story_files_not_shared():
+    assert Bundle().story_files is not Bundle().story_files
 
 
-def test_bundle_filter_path_ignores():
-    result = Bundle.filter_path('./root', 'one.story', ['root/one.story'])
-    assert result is None
+def test_bundle_init_cache():
+    assert Bundle(cache='cache').cache == 'cache'
 
 
-def test_bundle_parse_directory(patch, bundle):
-    """
-    Ensures parse_directory can parse a directory
-    """
-    patch.object(os, 'walk', return_value=[('root', [], ['one.story', 'two'])])
-    patch.object(Bundle, 'gitignores')
-    result = Bundle.parse_directory('dir')
-    assert Bundle.gitignores.call_count == 1
-    os.walk.assert_called_with('dir')
-    assert result == ['root/one.story']
-
-
-def test_bundle_parse_directory_gitignored(patch, bundle):
-    """
-    Ensures parse_directory does not return gitignored files
-    """
-    patch.object(os, 'walk', return_value=[('./root', [], ['one.story'])])
-    patch.object(Bundle, 'gitignores')
-    Bundle.gitignores.return_value = ['root/one.story']
-    assert Bundle.parse_directory('dir') == []
+def test_bundle_init_files():
+    bundle = Bundle(story_files={'one.story': 'hello'})
+    assert bundle.story_files == {'one.story': 'hello'}
 
 
-def test_bundle_parse_directory_ignored_path(patch, bundle):
-    patch.object(os, 'walk', return_value=[('./root', [], ['one.story'])])
-    patch.many(Bundle, ['gitignores', 'ignores'])
-    Bundle.gitignores.return_value = []
-    Bundle.parse_directory('dir', ignored_path='ignored')
-    Bundle.ignores.assert_called_with('ignored')
+def test_bundle_parse_directory(patch):
+    patch.object(Discovery, 'find')
+    result = Bundle.parse_directory('dir', ignored_path='ignored')
+    Discovery.find.assert_called_with('dir', ignored_path='ignored')
+    assert result == Discovery.find()
 
 
 def test_bundle_from_path(patch):
@@ -103,9 +54,18 @@ def test_bundle_from_path(patch):
     patch.object(Bundle, 'load_story')
     result = Bundle.from_path('path')
     Bundle.load_story.assert_called_with('path')
+    Bundle.__init__.assert_called_with(cache=None)
     assert isinstance(result, Bundle)
 
 
+def test_bundle_from_path_cache(patch):
+    patch.object(os.path, 'isdir', return_value=False)
+    patch.init(Bundle)
+    patch.object(Bundle, 'load_story')
+    Bundle.from_path('path', cache='cache')
+    Bundle.__init__.assert_called_with(cache='cache')
+
+
 def test_bundle_from_path_directory(patch):
     """
     Ensures Bundle.from_path can create a Bundle from a directory path
@@ -113,9 +73,13 @@ def test_bundle_from_path_directory(patch):
     patch.object(os.path, 'isdir')
     patch.init(Bundle)
     patch.many(Bundle, ['load_story', 'parse_directory'])
+    patch.object(Discovery, 'read')
     Bundle.parse_directory.return_value = ['one.story']
     Bundle.from_path('path')
     Bundle.parse_directory.assert_called_with('path', ignored_path=None)
+    Discovery.read.assert_called_with(['one.story'])
+    Bundle.__init__.assert_called_with(story_files=Discovery.read(),
+                                       cache=None)
     Bundle.load_story.assert_called_with('one.story')
 
 
@@ -153,6 +117,30 @@ def test_bundle_load_story_not_read(patch, bundle):
     assert bundle.story_files['one.story'] == Story.read()
 
 
+def test_bundle_load_story_not_read_files(patch, bundle):
+    """
+    Ensures Bundle.load_story doesn't read stories when read_files is False
+    """
+    patch.object(Story, 'read')
+    bundle.read_files = False
+    with raises(StoryError) as e:
+        bundle.load_story('one.story')
+    message = 'File "one.story" not found in the bundle'
+    assert e.value.short_message() == 'E0001: {}'.format(message)
+    assert Story.read.call_count == 0
+
+
+def test_bundle_load_story_loaded(patch, bundle):
+    """
+    Ensures Bundle.load_story loads a story only once
+    """
+    patch.init(Story)
+    bundle.story_files['one.story'] = 'hello'
+    result = bundle.load_story('one.story')
+    assert bundle.load_story('one.story') == result
+    assert Story.__init__.call_count == 1
+
+
 def test_bundle_find_stories(patch, bundle):
     """
     Ensures Bundle.find_stories returns the list of loaded stories
@@ -173,49 +161,285 @@ def test_bundle_services_no_duplicates(bundle):
     assert result == ['one']
 
 
-def test_bundle_compile_modules(patch, bundle):
-    patch.object(Bundle, 'compile')
-    bundle.compile_modules(['stories'], 'ebnf')
-    Bundle.compile.assert_called_with(['stories'], 'ebnf')
+def test_bundle_cycle(patch):
+    patch.object(StoryError, 'unnamed_error')
+    stack = [('a.story', 'modules'), ('b.story', 'modules')]
+    result = Bundle.cycle(stack, 'a.story')
+    message = 'Import cycle: a.story -> b.story -> a.story'
+    StoryError.unnamed_error.assert_called_with(message)
+    assert result == StoryError.unnamed_error()
+
+
+def test_bundle_graph(magic, bundle):
+    """
+    Ensures Bundle.graph yields modules before the stories importing them
+    """
+    modules = {'a': ['b', 'c'], 'b': ['c'], 'c': []}
+    imports = magic(side_effect=lambda story, ebnf: modules[story])
+    result = list(bundle.graph(['a'], imports, 'ebnf'))
+    assert result == ['c', 'b', 'a']
+    imports.assert_called_with('c', 'ebnf')
+
+
+def test_bundle_graph_once(magic, bundle):
+    """
+    Ensures Bundle.graph visits a module shared by many stories once
+    """
+    modules = {'a': ['utils'], 'b': ['utils'], 'utils': []}
+    imports = magic(side_effect=lambda story, ebnf: modules[story])
+    result = list(bundle.graph(['a', 'b', 'utils'], imports, None))
+    assert result == ['utils', 'a', 'b']
+    assert imports.call_count == 3
+
 
+def test_bundle_graph_cycle(patch, magic, bundle):
+    patch.object(Bundle, 'cycle', return_value=StoryError(None, None))
+    modules = {'a': ['b'], 'b': ['a']}
+    imports = magic(side_effect=lambda story, ebnf: modules[story])
+    with raises(StoryError):
+        list(bundle.graph(['a'], imports, None))
+    stack = Bundle.cycle.call_args[0][0]
+    assert [path for path, modules in stack] == ['a', 'b']
+    assert Bundle.cycle.call_args[0][1] == 'a'
 
-def test_bundle_parse_modules(patch, bundle):
-    patch.object(Bundle, 'parse')
-    bundle.parse_modules(['stories'], 'ebnf')
-    Bundle.parse.assert_called_with(['stories'], 'ebnf')
+
+def test_bundle_parse_story(patch, bundle):
+    patch.object(Bundle, 'load_story')
+    Bundle.load_story().tree = None
+    result = bundle.parse_story('one.story', 'ebnf')
+    Bundle.load_story.assert_called_with('one.story')
+    Bundle.load_story().parse.assert_called_with(ebnf='ebnf')
+    assert result == Bundle.load_story().modules()
+
+
+def test_bundle_parse_story_profiler(patch, bundle):
+    """
+    Ensures the phases of parsing are attributed to the story
+    """
+    patch.object(Bundle, 'load_story')
+    patch.object(Profiler, 'story')
+    Bundle.load_story().tree = None
+    bundle.parse_story('one.story', None)
+    Profiler.story.assert_called_with('one.story')
+
+
+def test_bundle_parse_story_parsed(patch, bundle):
+    patch.object(Bundle, 'load_story')
+    result = bundle.parse_story('one.story', None)
+    assert Bundle.load_story().parse.call_count == 0
+    assert result == Bundle.load_story().modules()
 
 
 def test_bundle_parse(patch, bundle):
-    patch.many(Bundle, ['parse_modules', 'load_story'])
+    patch.many(Bundle, ['load_story', 'graph'])
+    Bundle.graph.return_value = ['one.story']
     bundle.parse(['one.story'], None)
+    Bundle.graph.assert_called_with(['one.story'], bundle.parse_story, None)
     Bundle.load_story.assert_called_with('one.story')
-    story = Bundle.load_story()
-    Bundle.parse_modules.assert_called_with(story.modules(), None)
-    assert bundle.stories['one.story'] == story.tree
+    assert bundle.stories['one.story'] == Bundle.load_story().tree
 
 
-def test_bundle_compile(mocker, patch, bundle):
-    patch.many(Bundle, ['compile_modules', 'load_story'])
-    patch.many(Story, ['parse'])
+def test_bundle_load_cached(magic, bundle):
+    story = magic(compiled=None)
+    bundle.cache = magic()
+    bundle.load_cached(story, 'ebnf')
+    bundle.cache.load.assert_called_with(story.story, ebnf='ebnf')
+    assert story.compiled == bundle.cache.load()
+
+
+def test_bundle_load_cached_compiled(magic, bundle):
+    story = magic(compiled='compiled')
+    bundle.cache = magic()
+    bundle.load_cached(story, None)
+    assert bundle.cache.load.call_count == 0
+    assert story.compiled == 'compiled'
+
+
+def test_bundle_load_cached_no_cache(magic, bundle):
+    story = magic(compiled=None)
+    bundle.load_cached(story, None)
+    assert story.compiled is None
+
+
+def test_bundle_compile_imports(patch, bundle):
+    patch.many(Bundle, ['load_story', 'load_cached', 'parse_story'])
+    Bundle.load_story().compiled = None
+    result = bundle.compile_imports('one.story', 'ebnf')
+    Bundle.load_cached.assert_called_with(Bundle.load_story(), 'ebnf')
+    Bundle.parse_story.assert_called_with('one.story', 'ebnf')
+    assert result == Bundle.parse_story()
+
+
+def test_bundle_compile_imports_compiled(patch, bundle):
+    patch.many(Bundle, ['load_story', 'load_cached', 'parse_story'])
+    patch.object(StoryCache, 'modules')
+    result = bundle.compile_imports('one.story', 'ebnf')
+    StoryCache.modules.assert_called_with(Bundle.load_story().compiled)
+    assert result == StoryCache.modules()
+    assert Bundle.parse_story.call_count == 0
 
-    bundle.compile(['one.story'], None)
-    Bundle.load_story.assert_called_with('one.story')
 
+def test_bundle_compile_story(patch, bundle):
+    patch.object(Bundle, 'load_story')
     story = Bundle.load_story()
-    Bundle.compile_modules.assert_called_with(story.modules(), None)
+    story.compiled = None
+    bundle.compile_story('one.story', None)
     story.compile.assert_called()
     assert bundle.stories['one.story'] == story.compiled
 
 
+def test_bundle_compile_story_profiler(patch, bundle):
+    patch.object(Bundle, 'load_story')
+    patch.object(Profiler, 'story')
+    Bundle.load_story().compiled = None
+    bundle.compile_story('one.story', None)
+    Profiler.story.assert_called_with('one.story')
+
+
+def test_bundle_compile_story_save(patch, magic, bundle):
+    patch.object(Bundle, 'load_story')
+    story = Bundle.load_story()
+    story.compiled = None
+    bundle.cache = magic()
+    bundle.compile_story('one.story', 'ebnf')
+    bundle.cache.save.assert_called_with(story.story, story.compiled,
+                                         ebnf='ebnf')
+
+
+def test_bundle_compile_story_cached(patch, magic, bundle):
+    patch.object(Bundle, 'load_story')
+    bundle.cache = magic()
+    bundle.compile_story('one.story', None)
+    story = Bundle.load_story()
+    assert story.compile.call_count == 0
+    assert bundle.cache.save.call_count == 0
+    assert bundle.stories['one.story'] == story.compiled
+
+
+def test_bundle_compile(patch, bundle):
+    patch.many(Bundle, ['graph', 'compile_story'])
+    Bundle.graph.return_value = ['one.story']
+    bundle.compile(['one.story'], 'ebnf')
+    args = (['one.story'], bundle.compile_imports, 'ebnf')
+    Bundle.graph.assert_called_with(*args)
+    Bundle.compile_story.assert_called_with('one.story', 'ebnf')
+
+
+def test_bundle_unvisited():
+    visited = {'one.story'}
+    stories = ['one.story', 'two.story', 'two.story', 'three.story']
+    result = Bundle.unvisited(stories, visited)
+    assert result == ['two.story', 'three.story']
+    assert visited == {'one.story', 'two.story', 'three.story'}
+
+
+def test_bundle_parse_parallel(patch, magic, bundle):
+    patch.init(Workers)
+    patch.many(Workers, ['parse', 'shutdown'])
+    patch.object(Bundle, 'load_story')
+    story = Bundle.load_story()
+    story.modules.return_value = []
+    Workers.parse.return_value = ['tree']
+    bundle.parse_parallel(['one.story'], 'ebnf', 4)
+    Workers.__init__.assert_called_with(4, ebnf='ebnf')
+    Workers.parse.assert_called_with([story.story])
+    assert story.tree == 'tree'
+    assert Workers.shutdown.call_count == 1
+
+
+def test_bundle_parse_parallel_modules(patch, bundle):
+    """
+    Ensures Bundle.parse_parallel parses imported modules once, and not
+    the modules of stories that failed
+    """
+    patch.init(Workers)
+    patch.many(Workers, ['parse', 'shutdown'])
+    patch.object(Bundle, 'load_story')
+    Bundle.load_story().modules.return_value = ['one.story']
+    Workers.parse.side_effect = [['tree', None], ['tree']]
+    bundle.parse_parallel(['one.story', 'two.story'], None, 2)
+    assert Workers.parse.call_count == 1
+
+
+def test_bundle_compile_parallel(patch, magic, bundle):
+    patch.init(Workers)
+    patch.many(Workers, ['compile', 'shutdown'])
+    patch.many(Bundle, ['load_story', 'load_cached'])
+    story = Bundle.load_story()
+    story.compiled = None
+    Workers.compile.return_value = [{'modules': {}}]
+    bundle.cache = magic()
+    bundle.compile_parallel(['one.story'], 'ebnf', 4)
+    Bundle.load_cached.assert_called_with(story, 'ebnf')
+    Workers.compile.assert_called_with([story.story])
+    assert story.compiled == {'modules': {}}
+    bundle.cache.save.assert_called_with(story.story, story.compiled,
+                                         ebnf='ebnf')
+
+
+def test_bundle_compile_parallel_modules(patch, bundle):
+    patch.init(Workers)
+    patch.many(Workers, ['compile', 'shutdown'])
+    patch.many(Bundle, ['load_story', 'load_cached'])
+    stories = {'one.story': Story('one'), 'two.story': Story('two')}
+    Bundle.load_story.side_effect = lambda path: stories[path]
+    compiled = {'modules': {'two': 'two'}}
+    Workers.compile.side_effect = [[compiled], [{'modules': {}}]]
+    bundle.compile_parallel(['one.story'], None, 2)
+    assert Workers.compile.call_count == 2
+    Workers.compile.assert_called_with(['two'])
+
+
+def test_bundle_compile_parallel_failed(patch, bundle):
+    patch.init(Workers)
+    patch.many(Workers, ['compile', 'shutdown'])
+    patch.many(Bundle, ['load_story', 'load_cached'])
+    Bundle.load_story().compiled = None
+    Workers.compile.return_value = [None]
+    bundle.compile_parallel(['one.story'], None, 2)
+    assert Bundle.load_story().compiled is None
+    assert Workers.compile.call_count == 1
+
+
 def test_bundle_bundle(patch, bundle):
-    patch.many(Bundle, ['find_stories', 'services', 'compile'])
+    patch.many(Bundle, ['find_stories', 'services', 'compile',
+                        'compile_parallel'])
     result = bundle.bundle()
     Bundle.compile.assert_called_with(Bundle.find_stories(), None)
+    assert Bundle.compile_parallel.call_count == 0
     expected = {'stories': bundle.stories, 'services': Bundle.services(),
                 'entrypoint': Bundle.find_stories()}
     assert result == expected
 
 
+def test_bundle_bundle_entrypoint(patch, bundle):
+    patch.many(Bundle, ['find_stories', 'services', 'compile'])
+    bundle.stories = {'old.story': {}}
+    result = bundle.bundle(entrypoint=['one.story'])
+    assert Bundle.find_stories.call_count == 0
+    Bundle.compile.assert_called_with(['one.story'], None)
+    assert result['entrypoint'] == ['one.story']
+    assert bundle.stories == {}
+
+
+def test_bundle_forget(bundle):
+    bundle.story_files = {'one.story': 'source', 'two.story': 'source'}
+    bundle.loaded = {'one.story': 'story'}
+    bundle.forget('one.story')
+    bundle.forget('three.story')
+    assert bundle.story_files == {'two.story': 'source'}
+    assert bundle.loaded == {}
+
+
+def test_bundle_bundle_jobs(patch, bundle):
+    patch.many(Bundle, ['find_stories', 'services', 'compile',
+                        'compile_parallel'])
+    bundle.bundle(jobs=4)
+    args = (Bundle.find_stories(), None, 4)
+    Bundle.compile_parallel.assert_called_with(*args)
+    Bundle.compile.assert_called_with(Bundle.find_stories(), None)
+
+
 def test_bundle_bundle_ebnf(patch, bundle):
     patch.many(Bundle, ['find_stories', 'services', 'compile'])
     bundle.bundle(ebnf='ebnf')
@@ -229,6 +453,13 @@ def test_bundle_bundle_trees(patch, bundle):
     assert result == bundle.stories
 
 
+def test_bundle_bundle_trees_jobs(patch, bundle):
+    patch.many(Bundle, ['find_stories', 'parse', 'parse_parallel'])
+    bundle.bundle_trees(jobs=4)
+    Bundle.parse_parallel.assert_called_with(Bundle.find_stories(), None, 4)
+    Bundle.parse.assert_called_with(Bundle.find_stories(), None)
+
+
 def test_bundle_bundle_trees_ebnf(patch, bundle):
     patch.many(Bundle, ['find_stories', 'parse'])
     bundle.bundle_trees(ebnf='ebnf')
@@ -5,11 +5,17 @@ import os
 import click
 from click.testing import CliRunner
 
-from pytest import fixture, mark
+from pytest import fixture, mark, raises
 
 from storyscript.App import App
 from storyscript.Cli import Cli
+from storyscript.Client import Client
+from storyscript.Memory import Memory
+from storyscript.Profiler import Profiler
 from storyscript.Project import Project
+from storyscript.Server import Server
+from storyscript.StoryCache import StoryCache
+from storyscript.Timings import Timings
 from storyscript.Version import version
 from storyscript.exceptions.CompilerError import CompilerError
 from storyscript.exceptions.StoryError import StoryError
@@ -28,6 +34,7 @@ def echo(patch):
 @fixture
 def app(patch):
     patch.many(App, ['compile', 'parse'])
+    patch.object(Client, 'running', return_value=None)
     return App
 
 
@@ -97,7 +104,9 @@ def test_cli_compile_with_ignore_option(runner, app):
     runner.invoke(Cli.compile, ['path/fake.story',
                                 '--ignore', 'path/sub_dir/my_fake.story'])
     App.compile.assert_called_with('path/fake.story', ebnf=None,
-                                   ignored_path='path/sub_dir/my_fake.story')
+                                   ignored_path='path/sub_dir/my_fake.story',
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
 
 
 def test_cli_parse_with_ignore_option(runner, app):
@@ -179,7 +188,9 @@ def test_cli_compile(patch, runner, echo, app):
     patch.object(click, 'style')
     runner.invoke(Cli.compile, [])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
     click.style.assert_called_with('Script syntax passed!', fg='green')
     click.echo.assert_called_with(click.style())
 
@@ -190,7 +201,9 @@ def test_cli_compile_path(patch, runner, app):
     """
     runner.invoke(Cli.compile, ['/path'])
     App.compile.assert_called_with('/path', ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
 
 
 def test_cli_compile_output_file(patch, runner, app):
@@ -210,7 +223,9 @@ def test_cli_compile_silent(runner, echo, app, option):
     """
     result = runner.invoke(Cli.compile, [option])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
     assert result.output == ''
     assert click.echo.call_count == 0
 
@@ -218,7 +233,9 @@ def test_cli_compile_silent(runner, echo, app, option):
 def test_cli_compile_debug(runner, echo, app):
     runner.invoke(Cli.compile, ['--debug'])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
 
 
 @mark.parametrize('option', ['--json', '-j'])
@@ -228,14 +245,190 @@ def test_cli_compile_json(runner, echo, app, option):
     """
     runner.invoke(Cli.compile, [option])
     App.compile.assert_called_with(os.getcwd(), ebnf=None,
-                                   ignored_path=None)
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
     click.echo.assert_called_with(App.compile())
 
 
 def test_cli_compile_ebnf(runner, echo, app):
     runner.invoke(Cli.compile, ['--ebnf', 'test.ebnf'])
     App.compile.assert_called_with(os.getcwd(), ebnf='test.ebnf',
-                                   ignored_path=None)
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=1)
+
+
+def test_cli_compile_cache(runner, echo, app):
+    runner.invoke(Cli.compile, ['--cache', 'directory'])
+    App.compile.assert_called_with(os.getcwd(), ebnf=None,
+                                   ignored_path=None, cache='directory',
+                                   jobs=1)
+
+
+def test_cli_compile_jobs(runner, echo, app):
+    runner.invoke(Cli.compile, ['--jobs', '4'])
+    App.compile.assert_called_with(os.getcwd(), ebnf=None,
+                                   ignored_path=None,
+                                   cache=StoryCache.default_directory(),
+                                   jobs=4)
+
+
+def test_cli_compile_watch(patch, runner, app):
+    patch.object(Cli, 'watch')
+    runner.invoke(Cli.compile, ['/path', 'out.json', '-j', '--watch'])
+    Cli.watch.assert_called_with('/path', 'out.json', True, False, None,
+                                 None, StoryCache.default_directory())
+    assert App.compile.call_count == 0
+
+
+def test_cli_compile_profile(patch, runner, app):
+    patch.object(Cli, 'profile')
+    runner.invoke(Cli.compile, ['/path', '--profile', '--profile-format',
+                                'json'])
+    args = Cli.profile.call_args[0]
+    assert isinstance(args[0], Timings)
+    assert args[1:] == ('/path', None, None, False, 'json')
+    assert App.compile.call_count == 0
+
+
+def test_cli_compile_memprofile(patch, runner, app):
+    patch.object(Cli, 'profile')
+    runner.invoke(Cli.compile, ['/path', '--memprofile'])
+    args = Cli.profile.call_args[0]
+    assert isinstance(args[0], Memory)
+    assert args[-1] == 'text'
+
+
+def test_cli_compile_memprofile_unsupported(patch, runner, echo, app):
+    """
+    Ensures --memprofile refuses to run when memory can't be measured
+    """
+    patch.object(Cli, 'profile')
+    patch.object(Memory, 'supported', return_value=False)
+    e = runner.invoke(Cli.compile, ['/path', '--memprofile'])
+    assert e.exit_code == 1
+    message = 'Measuring memory needs Python 3.9 or later'
+    click.echo.assert_called_with(message)
+    assert Cli.profile.call_count == 0
+
+
+def test_cli_profile(patch, magic, echo, app):
+    patch.object(Profiler, 'record')
+    hook = magic()
+    Cli.profile(hook, 'path', 'ebnf', 'ignored', False, 'text')
+    Profiler.record.assert_called_with(hook=hook)
+    App.compile.assert_called_with('path', ignored_path='ignored',
+                                   ebnf='ebnf')
+    click.echo.assert_called_with(hook.text())
+
+
+def test_cli_profile_json(magic, echo, app):
+    hook = magic()
+    Cli.profile(hook, 'path', None, None, False, 'json')
+    click.echo.assert_called_with(hook.dumps())
+
+
+def test_cli_profile_error(patch, magic, echo, app):
+    """
+    Ensures Cli.profile prints the timings of stories with errors
+    """
+    patch.object(StoryError, 'echo')
+    App.compile.side_effect = StoryError('error', 'story')
+    hook = magic()
+    with raises(SystemExit):
+        Cli.profile(hook, 'path', None, None, False, 'text')
+    assert StoryError.echo.call_count == 1
+    click.echo.assert_called_with(hook.text())
+
+
+def test_cli_watch(patch, echo):
+    patch.object(App, 'watch', return_value=['results'])
+    patch.object(click, 'style')
+    Cli.watch('path', 'out.json', False, False, 'ignored', 'ebnf', 'cache')
+    App.watch.assert_called_with('path', output=None, ignored_path='ignored',
+                                 ebnf='ebnf', cache='cache')
+    click.style.assert_called_with('Script syntax passed!', fg='green')
+    click.echo.assert_called_with(click.style())
+
+
+def test_cli_watch_json(patch, echo):
+    patch.object(App, 'watch', return_value=['results'])
+    Cli.watch('path', None, True, False, None, None, None)
+    click.echo.assert_called_with('results')
+
+
+def test_cli_watch_output(patch, echo):
+    patch.object(App, 'watch', return_value=['results'])
+    patch.object(click, 'style')
+    Cli.watch('path', 'out.json', True, False, None, None, None)
+    App.watch.assert_called_with('path', output='out.json', ignored_path=None,
+                                 ebnf=None, cache=None)
+    click.echo.assert_called_with(click.style())
+
+
+def test_cli_watch_silent(patch, echo):
+    patch.object(App, 'watch', return_value=['results'])
+    Cli.watch('path', None, True, True, None, None, None)
+    assert click.echo.call_count == 0
+
+
+def test_cli_watch_error(patch, magic, echo):
+    error = StoryError(None, None)
+    patch.object(StoryError, 'echo')
+    patch.object(App, 'watch', return_value=[error])
+    Cli.watch('path', None, False, False, None, None, None)
+    assert StoryError.echo.call_count == 1
+    assert click.echo.call_count == 0
+
+
+def test_cli_watch_interrupt(patch, magic, echo):
+    patch.object(App, 'watch')
+    App.watch().__iter__.side_effect = KeyboardInterrupt
+    Cli.watch('path', None, False, False, None, None, None)
+
+
+def test_cli_compile_server(patch, runner, echo, app):
+    """
+    Ensures the compile command uses the compile server when it's running
+    """
+    Client.running.return_value = Client()
+    patch.object(Client, 'compile')
+    runner.invoke(Cli.compile, ['/path', '-j'])
+    Client.compile.assert_called_with('/path', ignored_path=None, ebnf=None,
+                                      cache=StoryCache.default_directory(),
+                                      jobs=1)
+    assert App.compile.call_count == 0
+    click.echo.assert_called_with(Client.compile())
+
+
+def test_cli_serve(patch, runner):
+    patch.object(Server, 'serve')
+    runner.invoke(Cli.serve, ['--socket', 'story.sock'])
+    Server.serve.assert_called_with(address='story.sock', port=None)
+
+
+def test_cli_serve_port(patch, runner):
+    patch.object(Server, 'serve')
+    runner.invoke(Cli.serve, ['--port', '2000'])
+    Server.serve.assert_called_with(address=None, port=2000)
+
+
+def test_cli_serve_error(patch, runner, echo):
+    """
+    Ensures the serve command reports sockets it can't listen on
+    """
+    error = StoryError.unnamed_error('A server is already running at x')
+    patch.object(Server, 'serve', side_effect=error)
+    e = runner.invoke(Cli.serve, [])
+    assert e.exit_code == 1
+    click.echo.assert_called_with('A server is already running at x')
+
+
+def test_cli_compile_no_cache(runner, echo, app):
+    runner.invoke(Cli.compile, ['--no-cache'])
+    App.compile.assert_called_with(os.getcwd(), ebnf=None,
+                                   ignored_path=None, cache=None, jobs=1)
 
 
 def test_cli_compile_not_found(runner, echo, app):
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import socket
+import stat
+import tempfile
+
+from pytest import fixture, raises
+
+
+from storyscript.Client import Client
+from storyscript.Version import version
+from storyscript.exceptions import RemoteError
+
+
+@fixture
+def client():
+    return Client(address='story.sock')
+
+
+def test_client_init(client):
+    assert client.address == 'story.sock'
+    assert client.port is None
+    assert client.timeout is None
+
+
+def test_client_init_default(patch):
+    patch.object(Client, 'default_address')
+    assert Client().address == Client.default_address()
+
+
+def test_client_init_port():
+    client = Client(port=2000, timeout=1)
+    assert client.address is None
+    assert client.port == 2000
+    assert client.timeout == 1
+
+
+def test_client_default_address(patch):
+    patch.object(os.environ, 'get', return_value='/run/user')
+    assert Client.default_address() == '/run/user/storyscript.sock'
+    os.environ.get.assert_called_with('XDG_RUNTIME_DIR')
+
+
+def test_client_default_address_temporary(patch):
+    patch.object(os.environ, 'get', return_value=None)
+    patch.object(tempfile, 'gettempdir', return_value='/tmp')
+    patch.object(os, 'getuid', return_value=1000)
+    assert Client.default_address() == '/tmp/storyscript-1000.sock'
+
+
+def test_client_owned(patch, magic):
+    status = magic(st_mode=stat.S_IFSOCK | 0o600, st_uid=1000)
+    patch.object(os, 'lstat', return_value=status)
+    patch.object(os, 'getuid', return_value=1000)
+    assert Client.owned('story.sock') is True
+    os.lstat.assert_called_with('story.sock')
+
+
+def test_client_owned_missing(patch):
+    patch.object(os, 'lstat', side_effect=FileNotFoundError)
+    assert Client.owned('story.sock') is False
+
+
+def test_client_owned_not_socket(patch, magic):
+    """
+    Ensures files and links are not sockets of the user
+    """
+    status = magic(st_mode=stat.S_IFLNK | 0o777, st_uid=1000)
+    patch.object(os, 'lstat', return_value=status)
+    patch.object(os, 'getuid', return_value=1000)
+    assert Client.owned('story.sock') is False
+
+
+def test_client_owned_other_user(patch, magic):
+    """
+    Ensures sockets created by other users are not trusted
+    """
+    status = magic(st_mode=stat.S_IFSOCK | 0o777, st_uid=1001)
+    patch.object(os, 'lstat', return_value=status)
+    patch.object(os, 'getuid', return_value=1000)
+    assert Client.owned('story.sock') is False
+
+
+def test_client_connect(patch, client):
+    patch.object(socket, 'socket')
+    result = client.connect()
+    socket.socket.assert_called_with(socket.AF_UNIX, socket.SOCK_STREAM)
+    socket.socket().settimeout.assert_called_with(None)
+    socket.socket().connect.assert_called_with('story.sock')
+    assert result == socket.socket()
+
+
+def test_client_connect_port(patch):
+    patch.object(socket, 'create_connection')
+    result = Client(port=2000).connect()
+    socket.create_connection.assert_called_with(('127.0.0.1', 2000),
+                                                timeout=None)
+    assert result == socket.create_connection()
+
+
+def test_client_send(patch, client):
+    patch.object(Client, 'connect')
+    connection = Client.connect().__enter__()
+    connection.makefile().__enter__().readline.return_value = '{"result": 1}'
+    result = client.send({'method': 'version'})
+    connection.sendall.assert_called_with(b'{"method": "version"}\n')
+    connection.makefile.assert_called_with('r', encoding='utf-8')
+    assert result == {'result': 1}
+
+
+def test_client_send_closed(patch, client):
+    """
+    Ensures a missing response is a connection error
+    """
+    patch.object(Client, 'connect')
+    connection = Client.connect().__enter__()
+    connection.makefile().__enter__().readline.return_value = ''
+    with raises(ConnectionError):
+        client.send({'method': 'version'})
+
+
+def test_client_request(patch, client):
+    patch.object(Client, 'send', return_value={'result': 'result'})
+    result = client.request('loads', string='x = 1')
+    request = {'method': 'loads', 'params': {'string': 'x = 1'}}
+    Client.send.assert_called_with(request)
+    assert result == 'result'
+
+
+def test_client_request_error(patch, client):
+    error = {'message': 'message', 'short_message': 'short'}
+    patch.object(Client, 'send', return_value={'error': error})
+    with raises(RemoteError) as e:
+        client.request('loads', string='foo')
+    assert e.value.message() == 'message'
+    assert e.value.short_message() == 'short'
+
+
+def test_client_running(patch):
+    patch.object(Client, 'owned', return_value=True)
+    patch.object(Client, 'send', return_value={'result': version})
+    result = Client.running()
+    Client.send.assert_called_with({'method': 'version', 'params': {}})
+    assert isinstance(result, Client)
+    assert result.timeout is None
+
+
+def test_client_running_no_socket(patch):
+    patch.object(Client, 'owned', return_value=False)
+    patch.object(Client, 'send')
+    assert Client.running() is None
+    assert Client.send.call_count == 0
+
+
+def test_client_running_refused(patch):
+    patch.object(Client, 'owned', return_value=True)
+    patch.object(Client, 'send', side_effect=ConnectionRefusedError)
+    assert Client.running() is None
+
+
+def test_client_running_invalid(patch):
+    patch.object(Client, 'owned', return_value=True)
+    patch.object(Client, 'send', side_effect=json.JSONDecodeError('', '', 0))
+    assert Client.running() is None
+
+
+def test_client_running_version(patch):
+    patch.object(Client, 'owned', return_value=True)
+    patch.object(Client, 'send', return_value={'result': '0.0.0'})
+    assert Client.running() is None
+
+
+def test_client_compile(patch, client):
+    patch.object(Client, 'request')
+    patch.object(os, 'getcwd', return_value='/home')
+    result = client.compile('path', ignored_path='ignored', cache='cache')
+    Client.request.assert_called_with('compile', path='path',
+                                      directory='/home',
+                                      ignored_path='ignored', ebnf=None,
+                                      cache='cache', jobs=1)
+    assert result == Client.request()
+
+
+def test_client_loads(patch, client):
+    patch.object(Client, 'request')
+    result = client.loads('x = 1')
+    Client.request.assert_called_with('loads', string='x = 1')
+    assert result == Client.request()
+
+
+def test_client_load_map(patch, client):
+    patch.object(Client, 'request')
+    patch.object(os, 'getcwd', return_value='/home')
+    result = client.load_map({'a': 'x'})
+    Client.request.assert_called_with('load_map', files={'a': 'x'},
+                                      directory='/home')
+    assert result == Client.request()
+
+
+def test_client_load_map_port(patch):
+    """
+    Ensures load_map doesn't send the directory to a port server
+    """
+    patch.object(Client, 'request')
+    Client(port=2000).load_map({'a': 'x'})
+    Client.request.assert_called_with('load_map', files={'a': 'x'})
+
+
+def test_client_lex(patch, client):
+    patch.object(Client, 'request')
+    result = client.lex('x = 1')
+    Client.request.assert_called_with('lex', string='x = 1', ebnf=None)
+    assert result == Client.request()
+
+
+def test_client_parse(patch, client):
+    patch.object(Client, 'request')
+    result = client.parse('x = 1', ebnf='ebnf')
+    Client.request.assert_called_with('parse', string='x = 1', ebnf='ebnf')
+    assert result == Client.request()
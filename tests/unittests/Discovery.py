@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import fixture
+
+from storyscript.Discovery import Discovery
+from storyscript.Gitignore import Gitignore
+from storyscript.Story import Story
+
+
+@fixture
+def gitignore(patch):
+    patch.object(Gitignore, 'from_directory')
+    gitignore = Gitignore.from_directory()
+    gitignore.relative.return_value = 'root'
+    gitignore.ignored.return_value = False
+    return gitignore
+
+
+def entry(magic, name, directory=False, symlink=False):
+    entry = magic()
+    entry.name = name
+    entry.is_dir.return_value = directory
+    entry.is_symlink.return_value = symlink
+    return entry
+
+
+def test_discovery_join():
+    assert Discovery.join('.', 'one.story') == 'one.story'
+    assert Discovery.join('root', 'one.story') == 'root/one.story'
+
+
+def test_discovery_ignores(patch):
+    patch.object(os.path, 'isdir')
+    patch.object(os, 'walk', return_value=[('root', [], ['one.story', 'two'])])
+    result = Discovery.ignores('path')
+    os.walk.assert_called_with('path')
+    assert result == {'root/one.story'}
+
+
+def test_discovery_ignores_not_dir(patch):
+    patch.many(os.path, ['relpath', 'isdir'])
+    os.path.isdir.return_value = False
+    result = Discovery.ignores('path')
+    os.path.relpath.assert_called_with('path')
+    assert result == {os.path.relpath()}
+
+
+def test_discovery_scan(patch):
+    patch.object(os, 'scandir')
+    os.scandir().__enter__.return_value = ['entry']
+    assert Discovery.scan('dir') == ['entry']
+    os.scandir.assert_called_with('dir')
+
+
+def test_discovery_scan_error(patch):
+    patch.object(os, 'scandir', side_effect=PermissionError)
+    assert Discovery.scan('dir') == []
+
+
+def test_discovery_find(patch, magic, gitignore):
+    patch.object(os.path, 'relpath', return_value='root')
+    patch.object(Discovery, 'scan')
+    Discovery.scan.return_value = [entry(magic, 'one.story'),
+                                   entry(magic, 'two')]
+    result = Discovery.find('dir')
+    os.path.relpath.assert_called_with('dir')
+    Gitignore.from_directory.assert_called_with('dir')
+    Discovery.scan.assert_called_with('root')
+    gitignore.load.assert_called_with('root')
+    gitignore.relative.assert_called_with('root')
+    gitignore.ignored.assert_called_with('root/one.story')
+    assert result == ['root/one.story']
+
+
+def test_discovery_find_gitignored(patch, magic, gitignore):
+    patch.object(os.path, 'relpath', return_value='root')
+    patch.object(Discovery, 'scan', return_value=[entry(magic, 'one.story')])
+    gitignore.ignored.return_value = True
+    assert Discovery.find('dir') == []
+
+
+def test_discovery_find_subdirs(patch, magic, gitignore):
+    """
+    Ensures Discovery.find walks subdirectories in order, except ignored
+    ones and symbolic links
+    """
+    patch.object(os.path, 'relpath', return_value='.')
+    gitignore.relative.return_value = ''
+    gitignore.ignored.side_effect = lambda path, *args: path == 'ignored'
+    tree = {
+        '.': [entry(magic, 'a', directory=True),
+              entry(magic, 'ignored', directory=True),
+              entry(magic, 'link', directory=True, symlink=True),
+              entry(magic, 'b', directory=True),
+              entry(magic, 'one.story')],
+        'a': [entry(magic, 'two.story')],
+        'b': [entry(magic, 'three.story')]
+    }
+    patch.object(Discovery, 'scan', side_effect=lambda path: tree[path])
+    result = Discovery.find('.')
+    assert result == ['one.story', 'a/two.story', 'b/three.story']
+
+
+def test_discovery_find_ignored_path(patch, magic, gitignore):
+    patch.object(os.path, 'relpath', return_value='root')
+    patch.object(Discovery, 'scan', return_value=[entry(magic, 'one.story')])
+    patch.object(Discovery, 'ignores', return_value={'root/one.story'})
+    result = Discovery.find('dir', ignored_path='ignored')
+    Discovery.ignores.assert_called_with('ignored')
+    assert result == []
+
+
+def test_discovery_read(patch):
+    patch.object(Story, 'read', side_effect=lambda path: path.upper())
+    result = Discovery.read(['one.story', 'two.story'])
+    assert result == {'one.story': 'ONE.STORY', 'two.story': 'TWO.STORY'}
+    assert list(result) == ['one.story', 'two.story']
+
+
+def test_discovery_read_jobs(patch):
+    patch.init(ThreadPoolExecutor)
+    patch.many(ThreadPoolExecutor, ['map', 'shutdown'])
+    ThreadPoolExecutor.map.return_value = ['one', 'two']
+    result = Discovery.read(['one.story', 'two.story'], jobs=4)
+    ThreadPoolExecutor.__init__.assert_called_with(max_workers=4)
+    ThreadPoolExecutor.map.assert_called_with(Story.read,
+                                              ['one.story', 'two.story'])
+    assert result == {'one.story': 'one', 'two.story': 'two'}
+
+
+def test_discovery_read_one(patch):
+    patch.object(Story, 'read')
+    patch.init(ThreadPoolExecutor)
+    result = Discovery.read(['one.story'])
+    assert ThreadPoolExecutor.__init__.call_count == 0
+    assert result == {'one.story': Story.read()}
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import re
+import struct
+
+from pytest import fixture, mark
+
+from storyscript.Gitignore import Gitignore
+
+
+@fixture
+def gitignore():
+    return Gitignore('/repo')
+
+
+def test_gitignore_init(gitignore):
+    assert gitignore.root == '/repo'
+    assert gitignore.patterns == []
+    assert gitignore.loaded == set()
+    assert gitignore.tracked == set()
+
+
+def test_gitignore_find_root(patch):
+    patch.object(os.path, 'exists', side_effect=lambda path: path == '/a/.git')
+    assert Gitignore.find_root('/a/b/c') == '/a'
+
+
+def test_gitignore_find_root_no_repository(patch):
+    patch.object(os.path, 'exists', return_value=False)
+    assert Gitignore.find_root('/a/b') == '/a/b'
+
+
+def test_gitignore_global_file(patch):
+    patch.object(os.environ, 'get', return_value=None)
+    patch.object(os.path, 'expanduser', return_value='/home')
+    assert Gitignore.global_file() == '/home/.config/git/ignore'
+    os.environ.get.assert_called_with('XDG_CONFIG_HOME')
+
+
+def test_gitignore_global_file_xdg(patch):
+    patch.object(os.environ, 'get', return_value='/config')
+    assert Gitignore.global_file() == '/config/git/ignore'
+
+
+def test_gitignore_config_files(patch):
+    patch.object(os.environ, 'get', return_value=None)
+    patch.object(os.path, 'expanduser', return_value='/home')
+    result = Gitignore.config_files('/repo')
+    assert result == ['/home/.config/git/config', '/home/.gitconfig',
+                      '/repo/.git/config']
+
+
+def test_gitignore_config_files_xdg(patch):
+    patch.object(os.environ, 'get', return_value='/config')
+    patch.object(os.path, 'expanduser', return_value='/home')
+    assert Gitignore.config_files('/repo')[0] == '/config/git/config'
+
+
+@mark.parametrize('value, string', [
+    (' ~/ignore', '~/ignore'),
+    (' "/with space" # comment', '/with space'),
+    (' "a;b" ; comment', 'a;b'),
+    (' a\\\\b', 'a\\b'),
+])
+def test_gitignore_config_string(value, string):
+    assert Gitignore.config_string(value) == string
+
+
+def test_gitignore_config_value(patch):
+    patch.object(io, 'open')
+    io.open().__enter__().read.return_value = (
+        '[user]\n\texcludesFile = user\n'
+        '[Core]\n\texcludesfile = first\n\tExcludesFile = /ignore\n')
+    result = Gitignore.config_value('config', 'core', 'excludesfile')
+    io.open.assert_called_with('config', 'r')
+    assert result == '/ignore'
+
+
+def test_gitignore_config_value_unset(patch):
+    patch.object(io, 'open')
+    io.open().__enter__().read.return_value = '[core]\n\tbare = false\n'
+    assert Gitignore.config_value('config', 'core', 'excludesfile') is None
+
+
+def test_gitignore_config_value_missing():
+    assert Gitignore.config_value('/missing', 'core', 'excludesfile') is None
+
+
+def test_gitignore_excludes_file(patch):
+    patch.object(Gitignore, 'config_files', return_value=['a', 'b', 'c'])
+    patch.object(Gitignore, 'config_value',
+                 side_effect=['/a/ignore', '/b/ignore', None])
+    assert Gitignore.excludes_file('/repo') == '/b/ignore'
+    Gitignore.config_files.assert_called_with('/repo')
+    Gitignore.config_value.assert_any_call('a', 'core', 'excludesfile')
+
+
+def test_gitignore_excludes_file_relative(patch):
+    patch.object(Gitignore, 'config_files', return_value=['c'])
+    patch.object(Gitignore, 'config_value', return_value='ignore')
+    assert Gitignore.excludes_file('/repo') == '/repo/ignore'
+
+
+def test_gitignore_excludes_file_home(patch):
+    patch.object(Gitignore, 'config_files', return_value=['c'])
+    patch.object(Gitignore, 'config_value', return_value='~/ignore')
+    patch.object(os.path, 'expanduser', return_value='/home/ignore')
+    assert Gitignore.excludes_file('/repo') == '/home/ignore'
+    os.path.expanduser.assert_called_with('~/ignore')
+
+
+def test_gitignore_excludes_file_unset(patch):
+    patch.object(Gitignore, 'config_files', return_value=['c'])
+    patch.object(Gitignore, 'config_value', return_value=None)
+    patch.object(Gitignore, 'global_file')
+    assert Gitignore.excludes_file('/repo') == Gitignore.global_file()
+
+
+def index(version, *entries):
+    """
+    Makes a git index with entries of paths and flags.
+    """
+    data = b'DIRC' + struct.pack('>II', version, len(entries))
+    for path, flags in entries:
+        entry = b'\0' * 60 + struct.pack('>H', flags)
+        if flags & 0x4000:
+            entry += b'\0\0'
+        if version == 4:
+            data += entry + path + b'\0'
+        else:
+            entry += path
+            data += entry + b'\0' * (8 - len(entry) % 8)
+    return data
+
+
+def test_gitignore_index_paths():
+    data = index(2, (b'a/one.story', 11), (b'two.story', 9))
+    assert Gitignore.index_paths(data) == ['a/one.story', 'two.story']
+
+
+def test_gitignore_index_paths_extended():
+    data = index(3, (b'one.story', 0x4000 | 9), (b'two.story', 9))
+    assert Gitignore.index_paths(data) == ['one.story', 'two.story']
+
+
+def test_gitignore_index_paths_compressed():
+    """
+    Ensures the paths of the version 4 index are decompressed
+    """
+    data = index(4, (b'\x00a/one.story', 11), (b'\x09two.story', 11))
+    assert Gitignore.index_paths(data) == ['a/one.story', 'a/two.story']
+
+
+@mark.parametrize('data', [b'', b'DIRC\0\0\0\x05\0\0\0\0', b'PACK' * 3])
+def test_gitignore_index_paths_unknown(data):
+    assert Gitignore.index_paths(data) == []
+
+
+def test_gitignore_index_varint():
+    assert Gitignore.index_varint(b'\x05', 0) == (5, 1)
+    assert Gitignore.index_varint(b'\x80\x00', 0) == (128, 2)
+
+
+def test_gitignore_load_index(patch, gitignore):
+    patch.object(io, 'open')
+    patch.object(Gitignore, 'index_paths', return_value=['a/b/one.story',
+                                                         'a/two.story'])
+    gitignore.load_index('/repo/.git/index')
+    io.open.assert_called_with('/repo/.git/index', 'rb')
+    Gitignore.index_paths.assert_called_with(io.open().__enter__().read())
+    assert gitignore.tracked == {'a', 'a/b', 'a/b/one.story', 'a/two.story'}
+
+
+def test_gitignore_load_index_missing(gitignore):
+    gitignore.load_index('/missing/index')
+    assert gitignore.tracked == set()
+
+
+def test_gitignore_load_index_invalid(patch, gitignore):
+    """
+    Ensures an index that can't be read tracks nothing
+    """
+    patch.object(io, 'open')
+    patch.object(Gitignore, 'index_paths', side_effect=struct.error)
+    gitignore.load_index('/repo/.git/index')
+    assert gitignore.tracked == set()
+
+
+@mark.parametrize('pattern, path, match', [
+    ('*.story', 'one.story', True),
+    ('*.story', 'dir/one.story', False),
+    ('on?.story', 'one.story', True),
+    ('dir/*', 'dir/one', True),
+    ('dir/*', 'dir/sub/one', False),
+    ('**/one', 'a/b/one', True),
+    ('**/one', 'one', True),
+    ('dir/**', 'dir/a/b', True),
+    ('a/**/b', 'a/b', True),
+    ('a/**/b', 'a/x/y/b', True),
+    ('[ab].story', 'a.story', True),
+    ('[!ab].story', 'a.story', False),
+    ('[!ab].story', 'c.story', True),
+    ('\\#file', '#file', True),
+    ('a.b', 'axb', False)
+])
+def test_gitignore_translate(pattern, path, match):
+    regex = re.compile(Gitignore.translate(pattern))
+    assert (regex.fullmatch(path) is not None) == match
+
+
+@mark.parametrize('line', ['', '   ', '# comment', '!', '/'])
+def test_gitignore_parse_empty(line):
+    assert Gitignore.parse(line) is None
+
+
+def test_gitignore_parse(patch):
+    patch.object(Gitignore, 'translate', return_value='one')
+    regex, negate, directory = Gitignore.parse('one')
+    Gitignore.translate.assert_called_with('one')
+    assert regex.pattern == '(?:.*/)?one'
+    assert negate is False
+    assert directory is False
+
+
+def test_gitignore_parse_anchored():
+    regex, negate, directory = Gitignore.parse('/build/')
+    assert regex.pattern == 'build'
+    assert directory is True
+
+
+def test_gitignore_parse_negate():
+    assert Gitignore.parse('!one.story')[1] is True
+
+
+def test_gitignore_parse_trailing_spaces():
+    assert Gitignore.parse('one  ')[0].fullmatch('one')
+    assert Gitignore.parse('one\\ ')[0].fullmatch('one ')
+
+
+def test_gitignore_load_file(patch, gitignore):
+    patch.object(io, 'open')
+    io.open().__enter__().read.return_value = '# comment\none\n'
+    patch.object(Gitignore, 'parse', side_effect=[None, ('regex', 1, 2)])
+    gitignore.load_file('.gitignore', 'base')
+    io.open.assert_called_with('.gitignore', 'r')
+    assert gitignore.patterns == [('base', 'regex', 1, 2)]
+
+
+def test_gitignore_load_file_missing(gitignore):
+    gitignore.load_file('/missing/.gitignore')
+    assert gitignore.patterns == []
+
+
+def test_gitignore_relative(gitignore):
+    assert gitignore.relative('/repo/a/b') == 'a/b'
+    assert gitignore.relative('/repo') == ''
+
+
+def test_gitignore_load(patch, gitignore):
+    patch.object(Gitignore, 'load_file')
+    gitignore.load('/repo/dir')
+    gitignore.load('/repo/dir')
+    Gitignore.load_file.assert_called_once_with('/repo/dir/.gitignore', 'dir')
+
+
+def test_gitignore_ignored(gitignore):
+    gitignore.patterns = [('', *Gitignore.parse('*.story')),
+                          ('', *Gitignore.parse('!keep.story'))]
+    assert gitignore.ignored('one.story') is True
+    assert gitignore.ignored('dir/one.story') is True
+    assert gitignore.ignored('keep.story') is False
+    assert gitignore.ignored('one.txt') is False
+
+
+def test_gitignore_ignored_directory(gitignore):
+    gitignore.patterns = [('', *Gitignore.parse('build/'))]
+    assert gitignore.ignored('build', directory=True) is True
+    assert gitignore.ignored('build') is False
+
+
+def test_gitignore_ignored_base(gitignore):
+    gitignore.patterns = [('dir', *Gitignore.parse('/one.story'))]
+    assert gitignore.ignored('dir/one.story') is True
+    assert gitignore.ignored('one.story') is False
+    assert gitignore.ignored('other/dir/one.story') is False
+
+
+def test_gitignore_ignored_tracked(gitignore):
+    """
+    Ensures tracked files and the directories containing them are not
+    ignored
+    """
+    gitignore.patterns = [('', *Gitignore.parse('*.story'))]
+    gitignore.tracked = {'build', 'build/one.story'}
+    assert gitignore.ignored('build', directory=True) is False
+    assert gitignore.ignored('build/one.story') is False
+    assert gitignore.ignored('build/two.story') is True
+
+
+def test_gitignore_ignored_tracked_parent(gitignore):
+    """
+    Ensures paths in ignored directories that contain tracked files stay
+    ignored
+    """
+    gitignore.patterns = [('', *Gitignore.parse('build/'))]
+    gitignore.tracked = {'build', 'build/lib', 'build/lib/one.story'}
+    assert gitignore.ignored('build/lib/two.story') is True
+    assert gitignore.ignored('build/other', directory=True) is True
+
+
+def test_gitignore_ignored_git(gitignore):
+    assert gitignore.ignored('.git', directory=True) is True
+
+
+def test_gitignore_from_directory(patch):
+    patch.object(Gitignore, 'find_root', return_value='/repo')
+    patch.many(Gitignore, ['excludes_file', 'load_file', 'load_index',
+                           'load'])
+    result = Gitignore.from_directory('/repo/a/b')
+    Gitignore.find_root.assert_called_with('/repo/a/b')
+    Gitignore.excludes_file.assert_called_with('/repo')
+    Gitignore.load_file.assert_any_call(Gitignore.excludes_file())
+    Gitignore.load_file.assert_any_call('/repo/.git/info/exclude')
+    Gitignore.load_index.assert_called_with('/repo/.git/index')
+    assert Gitignore.load.call_args_list[0][0] == ('/repo',)
+    assert Gitignore.load.call_args_list[1][0] == ('/repo/a',)
+    assert Gitignore.load.call_count == 2
+    assert result.root == '/repo'
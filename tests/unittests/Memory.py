@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import json
+import tracemalloc
+
+from pytest import fixture, raises
+
+from storyscript.Memory import Memory
+from storyscript.Timings import Timings
+from storyscript.exceptions import StoryError
+
+
+@fixture
+def memory():
+    return Memory()
+
+
+@fixture
+def traced(patch):
+    patch.many(tracemalloc, ['start', 'stop', 'get_traced_memory',
+                             'reset_peak', 'is_tracing'])
+
+
+@fixture
+def measured(memory):
+    memory.stories = {'b.story': {'parse': (2048, 1024, 1),
+                                  'read': (1024, 512, 1)},
+                      None: {'custom': (1024, 0, 2)}}
+    memory.peak = 4096
+    return memory
+
+
+def test_memory_init(memory):
+    assert isinstance(memory, Timings)
+    assert memory.stories == {}
+    assert memory.tracing is False
+    assert memory.peak == 0
+
+
+def test_memory_frames(memory):
+    memory.frames().append('frame')
+    assert memory.frames() == ['frame']
+
+
+def test_memory_trace(traced, memory):
+    tracemalloc.is_tracing.return_value = False
+    memory.trace()
+    assert tracemalloc.start.call_count == 1
+    assert memory.tracing is True
+
+
+def test_memory_trace_tracing(traced, memory):
+    """
+    Ensures Memory.trace does not take over tracing started by others
+    """
+    tracemalloc.is_tracing.return_value = True
+    memory.trace()
+    assert tracemalloc.start.call_count == 0
+    assert memory.tracing is False
+
+
+def test_memory_init_unsupported(patch):
+    """
+    Ensures the hook can't be made when the peak can't be reset
+    """
+    patch.object(Memory, 'supported', return_value=False)
+    with raises(StoryError) as e:
+        Memory()
+    message = 'E0001: Measuring memory needs Python 3.9 or later'
+    assert e.value.short_message() == message
+
+
+def test_memory_supported(patch):
+    patch.object(tracemalloc, 'reset_peak', create=True)
+    assert Memory.supported() is True
+
+
+def test_memory_supported_old(patch):
+    patch.dict(tracemalloc.__dict__)
+    tracemalloc.__dict__.pop('reset_peak', None)
+    assert Memory.supported() is False
+
+
+def test_memory_start(patch, traced, memory):
+    patch.object(Memory, 'trace')
+    tracemalloc.get_traced_memory.return_value = (10, 30)
+    memory.frames().append({'current': 0, 'peak': 20})
+    memory.start('parse', 'a.story')
+    assert Memory.trace.call_count == 1
+    assert tracemalloc.reset_peak.call_count == 1
+    assert memory.frames() == [{'current': 0, 'peak': 30},
+                               {'current': 10, 'peak': 10}]
+
+
+def test_memory_call(traced, memory):
+    memory.frames().append({'current': 0, 'peak': 0})
+    memory.frames().append({'current': 100, 'peak': 100})
+    tracemalloc.get_traced_memory.return_value = (150, 400)
+    memory('parse', 'a.story', 1)
+    tracemalloc.get_traced_memory.return_value = (200, 300)
+    memory.frames().append({'current': 150, 'peak': 150})
+    memory('parse', 'a.story', 1)
+    assert memory.stories['a.story']['parse'] == (300, 100, 2)
+    assert memory.frames() == [{'current': 0, 'peak': 400}]
+    assert memory.peak == 400
+
+
+def test_memory_call_not_started(traced, memory):
+    """
+    Ensures phases that started before the hook was added are ignored
+    """
+    memory('parse', 'a.story', 1)
+    assert memory.stories == {}
+
+
+def test_memory_close(traced, memory):
+    memory.tracing = True
+    memory.close()
+    assert tracemalloc.stop.call_count == 1
+    assert memory.tracing is False
+
+
+def test_memory_close_not_tracing(traced, memory):
+    memory.close()
+    assert tracemalloc.stop.call_count == 0
+
+
+def test_memory_total(measured):
+    assert measured.total() == 1536
+
+
+def test_memory_results(measured):
+    results = measured.results()
+    assert [result['story'] for result in results] == ['b.story', None]
+    assert results[0]['phases'] == {
+        'read': {'peak': 1024, 'retained': 512, 'calls': 1,
+                 'artifact': 'source'},
+        'parse': {'peak': 2048, 'retained': 1024, 'calls': 1,
+                  'artifact': 'tree'}
+    }
+    assert list(results[0]['phases']) == ['read', 'parse']
+    assert results[1]['phases']['custom']['artifact'] is None
+
+
+def test_memory_dumps(measured):
+    result = json.loads(measured.dumps())
+    assert result['peak'] == 4096
+    assert result['retained'] == 1536
+    assert result['stories'] == json.loads(json.dumps(measured.results()))
+
+
+def test_memory_text(measured):
+    lines = measured.text().split('\n')
+    assert lines[0] == 'b.story'
+    assert lines[1] == ('  read               1.0 KiB peak       0.5 KiB '
+                        'retained (source)')
+    assert lines[3] == '(shared)'
+    assert lines[4] == ('  custom             1.0 KiB peak       0.0 KiB '
+                        'retained')
+    assert lines[-1] == 'Peak                 4.0 KiB'
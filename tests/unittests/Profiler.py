@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import time
+
+from pytest import fixture, raises
+
+from storyscript.Profiler import Profiler
+from storyscript.Timings import Timings
+
+
+@fixture
+def hooks(patch):
+    patch.object(Profiler, 'hooks', [])
+    return Profiler.hooks
+
+
+def test_profiler_add(hooks):
+    Profiler.add('hook')
+    assert hooks == ['hook']
+
+
+def test_profiler_remove(hooks):
+    hooks.append('hook')
+    Profiler.remove('hook')
+    Profiler.remove('hook')
+    assert hooks == []
+
+
+def test_profiler_current():
+    assert Profiler.current() is None
+
+
+def test_profiler_story():
+    with Profiler.story('a.story'):
+        with Profiler.story('b.story'):
+            assert Profiler.current() == 'b.story'
+        assert Profiler.current() == 'a.story'
+    assert Profiler.current() is None
+
+
+def test_profiler_phase(patch, magic, hooks):
+    patch.object(time, 'perf_counter', side_effect=[1, 3])
+    hook = magic()
+    hooks.append(hook)
+    with Profiler.story('a.story'), Profiler.phase('parse'):
+        pass
+    hook.assert_called_with('parse', 'a.story', 2)
+
+
+def test_profiler_phase_start(magic, hooks):
+    """
+    Ensures hooks with a start method are told when phases begin
+    """
+    hook = magic()
+    hooks.append(hook)
+    with Profiler.story('a.story'), Profiler.phase('parse'):
+        hook.start.assert_called_with('parse', 'a.story')
+        assert hook.call_count == 0
+    assert hook.call_count == 1
+
+
+def test_profiler_phase_error(magic, hooks):
+    """
+    Ensures phases that fail are reported
+    """
+    hook = magic()
+    hooks.append(hook)
+    with raises(ValueError):
+        with Profiler.phase('parse'):
+            raise ValueError
+    assert hook.call_args[0][:2] == ('parse', None)
+
+
+def test_profiler_phase_no_hooks(patch, hooks):
+    patch.object(time, 'perf_counter')
+    with Profiler.phase('parse'):
+        pass
+    assert time.perf_counter.call_count == 0
+
+
+def test_profiler_record(hooks):
+    with Profiler.record() as timings:
+        assert hooks == [timings]
+    assert isinstance(timings, Timings)
+    assert hooks == []
+
+
+def test_profiler_record_close(magic, hooks):
+    hook = magic()
+    with Profiler.record(hook=hook):
+        assert hook.close.call_count == 0
+    assert hook.close.call_count == 1
+
+
+def test_profiler_record_hook(hooks):
+    with raises(ValueError):
+        with Profiler.record(hook='hook') as hook:
+            assert hooks == ['hook']
+            raise ValueError
+    assert hook == 'hook'
+    assert hooks == []
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+import os
+import socketserver
+from unittest.mock import call
+
+from pytest import raises
+
+from storyscript.Api import Api
+from storyscript.App import App
+from storyscript.Bundle import Bundle
+from storyscript.Client import Client
+from storyscript.Server import Server
+from storyscript.Story import Story
+from storyscript.Version import version
+from storyscript.exceptions import StoryError
+from storyscript.parser import Parser
+
+
+def test_server_version():
+    assert Server.version() == version
+
+
+def test_server_compile(patch):
+    patch.object(App, 'compile')
+    patch.object(os, 'getcwd', return_value='/server')
+    patch.object(os, 'chdir')
+    result = Server.compile('path', '/client', ignored_path='ignored',
+                            cache='cache', jobs=2)
+    App.compile.assert_called_with('path', ignored_path='ignored',
+                                   ebnf=None, cache='cache', jobs=2)
+    os.chdir.assert_called_with('/server')
+    assert os.chdir.call_args_list[0][0] == ('/client',)
+    assert result == App.compile()
+
+
+def test_server_loads(patch):
+    patch.object(Api, 'loads')
+    result = Server.loads('x = 1')
+    Api.loads.assert_called_with('x = 1')
+    assert result == Api.loads()
+
+
+def test_server_load_map(patch):
+    """
+    Ensures load_map doesn't read files of the server without a directory
+    """
+    patch.init(Bundle)
+    patch.object(Bundle, 'bundle')
+    result = Server.load_map({'a': 'x'})
+    Bundle.__init__.assert_called_with(story_files={'a': 'x'},
+                                       read_files=False)
+    assert result == Bundle.bundle()
+
+
+def test_server_load_map_directory(patch):
+    patch.object(Api, 'load_map')
+    patch.object(os, 'getcwd', return_value='/server')
+    patch.object(os, 'chdir')
+    result = Server.load_map({'a': 'x'}, directory='/client')
+    Api.load_map.assert_called_with({'a': 'x'})
+    assert os.chdir.call_args_list == [call('/client'), call('/server')]
+    assert result == Api.load_map()
+
+
+def test_server_lex(patch, magic):
+    patch.init(Story)
+    token = magic(type='NAME', value='x')
+    patch.object(Story, 'lex', return_value=[token])
+    assert Server.lex('x', ebnf='ebnf') == [['NAME', 'x']]
+    Story.__init__.assert_called_with('x')
+    Story.lex.assert_called_with(ebnf='ebnf')
+
+
+def test_server_parse(patch):
+    patch.init(Story)
+    patch.object(Story, 'parse')
+    Story.tree = None
+    patch.object(Story, 'tree')
+    result = Server.parse('x = 1', ebnf='ebnf')
+    Story.parse.assert_called_with(ebnf='ebnf')
+    assert result == Story.tree.pretty()
+
+
+def test_server_error(magic):
+    error = magic()
+    result = Server.error(error)
+    assert result == {'message': error.message(),
+                      'short_message': error.short_message()}
+
+
+def test_server_error_unformatted(magic):
+    """
+    Ensures errors that fail to be formatted are sent as plain text
+    """
+    error = magic(error='error')
+    error.message.side_effect = AttributeError
+    result = Server.error(error)
+    assert result == {'message': 'Error: error',
+                      'short_message': 'Error: error'}
+
+
+def test_server_uses_files():
+    assert Server.uses_files('compile', {}) is True
+    assert Server.uses_files('lex', {'ebnf': 'file.ebnf'}) is True
+
+
+def test_server_uses_files_directory():
+    params = {'files': {}, 'directory': '/'}
+    assert Server.uses_files('load_map', params) is True
+
+
+def test_server_uses_files_none():
+    assert Server.uses_files('loads', {'string': 'x'}) is False
+    assert Server.uses_files('lex', {'ebnf': None}) is False
+
+
+def test_server_respond(patch):
+    patch.object(Server, 'loads')
+    result = Server.respond('{"method": "loads", "params": {"string": "x"}}')
+    Server.loads.assert_called_with(string='x')
+    assert result == {'result': Server.loads(), 'version': version}
+
+
+def test_server_respond_unknown(patch):
+    patch.object(Server, 'error')
+    patch.object(StoryError, 'unnamed_error', return_value=StoryError(0, 0))
+    result = Server.respond('{"method": "respond"}')
+    StoryError.unnamed_error.assert_called_with('Unknown method respond')
+    Server.error.assert_called_with(StoryError.unnamed_error())
+    assert result == {'error': Server.error(), 'version': version}
+
+
+def test_server_respond_remote_files(patch):
+    """
+    Ensures requests that are not local can't use files of the server
+    """
+    patch.object(Server, 'error')
+    patch.object(Server, 'compile')
+    patch.object(StoryError, 'unnamed_error', return_value=StoryError(0, 0))
+    line = '{"method": "compile", "params": {"path": "/"}}'
+    result = Server.respond(line, local=False)
+    message = 'Method compile with files is only allowed on the Unix socket'
+    StoryError.unnamed_error.assert_called_with(message)
+    assert Server.compile.call_count == 0
+    assert result == {'error': Server.error(), 'version': version}
+
+
+def test_server_respond_remote(patch):
+    patch.object(Server, 'loads')
+    line = '{"method": "loads", "params": {"string": "x"}}'
+    result = Server.respond(line, local=False)
+    assert result == {'result': Server.loads(), 'version': version}
+
+
+def test_server_respond_story_error(patch):
+    error = StoryError(None, None)
+    patch.object(Server, 'error')
+    patch.object(Server, 'loads', side_effect=error)
+    result = Server.respond('{"method": "loads", "params": {"string": "x"}}')
+    Server.error.assert_called_with(error)
+    assert result['error'] == Server.error()
+
+
+def test_server_respond_internal_error(patch):
+    """
+    Ensures invalid requests and unexpected errors give internal errors
+    """
+    patch.object(Server, 'error')
+    patch.object(StoryError, 'internal_error')
+    result = Server.respond('invalid')
+    Server.error.assert_called_with(StoryError.internal_error())
+    assert result['error'] == Server.error()
+
+
+def test_server_remove_stale(patch):
+    patch.object(os.path, 'lexists', return_value=True)
+    patch.object(Client, 'owned', return_value=True)
+    patch.object(Client, 'connect', side_effect=ConnectionRefusedError)
+    patch.object(os, 'remove')
+    Server.remove_stale('story.sock')
+    Client.owned.assert_called_with('story.sock')
+    os.remove.assert_called_with('story.sock')
+
+
+def test_server_remove_stale_missing(patch):
+    patch.object(os.path, 'lexists', return_value=False)
+    patch.object(os, 'remove')
+    Server.remove_stale('story.sock')
+    assert os.remove.call_count == 0
+
+
+def test_server_remove_stale_not_owned(patch):
+    """
+    Ensures sockets of other users are never removed
+    """
+    patch.object(os.path, 'lexists', return_value=True)
+    patch.object(Client, 'owned', return_value=False)
+    patch.object(os, 'remove')
+    with raises(StoryError) as e:
+        Server.remove_stale('story.sock')
+    message = 'E0001: story.sock is not a socket of the user'
+    assert e.value.short_message() == message
+    assert os.remove.call_count == 0
+
+
+def test_server_remove_stale_running(patch):
+    """
+    Ensures the socket of a running server is kept
+    """
+    patch.object(os.path, 'lexists', return_value=True)
+    patch.object(Client, 'owned', return_value=True)
+    patch.object(Client, 'connect')
+    patch.object(os, 'remove')
+    with raises(StoryError) as e:
+        Server.remove_stale('story.sock')
+    message = 'E0001: A server is already running at story.sock'
+    assert e.value.short_message() == message
+    Client.connect().close.assert_called()
+    assert os.remove.call_count == 0
+
+
+def test_server_make(patch):
+    patch.object(Client, 'default_address', return_value='story.sock')
+    patch.object(Server, 'remove_stale')
+    patch.object(os, 'umask', return_value=0o22)
+    patch.init(socketserver.UnixStreamServer)
+    result = Server.make()
+    Server.remove_stale.assert_called_with('story.sock')
+    init = socketserver.UnixStreamServer.__init__
+    init.assert_called_with('story.sock', Server.Handler)
+    assert os.umask.call_args_list == [call(0o177), call(0o22)]
+    assert isinstance(result, socketserver.UnixStreamServer)
+
+
+def test_server_make_error(patch):
+    """
+    Ensures the umask is restored when the socket can't be created
+    """
+    patch.object(Client, 'default_address', return_value='story.sock')
+    patch.object(Server, 'remove_stale')
+    patch.object(os, 'umask', return_value=0o22)
+    patch.object(socketserver.UnixStreamServer, '__init__',
+                 side_effect=OSError)
+    with raises(OSError):
+        Server.make()
+    os.umask.assert_called_with(0o22)
+
+
+def test_server_make_port(patch):
+    patch.init(socketserver.TCPServer)
+    patch.many(socketserver.TCPServer, ['server_bind', 'server_activate'])
+    result = Server.make(port=2000)
+    args = (('127.0.0.1', 2000), Server.Handler)
+    socketserver.TCPServer.__init__.assert_called_with(
+        *args, bind_and_activate=False)
+    assert result.allow_reuse_address is True
+    assert socketserver.TCPServer.server_bind.call_count == 1
+
+
+def test_server_serve(patch):
+    patch.object(Parser, 'lark')
+    patch.object(Server, 'make')
+    patch.object(os, 'remove')
+    Server.serve(address='story.sock')
+    assert Parser.lark.call_count == 1
+    Server.make.assert_called_with(address='story.sock', port=None)
+    Server.make().serve_forever.assert_called()
+    Server.make().server_close.assert_called()
+    os.remove.assert_called_with(Server.make().server_address)
+
+
+def test_server_serve_interrupt(patch):
+    patch.object(Parser, 'lark')
+    patch.object(Server, 'make')
+    Server.make().serve_forever.side_effect = KeyboardInterrupt
+    patch.object(os, 'remove')
+    Server.serve(port=2000)
+    Server.make().server_close.assert_called()
+    assert os.remove.call_count == 0
@@ -7,6 +7,7 @@ from lark.exceptions import UnexpectedInput, UnexpectedToken
 
 from pytest import fixture, mark, raises
 
+from storyscript.Profiler import Profiler
 from storyscript.Story import Story
 from storyscript.compiler import Compiler
 from storyscript.exceptions import CompilerError, StoryError, StorySyntaxError
@@ -33,6 +34,8 @@ def compiler(patch, story):
 def test_story_init(story):
     assert story.story == 'story'
     assert story.path is None
+    assert story.tree is None
+    assert story.compiled is None
 
 
 def test_story_init_path():
@@ -87,6 +90,17 @@ def test_story_read(patch):
     assert result == Story.clean_source()
 
 
+def test_story_read_phases(patch):
+    """
+    Ensures Story.read measures reading and cleaning the story
+    """
+    patch.object(io, 'open')
+    patch.object(re, 'sub')
+    with Profiler.record() as timings:
+        Story.read('hello.story')
+    assert list(timings.stories['hello.story']) == ['read', 'clean']
+
+
 def test_story_read_not_found(patch, capsys):
     patch.object(io, 'open', side_effect=FileNotFoundError)
     patch.object(os, 'path')
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import io
+import json
+import os
+import tempfile
+
+from pytest import fixture
+
+from storyscript.StoryCache import StoryCache
+from storyscript.Version import version
+from storyscript.parser import Cache, Parser
+
+
+@fixture
+def cache():
+    return StoryCache('/cache')
+
+
+def test_storycache_init(cache):
+    assert cache.directory == '/cache'
+    assert cache.checksums == {}
+
+
+def test_storycache_default_directory(patch):
+    patch.object(os.environ, 'get', return_value=None)
+    patch.object(os.path, 'expanduser', return_value='/home')
+    result = StoryCache.default_directory()
+    assert result == '/home/.cache/storyscript/stories'
+    os.environ.get.assert_called_with('XDG_CACHE_HOME')
+
+
+def test_storycache_default_directory_xdg(patch):
+    patch.object(os.environ, 'get', return_value='/cache')
+    result = StoryCache.default_directory()
+    assert result == '/cache/storyscript/stories'
+
+
+def test_storycache_default_directory_parser_cache():
+    """
+    Ensures stories are cached next to the parsers.
+    """
+    result = StoryCache.default_directory()
+    assert result == os.path.join(Cache.directory(), 'stories')
+
+
+def test_storycache_checksum(patch, cache):
+    patch.init(Parser)
+    patch.object(Parser, 'checksum')
+    result = cache.checksum('ebnf')
+    Parser.__init__.assert_called_with(ebnf='ebnf')
+    assert result == Parser.checksum()
+    assert cache.checksums['ebnf'] == Parser.checksum()
+
+
+def test_storycache_checksum_memoized(patch, cache):
+    patch.object(Parser, 'checksum')
+    cache.checksums[None] = 'grammar'
+    assert cache.checksum(None) == 'grammar'
+    assert Parser.checksum.call_count == 0
+
+
+def test_storycache_key(patch, cache):
+    patch.object(hashlib, 'sha1')
+    patch.object(StoryCache, 'checksum', return_value='grammar')
+    result = cache.key('source', ebnf='ebnf')
+    StoryCache.checksum.assert_called_with('ebnf')
+    string = '{}\n{}\ngrammar\nsource'.format(StoryCache.revision, version)
+    hashlib.sha1.assert_called_with(string.encode('utf-8'))
+    assert result == hashlib.sha1().hexdigest()
+
+
+def test_storycache_key_source(patch, cache):
+    patch.object(StoryCache, 'checksum', return_value='grammar')
+    assert cache.key('one') != cache.key('two')
+
+
+def test_storycache_path(cache):
+    assert cache.path('key') == '/cache/key.json'
+
+
+def test_storycache_load(patch, cache):
+    patch.many(StoryCache, ['key', 'path'])
+    patch.object(io, 'open')
+    patch.object(json, 'load')
+    result = cache.load('source', ebnf='ebnf')
+    StoryCache.key.assert_called_with('source', 'ebnf')
+    StoryCache.path.assert_called_with(StoryCache.key())
+    io.open.assert_called_with(StoryCache.path(), 'r')
+    json.load.assert_called_with(io.open().__enter__())
+    assert result == json.load()
+
+
+def test_storycache_load_missing(patch, cache):
+    patch.object(StoryCache, 'key', return_value='key')
+    assert cache.load('source') is None
+
+
+def test_storycache_save(patch, cache):
+    patch.many(os, ['makedirs', 'replace'])
+    patch.object(io, 'open')
+    patch.object(json, 'dump')
+    patch.object(tempfile, 'mkstemp', return_value=(1, 'temporary'))
+    patch.many(StoryCache, ['key', 'path'])
+    cache.save('source', {'tree': {}}, ebnf='ebnf')
+    os.makedirs.assert_called_with('/cache', exist_ok=True)
+    tempfile.mkstemp.assert_called_with(dir='/cache')
+    io.open.assert_called_with(1, 'w')
+    json.dump.assert_called_with({'tree': {}}, io.open().__enter__())
+    StoryCache.key.assert_called_with('source', 'ebnf')
+    os.replace.assert_called_with('temporary', StoryCache.path())
+
+
+def test_storycache_save_unwritable(patch, cache):
+    patch.object(os, 'makedirs', side_effect=OSError)
+    patch.object(tempfile, 'mkstemp')
+    cache.save('source', {})
+    assert tempfile.mkstemp.call_count == 0
+
+
+def test_storycache_save_error(patch, cache):
+    """
+    Ensures StoryCache.save removes the temporary file when the story can't
+    be saved
+    """
+    patch.many(os, ['makedirs', 'replace', 'remove'])
+    patch.object(io, 'open')
+    patch.object(json, 'dump', side_effect=TypeError)
+    patch.object(tempfile, 'mkstemp', return_value=(1, 'temporary'))
+    patch.object(StoryCache, 'key')
+    cache.save('source', {})
+    os.remove.assert_called_with('temporary')
+    assert os.replace.call_count == 0
+
+
+def test_storycache_modules():
+    compiled = {'modules': {'one': 'one.story', 'two': 'dir/two'}}
+    result = StoryCache.modules(compiled)
+    assert result == ['one.story', 'dir/two.story']
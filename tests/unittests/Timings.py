@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import json
+
+from pytest import fixture
+
+from storyscript.Timings import Timings
+
+
+@fixture
+def timings():
+    timings = Timings()
+    timings('parse', 'b.story', 0.002)
+    timings('read', 'b.story', 0.001)
+    timings('parse', 'b.story', 0.002)
+    timings('lark', None, 0.01)
+    timings('read', 'a.story', 0.001)
+    return timings
+
+
+def test_timings_init():
+    timings = Timings()
+    assert timings.stories == {}
+    assert timings.lock is not None
+
+
+def test_timings_call(timings):
+    assert timings.stories['b.story'] == {'parse': (0.004, 2),
+                                          'read': (0.001, 1)}
+    assert timings.stories[None] == {'lark': (0.01, 1)}
+
+
+def test_timings_sort():
+    result = Timings.sort(['custom', 'compile', 'read', 'another'])
+    assert result == ['read', 'compile', 'another', 'custom']
+
+
+def test_timings_paths(timings):
+    assert timings.paths() == ['a.story', 'b.story', None]
+
+
+def test_timings_total(timings):
+    assert round(timings.total(), 6) == 0.016
+
+
+def test_timings_results(timings):
+    results = timings.results()
+    assert [result['story'] for result in results] == ['a.story', 'b.story',
+                                                       None]
+    phases = results[1]['phases']
+    assert list(phases) == ['read', 'parse']
+    assert phases['parse']['calls'] == 2
+    assert round(phases['parse']['time'], 6) == 4
+
+
+def test_timings_dumps(patch, timings):
+    patch.object(Timings, 'total', return_value=1)
+    result = json.loads(timings.dumps())
+    assert result['stories'] == json.loads(json.dumps(timings.results()))
+    assert result['total'] == 1000
+
+
+def test_timings_text(timings):
+    lines = timings.text().split('\n')
+    assert lines[0] == 'a.story'
+    assert lines[1] == '  read              1.00 ms     1 call'
+    assert lines[4] == '  parse             4.00 ms     2 calls'
+    assert lines[5] == '(shared)'
+    assert lines[-1] == 'Total              16.00 ms'
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+import tempfile
+import time
+
+from pytest import fixture, raises
+
+from storyscript.Bundle import Bundle
+from storyscript.Discovery import Discovery
+from storyscript.Watcher import Watcher
+from storyscript.exceptions import StoryError
+
+
+@fixture
+def watcher():
+    return Watcher('path', ignored_path='ignored', ebnf='ebnf')
+
+
+def test_watcher_init(patch):
+    patch.init(Bundle)
+    watcher = Watcher('path', ignored_path='ignored', ebnf='ebnf',
+                      cache='cache')
+    Bundle.__init__.assert_called_with(cache='cache')
+    assert watcher.path == 'path'
+    assert watcher.ignored_path == 'ignored'
+    assert watcher.ebnf == 'ebnf'
+    assert isinstance(watcher.bundle, Bundle)
+    assert watcher.entrypoint == []
+    assert watcher.snapshot == {}
+
+
+def test_watcher_find(patch, watcher):
+    patch.object(os.path, 'isdir')
+    patch.object(Discovery, 'find')
+    result = watcher.find()
+    Discovery.find.assert_called_with('path', ignored_path='ignored')
+    assert result == Discovery.find()
+
+
+def test_watcher_find_file(patch, watcher):
+    patch.object(os.path, 'isdir', return_value=False)
+    assert watcher.find() == ['path']
+
+
+def test_watcher_stat(patch, magic):
+    stat = magic(st_mtime_ns=1, st_size=2)
+    patch.object(os, 'stat', side_effect=[stat, FileNotFoundError])
+    result = Watcher.stat(['one.story', 'missing.story'])
+    assert result == {'one.story': (1, 2)}
+
+
+def test_watcher_update(patch, watcher):
+    patch.many(Watcher, ['find', 'stat'])
+    patch.object(Bundle, 'forget')
+    Watcher.find.return_value = ['one.story']
+    Watcher.stat.return_value = {'one.story': (2, 1), 'two.story': (1, 1)}
+    watcher.bundle.loaded = {'two.story': 'story'}
+    watcher.snapshot = {'one.story': (1, 1), 'two.story': (1, 1),
+                        'three.story': (1, 1)}
+    result = watcher.update()
+    Watcher.stat.assert_called_with(['one.story', 'two.story'])
+    assert result == ['one.story', 'three.story']
+    assert Bundle.forget.call_count == 2
+    assert watcher.entrypoint == ['one.story']
+    assert watcher.snapshot == Watcher.stat()
+
+
+def test_watcher_update_unchanged(patch, watcher):
+    patch.many(Watcher, ['find', 'stat'])
+    Watcher.stat.return_value = {}
+    assert watcher.update() == []
+
+
+def test_watcher_remember(patch, watcher):
+    patch.object(Watcher, 'stat', return_value={'two.story': (1, 1)})
+    watcher.bundle.loaded = {'one.story': 'story', 'two.story': 'story'}
+    watcher.snapshot = {'one.story': (1, 1)}
+    watcher.remember()
+    Watcher.stat.assert_called_with(['two.story'])
+    assert watcher.snapshot == {'one.story': (1, 1), 'two.story': (1, 1)}
+
+
+def test_watcher_compile(patch, watcher):
+    patch.object(Bundle, 'bundle')
+    patch.object(Watcher, 'remember')
+    patch.object(json, 'dumps')
+    watcher.entrypoint = ['one.story']
+    result = watcher.compile()
+    Bundle.bundle.assert_called_with(ebnf='ebnf', entrypoint=['one.story'])
+    assert Watcher.remember.call_count == 1
+    json.dumps.assert_called_with(Bundle.bundle(), indent=2)
+    assert result == json.dumps()
+
+
+def test_watcher_compile_error(patch, watcher):
+    """
+    Ensures the modules loaded before an error are remembered
+    """
+    patch.object(Bundle, 'bundle', side_effect=StoryError(None, None))
+    patch.object(Watcher, 'remember')
+    with raises(StoryError):
+        watcher.compile()
+    assert Watcher.remember.call_count == 1
+
+
+def test_watcher_write(patch):
+    patch.object(tempfile, 'mkstemp', return_value=(1, 'temporary'))
+    patch.object(io, 'open')
+    patch.object(os, 'replace')
+    Watcher.write('/dir/out.json', 'results')
+    tempfile.mkstemp.assert_called_with(dir='/dir')
+    io.open.assert_called_with(1, 'w')
+    io.open().__enter__().write.assert_called_with('results')
+    os.replace.assert_called_with('temporary', '/dir/out.json')
+
+
+def test_watcher_write_error(patch):
+    patch.object(tempfile, 'mkstemp', return_value=(1, 'temporary'))
+    patch.object(io, 'open', side_effect=OSError)
+    patch.many(os, ['replace', 'remove'])
+    with raises(OSError):
+        Watcher.write('out.json', 'results')
+    os.remove.assert_called_with('temporary')
+    assert os.replace.call_count == 0
+
+
+def test_watcher_watch(patch, watcher):
+    patch.many(Watcher, ['update', 'compile', 'write'])
+    patch.object(time, 'sleep')
+    results = watcher.watch(output='out.json', interval=2)
+    assert next(results) == Watcher.compile()
+    Watcher.write.assert_called_with('out.json', Watcher.compile())
+    next(results)
+    time.sleep.assert_called_with(2)
+
+
+def test_watcher_watch_unchanged(patch, watcher):
+    patch.many(Watcher, ['update', 'compile'])
+    Watcher.update.side_effect = [[], ['one.story']]
+    patch.object(time, 'sleep')
+    next(watcher.watch())
+    assert Watcher.compile.call_count == 1
+    assert time.sleep.call_count == 1
+
+
+def test_watcher_watch_error(patch, watcher):
+    error = StoryError(None, None)
+    patch.many(Watcher, ['update', 'write'])
+    patch.object(Watcher, 'compile', side_effect=error)
+    patch.object(time, 'sleep')
+    assert next(watcher.watch(output='out.json')) == error
+    assert Watcher.write.call_count == 0
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
+
+from pytest import fixture
+
+from storyscript.Story import Story
+from storyscript.Workers import Workers
+from storyscript.exceptions import StoryError
+
+
+@fixture
+def workers(patch):
+    patch.init(ProcessPoolExecutor)
+    return Workers(4, ebnf='ebnf')
+
+
+def test_workers_init(workers):
+    ProcessPoolExecutor.__init__.assert_called_with(max_workers=4)
+    assert workers.ebnf == 'ebnf'
+    assert isinstance(workers.executor, ProcessPoolExecutor)
+
+
+def test_workers_parse_source(patch):
+    patch.init(Story)
+    patch.object(Story, 'parse')
+    Story.tree = 'tree'
+    result = Workers.parse_source('source', 'ebnf')
+    Story.__init__.assert_called_with('source')
+    Story.parse.assert_called_with(ebnf='ebnf')
+    assert result == 'tree'
+    del Story.tree
+
+
+def test_workers_parse_source_error(patch):
+    patch.object(Story, 'parse', side_effect=StoryError(None, None))
+    assert Workers.parse_source('source', None) is None
+
+
+def test_workers_compile_source(patch):
+    patch.init(Story)
+    patch.object(Story, 'process')
+    result = Workers.compile_source('source', 'ebnf')
+    Story.__init__.assert_called_with('source')
+    Story.process.assert_called_with(ebnf='ebnf')
+    assert result == Story.process()
+
+
+def test_workers_compile_source_error(patch):
+    patch.object(Story, 'process', side_effect=StoryError(None, None))
+    assert Workers.compile_source('source', None) is None
+
+
+def test_workers_map(patch, workers):
+    patch.object(ProcessPoolExecutor, 'map', return_value=iter(['result']))
+    result = workers.map('function', ['source'])
+    ProcessPoolExecutor.map.assert_called_with('function', ['source'],
+                                               ['ebnf'])
+    assert result == ['result']
+
+
+def test_workers_parse(patch, workers):
+    patch.object(Workers, 'map')
+    result = workers.parse(['source'])
+    Workers.map.assert_called_with(Workers.parse_source, ['source'])
+    assert result == Workers.map()
+
+
+def test_workers_compile(patch, workers):
+    patch.object(Workers, 'map')
+    result = workers.compile(['source'])
+    Workers.map.assert_called_with(Workers.compile_source, ['source'])
+    assert result == Workers.map()
+
+
+def test_workers_context(patch, workers):
+    patch.object(ProcessPoolExecutor, 'shutdown')
+    with workers as context:
+        assert context == workers
+    assert ProcessPoolExecutor.shutdown.call_count == 1
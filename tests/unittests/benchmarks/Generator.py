@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from benchmarks.Generator import Generator
+
+from pytest import mark
+
+
+def test_generator_init():
+    generator = Generator(lines=1, depth=2)
+    assert generator.lines == 1
+    assert generator.depth == 2
+    assert generator.ladder == 0
+    assert generator.inline == 0
+    assert generator.services == 0
+    assert generator.imports == 0
+    assert generator.templates == 0
+
+
+def test_generator_indent():
+    assert Generator.indent(2, 'x = 0') == '        x = 0'
+
+
+def test_generator_assignments():
+    result = Generator(lines=3).assignments()
+    assert result == ['a0 = 0', 'a1 = a0 + 1 * 2', 'a2 = 2']
+
+
+def test_generator_nested():
+    result = Generator(depth=2).nested()
+    assert result == ['if n0 > 0', '    foreach items1 as item1',
+                      '        x = 0']
+
+
+def test_generator_nested_none():
+    assert Generator().nested() == []
+
+
+def test_generator_ladder_branches():
+    result = Generator(ladder=2).ladder_branches()
+    assert result == ['if colour == "colour0"', '    x = 0',
+                      'else if colour == "colour1"', '    x = 1', 'else',
+                      '    x = -1']
+
+
+def test_generator_inline_expressions():
+    result = Generator(inline=1).inline_expressions()
+    assert result == ['i0 = (alpine echo text:"0")']
+
+
+def test_generator_service_calls():
+    result = Generator(services=1).service_calls()
+    assert result == ['service0 run input:0 as output0']
+
+
+def test_generator_template_strings():
+    result = Generator(templates=1).template_strings()
+    assert result == ['name = "world"', 't0 = "hello {name} number 0"']
+
+
+def test_generator_modules():
+    assert Generator(imports=2).modules() == ['module0.story',
+                                              'module1.story']
+
+
+def test_generator_import_lines():
+    result = Generator(imports=1).import_lines()
+    assert result == ['import "module0" as module0']
+
+
+def test_generator_story():
+    assert Generator(lines=1, services=1).story() == (
+        'a0 = 0\nservice0 run input:0 as output0\n')
+
+
+def test_generator_files():
+    files = Generator(imports=1).files()
+    assert files['main.story'] == 'import "module0" as module0\n'
+    assert files['module0.story'] == 'm0 = 0\nalpine echo text:"0"\n'
+
+
+@mark.parametrize('axis', Generator.axes)
+def test_generator_scaled(axis):
+    generator = Generator.scaled(axis, 10)
+    assert getattr(generator, axis) == 10
+    if axis != 'lines':
+        assert generator.lines == 4
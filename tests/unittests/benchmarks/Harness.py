@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import time
+
+from benchmarks.Harness import Harness
+
+from pytest import fixture
+
+
+@fixture
+def harness():
+    return Harness(rounds=3, min_time=1)
+
+
+def test_harness_init():
+    harness = Harness()
+    assert harness.rounds == 5
+    assert harness.min_time == 0.1
+    assert harness.max_loops == 10000
+
+
+def test_harness_call(patch, magic):
+    patch.object(time, 'perf_counter', side_effect=[1, 3])
+    function = magic()
+    assert Harness.call(function) == 2
+    function.assert_called_with()
+
+
+def test_harness_call_setup(patch, magic):
+    """
+    Ensures the result of the setup is passed to the function
+    """
+    patch.object(time, 'perf_counter', side_effect=[1, 3])
+    function = magic()
+    setup = magic()
+    Harness.call(function, setup=setup)
+    function.assert_called_with(setup())
+
+
+def test_harness_round(patch, harness):
+    patch.object(Harness, 'call', side_effect=[1, 2, 3])
+    assert harness.round('function', 'setup', 3) == 2
+    Harness.call.assert_called_with('function', setup='setup')
+
+
+def test_harness_loops(patch, harness):
+    patch.object(Harness, 'call', return_value=0.1)
+    assert harness.loops('function', setup='setup') == 11
+    Harness.call.assert_called_with('function', setup='setup')
+
+
+def test_harness_loops_slow(patch, harness):
+    patch.object(Harness, 'call', return_value=2)
+    assert harness.loops('function') == 1
+
+
+def test_harness_loops_max(patch, harness):
+    patch.object(Harness, 'call', return_value=0)
+    assert harness.loops('function') == harness.max_loops
+
+
+def test_harness_measure(patch, harness):
+    patch.object(Harness, 'loops', return_value=10)
+    patch.object(Harness, 'round', side_effect=[3, 1, 2])
+    result = harness.measure('function', setup='setup')
+    Harness.loops.assert_called_with('function', setup='setup')
+    Harness.round.assert_called_with('function', 'setup', 10)
+    assert result == {'min': 1, 'median': 2, 'mean': 2, 'rounds': 3,
+                      'loops': 10}
+
+
+def test_harness_run(patch, magic, harness):
+    patch.object(Harness, 'measure')
+    benchmark = magic(return_value=('function', 'setup'))
+    result = list(harness.run([('parse', benchmark)]))
+    Harness.measure.assert_called_with('function', setup='setup')
+    assert result == [('parse', Harness.measure())]
+
+
+def test_harness_run_match(patch, magic, harness):
+    patch.object(Harness, 'measure')
+    benchmark = magic(return_value=('function', 'setup'))
+    benchmarks = [('parse.lines', benchmark), ('compile.lines', benchmark)]
+    result = list(harness.run(benchmarks, match='compile'))
+    assert [name for name, measure in result] == ['compile.lines']
+
+
+def test_harness_run_error(magic, harness):
+    """
+    Ensures benchmarks that fail are reported with their error
+    """
+    benchmark = magic(side_effect=ValueError('failed'))
+    result = list(harness.run([('parse', benchmark)]))
+    assert result == [('parse', {'error': 'ValueError: failed'})]
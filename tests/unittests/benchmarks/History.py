@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+import platform
+
+from benchmarks.History import History
+
+import lark
+
+from pytest import fixture
+
+from storyscript.Version import version
+
+
+@fixture
+def history(tmpdir):
+    return History(str(tmpdir.join('history.json')))
+
+
+@fixture
+def environment(patch):
+    patch.object(History, 'environment', return_value={'node': 'a'})
+    return History.environment()
+
+
+def make_run(environment, **results):
+    results = {name: {'min': time} for name, time in results.items()}
+    return {'environment': environment, 'results': results}
+
+
+def test_history_init():
+    assert History('path').path == 'path'
+
+
+def test_history_default_path():
+    assert History.default_path() == os.path.join('.benchmarks',
+                                                  'history.json')
+
+
+def test_history_environment():
+    result = History.environment()
+    assert result == {'node': platform.node(),
+                      'machine': platform.machine(),
+                      'python': platform.python_version()}
+
+
+def test_history_make_run(environment):
+    result = History.make_run('results')
+    assert result['storyscript'] == version
+    assert result['lark'] == lark.__version__
+    assert result['environment'] == environment
+    assert result['results'] == 'results'
+    assert 'date' in result
+
+
+def test_history_load(history):
+    with io.open(history.path, 'w') as f:
+        json.dump(['run'], f)
+    assert history.load() == ['run']
+
+
+def test_history_load_missing(history):
+    assert history.load() == []
+
+
+def test_history_load_invalid(history):
+    with io.open(history.path, 'w') as f:
+        f.write('{')
+    assert history.load() == []
+
+
+def test_history_save(tmpdir):
+    """
+    Ensures History.save adds runs and creates the directory
+    """
+    history = History(str(tmpdir.join('results', 'history.json')))
+    history.save('first')
+    history.save('second')
+    assert history.load() == ['first', 'second']
+    assert os.listdir(str(tmpdir.join('results'))) == ['history.json']
+
+
+def test_history_baseline(history, environment):
+    runs = [make_run(environment, parse=4), make_run(environment, parse=1),
+            make_run({'node': 'b'}, parse=10), make_run(environment),
+            make_run(environment, parse=2)]
+    assert history.baseline(runs, 'parse') == 2
+
+
+def test_history_baseline_size(history, environment):
+    """
+    Ensures only the last runs are used
+    """
+    runs = [make_run(environment, parse=10), make_run(environment, parse=1),
+            make_run(environment, parse=2)]
+    assert history.baseline(runs, 'parse', size=2) == 1.5
+
+
+def test_history_baseline_none(history, environment):
+    runs = [make_run({'node': 'b'}, parse=1)]
+    assert history.baseline(runs, 'parse') is None
+
+
+def test_history_regressions(patch, history):
+    patch.object(History, 'load')
+    patch.object(History, 'baseline', return_value=1)
+    results = {'parse': {'min': 1.3}, 'compile': {'min': 1.1},
+               'startup': {'error': 'error'}}
+    result = history.regressions(results, threshold=0.2)
+    History.baseline.assert_called_with(History.load(), 'startup')
+    assert result == [('parse', 1, 1.3)]
+
+
+def test_history_regressions_no_baseline(patch, history):
+    patch.object(History, 'baseline', return_value=None)
+    assert history.regressions({'parse': {'min': 10}}) == []
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+import copy
+import os
+import subprocess
+import sys
+
+from benchmarks.Generator import Generator
+from benchmarks.Suite import Suite
+
+from pytest import raises
+
+from storyscript.Bundle import Bundle
+from storyscript.compiler import Compiler
+from storyscript.parser import Parser
+
+
+def test_suite_parse(patch, magic):
+    patch.init(Parser)
+    patch.object(Parser, 'parse')
+    generator = magic()
+    function, setup = Suite.parse(generator)
+    function()
+    Parser.parse.assert_called_with(generator.story())
+    assert Parser.parse.call_count == 2
+    assert setup is None
+
+
+def test_suite_compile(patch, magic):
+    patch.init(Parser)
+    patch.object(Parser, 'parse')
+    patch.object(copy, 'deepcopy')
+    generator = magic()
+    function, setup = Suite.compile(generator)
+    result = setup()
+    copy.deepcopy.assert_called_with(Parser.parse())
+    assert result == copy.deepcopy()
+    assert function == Compiler.compile
+
+
+def test_suite_bundle(patch, magic):
+    patch.init(Bundle)
+    patch.object(Bundle, 'bundle')
+    generator = magic()
+    generator.files.return_value = {'main.story': 'x = 0'}
+    function, setup = Suite.bundle(generator)
+    bundle = setup()
+    Bundle.__init__.assert_called_with(story_files={'main.story': 'x = 0'})
+    function(bundle)
+    assert Bundle.bundle.call_count == 1
+
+
+def test_suite_run_python(patch):
+    patch.object(subprocess, 'run')
+    subprocess.run().returncode = 0
+    Suite.run_python('code')
+    subprocess.run.assert_called_with([sys.executable, '-c', 'code'],
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.PIPE)
+
+
+def test_suite_run_python_error(patch):
+    patch.object(subprocess, 'run')
+    subprocess.run().returncode = 1
+    subprocess.run().stderr = b'Traceback\nImportError: error\n'
+    with raises(RuntimeError) as e:
+        Suite.run_python('code')
+    assert str(e.value) == 'ImportError: error'
+
+
+def test_suite_start(patch):
+    patch.object(Suite, 'run_python')
+    function, setup = Suite.start('code')
+    function()
+    Suite.run_python.assert_called_with('code')
+    assert setup is None
+
+
+def test_suite_startup():
+    assert Suite.startup['version'].endswith("Cli.main(['--version'])")
+    assert Suite.startup['grammar'].endswith("Cli.main(['grammar'])")
+    code = "Cli.main(['compile', {!r}, '--no-cache'])".format(os.devnull)
+    assert Suite.startup['compile'].endswith(code)
+
+
+def test_suite_over_budget(patch):
+    patch.object(Suite, 'budgets', {'startup.version': 0.1,
+                                    'startup.grammar': 0.2})
+    results = {'startup.version': {'min': 0.15},
+               'startup.grammar': {'min': 0.1}}
+    assert Suite.over_budget(results) == [('startup.version', 0.1, 0.15)]
+
+
+def test_suite_over_budget_missing():
+    """
+    Ensures benchmarks that did not run or failed are not over budget
+    """
+    results = {'startup.version': {'error': 'error'}}
+    assert Suite.over_budget(results) == []
+
+
+def test_suite_benchmarks():
+    names = [name for name, benchmark in Suite.benchmarks()]
+    assert 'parse.lines.10' in names
+    assert 'compile.depth.50' in names
+    assert 'bundle.imports.50' in names
+    startup = ['startup.api', 'startup.cli', 'startup.version',
+               'startup.grammar', 'startup.compile']
+    assert names[-5:] == startup
+    assert len(names) == 3 * 7 * 3 + 5
+
+
+def test_suite_benchmarks_quick():
+    names = [name for name, benchmark in Suite.benchmarks(quick=True)]
+    assert 'parse.lines.10' in names
+    assert 'parse.lines.100' not in names
+
+
+def test_suite_benchmark(patch, magic):
+    function = magic()
+    benchmark = Suite.benchmark(function, Generator())
+    assert benchmark() == function()
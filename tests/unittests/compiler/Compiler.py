@@ -3,6 +3,7 @@ from lark.lexer import Token
 
 from pytest import fixture, mark, raises
 
+from storyscript.Profiler import Profiler
 from storyscript.Version import version
 from storyscript.compiler import Compiler, Lines, Objects, Preprocessor
 from storyscript.exceptions import CompilerError, StorySyntaxError
@@ -26,6 +27,7 @@ def test_compiler_init(patch):
     patch.init(Lines)
     compiler = Compiler()
     assert isinstance(compiler.lines, Lines)
+    assert compiler.scheduled is None
 
 
 def test_compiler_output(tree):
@@ -317,32 +319,48 @@ def test_compiler_return_statement_error(patch, compiler, tree):
 def test_compiler_if_block(patch, compiler, lines, tree):
     patch.object(Objects, 'assertion')
     patch.object(Compiler, 'subtree')
-    tree.elseif_block = None
-    tree.else_block = None
+    tree.children = []
     compiler.if_block(tree, '1')
     Objects.assertion.assert_called_with(tree.if_statement)
     nested_block = tree.nested_block
     args = Objects.assertion()
     lines.set_scope.assert_called_with(tree.line(), '1')
+    lines.enter_branch.assert_called_with(tree.line())
     lines.append.assert_called_with('if', tree.line(), args=args,
                                     enter=nested_block.line(), parent='1')
     compiler.subtree.assert_called_with(nested_block, parent=tree.line())
+    assert lines.exit_branch.call_count == 1
 
 
 def test_compiler_if_block_with_elseif(patch, compiler, tree):
     patch.object(Objects, 'assertion')
     patch.many(Compiler, ['subtree', 'subtrees'])
-    tree.else_block = None
+    elseif_block = Tree('elseif_block', [])
+    tree.children = [Tree('if_statement', []), elseif_block]
     compiler.if_block(tree, '1')
-    compiler.subtrees.assert_called_with(tree.elseif_block)
+    compiler.subtrees.assert_called_with(elseif_block)
+
+
+def test_compiler_if_block_with_elseif_ladder(patch, compiler, tree):
+    """
+    Ensures that every elseif block of an if block is compiled
+    """
+    patch.object(Objects, 'assertion')
+    patch.many(Compiler, ['subtree', 'subtrees'])
+    blocks = [Tree('elseif_block', ['1']), Tree('elseif_block', ['2']),
+              Tree('else_block', [])]
+    tree.children = [Tree('if_statement', []), 'token'] + blocks
+    compiler.if_block(tree, '1')
+    compiler.subtrees.assert_called_with(*blocks)
 
 
 def test_compiler_if_block_with_else(patch, compiler, tree):
     patch.object(Objects, 'assertion')
     patch.many(Compiler, ['subtree', 'subtrees'])
-    tree.elseif_block = None
+    else_block = Tree('else_block', [])
+    tree.children = [Tree('if_statement', []), else_block]
     compiler.if_block(tree, '1')
-    compiler.subtrees.assert_called_with(tree.else_block)
+    compiler.subtrees.assert_called_with(else_block)
 
 
 def test_compiler_elseif_block(patch, compiler, lines, tree):
@@ -537,22 +555,24 @@ def test_compiler_try_block(patch, compiler, lines, tree):
     compiler.try_block(tree, '1')
     kwargs = {'enter': tree.nested_block.line(), 'parent': '1'}
     lines.set_scope.assert_called_with(tree.line(), '1')
+    lines.enter_branch.assert_called_with(tree.line())
     lines.append.assert_called_with('try', tree.line(), **kwargs)
     Compiler.subtree.assert_called_with(tree.nested_block, parent=tree.line())
+    assert lines.exit_branch.call_count == 1
 
 
 def test_compiler_try_block_catch(patch, compiler, lines, tree):
-    patch.many(Compiler, ['subtree', 'catch_block'])
+    patch.object(Compiler, 'subtree')
     tree.finally_block = None
     compiler.try_block(tree, '1')
-    Compiler.catch_block.assert_called_with(tree.catch_block, parent='1')
+    Compiler.subtree.assert_called_with(tree.catch_block, parent='1')
 
 
 def test_compiler_try_block_finally(patch, compiler, lines, tree):
-    patch.many(Compiler, ['subtree', 'finally_block'])
+    patch.object(Compiler, 'subtree')
     tree.catch_block = None
     compiler.try_block(tree, '1')
-    Compiler.finally_block.assert_called_with(tree.finally_block, parent='1')
+    Compiler.subtree.assert_called_with(tree.finally_block, parent='1')
 
 
 def test_compiler_catch_block(patch, compiler, lines, tree):
@@ -587,8 +607,9 @@ def test_compiler_finally_block(patch, compiler, lines, tree):
 @mark.parametrize('method_name', [
     'service_block', 'absolute_expression', 'assignment', 'if_block',
     'elseif_block', 'else_block', 'foreach_block', 'function_block',
-    'when_block', 'try_block', 'return_statement', 'arguments', 'imports',
-    'mutation_block', 'indented_chain'
+    'when_block', 'try_block', 'catch_block', 'finally_block',
+    'return_statement', 'arguments', 'imports', 'mutation_block',
+    'indented_chain'
 ])
 def test_compiler_subtree(patch, compiler, method_name):
     patch.object(Compiler, method_name)
@@ -605,6 +626,58 @@ def test_compiler_subtree_parent(patch, compiler):
     compiler.assignment.assert_called_with(tree, '1')
 
 
+def test_compiler_subtree_schedule(patch, compiler, tree):
+    patch.object(Compiler, 'schedule')
+    compiler.subtree(tree, parent='1')
+    Compiler.schedule.assert_called_with(compiler.dispatch, tree, '1')
+
+
+def test_compiler_dispatch(patch, compiler):
+    patch.object(Compiler, 'parse_tree')
+    tree = Tree('block', [])
+    compiler.dispatch(tree, '1')
+    Compiler.parse_tree.assert_called_with(tree, parent='1')
+
+
+def test_compiler_walk(compiler):
+    """
+    Ensures Compiler.walk does the work scheduled by a function depth first
+    and in order, after the function
+    """
+    done = []
+
+    def work(name, *scheduled):
+        done.append(name)
+        for item in scheduled:
+            compiler.schedule(work, *item)
+
+    compiler.walk(work, 'a', ('b', ('c',)), ('d',))
+    assert done == ['a', 'b', 'c', 'd']
+    assert compiler.scheduled is None
+
+
+def test_compiler_walk_error(magic, compiler):
+    function = magic(side_effect=ValueError)
+    with raises(ValueError):
+        compiler.walk(function)
+    assert compiler.scheduled is None
+
+
+def test_compiler_schedule(magic, compiler):
+    compiler.scheduled = []
+    compiler.schedule('function', 'tree')
+    assert compiler.scheduled == [('function', ('tree',))]
+
+
+def test_compiler_schedule_now(patch, compiler):
+    """
+    Ensures work scheduled outside of a walk is done at once
+    """
+    patch.object(Compiler, 'walk')
+    compiler.schedule('function', 'tree')
+    Compiler.walk.assert_called_with('function', 'tree')
+
+
 def test_compiler_subtrees(patch, compiler, tree):
     patch.object(Compiler, 'subtree', return_value={'tree': 'sub'})
     compiler.subtrees(tree, tree)
@@ -646,3 +719,15 @@ def test_compiler_compile(patch):
                 'services': lines.get_services(), 'functions': lines.functions,
                 'entrypoint': lines.first(), 'modules': lines.modules}
     assert result == expected
+
+
+def test_compiler_compile_phases(patch):
+    """
+    Ensures Compiler.compile measures preprocessing and compiling
+    """
+    patch.object(Preprocessor, 'process')
+    patch.many(Compiler, ['parse_tree', 'compiler'])
+    patch.object(Profiler, 'phase')
+    Compiler.compile('tree')
+    phases = [call[0][0] for call in Profiler.phase.call_args_list]
+    assert phases == ['preprocess', 'compile']
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
-import random
-import uuid
+import itertools
 
 from lark.lexer import Token
 
@@ -17,30 +16,46 @@ def fake_tree(block):
 
 def test_faketree_init(block, fake_tree):
     assert fake_tree.block == block
-    assert fake_tree.original_line == block.line()
+    assert fake_tree.original_line == block.position('line')
     assert fake_tree.new_lines == []
+    assert next(fake_tree.names) == 0
 
 
-def test_faketree_line(patch, fake_tree):
+def test_faketree_init_names(block):
+    names = itertools.count()
+    assert FakeTree(block, names=names).names == names
+
+
+def test_faketree_line(fake_tree):
     """
     Ensures FakeTree.line can create a fake line number
     """
-    patch.object(random, 'uniform')
-    fake_tree.original_line = '1.2'
+    fake_tree.original_line = 12
     result = fake_tree.line()
-    random.uniform.assert_called_with(1.2 - 1, 1.2)
-    assert fake_tree.new_lines == [random.uniform()]
-    assert result == str(random.uniform())
+    assert result == '11.1'
+    assert fake_tree.new_lines == ['11.1']
 
 
-def test_faketree_line_successive(patch, fake_tree):
+def test_faketree_line_successive(fake_tree):
     """
     Ensures FakeTree.line takes into account FakeTree.new_lines
     """
-    patch.object(random, 'uniform')
-    fake_tree.new_lines = [0.2]
-    fake_tree.line()
-    random.uniform.assert_called_with(0.2, 1)
+    fake_tree.original_line = 12
+    fake_tree.new_lines = ['11.1']
+    assert fake_tree.line() == '11.2'
+
+
+def test_faketree_line_ordered(fake_tree):
+    """
+    Ensures fake lines are always increasing and before the block
+    """
+    fake_tree.original_line = 12
+    lines = [fake_tree.line() for _ in range(30)]
+    assert lines[8:11] == ['11.9', '11.91', '11.92']
+    assert lines[18] == '11.991'
+    numbers = [float(line) for line in lines]
+    assert numbers == sorted(set(numbers))
+    assert 11 < numbers[0] and numbers[-1] < 12
 
 
 def test_faketree_get_line(patch, tree, fake_tree):
@@ -56,17 +71,21 @@ def test_faketree_get_line_existing(tree, fake_tree):
     """
     Ensures FakeTree.get_line gets the existing line when appropriate.
     """
-    fake_tree.new_lines = [0.1]
+    fake_tree.new_lines = ['0.1']
     tree.line.return_value = '0.1'
     assert fake_tree.get_line(tree) == tree.line()
 
 
 def test_faketree_path(patch, fake_tree):
-    patch.object(uuid, 'uuid4')
     patch.object(FakeTree, 'line')
     result = fake_tree.path()
-    name = '${}'.format(uuid.uuid4().hex[:8])
-    assert result == Tree('path', [Token('NAME', name, line=FakeTree.line())])
+    assert result == Tree('path', [Token('NAME', '$0', line=FakeTree.line())])
+
+
+def test_faketree_path_successive(patch, fake_tree):
+    patch.object(FakeTree, 'line')
+    fake_tree.path()
+    assert fake_tree.path().child(0).value == '$1'
 
 
 def test_faketree_path_name(patch, fake_tree):
@@ -85,7 +104,7 @@ def test_faketree_assignment(patch, tree, fake_tree):
     FakeTree.get_line.assert_called_with(tree)
     line = FakeTree.get_line()
     FakeTree.path.assert_called_with(line=line)
-    assert tree.child().child().line == line
+    tree.set_line.assert_called_with(line)
     assert result.children[0] == FakeTree.path()
     subtree = [Token('EQUALS', '=', line=line), tree]
     expected = Tree('assignment_fragment', subtree)
@@ -94,15 +113,28 @@ def test_faketree_assignment(patch, tree, fake_tree):
 
 def test_faketree_add_assignment(patch, fake_tree, block):
     patch.object(FakeTree, 'assignment')
-    block.child.return_value = None
+    block.children = ['statement']
     result = fake_tree.add_assignment('value')
     FakeTree.assignment.assert_called_with('value')
-    assert block.children == [FakeTree.assignment(), block.child()]
+    assert block.children == [FakeTree.assignment(), 'statement']
     assert result == FakeTree.assignment()
 
 
 def test_faketree_add_assignment_more_children(patch, fake_tree, block):
     patch.object(FakeTree, 'assignment')
+    block.children = ['first', 'last']
     fake_tree.add_assignment('value')
-    expected = [block.child(), FakeTree.assignment(), block.child()]
+    expected = ['first', FakeTree.assignment(), 'last']
     assert block.children == expected
+
+
+def test_faketree_add_assignment_many(patch, fake_tree, block):
+    """
+    Ensures fake assignments are added after the previous ones, keeping the
+    statement of the block.
+    """
+    patch.object(FakeTree, 'assignment', side_effect=['one', 'two', 'three'])
+    block.children = ['statement']
+    for value in range(3):
+        fake_tree.add_assignment(value)
+    assert block.children == ['one', 'two', 'three', 'statement']
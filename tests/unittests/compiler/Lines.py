@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from pytest import fixture, mark, raises
 
-from storyscript.compiler import Lines
+from storyscript.compiler import Lines, Symbols
 from storyscript.exceptions import StorySyntaxError
 
 
@@ -12,7 +12,10 @@ def lines():
 
 def test_lines_init(lines):
     assert lines.lines == {}
-    assert lines.variables == []
+    assert lines.ordered == []
+    assert lines.numbers == []
+    assert lines.branches == []
+    assert isinstance(lines.variables, Symbols)
     assert lines.services == []
     assert lines.functions == {}
     assert lines.output_scopes == {}
@@ -20,24 +23,39 @@ def test_lines_init(lines):
 
 
 def test_lines_sort(lines):
-    lines.lines = {'1': '1', '2': '2', '2.1': '2'}
+    lines.ordered = ['1', '2', '2.1']
     assert lines.sort() == ['1', '2', '2.1']
 
 
-def test_lines_first(patch, lines):
-    patch.object(Lines, 'sort')
-    lines.lines = {'1': '1'}
-    assert lines.first() == lines.sort()[0]
+def test_lines_add(lines):
+    lines.add('1')
+    lines.add('2')
+    assert lines.ordered == ['1', '2']
+    assert lines.numbers == [1.0, 2.0]
+
+
+def test_lines_add_before(lines):
+    """
+    Ensures that lines added out of order are kept in order
+    """
+    for line in ['1', '3', '2.5', '10', '2.25']:
+        lines.add(line)
+    assert lines.ordered == ['1', '2.25', '2.5', '3', '10']
+    assert lines.numbers == sorted(lines.numbers)
+
+
+def test_lines_first(lines):
+    lines.ordered = ['1', '2']
+    assert lines.first() == '1'
 
 
 def test_lines_first_none(lines):
     assert lines.first() is None
 
 
-def test_lines_last(patch, lines):
-    patch.object(Lines, 'sort')
-    lines.lines = {'1': '1'}
-    assert lines.last() == lines.sort()[-1]
+def test_lines_last(lines):
+    lines.ordered = ['1', '2']
+    assert lines.last() == '2'
 
 
 def test_lines_last_no_lines(lines):
@@ -58,42 +76,91 @@ def test_lines_set_next(patch, lines):
     assert lines.lines['1']['next'] == '2'
 
 
-@mark.parametrize('method', ['if', 'elif', 'try', 'catch'])
-def test_lines_set_exit(patch, lines, method):
-    patch.object(Lines, 'sort', return_value=['1', '2'])
-    lines.lines = {'1': {}, '2': {'method': method}}
+def test_lines_enter_branch(lines):
+    lines.enter_branch('1')
+    assert lines.branches == ['1']
+
+
+def test_lines_set_exit(lines):
+    lines.lines = {'1': {}, '2': {}}
+    lines.branches = ['1']
+    lines.set_exit('2')
+    assert lines.lines['1']['exit'] == '2'
+    assert lines.branches == ['2']
+
+
+def test_lines_set_exit_nested(lines):
+    """
+    Ensures that the exit is set on the innermost open construct
+    """
+    lines.lines = {'1': {}, '2': {}}
+    lines.branches = ['1', '2']
     lines.set_exit('3')
-    assert lines.sort.call_count == 1
     assert lines.lines['2']['exit'] == '3'
+    assert lines.lines['1'] == {}
+
+
+def test_lines_set_exit_no_branches(lines):
+    lines.set_exit('1')
+    assert lines.lines == {}
+
+
+def test_lines_exit_branch(lines):
+    lines.branches = ['1', '2']
+    lines.exit_branch()
+    assert lines.branches == ['1']
 
 
 def test_lines_set_scope(lines):
     lines.set_scope('2', '1')
-    assert lines.output_scopes['2'] == {'parent': '1', 'output': []}
+    assert lines.output_scopes['2'] == frozenset()
 
 
 def test_lines_set_scope_output(lines):
     lines.set_scope('2', '1', output=['x'])
-    assert lines.output_scopes['2']['output'] == ['x']
+    assert lines.output_scopes['2'] == frozenset(['x'])
+
+
+def test_lines_set_scope_parent(lines):
+    """
+    Ensures that the outputs of the parent scope are visible in a scope
+    """
+    lines.output_scopes = {'1': frozenset(['x'])}
+    lines.set_scope('2', '1', output=['y'])
+    assert lines.output_scopes['2'] == frozenset(['x', 'y'])
+    assert lines.output_scopes['1'] == frozenset(['x'])
 
 
 def test_lines_is_output(lines):
-    lines.output_scopes = {'1': {'parent': None, 'output': ['service']}}
+    lines.output_scopes = {'1': frozenset(['service'])}
     assert lines.is_output('1', 'service') is True
 
 
 def test_lines_is_output_from_parent(lines):
-    lines.output_scopes = {
-        '2': {'parent': '1', 'output': []},
-        '1': {'output': ['service']}
-    }
+    lines.set_scope('1', None, output=['service'])
+    lines.set_scope('2', '1')
     assert lines.is_output('2', 'service') is True
 
 
+def test_lines_is_output_nested(lines):
+    """
+    Ensures that deeply nested scopes don't reach the recursion limit
+    """
+    lines.set_scope('0', None, output=['service'])
+    for line in range(1, 5000):
+        lines.set_scope(str(line), str(line - 1))
+    assert lines.is_output('4999', 'service') is True
+
+
 def test_lines_is_output_false(lines):
     assert lines.is_output('1', 'service') is False
 
 
+def test_lines_is_output_other(lines):
+    lines.output_scopes = {'1': frozenset(['service'])}
+    assert lines.is_output('1', 'other') is False
+
+
 def test_lines_make(lines):
     expected = {'1': {'method': 'method', 'ln': '1', 'output': None,
                       'name': None,
@@ -102,6 +169,18 @@ def test_lines_make(lines):
                       'parent': None}}
     lines.make('method', '1')
     assert lines.lines == expected
+    assert lines.ordered == ['1']
+
+
+def test_lines_make_existing(patch, lines):
+    """
+    Ensures that a line made again replaces the existing one
+    """
+    patch.object(Lines, 'add')
+    lines.lines = {'1': {}}
+    lines.make('method', '1')
+    assert Lines.add.call_count == 0
+    assert lines.lines['1']['method'] == 'method'
 
 
 @mark.parametrize('keywords', ['service', 'command', 'function', 'output',
@@ -153,8 +232,9 @@ def test_lines_append_set(patch, lines):
     Ensures that a variable is registered properly
     """
     patch.many(Lines, ['make', 'set_next'])
-    lines.append('set', 'line', name=['name'])
-    assert lines.variables[-1] == ['name']
+    lines.append('set', 'line', name=['name'], parent='1')
+    assert lines.variables.get(['name'])['line'] == 'line'
+    assert lines.variables.get(['name'])['parent'] == '1'
 
 
 def test_compiler_append_service(patch, lines):
@@ -205,3 +285,8 @@ def test_lines_execute(patch, lines):
 def test_compiler_get_services(lines):
     lines.services = ['one', 'one']
     assert lines.get_services() == ['one']
+
+
+def test_compiler_get_services_order(lines):
+    lines.services = ['two', 'one', 'two', 'three']
+    assert lines.get_services() == ['two', 'one', 'three']
@@ -398,39 +398,65 @@ def test_objects_resolve_operand_factor(patch, tree):
     assert result == Objects.entity()
 
 
-def test_objects_expression_values(patch):
-    patch.object(Objects, 'resolve_operand')
+def test_objects_operands():
     tree = Tree('test', [])
-    result = Objects.expression_values([tree, 'not_a_tree'])
-    Objects.resolve_operand.assert_called_with(tree)
-    assert result == [Objects.resolve_operand()]
+    tree.children = [tree, 'not_a_tree']
+    assert Objects.operands(tree) == [tree]
+
+
+def test_objects_operands_one_child():
+    """
+    Ensures Objects.operands finds the operands of an expression with one
+    child tree
+    """
+    operand = Tree('operand', [])
+    tree = Tree('test', [Tree('child', [operand, 'token', operand])])
+    assert Objects.operands(tree) == [operand, operand]
+
+
+def test_objects_operand_nested(tree):
+    tree.children = [1, 2]
+    assert Objects.operand(tree) == (tree, None)
+
+
+def test_objects_operand_value(patch, tree):
+    patch.object(Objects, 'number')
+    tree.data = 'number'
+    assert Objects.operand(tree) == (None, Objects.number())
 
 
 def test_objects_expression(patch, tree):
     """
     Ensures Objects.expression can compile expressions
     """
-    patch.many(Objects, ['expression_type', 'expression_values'])
-    tree.number = None
+    patch.many(Objects, ['expression_type', 'operands', 'operand'])
+    Objects.operands.return_value = ['one', 'two']
+    Objects.operand.return_value = (None, 'value')
     result = Objects.expression(tree)
-    Objects.expression_values.assert_called_with(tree.children)
+    Objects.operands.assert_called_with(tree)
+    Objects.operand.assert_called_with('two')
     Objects.expression_type.assert_called_with(tree.find_operator(), tree)
-    expected = {'$OBJECT': 'expression',
-                'values': Objects.expression_values(),
+    expected = {'$OBJECT': 'expression', 'values': ['value', 'value'],
                 'expression': Objects.expression_type()}
     assert result == expected
 
 
-def test_objects_expression_one_child(patch, tree):
+def test_objects_expression_nested(patch, magic, tree):
     """
-    Ensures Objects.expression can compile expressions with one child tree
+    Ensures Objects.expression compiles nested expressions in place
     """
-    patch.many(Objects, ['expression_type', 'expression_values'])
-    tree.number = None
-    tree.children = [1]
-    Objects.expression(tree)
-    Objects.expression_values.assert_called_with(tree.child().children)
-    Objects.expression_type.assert_called_with(tree.find_operator(), tree)
+    patch.many(Objects, ['expression_type', 'operands', 'operand'])
+    nested = magic()
+    operands = {tree: ['one', 'two'], nested: ['three']}
+    Objects.operands.side_effect = lambda item: operands[item]
+    values = {'one': (nested, None), 'two': (None, 2), 'three': (None, 3)}
+    Objects.operand.side_effect = lambda item: values[item]
+    Objects.expression_type.side_effect = lambda operator, item: item
+    result = Objects.expression(tree)
+    expected = {'$OBJECT': 'expression', 'expression': tree,
+                'values': [{'$OBJECT': 'expression', 'expression': nested,
+                            'values': [3]}, 2]}
+    assert result == expected
 
 
 def test_objects_assertion(patch, tree):
@@ -1,19 +1,22 @@
 # -*- coding: utf-8 -*-
+import itertools
+from unittest.mock import call
+
 from pytest import fixture
 
 from storyscript.compiler import FakeTree, Preprocessor
+from storyscript.parser import Tree
 
 
 @fixture
-def fake_tree(patch):
-    patch.object(Preprocessor, 'fake_tree')
-    return Preprocessor.fake_tree
+def fake_tree(magic):
+    return magic()
 
 
 def test_preprocessor_fake_tree(patch):
     patch.init(FakeTree)
-    result = Preprocessor.fake_tree('block')
-    FakeTree.__init__.assert_called_with('block')
+    result = Preprocessor.fake_tree('block', 'names')
+    FakeTree.__init__.assert_called_with('block', names='names')
     assert isinstance(result, FakeTree)
 
 
@@ -36,117 +39,159 @@ def test_preprocessor_replace_expression_argument(magic, tree):
     parent.entity.path.replace.assert_called_with(0, assignment)
 
 
-def test_preprocessor_replace_in_entity(magic, tree, block, fake_tree):
+def test_preprocessor_replace_in_entity(patch, magic, tree, fake_tree):
+    patch.object(Preprocessor, 'service_arguments')
     path_value = magic()
-    Preprocessor.replace_in_entity(block, tree, path_value)
-    fake_tree.assert_called_with(block)
+    Preprocessor.replace_in_entity(fake_tree, tree, path_value)
     service = path_value.path.inline_expression.service
-    fake_tree().add_assignment.assert_called_with(service)
-    path_value.replace.assert_called_with(0, fake_tree().add_assignment().path)
-    assert path_value.path.children[0].line == tree.line()
+    Preprocessor.service_arguments.assert_called_with(fake_tree, service)
+    fake_tree.add_assignment.assert_called_with(service)
+    path_value.replace.assert_called_with(0, fake_tree.add_assignment().path)
+    path_value.path.set_line.assert_called_with(tree.line())
+
+
+def test_preprocessor_inline_arguments(magic):
+    argument = Tree('arguments', [])
+    argument.node = magic()
+    fragment = Tree('service_fragment', ['command', argument])
+    service = Tree('service', ['path', fragment])
+    assert Preprocessor.inline_arguments(service) == [argument]
+    argument.node.assert_called_with('entity.path.inline_expression')
+
+
+def test_preprocessor_inline_arguments_no_expression(magic):
+    argument = Tree('arguments', [])
+    argument.node = magic(return_value=None)
+    service = Tree('service', [Tree('service_fragment', [argument])])
+    assert Preprocessor.inline_arguments(service) == []
+
+
+def test_preprocessor_inline_arguments_no_fragment():
+    service = Tree('service', [Tree('path', [])])
+    assert Preprocessor.inline_arguments(service) == []
 
 
-def test_preprocessor_service_arguments(patch, magic, tree, fake_tree):
+def test_preprocessor_service_arguments(patch, magic, fake_tree):
     patch.object(Preprocessor, 'replace_expression')
     argument = magic()
-    tree.find_data.return_value = [argument]
-    Preprocessor.service_arguments('block', tree)
-    fake_tree.assert_called_with('block')
-    tree.find_data.assert_called_with('arguments')
+    patch.object(Preprocessor, 'inline_arguments',
+                 side_effect=[[argument], []])
+    Preprocessor.service_arguments(fake_tree, 'service')
     argument.node.assert_called_with('entity.path.inline_expression')
-    args = (fake_tree(), argument, argument.node())
+    expression = argument.node()
+    calls = [call('service'), call(expression.service)]
+    assert Preprocessor.inline_arguments.call_args_list == calls
+    args = (fake_tree, argument, expression)
     Preprocessor.replace_expression.assert_called_with(*args)
 
 
-def test_preprocessor_service_arguments_no_expression(patch, magic, tree):
-    patch.many(Preprocessor, ['fake_tree', 'replace_expression'])
-    argument = magic(inline_expression=None)
-    tree.service_fragment.find_data.return_value = [argument]
-    Preprocessor.service_arguments(magic(), tree)
+def test_preprocessor_service_arguments_none(patch, fake_tree):
+    patch.object(Preprocessor, 'replace_expression')
+    patch.object(Preprocessor, 'inline_arguments', return_value=[])
+    Preprocessor.service_arguments(fake_tree, 'service')
     assert Preprocessor.replace_expression.call_count == 0
 
 
-def test_preprocessor_assignment_expression(patch, magic, tree, fake_tree):
+def test_preprocessor_service_arguments_nested(patch, magic, fake_tree):
+    """
+    Ensures nested inline expressions are replaced before the ones
+    containing them, and arguments in their order.
+    """
     patch.object(Preprocessor, 'replace_expression')
-    block = magic()
-    Preprocessor.assignment_expression(block, tree)
-    fake_tree.assert_called_with(block)
-    parent = block.rules.assignment.assignment_fragment
-    args = (fake_tree(), parent, tree.inline_expression)
+    first = magic()
+    nested = magic()
+    last = magic()
+    patch.object(Preprocessor, 'inline_arguments',
+                 side_effect=[[first, last], [nested], [], []])
+    Preprocessor.service_arguments(fake_tree, 'service')
+    arguments = [args[1] for args, kwargs in
+                 Preprocessor.replace_expression.call_args_list]
+    assert arguments == [nested, first, last]
+
+
+def test_preprocessor_assignment_expression(patch, magic, tree, fake_tree):
+    patch.many(Preprocessor, ['replace_expression', 'service_arguments'])
+    Preprocessor.assignment_expression(fake_tree, tree)
+    service = tree.inline_expression.service
+    Preprocessor.service_arguments.assert_called_with(fake_tree, service)
+    parent = fake_tree.block.rules.assignment.assignment_fragment
+    args = (fake_tree, parent, tree.inline_expression)
     Preprocessor.replace_expression.assert_called_with(*args)
 
 
-def test_preprocessor_assignments(patch, magic, tree):
+def test_preprocessor_assignment(patch, fake_tree):
     """
-    Ensures Preprocessor.assignments can process lines like
+    Ensures Preprocessor.assignment can process lines like
     a = alpine echo text:(random value)
     """
     patch.object(Preprocessor, 'service_arguments')
-    assignment = magic()
-    tree.find_data.return_value = [assignment]
-    Preprocessor.assignments(tree)
-    args = (tree, assignment.assignment_fragment.service)
+    Preprocessor.assignment(fake_tree)
+    fragment = fake_tree.block.rules.assignment.assignment_fragment
+    args = (fake_tree, fragment.service)
     Preprocessor.service_arguments.assert_called_with(*args)
 
 
-def test_preprocessor_assignments_to_expression(patch, magic, tree):
+def test_preprocessor_assignment_to_expression(patch, fake_tree):
     """
-    Ensures Preprocessor.assignments can process lines like
+    Ensures Preprocessor.assignment can process lines like
     a = (alpine echo message:'text')
     """
     patch.object(Preprocessor, 'assignment_expression')
-    assignment = magic()
-    assignment.assignment_fragment.service = None
-    tree.find_data.return_value = [assignment]
-    Preprocessor.assignments(tree)
-    fragment = assignment.assignment_fragment
+    fragment = fake_tree.block.rules.assignment.assignment_fragment
+    fragment.service = None
+    Preprocessor.assignment(fake_tree)
     factor = fragment.expression.multiplication.exponential.factor
-    args = (tree, factor.entity.path)
+    args = (fake_tree, factor.entity.path)
     Preprocessor.assignment_expression.assert_called_with(*args)
 
 
-def test_preprocessor_assignments_no_expression(patch, magic, tree):
+def test_preprocessor_assignment_no_expression(patch, fake_tree):
     patch.object(Preprocessor, 'assignment_expression')
-    assignment = magic()
-    assignment.assignment_fragment.service = None
-    fragment = assignment.assignment_fragment
+    fragment = fake_tree.block.rules.assignment.assignment_fragment
+    fragment.service = None
     factor = fragment.expression.multiplication.exponential.factor
     factor.entity.path.inline_expression = None
-    tree.find_data.return_value = [assignment]
-    Preprocessor.assignments(tree)
+    Preprocessor.assignment(fake_tree)
+    assert Preprocessor.assignment_expression.call_count == 0
+
+
+def test_preprocessor_assignment_no_assignment(patch, fake_tree):
+    patch.many(Preprocessor, ['service_arguments', 'assignment_expression'])
+    fake_tree.block.rules = None
+    Preprocessor.assignment(fake_tree)
+    assert Preprocessor.service_arguments.call_count == 0
     assert Preprocessor.assignment_expression.call_count == 0
 
 
-def test_preprocessor_service(patch, magic, tree):
+def test_preprocessor_service(patch, fake_tree):
     patch.object(Preprocessor, 'service_arguments')
-    Preprocessor.service(tree)
-    tree.node.assert_called_with('service_block.service')
-    Preprocessor.service_arguments.assert_called_with(tree, tree.node())
+    Preprocessor.service(fake_tree)
+    fake_tree.block.node.assert_called_with('service_block.service')
+    args = (fake_tree, fake_tree.block.node())
+    Preprocessor.service_arguments.assert_called_with(*args)
 
 
-def test_preprocessor_service_no_service(patch, magic, tree):
+def test_preprocessor_service_no_service(patch, fake_tree):
     patch.object(Preprocessor, 'service_arguments')
-    tree.node.return_value = None
-    Preprocessor.service(tree)
+    fake_tree.block.node.return_value = None
+    Preprocessor.service(fake_tree)
     assert Preprocessor.service_arguments.call_count == 0
 
 
-def test_preprocessor_flow_statement(patch, magic, tree):
+def test_preprocessor_flow_statement(patch, magic, fake_tree):
     """
     Ensures flow_statement replaces inline expressions inside if statements
     """
     patch.object(Preprocessor, 'replace_in_entity')
     statement = magic()
     statement.child.return_value = None
-    tree.find_data.return_value = [statement]
-    Preprocessor.flow_statement('statement', tree)
-    tree.find_data.assert_called_with('statement')
+    Preprocessor.flow_statement(fake_tree, statement)
     statement.node.assert_called_with('entity.path.inline_expression')
-    args = (tree, statement, statement.entity)
+    args = (fake_tree, statement, statement.entity)
     Preprocessor.replace_in_entity.assert_called_with(*args)
 
 
-def test_preprocessor_flow_statement_rhs(patch, magic, tree):
+def test_preprocessor_flow_statement_rhs(patch, magic, fake_tree):
     """
     Ensures flow_statement replaces inline expressions on the right hand-side
     of statements
@@ -154,13 +199,12 @@ def test_preprocessor_flow_statement_rhs(patch, magic, tree):
     patch.object(Preprocessor, 'replace_in_entity')
     statement = magic()
     statement.node.return_value = None
-    tree.find_data.return_value = [statement]
-    Preprocessor.flow_statement('statement', tree)
-    args = (tree, statement, statement.child())
+    Preprocessor.flow_statement(fake_tree, statement)
+    args = (fake_tree, statement, statement.child())
     Preprocessor.replace_in_entity.assert_called_with(*args)
 
 
-def test_preprocessor_flow_statement_no_expression(patch, magic, tree):
+def test_preprocessor_flow_statement_no_expression(patch, magic, fake_tree):
     """
     Ensures flow_statement ignores statements without inline expressions
     """
@@ -168,16 +212,43 @@ def test_preprocessor_flow_statement_no_expression(patch, magic, tree):
     statement = magic()
     statement.child.return_value = None
     statement.node.return_value = None
-    tree.find_data.return_value = [statement]
-    Preprocessor.flow_statement('statement', tree)
+    Preprocessor.flow_statement(fake_tree, statement)
     assert Preprocessor.replace_in_entity.call_count == 0
 
 
+def test_preprocessor_if_block(patch, fake_tree):
+    """
+    Ensures if_block processes the if statement and every else if statement
+    """
+    patch.object(Preprocessor, 'flow_statement')
+    if_block = fake_tree.block.if_block
+    elseif_block = Tree('elseif_block', [Tree('elseif_statement', [])])
+    if_block.children = [Tree('if_statement', []), 'token', elseif_block,
+                         Tree('else_block', [])]
+    Preprocessor.if_block(fake_tree)
+    calls = Preprocessor.flow_statement.call_args_list
+    assert calls[0] == call(fake_tree, if_block.if_statement)
+    assert calls[1] == call(fake_tree, elseif_block.elseif_statement)
+    assert Preprocessor.flow_statement.call_count == 2
+
+
+def test_preprocessor_if_block_no_if(patch, fake_tree):
+    patch.object(Preprocessor, 'flow_statement')
+    fake_tree.block.if_block = None
+    Preprocessor.if_block(fake_tree)
+    assert Preprocessor.flow_statement.call_count == 0
+
+
 def test_preprocessor_process(patch, magic, tree, block):
-    patch.many(Preprocessor, ['assignments', 'service', 'flow_statement'])
+    patch.many(Preprocessor, ['fake_tree', 'assignment', 'service',
+                              'if_block'])
     tree.find_data.return_value = [block]
     result = Preprocessor.process(tree)
-    Preprocessor.assignments.assert_called_with(block)
-    Preprocessor.service.assert_called_with(block)
-    Preprocessor.flow_statement.assert_called_with('elseif_statement', block)
+    tree.find_data.assert_called_with('block')
+    names = Preprocessor.fake_tree.call_args[0][1]
+    assert isinstance(names, itertools.count)
+    Preprocessor.fake_tree.assert_called_with(block, names)
+    Preprocessor.assignment.assert_called_with(Preprocessor.fake_tree())
+    Preprocessor.service.assert_called_with(Preprocessor.fake_tree())
+    Preprocessor.if_block.assert_called_with(Preprocessor.fake_tree())
     assert result == tree
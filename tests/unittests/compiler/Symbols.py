@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from pytest import fixture
+
+from storyscript.compiler import Symbols
+
+
+@fixture
+def symbols():
+    return Symbols()
+
+
+def test_symbols_init(symbols):
+    assert symbols.symbols == {}
+
+
+def test_symbols_key():
+    assert Symbols.key(['a', 'b']) == ('a', 'b')
+
+
+def test_symbols_key_objects():
+    """
+    Ensures that parts of names that are not strings are encoded
+    """
+    name = ['a', {'string': 'b', '$OBJECT': 'string'}]
+    expected = ('a', '{"$OBJECT": "string", "string": "b"}')
+    assert Symbols.key(name) == expected
+
+
+def test_symbols_declare(symbols):
+    symbols.declare(['a'], '1', parent='0')
+    expected = {'name': ['a'], 'line': '1', 'parent': '0'}
+    assert symbols.symbols[('a',)] == expected
+
+
+def test_symbols_declare_again(symbols):
+    """
+    Ensures that the first declaration of a variable is kept
+    """
+    symbols.declare(['a'], '1')
+    symbols.declare(['a'], '2')
+    assert symbols.get(['a'])['line'] == '1'
+
+
+def test_symbols_get(symbols):
+    symbols.declare(['a'], '1')
+    assert symbols.get(['a'])['name'] == ['a']
+    assert symbols.get(['b']) is None
+
+
+def test_symbols_contains(symbols):
+    symbols.declare(['a', 'b'], '1')
+    assert ['a', 'b'] in symbols
+    assert ['a'] not in symbols
+
+
+def test_symbols_len(symbols):
+    symbols.declare(['a'], '1')
+    assert len(symbols) == 1
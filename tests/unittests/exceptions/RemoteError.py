@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from storyscript.exceptions import RemoteError, StoryError
+
+
+def test_remoteerror_init():
+    error = RemoteError('message', 'short message', path='path')
+    assert error.remote_message == 'message'
+    assert error.remote_short_message == 'short message'
+    assert error.path == 'path'
+    assert isinstance(error, StoryError)
+
+
+def test_remoteerror_message():
+    assert RemoteError('message', 'short').message() == 'message'
+
+
+def test_remoteerror_short_message():
+    assert RemoteError('message', 'short').short_message() == 'short'
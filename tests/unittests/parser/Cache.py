@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import pickle
+import tempfile
+
+import lark
+from lark.parsers.lalr_analysis import Reduce, Shift
+
+from storyscript.Version import version
+from storyscript.parser import Cache
+
+
+def test_cache_directory(patch):
+    patch.object(os.environ, 'get', return_value=None)
+    patch.object(os.path, 'expanduser', return_value='/home')
+    assert Cache.directory() == '/home/.cache/storyscript'
+    os.environ.get.assert_called_with('XDG_CACHE_HOME')
+
+
+def test_cache_directory_xdg(patch):
+    patch.object(os.environ, 'get', return_value='/cache')
+    assert Cache.directory() == '/cache/storyscript'
+
+
+def test_cache_path(patch):
+    patch.object(Cache, 'directory', return_value='/cache')
+    result = Cache.path('hash')
+    filename = 'parser-{}-{}-{}-hash.pickle'.format(Cache.revision,
+                                                    lark.__version__, version)
+    assert result == '/cache/{}'.format(filename)
+
+
+def test_cache_restore_actions(magic):
+    """
+    Ensures Cache.restore_actions replaces copies of the LALR actions with
+    the original ones
+    """
+    parser = magic()
+    shift = magic(name='Shift')
+    shift.name = 'Shift'
+    reduce = magic()
+    reduce.name = 'Reduce'
+    states = {0: {'NAME': (shift, 1), '$END': (reduce, 'rule')}}
+    parser.parser.parser._parse_table.states = states
+    Cache.restore_actions(parser)
+    assert states[0] == {'NAME': (Shift, 1), '$END': (Reduce, 'rule')}
+
+
+def test_cache_load(patch):
+    patch.many(io, ['open'])
+    patch.object(pickle, 'load')
+    patch.many(Cache, ['path', 'restore_actions'])
+    result = Cache.load('hash')
+    Cache.path.assert_called_with('hash')
+    io.open.assert_called_with(Cache.path(), 'rb')
+    pickle.load.assert_called_with(io.open().__enter__())
+    Cache.restore_actions.assert_called_with(pickle.load())
+    assert result == pickle.load()
+
+
+def test_cache_load_missing(patch):
+    patch.object(Cache, 'path', return_value='/missing/parser.pickle')
+    assert Cache.load('hash') is None
+
+
+def test_cache_save(patch):
+    patch.many(os, ['makedirs', 'replace'])
+    patch.object(io, 'open')
+    patch.object(pickle, 'dump')
+    patch.object(tempfile, 'mkstemp', return_value=(1, 'temporary'))
+    patch.many(Cache, ['directory', 'path'])
+    Cache.save('hash', 'parser')
+    os.makedirs.assert_called_with(Cache.directory(), exist_ok=True)
+    tempfile.mkstemp.assert_called_with(dir=Cache.directory())
+    io.open.assert_called_with(1, 'wb')
+    protocol = pickle.HIGHEST_PROTOCOL
+    pickle.dump.assert_called_with('parser', io.open().__enter__(),
+                                   protocol=protocol)
+    os.replace.assert_called_with('temporary', Cache.path())
+
+
+def test_cache_save_unwritable(patch):
+    patch.object(os, 'makedirs', side_effect=OSError)
+    patch.object(tempfile, 'mkstemp')
+    Cache.save('hash', 'parser')
+    assert tempfile.mkstemp.call_count == 0
+
+
+def test_cache_save_error(patch):
+    """
+    Ensures Cache.save removes the temporary file when the parser can't be
+    saved
+    """
+    patch.many(os, ['makedirs', 'replace', 'remove'])
+    patch.object(io, 'open')
+    patch.object(pickle, 'dump', side_effect=pickle.PicklingError)
+    patch.object(tempfile, 'mkstemp', return_value=(1, 'temporary'))
+    Cache.save('hash', 'parser')
+    os.remove.assert_called_with('temporary')
+    assert os.replace.call_count == 0
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from lark.indenter import Indenter
+from lark.lexer import Token
 
 from storyscript.parser import CustomIndenter
 
@@ -12,3 +13,16 @@ def test_indenter():
     assert CustomIndenter.INDENT_type == '_INDENT'
     assert CustomIndenter.DEDENT_type == '_DEDENT'
     assert CustomIndenter.tab_len == 8
+
+
+def test_indenter_process():
+    """
+    Ensures CustomIndenter.process resets the indentation levels
+    """
+    indenter = CustomIndenter()
+    indenter.paren_level = 1
+    indenter.indent_level = [0, 4]
+    stream = [Token('NAME', 'x')]
+    assert list(indenter.process(stream)) == stream
+    assert indenter.indent_level == [0]
+    assert indenter.paren_level == 0
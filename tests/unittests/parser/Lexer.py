@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from lark.lexer import PatternStr, TerminalDef, TraditionalLexer
+
+from pytest import fixture
+
+from storyscript.parser import Lexer
+
+
+@fixture
+def terminals():
+    return [TerminalDef('IF', PatternStr('if')),
+            TerminalDef('ELSE', PatternStr('else')),
+            TerminalDef('_WS', PatternStr(' '))]
+
+
+@fixture
+def lexer(terminals):
+    states = {0: ['IF'], 1: ['ELSE'], 2: ['IF']}
+    return Lexer(terminals, states, ignore=['_WS'])
+
+
+def test_lexer_init(patch, terminals):
+    patch.init(TraditionalLexer)
+    patch.object(Lexer, 'set_parser_state')
+    lexer = Lexer(terminals, 'states', ignore=['_WS'], always_accept=['_NL'])
+    TraditionalLexer.__init__.assert_called_with(terminals, ignore=['_WS'])
+    Lexer.set_parser_state.assert_called_with(None)
+    assert lexer.states == 'states'
+    assert lexer.ignore == ['_WS']
+    assert lexer.always_accept == ['_NL']
+    assert lexer.lexers == {}
+    assert isinstance(lexer.root_lexer, TraditionalLexer)
+
+
+def test_lexer_state_lexer(lexer):
+    result = lexer.state_lexer(0)
+    names = [terminal.name for terminal in result.terminals]
+    assert sorted(names) == ['IF', '_WS']
+    assert lexer.lexers[0] == result
+
+
+def test_lexer_state_lexer_shared(lexer):
+    """
+    Ensures states that accept the same tokens share the same lexer
+    """
+    assert lexer.state_lexer(0) is lexer.state_lexer(2)
+    assert lexer.state_lexer(0) is not lexer.state_lexer(1)
+
+
+def test_lexer_lex(lexer):
+    """
+    Ensures the lexer follows the state of the parser
+    """
+    tokens = []
+    lexer.set_parser_state(0)
+    for token in lexer.lex('if else'):
+        tokens.append(token)
+        lexer.set_parser_state(1)
+    assert tokens == ['if', 'else']
+    assert tokens[1].type == 'ELSE'
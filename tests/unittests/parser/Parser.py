@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
+import hashlib
 import io
 
 from lark import Lark
 
 from pytest import fixture
 
-from storyscript.parser import (CustomIndenter, Grammar, Parser, Transformer,
-                                Tree)
+from storyscript.Profiler import Profiler
+from storyscript.parser import (Cache, CustomIndenter, Grammar, Parser,
+                                Standalone, Transformer, Tree)
 
 
 @fixture
@@ -56,29 +58,207 @@ def test_parser_grammar_ebnf(patch, parser):
     assert result == io.open().__enter__().read()
 
 
-def test_parser_lark(patch, parser):
+def test_parser_fingerprint(patch, parser):
+    patch.object(hashlib, 'sha1')
+    result = parser.fingerprint('grammar')
+    hashlib.sha1.assert_called_with(b'lalr\ngrammar')
+    assert result == hashlib.sha1().hexdigest()
+
+
+def test_parser_fingerprint_algo():
+    assert Parser().fingerprint('g') != Parser(algo='earley').fingerprint('g')
+
+
+def test_parser_checksum(patch, parser):
+    patch.many(Standalone, ['supports', 'fingerprint'])
+    assert parser.checksum() == Standalone.fingerprint()
+    Standalone.supports.assert_called_with('lalr')
+
+
+def test_parser_checksum_ebnf(patch, parser):
+    patch.many(Parser, ['grammar', 'fingerprint'])
+    parser.ebnf = 'grammar.ebnf'
+    result = parser.checksum()
+    Parser.fingerprint.assert_called_with(Parser.grammar())
+    assert result == Parser.fingerprint()
+
+
+def test_parser_inline(parser):
+    assert parser.inline() is True
+    assert Parser(algo='earley').inline() is False
+
+
+def test_parser_build(patch, parser):
+    """
+    Ensures Parser.build can produce the correct Lark instance and cache it
+    """
+    patch.init(Lark)
+    patch.many(Parser, ['indenter', 'transformer'])
+    patch.many(Cache, ['load', 'save'])
+    Cache.load.return_value = None
+    result = parser.build('grammar', 'hash')
+    Cache.load.assert_called_with('hash')
+    kwargs = {'parser': parser.algo, 'postlex': Parser.indenter(),
+              'transformer': Parser.transformer()}
+    Lark.__init__.assert_called_with('grammar', **kwargs)
+    Cache.save.assert_called_with('hash', result)
+    assert isinstance(result, Lark)
+
+
+def test_parser_build_earley(patch):
     """
-    Ensures Parser.lark can produce the correct Lark instance.
+    Ensures Parser.build does not embed the transformer with Earley
     """
     patch.init(Lark)
-    patch.many(Parser, ['indenter', 'grammar'])
+    patch.object(Parser, 'indenter')
+    patch.many(Cache, ['load', 'save'])
+    Cache.load.return_value = None
+    Parser(algo='earley').build('grammar', 'hash')
+    kwargs = {'parser': 'earley', 'postlex': Parser.indenter()}
+    Lark.__init__.assert_called_with('grammar', **kwargs)
+
+
+def test_parser_build_cached(patch, parser):
+    patch.init(Lark)
+    patch.many(Cache, ['load', 'save'])
+    assert parser.build('grammar', 'hash') == Cache.load()
+    assert Lark.__init__.call_count == 0
+    assert Cache.save.call_count == 0
+
+
+def test_parser_dynamic(patch, parser):
+    """
+    Ensures Parser.dynamic can produce the correct Lark instance.
+    """
+    patch.many(Parser, ['grammar', 'fingerprint', 'build'])
+    patch.object(Parser, 'larks', {})
+    result = parser.dynamic()
+    Parser.fingerprint.assert_called_with(parser.grammar())
+    Parser.build.assert_called_with(parser.grammar(), Parser.fingerprint())
+    assert result == Parser.build()
+    assert Parser.larks[Parser.fingerprint()] == result
+
+
+def test_parser_dynamic_phase(patch, parser):
+    """
+    Ensures building Lark is measured as shared by all stories
+    """
+    patch.many(Parser, ['grammar', 'fingerprint', 'build'])
+    patch.object(Parser, 'larks', {})
+    patch.many(Profiler, ['story', 'phase'])
+    parser.dynamic()
+    Profiler.story.assert_called_with(None)
+    Profiler.phase.assert_called_with('lark')
+
+
+def test_parser_dynamic_cached(patch, parser):
+    """
+    Ensures Parser.dynamic reuses the instance built for the same grammar
+    """
+    patch.many(Parser, ['grammar', 'fingerprint', 'build'])
+    patch.object(Parser, 'larks', {Parser.fingerprint(): 'lark'})
+    assert parser.dynamic() == 'lark'
+    assert Parser.build.call_count == 0
+
+
+def test_parser_lark(patch, parser):
+    """
+    Ensures Parser.lark uses the standalone parser for the default grammar
+    """
+    patch.init(Standalone)
+    patch.many(Standalone, ['supports', 'fingerprint'])
+    patch.many(Parser, ['indenter', 'transformer'])
+    patch.object(Parser, 'larks', {})
     result = parser.lark()
+    Standalone.supports.assert_called_with('lalr')
+    kwargs = {'postlex': Parser.indenter(),
+              'transformer': Parser.transformer()}
+    Standalone.__init__.assert_called_with(**kwargs)
+    assert isinstance(result, Standalone)
+    assert Parser.larks[Standalone.fingerprint()] == result
+
+
+def test_parser_lark_cached(patch, parser):
+    patch.init(Standalone)
+    patch.many(Standalone, ['supports', 'fingerprint'])
+    patch.object(Parser, 'larks', {Standalone.fingerprint(): 'standalone'})
+    assert parser.lark() == 'standalone'
+    assert Standalone.__init__.call_count == 0
+
+
+def test_parser_lark_ebnf(patch, parser):
+    """
+    Ensures Parser.lark uses Lark for grammars loaded from a file
+    """
+    patch.object(Parser, 'dynamic')
+    patch.object(Standalone, 'supports')
+    parser.ebnf = 'grammar.ebnf'
+    assert parser.lark() == Parser.dynamic()
+
+
+def test_parser_lark_unsupported(patch, parser):
+    patch.object(Parser, 'dynamic')
+    patch.object(Standalone, 'supports', return_value=False)
+    assert parser.lark() == Parser.dynamic()
+
+
+def test_parser_generate(patch, parser):
+    patch.init(Lark)
+    patch.many(Parser, ['grammar', 'fingerprint', 'indenter'])
+    patch.object(Standalone, 'source')
+    patch.object(io, 'open')
+    parser.generate('Tables.py')
     kwargs = {'parser': parser.algo, 'postlex': Parser.indenter()}
-    Lark.__init__.assert_called_with(parser.grammar(), **kwargs)
-    assert isinstance(result, Lark)
+    Lark.__init__.assert_called_with(Parser.grammar(), **kwargs)
+    Parser.fingerprint.assert_called_with(Parser.grammar())
+    lark = Standalone.source.call_args[0][0]
+    assert isinstance(lark, Lark)
+    Standalone.source.assert_called_with(lark, Parser.fingerprint())
+    io.open.assert_called_with('Tables.py', 'w')
+    io.open().__enter__().write.assert_called_with(Standalone.source())
 
 
 def test_parser_parse(patch, parser):
     """
-    Ensures the build method can build the grammar
+    Ensures Parser.parse produces the tree transformed while parsing
     """
     patch.many(Parser, ['lark', 'transformer'])
     result = parser.parse('source')
     Parser.lark().parse.assert_called_with('source\n')
+    assert Parser.transformer().transform.call_count == 0
+    assert result == Parser.lark().parse()
+
+
+def test_parser_parse_lock(patch, magic, parser):
+    """
+    Ensures Parser.parse holds the lock while parsing
+    """
+    patch.many(Parser, ['lark', 'transformer'])
+    patch.object(Parser, 'lock')
+    Parser.lark().parse.side_effect = lambda source: Parser.lock.__enter__
+    parser.parse('source')
+    assert Parser.lock.__enter__.call_count == 1
+    assert Parser.lock.__exit__.call_count == 1
+
+
+def test_parser_parse_earley(patch):
+    """
+    Ensures Parser.parse transforms the tree after parsing with Earley
+    """
+    patch.many(Parser, ['lark', 'transformer'])
+    result = Parser(algo='earley').parse('source')
     Parser.transformer().transform.assert_called_with(Parser.lark().parse())
     assert result == Parser.transformer().transform()
 
 
+def test_parser_parse_phases(patch, parser):
+    patch.many(Parser, ['lark', 'transformer'])
+    patch.object(Profiler, 'phase')
+    Parser(algo='earley').parse('source')
+    phases = [call[0][0] for call in Profiler.phase.call_args_list]
+    assert phases == ['parse', 'transform']
+
+
 def test_parser_parse_empty(patch, parser):
     """
     Ensures that empty stories are parsed correctly
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from storyscript.parser import Revision
+
+
+def test_revision_init():
+    revision = Revision()
+    assert revision.count == 0
+    assert revision.parent is None
+
+
+def test_revision_root():
+    revision = Revision()
+    assert revision.root() is revision
+
+
+def test_revision_root_joined():
+    """
+    Ensures the root is found through joined revisions, which then point
+    to it directly
+    """
+    root = Revision()
+    middle = Revision()
+    revision = Revision()
+    middle.parent = root
+    revision.parent = middle
+    assert revision.root() is root
+    assert revision.parent is root
+
+
+def test_revision_join():
+    revision = Revision()
+    other = Revision()
+    assert revision.join(other) is revision
+    assert other.parent is revision
+    assert other.root() is revision
+
+
+def test_revision_join_same():
+    revision = Revision()
+    other = Revision()
+    other.parent = revision
+    assert revision.join(other) is revision
+    assert revision.parent is None
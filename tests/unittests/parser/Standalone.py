@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import lark
+from lark.grammar import NonTerminal, Rule, Terminal
+from lark.lexer import PatternRE, PatternStr
+from lark.parse_tree_builder import ParseTreeBuilder
+from lark.parsers.lalr_analysis import ParseTable, Reduce, Shift
+from lark.parsers.lalr_parser import _Parser
+from lark.tree import Tree
+
+from pytest import fixture, mark
+
+from storyscript.parser import Lexer, Standalone, Tables
+
+
+@fixture
+def standalone(patch):
+    patch.init(Standalone)
+    standalone = Standalone()
+    standalone.postlex = None
+    return standalone
+
+
+def test_standalone_init(patch):
+    patch.many(Standalone, ['make_terminals', 'make_rules', 'make_parse_table',
+                            'make_parser', 'make_lexer'])
+    standalone = Standalone(postlex='postlex', transformer='transformer')
+    Standalone.make_parse_table.assert_called_with(Standalone.make_rules())
+    assert standalone.postlex == 'postlex'
+    assert standalone.transformer == 'transformer'
+    assert standalone.terminals == Standalone.make_terminals()
+    assert standalone.rules == Standalone.make_rules()
+    assert standalone.parse_table == Standalone.make_parse_table()
+    assert standalone.parser == Standalone.make_parser()
+    assert standalone.lexer == Standalone.make_lexer()
+
+
+def test_standalone_fingerprint(patch):
+    patch.object(Tables, 'fingerprint', 'hash')
+    assert Standalone.fingerprint() == 'hash'
+
+
+@mark.parametrize('algo, version, expected', [
+    ('lalr', lark.__version__, True),
+    ('lalr', '0.0.0', False),
+    ('earley', lark.__version__, False)
+])
+def test_standalone_supports(patch, algo, version, expected):
+    patch.object(Tables, 'lark_version', version)
+    assert Standalone.supports(algo) is expected
+
+
+def test_standalone_make_terminals(patch):
+    terminals = [('NAME', 're', '[a-z]+', ['i'], 1),
+                 ('IF', 'str', 'if', [], 2)]
+    patch.object(Tables, 'terminals', terminals)
+    result = Standalone.make_terminals()
+    assert result[0].name == 'NAME'
+    assert result[0].pattern == PatternRE('[a-z]+', ['i'])
+    assert result[0].priority == 1
+    assert result[1].pattern == PatternStr('if', [])
+
+
+def test_standalone_make_rules(patch):
+    rules = [('start', [('NAME', True, True), ('block', False, False)],
+              'alias', (False, True, None)),
+             ('block', [], None, None)]
+    patch.object(Tables, 'rules', rules)
+    result = Standalone.make_rules()
+    assert result[0].origin == NonTerminal('start')
+    assert result[0].expansion == [Terminal('NAME'), NonTerminal('block')]
+    assert result[0].expansion[0].filter_out is True
+    assert result[0].alias == 'alias'
+    assert result[0].options.expand1 is True
+    assert result[1].options is None
+
+
+def test_standalone_make_parse_table(patch):
+    states = {0: {'NAME': (True, 1), '$END': (False, 0)}}
+    patch.object(Tables, 'states', states)
+    patch.object(Tables, 'start_state', 0)
+    patch.object(Tables, 'end_state', 1)
+    result = Standalone.make_parse_table(['rule'])
+    assert result.states == {0: {'NAME': (Shift, 1), '$END': (Reduce, 'rule')}}
+    assert result.start_state == 0
+    assert result.end_state == 1
+
+
+def test_standalone_make_parser(patch, magic, standalone):
+    patch.init(ParseTreeBuilder)
+    patch.init(_Parser)
+    patch.object(ParseTreeBuilder, 'create_callback')
+    rule = magic(alias='_cb0_start')
+    standalone.rules = [rule]
+    standalone.parse_table = 'table'
+    standalone.transformer = 'transformer'
+    result = standalone.make_parser()
+    ParseTreeBuilder.__init__.assert_called_with([rule], Tree)
+    ParseTreeBuilder.create_callback.assert_called_with('transformer')
+    callbacks = {rule: ParseTreeBuilder.create_callback()._cb0_start}
+    _Parser.__init__.assert_called_with('table', callbacks)
+    assert isinstance(result, _Parser)
+
+
+def test_standalone_make_lexer(patch, magic, standalone):
+    patch.init(Lexer)
+    standalone.terminals = 'terminals'
+    standalone.parse_table = magic(states={0: {'NAME': 'action'}})
+    standalone.postlex = magic(always_accept=('_NL',))
+    result = standalone.make_lexer()
+    kwargs = {'ignore': Tables.ignore, 'always_accept': ('_NL',)}
+    Lexer.__init__.assert_called_with('terminals', {0: ['NAME']}, **kwargs)
+    assert isinstance(result, Lexer)
+
+
+def test_standalone_process(magic, standalone):
+    standalone.postlex = magic()
+    result = standalone.process('stream')
+    standalone.postlex.process.assert_called_with('stream')
+    assert result == standalone.postlex.process()
+
+
+def test_standalone_process_no_postlex(standalone):
+    assert standalone.process('stream') == 'stream'
+
+
+def test_standalone_parse(patch, magic, standalone):
+    patch.object(Standalone, 'process')
+    standalone.lexer = magic()
+    standalone.parser = magic()
+    result = standalone.parse('source')
+    standalone.lexer.lex.assert_called_with('source')
+    Standalone.process.assert_called_with(standalone.lexer.lex())
+    args = (Standalone.process(), standalone.lexer.set_parser_state)
+    standalone.parser.parse.assert_called_with(*args)
+    assert result == standalone.parser.parse()
+
+
+def test_standalone_lex(patch, magic, standalone):
+    patch.object(Standalone, 'process')
+    standalone.lexer = magic()
+    result = standalone.lex('source')
+    standalone.lexer.root_lexer.lex.assert_called_with('source')
+    Standalone.process.assert_called_with(standalone.lexer.root_lexer.lex())
+    assert result == Standalone.process()
+
+
+def test_standalone_rule_key():
+    rule = Rule(NonTerminal('start'), [Terminal('IF'), NonTerminal('block')],
+                alias='alias')
+    assert Standalone.rule_key(rule) == ('start', ['IF', 'block'], 'alias')
+
+
+def test_standalone_state_numbers():
+    """
+    Ensures states are numbered in the order they are reached, following
+    tokens in alphabetical order
+    """
+    states = {7: {'b': (Shift, 3), 'a': (Shift, 5), 'c': (Reduce, 'rule')},
+              5: {'a': (Shift, 7)},
+              3: {'d': (Shift, 9)},
+              9: {},
+              4: {}}
+    parse_table = ParseTable(states, 7, 9)
+    numbers = Standalone.state_numbers(parse_table)
+    assert numbers == {7: 0, 5: 1, 3: 2, 9: 3, 4: 4}
+
+
+def test_standalone_source(magic):
+    parser = magic()
+    parser.terminals = [magic(pattern=PatternStr('if'), priority=1)]
+    parser.terminals[0].name = 'IF'
+    parser.rules = []
+    parser.ignore_tokens = []
+    parser.parser.parser._parse_table = ParseTable({0: {}}, 0, 0)
+    result = Standalone.source(parser, 'hash')
+    assert result.startswith('# -*- coding: utf-8 -*-\n# flake8: noqa\n')
+    assert "fingerprint = 'hash'\n" in result
+    assert "terminals = [('IF', 'str', 'if', [], 1)]\n" in result
+
+
+def test_standalone_source_order(magic):
+    """
+    Ensures rules and states are written in a fixed order
+    """
+    second = Rule(NonTerminal('b'), [Terminal('Y')], alias='b')
+    first = Rule(NonTerminal('a'), [Terminal('X')], alias='a')
+    parser = magic(terminals=[], ignore_tokens=[], rules=[second, first])
+    parser._parse_tree_builder.user_aliases = {first: None, second: None}
+    states = {4: {'X': (Shift, 8), 'b': (Reduce, second)},
+              8: {'Y': (Reduce, first)}}
+    parser.parser.parser._parse_table = ParseTable(states, 4, 8)
+    result = Standalone.source(parser, 'hash')
+    assert 'start_state = 0\nend_state = 1\n' in result
+    assert "rules = [('a', [('X', True, False)]" in result
+    assert ("states = {0: {'X': (True, 1), 'b': (False, 1)}, "
+            "1: {'Y': (False, 0)}}\n") in result
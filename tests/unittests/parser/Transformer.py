@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
-from lark import Transformer as LarkTransformer
+from lark import Transformer as LarkTransformer, Tree as LarkTree
 from lark.lexer import Token
+from lark.visitors import Discard
 
 from pytest import fixture, mark, raises
 
@@ -52,10 +53,9 @@ def test_transformer_implicit_output(tree):
     Ensures Transformer.implicit_output adds an output tree when needed
     """
     tree.service_fragment.output = None
-    tree.service_fragment.children = []
     Transformer.implicit_output(tree)
     expected = Tree('output', [tree.service_fragment.command.child()])
-    assert tree.service_fragment.children[-1] == expected
+    tree.service_fragment.append.assert_called_with(expected)
 
 
 def test_transformer_implicit_output_none(tree):
@@ -134,7 +134,7 @@ def test_transformer_service_block_indented_args(tree, magic):
     block = magic()
     matches = [block, tree]
     result = Transformer.service_block(matches)
-    block.service_fragment.children.append.assert_called_with('argument')
+    block.service_fragment.append.assert_called_with('argument')
     assert result == Tree('service_block', [block])
 
 
@@ -154,3 +154,45 @@ def test_transformer_rules(rule):
     assert isinstance(result, Tree)
     assert result.data == rule
     assert result.children == ['matches']
+
+
+def test_transformer_getattr_dunder():
+    """
+    Ensures special attributes are not mistaken for rules, so that the
+    transformer can be copied and pickled with the parser
+    """
+    with raises(AttributeError):
+        Transformer().__deepcopy__
+
+
+def test_transformer_transform():
+    tree = LarkTree('start', [LarkTree('path', [Token('NAME', 'x')]),
+                              Token('WORD', 'word')])
+    result = Transformer().transform(tree)
+    path = Tree('path', [Token('NAME', 'x')])
+    assert result == Tree('start', [path, Token('WORD', 'word')])
+    assert isinstance(result.child(0), Tree)
+
+
+def test_transformer_transform_deep():
+    """
+    Ensures trees deeper than the recursion limit can be transformed
+    """
+    tree = LarkTree('leaf', [])
+    for n in range(5000):
+        tree = LarkTree('block', [tree])
+    result = Transformer().transform(tree)
+    for n in range(5000):
+        result = result.child(0)
+    assert result == Tree('leaf', [])
+
+
+def test_transformer_transform_discard(patch):
+    def call(tree, children):
+        if tree.data == 'discarded':
+            raise Discard
+        return Tree(tree.data, children)
+
+    patch.object(Transformer, '_call_userfunc', side_effect=call)
+    tree = LarkTree('start', [LarkTree('discarded', []), 'token'])
+    assert Transformer().transform(tree) == Tree('start', ['token'])
@@ -39,6 +39,38 @@ def test_tree_walk_token():
     assert result == inner_tree
 
 
+def test_tree_walk_first():
+    """
+    Ensures that the first subtree with the given name is found
+    """
+    first = Tree('inner', ['first'])
+    tree = Tree('rule', [first, Tree('inner', ['second'])])
+    assert Tree.walk(tree, 'inner') is first
+
+
+def test_tree_index():
+    inner_tree = Tree('inner', [])
+    tree = Tree('rule', [Token('test', 'test'), inner_tree])
+    assert tree.index() == {'inner': inner_tree}
+    assert tree.index() is tree.index()
+
+
+def test_tree_index_children():
+    """
+    Ensures that the index is dropped when the children are reassigned
+    """
+    tree = Tree('rule', [])
+    assert tree.inner is None
+    tree.children = [Tree('inner', [])]
+    assert tree.inner == Tree('inner', [])
+
+
+def test_tree_shards(patch):
+    patch.object(Tree, 'paths', {})
+    assert Tree.shards('one.two') == ['one', 'two']
+    assert Tree.paths == {'one.two': ['one', 'two']}
+
+
 def test_tree_node(patch):
     patch.object(Tree, 'walk')
     tree = Tree('rule', [])
@@ -57,6 +89,118 @@ def test_tree_child_overflow():
     assert tree.child(1) is None
 
 
+def test_tree_first_token():
+    token = Token('WORD', 'word')
+    tree = Tree('outer', [Tree('path', [token]), Token('WORD', 'other')])
+    assert tree.first_token() is token
+
+
+def test_tree_first_token_deep():
+    """
+    Ensures the first token of trees deeper than the recursion limit is
+    found, and remembered by the trees on the way
+    """
+    token = Token('WORD', 'word')
+    tree = Tree('path', [token])
+    trees = [tree]
+    for n in range(5000):
+        tree = Tree('outer', [tree])
+        trees.append(tree)
+    assert tree.first_token() is token
+    assert trees[2500]._first[2] is token
+
+
+def test_tree_known_first():
+    tree = Tree('path', [Token('WORD', 'word')])
+    assert tree.known_first() is False
+    tree.first_token()
+    assert tree.known_first() is True
+    tree.invalidate_positions()
+    assert tree.known_first() is False
+
+
+def test_tree_invalidate_positions_unknown():
+    """
+    Ensures trees that were not used to find first tokens don't get a
+    revision when they change
+    """
+    tree = Tree('path', [Token('WORD', 'word')])
+    tree.invalidate_positions()
+    assert tree._revision is None
+
+
+def test_tree_first_token_revision():
+    """
+    Ensures the trees on the way to the first token share a revision
+    """
+    inner = Tree('path', [Token('WORD', 'word')])
+    tree = Tree('outer', [inner])
+    inner.first_token()
+    tree.first_token()
+    assert tree.revision() is inner.revision()
+
+
+def test_tree_first_token_other_trees():
+    """
+    Ensures changing a tree doesn't forget the first tokens of unrelated
+    trees, like the ones of other stories
+    """
+    one = Tree('outer', [Tree('path', [Token('WORD', 'one')])])
+    two = Tree('outer', [Tree('path', [Token('WORD', 'two')])])
+    one.first_token()
+    two.first_token()
+    one.child(0).replace(0, Token('WORD', 'new'))
+    assert one.known_first() is False
+    assert two.known_first() is True
+    assert one.first_token() == 'new'
+
+
+def test_tree_first_token_empty(tree):
+    assert tree.first_token() is None
+    assert tree.line() is None
+
+
+def test_tree_first_token_cached():
+    """
+    Ensures the first token is found only once
+    """
+    token = Token('WORD', 'word')
+    tree = Tree('outer', [Tree('path', [token])])
+    tree.first_token()
+    tree.child(0).children.clear()
+    assert tree.first_token() is token
+
+
+def test_tree_first_token_replace():
+    """
+    Ensures the first token of the parents is found again when a first child
+    is replaced
+    """
+    inner = Tree('path', [Token('WORD', 'old', line=1)])
+    tree = Tree('outer', [inner])
+    assert tree.line() == '1'
+    inner.replace(0, Token('WORD', 'new', line=2))
+    assert tree.line() == '2'
+
+
+def test_tree_set_line():
+    token = Token('WORD', 'word', line=1)
+    tree = Tree('outer', [Tree('path', [token])])
+    assert tree.line() == '1'
+    tree.child(0).set_line('0.5')
+    assert token.line == '0.5'
+    assert tree.line() == '0.5'
+
+
+def test_tree_position():
+    tree = Tree('outer', [Tree('path', [Token('WORD', 'word', line=1)])])
+    assert tree.position('line') == 1
+
+
+def test_tree_position_empty():
+    assert Tree('outer', []).position('line') is None
+
+
 def test_tree_line():
     tree = Tree('outer', [Tree('path', [Token('WORD', 'word', line=1)])])
     assert tree.line() == '1'
@@ -86,6 +230,28 @@ def test_tree_insert():
     assert tree.children == ['child']
 
 
+def test_tree_insert_index():
+    tree = Tree('tree', [Tree('inner', ['old'])])
+    assert tree.inner.child(0) == 'old'
+    tree.insert(Tree('inner', ['new']))
+    assert tree.inner.child(0) == 'new'
+
+
+def test_tree_children_positions():
+    tree = Tree('tree', [Token('WORD', 'word', line=1)])
+    assert tree.line() == '1'
+    tree.children = [Token('WORD', 'word', line=2)]
+    assert tree.line() == '2'
+
+
+def test_tree_append():
+    tree = Tree('tree', ['child'])
+    assert tree.inner is None
+    tree.append(Tree('inner', []))
+    assert tree.children == ['child', Tree('inner', [])]
+    assert tree.inner == Tree('inner', [])
+
+
 def test_tree_rename():
     """
     Ensures Tree.rename can rename the current tree
@@ -101,6 +267,13 @@ def test_tree_replace():
     assert tree.children == ['new']
 
 
+def test_tree_replace_index():
+    tree = Tree('tree', [Tree('inner', ['old'])])
+    assert tree.inner.child(0) == 'old'
+    tree.replace(0, Tree('inner', ['new']))
+    assert tree.inner.child(0) == 'new'
+
+
 def test_tree_extract_path():
     tree = Tree('path', [Token('NAME', 'one')])
     assert tree.extract_path() == 'one'
@@ -182,3 +355,29 @@ def test_tree_expect(tree):
         tree.expect(0, 'error')
 
     assert e.value.message() == 'Unknown compiler error'
+
+
+def test_tree_getstate():
+    tree = Tree('rule', [Token('ANY', 'value', line=1)])
+    tree.index()
+    tree.first_token()
+    state = tree.__getstate__()
+    assert state['_children'] == tree.children
+    assert '_index' not in state
+    assert '_first' not in state
+    assert '_revision' not in state
+
+
+def test_tree_getattr(patch, tree):
+    patch.object(Tree, 'node')
+    result = tree.inner
+    Tree.node.assert_called_with('inner')
+    assert result == Tree.node()
+
+
+def test_tree_getattr_private(tree):
+    """
+    Ensures private attributes are not looked up as subtrees
+    """
+    with raises(AttributeError):
+        tree._private